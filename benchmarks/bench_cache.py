@@ -0,0 +1,144 @@
+"""
+Classification cache benchmark on static-heavy synthetic footage.
+
+Usage (from project root):
+    python -m benchmarks.bench_cache
+    python -m benchmarks.bench_cache --hold 120 --jitter 0.8 --tolerance 3
+
+The stream is made of "holds": one synthetic hand kept still for --hold
+frames with per-frame landmark jitter (rounded to integer pixels like
+the detector output), then a new hand. The same stream is classified
+with and without `CachedClassifier`, and the report shows how many
+classifier calls were skipped and how many labels differ. Exits 1 when
+a label differs on a hand whose wrist-relative landmarks moved more
+than the cache bound (tolerance + quantum) away from the hand the
+reused label was computed on.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.inference.cache import CachedClassifier
+from src.inference.predictor import detect_gesture_from_landmarks
+from src.processing.synthetic import SyntheticHandConfig, SyntheticHandGenerator
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the landmark classification cache")
+    parser.add_argument("--holds", type=int, default=200, help="number of distinct still hands")
+    parser.add_argument("--hold", type=int, default=90, help="frames per still hand")
+    parser.add_argument("--jitter", type=float, default=0.8, help="per-frame landmark jitter (px)")
+    parser.add_argument("--tolerance", type=float, default=3.0, help="cache tolerance (px)")
+    parser.add_argument("--entries", type=int, default=32, help="cache entries (LRU)")
+    parser.add_argument(
+        "--classifier-cost-us",
+        type=float,
+        default=0.0,
+        help="extra busy-wait per classifier call, to simulate a learned model",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def static_stream(holds: int, hold: int, jitter: float, seed: int):
+    cfg = SyntheticHandConfig(jitter_px=0.0)
+    gen = SyntheticHandGenerator(cfg, seed=seed)
+    rng = np.random.default_rng(seed + 1)
+    base, _ = gen.sample(holds)
+
+    for hand in base:
+        noise = rng.normal(0.0, jitter, size=(hold, 21, 2))
+        frames = np.repeat(hand[None], hold, axis=0)
+        frames[..., :2] = np.rint(frames[..., :2] + noise)
+        for pts in frames.tolist():
+            yield [(int(x), int(y), z) for x, y, z in pts]
+
+
+def slow_classifier(cost_us: float):
+    cost_s = cost_us / 1e6
+
+    def classify(pts, img_w, img_h):
+        deadline = time.perf_counter() + cost_s
+        result = detect_gesture_from_landmarks(pts, img_w, img_h)
+        while time.perf_counter() < deadline:
+            pass
+        return result
+
+    return classify
+
+
+def recording_classifier(classify, sources: dict, results: list):
+    # fresh result tuple per call, so a cached result can be traced back
+    # to the hand it was computed on (the cache returns the stored tuple)
+    def classify_and_record(pts, img_w, img_h):
+        key, gid, conf = classify(pts, img_w, img_h)
+        result = (key, gid, conf)
+        sources[id(result)] = pts
+        results.append(result)
+        return result
+
+    return classify_and_record
+
+
+def moved_px(a, b) -> float:
+    """
+    Largest wrist-relative x / y difference between two hands (px).
+    """
+    a, b = np.asarray(a, dtype=np.float32)[:, :2], np.asarray(b, dtype=np.float32)[:, :2]
+    return float(np.abs((a - a[0]) - (b - b[0])).max())
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    w, h = 640, 480
+    stream = list(static_stream(args.holds, args.hold, args.jitter, args.seed))
+    classify = slow_classifier(args.classifier_cost_us) if args.classifier_cost_us > 0 else detect_gesture_from_landmarks
+
+    t0 = time.perf_counter()
+    plain = [classify(pts, w, h) for pts in stream]
+    t_plain = time.perf_counter() - t0
+
+    cached_fn = CachedClassifier(classify, tolerance_px=args.tolerance, max_entries=args.entries)
+    t0 = time.perf_counter()
+    cached = [cached_fn(pts, w, h) for pts in stream]
+    t_cached = time.perf_counter() - t0
+
+    mismatches = sum(1 for a, b in zip(plain, cached) if a[0] != b[0])
+
+    # same stream again, tracing each reused label back to its source hand
+    sources, results = {}, []
+    traced_fn = CachedClassifier(recording_classifier(classify, sources, results),
+                                 tolerance_px=args.tolerance, max_entries=args.entries)
+    bound = args.tolerance + traced_fn.quantum_px
+    beyond = []
+    for pts, a in zip(stream, plain):
+        b = traced_fn(pts, w, h)
+        if a[0] != b[0]:
+            moved = moved_px(pts, sources[id(b)])
+            if moved > bound:
+                beyond.append(moved)
+    stats = cached_fn.stats()
+    n = len(stream)
+
+    print(f"▶️ {n} frame(s): {args.holds} hold(s) x {args.hold} frame(s), jitter {args.jitter}px, "
+          f"tolerance {args.tolerance}px")
+    print(f"🧠 classifier calls: {stats['misses']} / {n} (hit rate {stats['hit_rate']:.3f})")
+    print(f"🎯 label mismatches vs uncached: {mismatches} ({mismatches / n:.4%}), "
+          f"bound: wrist-relative landmarks within {args.tolerance + cached_fn.quantum_px}px")
+    print(f"⏱  uncached {t_plain / n * 1e6:.2f} µs/hand | cached {t_cached / n * 1e6:.2f} µs/hand")
+    if beyond:
+        print(f"❌ {len(beyond)} label change(s) on hands that moved more than {bound}px from the cached one "
+              f"(up to {max(beyond):.1f}px)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Label flicker and gesture-onset latency: majority vote vs One-Euro filtering.
+
+Usage (from project root):
+    python -m benchmarks.bench_filtering                          # scripted synthetic session, 3 min
+    python -m benchmarks.bench_filtering --jitter 3 --motion 120  # noisier detector, faster hand
+    python -m benchmarks.bench_filtering --log data/logs/session.jsonl   # recorded session (flicker only)
+
+A scripted session is generated: one synthetic hand holds a random
+gesture for --hold-min..--hold-max seconds, morphs into the next one over
+--transition seconds, and drifts around the frame (--motion px
+amplitude) the whole time. Detector noise is per-joint Gaussian jitter
+(--jitter px), rounded to integer pixels like MediaPipe output. The
+noisy session is written as a landmark log and replayed frame by frame
+through `GesturePipeline` in each configuration below.
+
+Ground truth is the rule engine on the noise-free landmarks, so only
+flicker caused by jitter counts. Reported per configuration:
+
+    blips/min           stable-label runs shorter than --blip seconds
+                        (the truth row shows how many are real: brief
+                        intermediate poses while morphing)
+    wrong frames        frames whose stable label differs from the truth
+    onset p50 / p95     time from the start of a true gesture held for at
+                        least --blip seconds until the stable label shows it
+    missed              such gestures the stable label never showed
+
+With --log (no ground truth) blips and label changes per minute are reported.
+
+On the scripted session the run fails (exit 1) unless "one-euro, vote 1"
+keeps blips/min within --max-blip-ratio of the truth row and its onset
+p50 below that of "raw, vote 7 (current)".
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.capture.landmark_log import LandmarkLogWriter, read_landmark_log
+from src.inference.batch_predictor import ID_KEYS, detect_gestures_batch
+from src.inference.pipeline import GesturePipeline
+from src.processing.filters import OneEuroFilterBank
+from src.processing.synthetic import GESTURE_POSES, SyntheticHandGenerator
+
+# (name, one-euro?, smoothing window)
+BASELINE = "raw, vote 7 (current)"
+CANDIDATE = "one-euro, vote 1"
+CONFIGS = [
+    ("raw, vote 1", False, 1),
+    ("raw, vote 2", False, 2),
+    (BASELINE, False, 7),
+    (CANDIDATE, True, 1),
+    ("one-euro, vote 2", True, 2),
+]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark landmark filtering vs label smoothing")
+    parser.add_argument("--log", default=None, help="replay a recorded landmark log instead (no ground truth)")
+    parser.add_argument("--duration", type=float, default=180.0, help="scripted session length (s)")
+    parser.add_argument("--fps", type=float, default=30.0)
+    parser.add_argument("--hold-min", type=float, default=0.8)
+    parser.add_argument("--hold-max", type=float, default=2.5)
+    parser.add_argument("--transition", type=float, default=0.2, help="seconds to morph between gestures")
+    parser.add_argument("--jitter", type=float, default=2.0, help="detector noise per joint (px, std-dev)")
+    parser.add_argument("--motion", type=float, default=60.0, help="wrist drift amplitude (px)")
+    parser.add_argument("--blip", type=float, default=0.25, help="label runs shorter than this count as flicker (s)")
+    parser.add_argument("--min-cutoff", type=float, default=1.0)
+    parser.add_argument("--beta", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-log", default=None, help="keep the generated noisy session here")
+    parser.add_argument("--max-blip-ratio", type=float, default=1.1,
+                        help="one-euro, vote 1 may have at most this many times the truth's blips/min")
+    return parser.parse_args(argv)
+
+
+def scripted_session(args):
+    """
+    Noise-free and noisy (integer) landmarks, (N, 21, 3) each, plus
+    timestamps and image size.
+    """
+    gen = SyntheticHandGenerator(seed=args.seed)
+    rng = gen.rng
+    w, h = gen.config.img_w, gen.config.img_h
+    n = int(args.duration * args.fps)
+    t = np.arange(n) / args.fps
+
+    keys = list(GESTURE_POSES)
+    curls = np.empty((n, 5))
+    pinch = np.empty(n)
+    roll = np.empty(n)
+    yaw = np.empty(n)
+    scale = np.empty(n)
+
+    i, key = 0, rng.choice(keys)
+    prev = None
+    while i < n:
+        target_curls = np.array(GESTURE_POSES[key][0]) + rng.normal(0.0, 0.04, 5)
+        target = (target_curls, GESTURE_POSES[key][1], rng.uniform(-10, 10), rng.uniform(-15, 15), rng.uniform(120, 160))
+        hold = int(rng.uniform(args.hold_min, args.hold_max) * args.fps)
+        trans = int(args.transition * args.fps) if prev is not None else 0
+        end = min(n, i + trans + hold)
+        for j in range(i, end):
+            a = min(1.0, (j - i + 1) / trans) if trans else 1.0
+            src = prev if prev is not None else target
+            curls[j] = (1 - a) * src[0] + a * target[0]
+            pinch[j], roll[j], yaw[j], scale[j] = ((1 - a) * s + a * d for s, d in zip(src[1:], target[1:]))
+        prev, i = target, end
+        key = rng.choice([k for k in keys if k != key])
+
+    phase = rng.uniform(0, 2 * np.pi, 2)
+    wrist = np.stack([
+        w / 2 + args.motion * np.sin(2 * np.pi * 0.2 * t + phase[0]),
+        h * 0.85 + 0.5 * args.motion * np.sin(2 * np.pi * 0.13 * t + phase[1]),
+    ], axis=1)
+    clean = gen.pose(curls, pinch, roll, yaw, scale, wrist)
+    clean[..., :2] = np.rint(clean[..., :2])
+    noisy = clean.copy()
+    noisy[..., :2] = np.rint(clean[..., :2] + rng.normal(0.0, args.jitter, (n, 21, 2)))
+    return clean, noisy, t, (w, h)
+
+
+def runs(labels):
+    """
+    (start, end) index ranges of constant labels.
+    """
+    bounds = [0] + [i for i in range(1, len(labels)) if labels[i] != labels[i - 1]] + [len(labels)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def blips(labels, t, min_s: float) -> int:
+    """
+    Label runs (other than the first and last) shorter than `min_s`.
+    """
+    inner = runs(labels)[1:-1]
+    return sum(t[end] - t[start] < min_s for start, end in inner)
+
+
+def onsets(stable, truth, t, min_s: float):
+    """
+    Latency (s) from the start of each true gesture held for at least
+    `min_s` until the stable label shows it, and how many were never shown.
+    """
+    latencies, missed = [], 0
+    for start, end in runs(truth)[1:]:
+        if t[end - 1] - t[start] < min_s:
+            continue
+        hit = next((j for j in range(start, end) if stable[j] == truth[start]), None)
+        if hit is None:
+            missed += 1
+        else:
+            latencies.append(t[hit] - t[start])
+    return latencies, missed
+
+
+def run_config(frames, one_euro: bool, window: int, args):
+    landmark_filter = OneEuroFilterBank(min_cutoff=args.min_cutoff, beta=args.beta) if one_euro else None
+    pipeline = GesturePipeline(smoothing_window=window, landmark_filter=landmark_filter)
+    t0 = time.perf_counter()
+    stable = [pipeline.step(lf.hands, lf.width, lf.height, t=lf.timestamp).stable_key for lf in frames]
+    return stable, (time.perf_counter() - t0) / max(len(frames), 1) * 1e6
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    truth = None
+    if args.log:
+        log_path = Path(args.log)
+    else:
+        clean, noisy, t, (w, h) = scripted_session(args)
+        ids, _ = detect_gestures_batch(clean, w, h)
+        truth = ID_KEYS[ids].tolist()
+        log_path = Path(args.save_log) if args.save_log else Path(tempfile.mkdtemp()) / "filtering_session.jsonl"
+        with LandmarkLogWriter(log_path, source="bench_filtering") as log:
+            for hand, ts in zip(noisy.astype(np.int64).tolist(), t.tolist()):
+                log.write([[(x, y, float(z)) for x, y, z in hand]], w, h, timestamp=ts)
+
+    frames = list(read_landmark_log(log_path))
+    times = [lf.timestamp for lf in frames]
+    minutes = max(times[-1] - times[0], 1e-9) / 60.0 if frames else 1.0
+    print(f"▶️ {len(frames)} frame(s), {minutes * 60.0:.0f} s from {log_path}")
+    print(f"   One-Euro min_cutoff {args.min_cutoff:g} Hz, beta {args.beta:g}"
+          + (f"; jitter {args.jitter:g} px, motion {args.motion:g} px" if truth is not None else ""))
+    if truth is not None:
+        print(f"   {'config':<24}{'blips/min':>10}{'wrong frames':>14}{'onset p50':>11}{'onset p95':>11}"
+              f"{'missed':>8}{'µs/frame':>10}")
+        truth_rate = blips(truth, times, args.blip) / minutes
+        print(f"   {'truth (noise-free)':<24}{truth_rate:10.1f}")
+    else:
+        print(f"   {'config':<24}{'blips/min':>10}{'changes/min':>13}{'µs/frame':>10}")
+
+    results = {}
+    for name, one_euro, window in CONFIGS:
+        stable, us = run_config(frames, one_euro, window, args)
+        rate = blips(stable, times, args.blip) / minutes
+        if truth is None:
+            print(f"   {name:<24}{rate:10.1f}{(len(runs(stable)) - 1) / minutes:13.1f}{us:10.1f}")
+            continue
+        wrong = np.mean([s != g for s, g in zip(stable, truth)]) * 100.0
+        latencies, missed = onsets(stable, truth, times, args.blip)
+        p50, p95 = (np.percentile(latencies, [50, 95]) * 1000.0) if latencies else (float("nan"),) * 2
+        print(f"   {name:<24}{rate:10.1f}{wrong:13.1f}%{p50:9.0f}ms{p95:9.0f}ms{missed:8d}{us:10.1f}")
+        results[name] = (rate, p50)
+    if truth is None:
+        return
+
+    failures = []
+    rate, p50 = results[CANDIDATE]
+    if not rate <= args.max_blip_ratio * truth_rate:
+        failures.append(f"{CANDIDATE}: {rate:.1f} blips/min, limit {args.max_blip_ratio:g} x truth = "
+                        f"{args.max_blip_ratio * truth_rate:.1f}")
+    if not p50 < results[BASELINE][1]:
+        failures.append(f"{CANDIDATE}: onset p50 {p50:.0f} ms, not below {BASELINE} ({results[BASELINE][1]:.0f} ms)")
+    if failures:
+        for f in failures:
+            print(f"❌ {f}")
+        sys.exit(1)
+    print(f"✅ {CANDIDATE}: flicker within {args.max_blip_ratio:g} x truth, faster onset than {BASELINE}.")
+
+
+if __name__ == "__main__":
+    main()
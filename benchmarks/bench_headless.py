@@ -0,0 +1,98 @@
+"""
+CPU cost of the windowed demo path vs headless event mode.
+
+Usage (from project root):
+    python -m benchmarks.bench_headless                       # synthetic landmark stream
+    python -m benchmarks.bench_headless --log data/logs/session.jsonl
+    python -m benchmarks.bench_headless --show                # include cv2.imshow (needs a display)
+
+Both paths get the same hands (detection is identical in both modes and
+is left out). Windowed = classify + smooth + draw landmarks / text /
+avatar on a camera-sized frame (+ imshow with --show). Headless =
+classify + debounced transitions to a JSONL sink.
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.capture.landmark_log import LandmarkFrame, read_landmark_log
+from src.inference.events import GestureEventTracker, StdoutEventSink
+from src.inference.overlay_inference import load_avatars
+from src.inference.pipeline import GesturePipeline
+from src.inference.predictor import detect_gesture_from_landmarks
+from src.processing.synthetic import SyntheticHandGenerator
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Windowed vs headless CPU benchmark")
+    parser.add_argument("--log", default=None, help="landmark log to use instead of a synthetic stream")
+    parser.add_argument("--frames", type=int, default=3000, help="synthetic frames")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--show", action="store_true", help="include cv2.imshow in the windowed path")
+    return parser.parse_args(argv)
+
+
+def synthetic_frames(n: int, w: int, h: int):
+    gen = SyntheticHandGenerator(seed=0)
+    gen.config.img_w, gen.config.img_h = w, h
+    pts, _ = gen.sample(n // 30 + 1)
+    frames = []
+    for i in range(n):
+        hand = pts[i // 30].tolist()
+        frames.append(LandmarkFrame(i / 30.0, w, h, [[(int(x), int(y), z) for x, y, z in hand]]))
+    return frames
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    frames = list(read_landmark_log(args.log)) if args.log else synthetic_frames(args.frames, args.width, args.height)
+    w, h = frames[0].width, frames[0].height
+    camera_frame = np.full((h, w, 3), 90, dtype=np.uint8)
+
+    pipeline = GesturePipeline(avatars=load_avatars(size=(150, 150)))
+    c0, t0 = time.process_time(), time.perf_counter()
+    for lf in frames:
+        frame = camera_frame.copy()   # stands in for the freshly captured frame
+        result = pipeline.step(lf.hands, lf.width, lf.height)
+        frame = pipeline.render(frame, result)
+        if args.show:
+            cv2.imshow("RT-Gesture3D - Benchmark", frame)
+            cv2.waitKey(1)
+    windowed_cpu, windowed_wall = time.process_time() - c0, time.perf_counter() - t0
+    if args.show:
+        cv2.destroyAllWindows()
+
+    tracker = GestureEventTracker()
+    sink = StdoutEventSink(io.StringIO())
+    c0, t0 = time.process_time(), time.perf_counter()
+    for lf in frames:
+        labels = []
+        for pts in lf.hands:
+            key, _, conf = detect_gesture_from_landmarks(pts, lf.width, lf.height)
+            labels.append((key, conf))
+        for event in tracker.update(labels, now=lf.timestamp):
+            sink.emit(event)
+    headless_cpu, headless_wall = time.process_time() - c0, time.perf_counter() - t0
+
+    n = len(frames)
+    print(f"▶️ {n} frame(s) at {w}x{h}")
+    print(f"🖼  windowed: {windowed_cpu / n * 1e6:8.1f} µs CPU/frame ({n / windowed_wall:,.0f} frames/s)")
+    print(f"📡 headless: {headless_cpu / n * 1e6:8.1f} µs CPU/frame ({n / headless_wall:,.0f} frames/s), "
+          f"{sink.emitted} event(s) instead of {n} per-frame messages")
+    if headless_cpu > 0:
+        print(f"📉 CPU reduction above detection: {windowed_cpu / headless_cpu:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+"""
+Full-frame vs ROI crop-and-redetect hand detection at 1080p and 4K.
+
+Usage (from project root):
+    python -m benchmarks.bench_roi
+    python -m benchmarks.bench_roi --hand-image hand.jpg --hand-px 180 --frames 120
+
+A small hand moves slowly across a large, noisy frame (drawing it is
+not timed). The baseline runs
+the detector on the whole frame every frame (`MediaPipeHandDetector`);
+the ROI path runs `RoiHandDetector`. Reported per resolution: ms per
+frame, pixels handed to the detector per frame (relative to the frame)
+and the share of frames where the hand was found.
+
+With MediaPipe Hands and --hand-image (a photo of one hand), the real
+graphs run on the photo pasted into the frame. Otherwise a stand-in
+detector is used: it does the work MediaPipe does per input pixel
+(optional downscale, BGR→RGB, resize to the model input) and returns the
+known synthetic landmarks when the hand lies inside the image it was
+given, so the ROI bookkeeping, cropping and coordinate mapping are
+measured, but not MediaPipe's own network time.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.detection.roi import RoiHandDetector
+from src.processing.synthetic import SyntheticHandGenerator
+
+RESOLUTIONS = {"1080p": (1920, 1080), "4k": (3840, 2160)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark full-frame vs ROI hand detection")
+    parser.add_argument("--resolutions", nargs="*", default=list(RESOLUTIONS), choices=list(RESOLUTIONS))
+    parser.add_argument("--frames", type=int, default=60, help="frames per run")
+    parser.add_argument("--hand-px", type=int, default=120, help="hand size (wrist → fingertip) in pixels")
+    parser.add_argument("--hand-image", default=None, help="photo of a hand (enables the real MediaPipe graphs)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+class StandInDetector:
+    """
+    MediaPipe stand-in: per-pixel preprocessing cost, known answer.
+
+    The answer is found from where the input image lives inside the
+    benchmark frame (crops are NumPy views), so only views and the full
+    frame can be "detected"; resized crops return no hand.
+    """
+
+    def __init__(self, scene: dict, model_input: int = 224) -> None:
+        self.scene = scene                # {"frame": current frame, "hands": its landmarks in frame pixels}
+        self.model_input = model_input
+        self.inference_scale = 1.0
+
+    def configure(self, **settings) -> None:
+        for name, value in settings.items():
+            setattr(self, name, value)
+
+    def detect(self, image):
+        small = image
+        if self.inference_scale != 1.0:
+            small = cv2.resize(image, None, fx=self.inference_scale, fy=self.inference_scale, interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+        cv2.resize(rgb, (self.model_input, self.model_input), interpolation=cv2.INTER_LINEAR)
+
+        frame, hands = self.scene["frame"], self.scene["hands"]
+        offset = image.__array_interface__["data"][0] - frame.__array_interface__["data"][0]
+        if not 0 <= offset < frame.nbytes or image.strides != frame.strides:
+            return []
+        y0, rest = divmod(offset, frame.strides[0])
+        x0 = rest // frame.strides[1]
+        h, w = image.shape[:2]
+        out = []
+        for pts in hands:
+            xs, ys = [p[0] - x0 for p in pts], [p[1] - y0 for p in pts]
+            if min(xs) >= 0 and min(ys) >= 0 and max(xs) < w and max(ys) < h:
+                # MediaPipe's z is in units of the input image width
+                out.append([(x, y, z * frame.shape[1] / w) for x, y, (_, _, z) in zip(xs, ys, pts)])
+        return out
+
+    def close(self) -> None:
+        pass
+
+
+def make_scene(size, n, args, hand_image=None):
+    """
+    Background frame plus, per frame, one hand drifting slowly across it
+    (landmarks in frame pixels).
+    """
+    w, h = size
+    rng = np.random.default_rng(args.seed)
+    background = rng.integers(40, 90, size=(h, w, 3), dtype=np.uint8)
+    base, _ = SyntheticHandGenerator(seed=args.seed).sample(1, gestures=["stop"])
+    rel = base[0].copy()
+    rel[:, :2] = (rel[:, :2] - rel[0, :2]) / np.ptp(rel[:, 1]) * args.hand_px * 0.9
+    truth = []
+    for i in range(n):
+        cx, cy = w * (0.3 + 0.4 * i / max(n - 1, 1)), h * 0.6
+        truth.append([[(int(x + cx), int(y + cy), float(z)) for x, y, z in rel.tolist()]])
+    patch = None
+    if hand_image is not None:
+        hh, hw = hand_image.shape[:2]
+        patch = cv2.resize(hand_image, (max(int(hw * args.hand_px / hh), 1), args.hand_px))
+    return background, truth, patch
+
+
+def render(frame, background, hands, patch, hand_px):
+    """
+    Draw the hand into `frame` (untimed).
+    """
+    np.copyto(frame, background)
+    for hand in hands:
+        if patch is not None:
+            x0 = max(hand[0][0] - patch.shape[1] // 2, 0)
+            y0 = max(hand[0][1] - hand_px, 0)
+            frame[y0:y0 + patch.shape[0], x0:x0 + patch.shape[1]] = patch[: frame.shape[0] - y0, : frame.shape[1] - x0]
+        else:
+            for x, y, _ in hand:
+                cv2.circle(frame, (x, y), max(hand_px // 40, 2), (200, 170, 150), -1)
+
+
+def run(detect, background, truth, patch, args, scene):
+    frame = background.copy()
+    found = 0
+    elapsed = 0.0
+    for hands in truth:
+        render(frame, background, hands, patch, args.hand_px)
+        scene["frame"], scene["hands"] = frame, hands
+        t0 = time.perf_counter()
+        found += bool(detect(frame))
+        elapsed += time.perf_counter() - t0
+    return elapsed / len(truth) * 1000.0, found / len(truth)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    hand_image = cv2.imread(args.hand_image) if args.hand_image else None
+    real = False
+    if hand_image is not None:
+        try:
+            from src.detection.mediapipe_wrapper import MediaPipeHandDetector
+
+            MediaPipeHandDetector(max_num_hands=1).close()
+            real = True
+        except Exception as e:  # mediapipe missing or without the solutions API
+            print(f"⚠️ MediaPipe Hands unavailable ({e}); using the stand-in detector")
+    elif args.hand_image:
+        raise SystemExit(f"❌ Could not read {args.hand_image}")
+
+    print(f"▶️ Detector: {'MediaPipe' if real else 'stand-in (preprocessing cost only)'}, "
+          f"hand {args.hand_px}px, {args.frames} frames per run")
+    for name in args.resolutions:
+        size = RESOLUTIONS[name]
+        background, truth, patch = make_scene(size, args.frames, args, hand_image if real else None)
+
+        scene = {"frame": None, "hands": []}
+        if real:
+            full = MediaPipeHandDetector(max_num_hands=1)
+            roi = RoiHandDetector(max_num_hands=1)
+        else:
+            full = StandInDetector(scene)
+            roi = RoiHandDetector(max_num_hands=1, proposer=StandInDetector(scene), refiner=StandInDetector(scene))
+
+        full_ms, full_found = run(full.detect, background, truth, patch, args, scene)
+        roi_ms, roi_found = run(roi.detect, background, truth, patch, args, scene)
+        stats = roi.stats()
+        full.close()
+        roi.close()
+
+        print(f"📐 {name} ({size[0]}x{size[1]})")
+        print(f"   🔴 full frame: {full_ms:7.2f} ms/frame, pixels 100.0%, hand found {full_found:.0%}")
+        print(f"   🟢 ROI       : {roi_ms:7.2f} ms/frame, pixels {stats['pixel_ratio']:.1%}, hand found {roi_found:.0%} "
+              f"({stats['proposal_passes']} proposal pass(es), {stats['crops']} crop(s), {stats['lost']} lost)")
+        if roi_ms > 0:
+            print(f"   📉 speed-up: {full_ms / roi_ms:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
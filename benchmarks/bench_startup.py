@@ -0,0 +1,188 @@
+"""
+Time to first prediction: serial vs parallel warm start.
+
+Usage (from project root):
+    python -m benchmarks.bench_startup                        # synthetic source, 5 runs per mode
+    python -m benchmarks.bench_startup --source 0 --runs 10   # real camera
+    python -m benchmarks.bench_startup --no-history           # don't append to data/benchmarks/startup.jsonl
+
+Every run is a fresh Python process (so imports count) doing what the
+live demo does before its first prediction: open the source, import
+MediaPipe and build + warm up the detector, load the avatars, then read
+one frame, detect and classify it. `serial` runs the startup tasks one
+after another (`--serial-startup`), `parallel` uses `WarmStart`.
+
+Reported per mode: median / min / max time to first prediction, from
+`WarmStart()` and from process start. Medians are appended to
+data/benchmarks/startup.jsonl (gitignored) and compared with the
+previous entry, so regressions show up run over run.
+
+Without MediaPipe Hands (or with --stand-in) the detector is a stand-in
+that sleeps --stand-in-build-ms to build and --stand-in-first-ms on its
+first call (lazy initialisation); with a synthetic source, opening it
+sleeps --stand-in-open-ms like a camera negotiating its format. Sleeps
+release the GIL, as MediaPipe's graph setup and camera I/O do.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.inference.startup import WarmStart, warm_detector
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark time to first prediction")
+    parser.add_argument("--source", default="synthetic", help="frame source spec (see --source of the demo)")
+    parser.add_argument("--runs", type=int, default=5, help="fresh processes per mode")
+    parser.add_argument("--stand-in", action="store_true", help="use the stand-in detector even if MediaPipe works")
+    parser.add_argument("--stand-in-build-ms", type=float, default=300.0)
+    parser.add_argument("--stand-in-first-ms", type=float, default=120.0)
+    parser.add_argument("--stand-in-open-ms", type=float, default=250.0)
+    parser.add_argument("--no-history", action="store_true")
+    parser.add_argument("--child", choices=["serial", "parallel"], default=None, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+class StandInDetector:
+    """
+    Sleeps instead of building / initialising a MediaPipe graph.
+    """
+
+    def __init__(self, build_ms: float, first_ms: float) -> None:
+        time.sleep(build_ms / 1000.0)
+        self.first_ms = first_ms
+
+    def detect(self, frame):
+        if self.first_ms:
+            time.sleep(self.first_ms / 1000.0)
+            self.first_ms = 0.0
+        return []
+
+    def close(self) -> None:
+        pass
+
+
+def _open_source(args):
+    from src.capture.sources import CaptureSettings, open_source
+
+    if args.source.startswith("synthetic") and args.stand_in_open_ms:
+        time.sleep(args.stand_in_open_ms / 1000.0)
+    return open_source(args.source, CaptureSettings(), prefetch=False, realtime=False)
+
+
+def _make_detector(args):
+    if not args.stand_in:
+        try:
+            from src.detection.mediapipe_wrapper import MediaPipeHandDetector
+
+            return MediaPipeHandDetector(max_num_hands=1)
+        except Exception:   # mediapipe missing or without the solutions API
+            pass
+    return StandInDetector(args.stand_in_build_ms, args.stand_in_first_ms)
+
+
+def _load_avatars():
+    from src.inference.overlay_inference import load_avatars
+
+    return load_avatars(size=(150, 150))
+
+
+def child(args) -> None:
+    """
+    One startup in this process; prints the WarmStart report as JSON.
+    """
+    import contextlib
+    import io
+
+    startup = WarmStart(parallel=args.child == "parallel")
+    with contextlib.redirect_stdout(io.StringIO()):      # keep load_avatars quiet
+        startup.submit("source", _open_source, args)
+        startup.submit("detector", warm_detector, lambda: _make_detector(args), (480, 640, 3))
+        startup.submit("avatars", _load_avatars)
+        source, detector = startup.get("source"), startup.get("detector")
+        startup.wait()
+
+    from src.inference.pipeline import GesturePipeline
+
+    pipeline = GesturePipeline(avatars=startup.get("avatars"))
+    captured = source.next_frame()
+    if captured is None:
+        raise SystemExit(f"❌ Could not read from {args.source}")
+    startup.first_frame()
+    h, w = captured.image.shape[:2]
+    pipeline.step(detector.detect(captured.image), w, h)
+    startup.first_prediction()
+
+    report = startup.report()
+    report["detector"] = type(detector).__name__
+    source.close()
+    detector.close()
+    print(json.dumps(report))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.child:
+        child(args)
+        return
+
+    base = [sys.executable, "-m", "benchmarks.bench_startup", "--source", args.source,
+            "--stand-in-build-ms", str(args.stand_in_build_ms), "--stand-in-first-ms", str(args.stand_in_first_ms),
+            "--stand-in-open-ms", str(args.stand_in_open_ms)] + (["--stand-in"] if args.stand_in else [])
+    results = {}
+    detector = "?"
+    for mode in ("serial", "parallel"):
+        reports = []
+        for _ in range(args.runs):
+            out = subprocess.run(base + ["--child", mode], cwd=PROJECT_ROOT, capture_output=True, text=True)
+            if out.returncode != 0:
+                raise SystemExit(f"❌ {mode} run failed:\n{out.stderr.strip()}")
+            reports.append(json.loads(out.stdout.strip().splitlines()[-1]))
+        detector = reports[0]["detector"]
+        results[mode] = reports
+
+    print(f"▶️ {args.runs} fresh process(es) per mode, source {args.source}, detector {detector}")
+    summary = {}
+    for mode, reports in results.items():
+        ttfp = [r["first_prediction_ms"] for r in reports]
+        proc = [r["process_ms"] for r in reports if r["process_ms"] is not None]
+        tasks = {name: statistics.median(r["tasks"][name]["ms"] for r in reports) for name in reports[0]["tasks"]}
+        summary[mode] = {
+            "first_prediction_ms": statistics.median(ttfp),
+            "process_ms": statistics.median(proc) if proc else None,
+        }
+        since_start = f", {summary[mode]['process_ms']:.0f} ms since process start" if proc else ""
+        print(f"   {mode:<8} first prediction: median {statistics.median(ttfp):6.0f} ms "
+              f"(min {min(ttfp):.0f}, max {max(ttfp):.0f}){since_start}")
+        print(f"            tasks: " + ", ".join(f"{k} {v:.0f} ms" for k, v in tasks.items()))
+    if summary["parallel"]["first_prediction_ms"] > 0:
+        print(f"   📉 speed-up: {summary['serial']['first_prediction_ms'] / summary['parallel']['first_prediction_ms']:.2f}x")
+
+    if not args.no_history:
+        history = PROJECT_ROOT / "data" / "benchmarks" / "startup.jsonl"
+        history.parent.mkdir(parents=True, exist_ok=True)
+        previous = None
+        if history.exists():
+            lines = [json.loads(line) for line in history.read_text(encoding="utf-8").splitlines() if line.strip()]
+            same = [e for e in lines if e["source"] == args.source and e["detector"] == detector]
+            previous = same[-1] if same else None
+        entry = {"time": time.time(), "source": args.source, "detector": detector, "runs": args.runs, **summary}
+        with open(history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        if previous is not None:
+            before, now = previous["parallel"]["first_prediction_ms"], summary["parallel"]["first_prediction_ms"]
+            print(f"   🕒 vs previous run: {before:.0f} → {now:.0f} ms ({(now - before) / before * 100.0:+.1f}%)")
+        print(f"📝 History: {history}")
+
+
+if __name__ == "__main__":
+    main()
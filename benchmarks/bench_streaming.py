@@ -0,0 +1,125 @@
+"""
+Streaming (carried hidden state) vs sliding-window re-inference for temporal ONNX models.
+
+Usage (from project root):
+    python -m benchmarks.bench_streaming                                  # untrained GRU stand-in
+    python -m benchmarks.bench_streaming --streams 1 4 16 64 --window 30
+    python -m benchmarks.bench_streaming --model models/checkpoints/gesture_gru.onnx
+
+Without --model an untrained GRU (--hidden, --layers) is exported to a
+temporary folder with `src/training/export_temporal.py`; cost does not
+depend on the weights. For every stream count S, --frames frames of
+synthetic hand features (S hands per frame) go through:
+
+    streaming   StreamingOnnxModel: one session call per frame, one GRU step per hand
+    windowed    WindowedOnnxModel: last --window frames per hand, re-run every frame
+
+Reported: ms per frame (p50 / p99) and hands per second for both, and
+the speed-up. Before timing, outputs of both are compared over the
+first --window frames (identical history, so they must agree), and a
+track loss is simulated to check that a re-appearing stream starts from
+zero state.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.inference.mapping import GESTURES
+from src.inference.streaming_onnx import StreamingOnnxModel, WindowedOnnxModel
+from src.processing.preprocess import FEATURE_DIM, hand_features_batch
+from src.processing.synthetic import SyntheticHandGenerator
+from src.training.export_temporal import export_gru, random_gru_weights
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs windowed temporal inference")
+    parser.add_argument("--model", default=None, help="temporal ONNX model (default: untrained GRU stand-in)")
+    parser.add_argument("--hidden", type=int, default=64)
+    parser.add_argument("--layers", type=int, default=1)
+    parser.add_argument("--window", type=int, default=30, help="sliding window length (frames)")
+    parser.add_argument("--streams", type=int, nargs="*", default=[1, 4, 16], help="concurrent hands / streams")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per stream count")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def feature_stream(n_frames: int, n_streams: int, seed: int) -> np.ndarray:
+    """
+    (n_frames, n_streams, FEATURE_DIM) features of synthetic hands.
+    """
+    gen = SyntheticHandGenerator(seed=seed)
+    pts, _ = gen.sample(n_frames * n_streams)
+    return hand_features_batch(pts, gen.config.img_w).reshape(n_frames, n_streams, FEATURE_DIM)
+
+
+def check(model_path: Path, window: int, seed: int) -> None:
+    feats = feature_stream(window, 3, seed)
+    streaming = StreamingOnnxModel(model_path, max_streams=4)
+    windowed = WindowedOnnxModel(model_path, window=window)
+    streams = ["a", "b", "c"]
+    diff = 0.0
+    for t in range(window):
+        diff = max(diff, float(np.abs(streaming.step(streams, feats[t], t=t * 0.033)
+                                      - windowed.step(streams, feats[t], t=t * 0.033)).max()))
+    print(f"🔎 streaming vs windowed over the first {window} frames: max |Δp| = {diff:.2e}")
+    if diff > 1e-4:
+        raise SystemExit("❌ Streaming and windowed outputs disagree")
+
+    # track loss: stream "a" disappears for longer than the timeout, then returns
+    fresh = StreamingOnnxModel(model_path, max_streams=4)
+    back = streaming.step(["a"], feats[0, :1], t=window * 0.033 + 10.0)
+    first = fresh.step(["a"], feats[0, :1], t=0.0)
+    if float(np.abs(back - first).max()) > 1e-5:
+        raise SystemExit("❌ A stream returning after track loss kept its old state")
+    print("🔎 track loss: returning stream restarts from zero state ✅")
+
+
+def time_model(model, feats: np.ndarray) -> np.ndarray:
+    streams = list(range(feats.shape[1]))
+    samples = np.empty(len(feats))
+    for t, frame in enumerate(feats):
+        t0 = time.perf_counter()
+        model.step(streams, frame, t=t * 0.033)
+        samples[t] = time.perf_counter() - t0
+    return samples
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.model:
+        model_path = Path(args.model)
+        label = model_path.name
+    else:
+        model_path = Path(tempfile.mkdtemp()) / "gesture_gru.onnx"
+        classes = list(GESTURES)
+        export_gru(model_path, classes, random_gru_weights(FEATURE_DIM, args.hidden, len(classes), args.layers, args.seed))
+        label = f"untrained GRU {args.layers} x {args.hidden}"
+
+    print(f"▶️ {label}, window {args.window} frames, {args.frames} timed frames per stream count")
+    check(model_path, args.window, args.seed)
+
+    print(f"   {'streams':>7}  {'streaming p50 / p99 (ms)':>26}  {'windowed p50 / p99 (ms)':>25}  {'hands/s':>17}  speed-up")
+    for n in args.streams:
+        # warm-up frames fill the windows, so every timed windowed call runs the full window
+        feats = feature_stream(args.window + args.frames, n, args.seed + n)
+        results = []
+        for model in (StreamingOnnxModel(model_path, max_streams=max(n, 1)), WindowedOnnxModel(model_path, window=args.window)):
+            time_model(model, feats[:args.window])
+            results.append(time_model(model, feats[args.window:]) * 1000.0)
+        (s50, s99), (w50, w99) = (np.percentile(r, [50, 99]) for r in results)
+        rates = [n * len(r) / (r.sum() / 1000.0) for r in results]
+        print(f"   {n:7d}  {s50:12.3f} / {s99:<11.3f}  {w50:11.3f} / {w99:<11.3f}  "
+              f"{rates[0]:8.0f} / {rates[1]:<7.0f}  {w50 / s50:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
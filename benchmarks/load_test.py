@@ -0,0 +1,172 @@
+"""
+Load / correctness test for the gesture classifiers on synthetic hands.
+
+Usage (from project root):
+    python -m benchmarks.load_test
+    python -m benchmarks.load_test --hands 5000000 --chunk 200000 --scalar-hands 500000
+    python -m benchmarks.load_test --json load_test.json
+
+Drives the scalar rule engine (`detect_gesture_from_landmarks`) and the
+vectorized batch backend with hands from `SyntheticHandGenerator`, and
+reports throughput, allocation counts and label agreement (with the
+intended gesture and between the two backends).
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.inference.batch_predictor import ID_KEYS, detect_gestures_batch
+from src.inference.predictor import detect_gesture_from_landmarks
+from src.processing.synthetic import SyntheticHandConfig, SyntheticHandGenerator
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Synthetic-hand load test for gesture classifiers")
+    parser.add_argument("--hands", type=int, default=2_000_000, help="hands for the batch backend")
+    parser.add_argument("--scalar-hands", type=int, default=200_000, help="hands for the scalar rule engine")
+    parser.add_argument("--chunk", type=int, default=100_000, help="hands generated / classified per batch")
+    parser.add_argument("--img-w", type=int, default=640)
+    parser.add_argument("--img-h", type=int, default=480)
+    parser.add_argument("--jitter", type=float, default=1.5, help="per-joint jitter (px)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", metavar="PATH", default=None, help="also write the report as JSON")
+    return parser.parse_args(argv)
+
+
+def _gen0_collections() -> int:
+    return gc.get_stats()[0]["collections"]
+
+
+def _scalar_keys(pts: np.ndarray, img_w: int, img_h: int) -> np.ndarray:
+    hands = pts.tolist()
+    return np.array([detect_gesture_from_landmarks(h, img_w, img_h)[0] for h in hands], dtype=object)
+
+
+def _allocations(fn, *args) -> dict:
+    """
+    Allocation profile of one call: peak traced bytes and live blocks created.
+    """
+    gc.collect()
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    blocks_after = sys.getallocatedblocks()
+    tracemalloc.stop()
+    return {"peak_bytes": peak, "net_blocks": blocks_after - blocks_before}
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    cfg = SyntheticHandConfig(img_w=args.img_w, img_h=args.img_h, jitter_px=args.jitter)
+    gen = SyntheticHandGenerator(cfg, seed=args.seed)
+
+    total = max(args.hands, args.scalar_hands)
+    print(f"▶️ Load test: {args.hands} batch hand(s), {args.scalar_hands} scalar hand(s), chunk={args.chunk}")
+
+    t_gen = t_batch = t_scalar = 0.0
+    n_batch = n_scalar = 0
+    batch_ok = scalar_ok = backends_agree = 0
+    gc_batch = gc_scalar = 0
+    per_class = {}
+
+    done = 0
+    while done < total:
+        n = min(args.chunk, total - done)
+
+        t0 = time.perf_counter()
+        pts, labels = gen.sample(n)
+        t_gen += time.perf_counter() - t0
+
+        batch_keys = None
+        if done < args.hands:
+            m = min(n, args.hands - done)
+            g0 = _gen0_collections()
+            t0 = time.perf_counter()
+            ids, _ = detect_gestures_batch(pts[:m], args.img_w, args.img_h)
+            t_batch += time.perf_counter() - t0
+            gc_batch += _gen0_collections() - g0
+
+            batch_keys = ID_KEYS[ids]
+            hit = batch_keys == labels[:m]
+            batch_ok += int(hit.sum())
+            n_batch += m
+            for key in np.unique(labels[:m]):
+                sel = labels[:m] == key
+                c = per_class.setdefault(key, [0, 0])
+                c[0] += int(hit[sel].sum())
+                c[1] += int(sel.sum())
+
+        if done < args.scalar_hands:
+            m = min(n, args.scalar_hands - done)
+            g0 = _gen0_collections()
+            t0 = time.perf_counter()
+            scalar_keys = _scalar_keys(pts[:m], args.img_w, args.img_h)
+            t_scalar += time.perf_counter() - t0
+            gc_scalar += _gen0_collections() - g0
+
+            scalar_ok += int((scalar_keys == labels[:m]).sum())
+            n_scalar += m
+            if batch_keys is not None:
+                k = min(m, len(batch_keys))
+                backends_agree += int((scalar_keys[:k] == batch_keys[:k]).sum())
+
+        done += n
+
+    probe, _ = gen.sample(min(args.chunk, 10_000))
+    alloc_batch = _allocations(detect_gestures_batch, probe, args.img_w, args.img_h)
+    alloc_scalar = _allocations(_scalar_keys, probe, args.img_w, args.img_h)
+
+    report = {
+        "generator": {"hands": total, "hands_per_s": total / t_gen if t_gen else 0.0},
+        "batch": {
+            "hands": n_batch,
+            "seconds": t_batch,
+            "hands_per_s": n_batch / t_batch if t_batch else 0.0,
+            "label_agreement": batch_ok / n_batch if n_batch else 0.0,
+            "gc_gen0_collections": gc_batch,
+            "alloc_probe": {"hands": len(probe), **alloc_batch},
+        },
+        "scalar": {
+            "hands": n_scalar,
+            "seconds": t_scalar,
+            "hands_per_s": n_scalar / t_scalar if t_scalar else 0.0,
+            "label_agreement": scalar_ok / n_scalar if n_scalar else 0.0,
+            "gc_gen0_collections": gc_scalar,
+            "alloc_probe": {"hands": len(probe), **alloc_scalar},
+        },
+        "scalar_vs_batch_agreement": backends_agree / min(n_scalar, n_batch) if min(n_scalar, n_batch) else 0.0,
+        "per_class_agreement": {k: ok / n for k, (ok, n) in sorted(per_class.items())},
+    }
+
+    print(f"🧪 generator : {report['generator']['hands_per_s']:>14,.0f} hands/s")
+    for name in ("batch", "scalar"):
+        r = report[name]
+        print(
+            f"⚡ {name:<9}: {r['hands_per_s']:>14,.0f} hands/s | agreement {r['label_agreement']:.4f} | "
+            f"gen0 GCs {r['gc_gen0_collections']} | probe peak {r['alloc_probe']['peak_bytes'] / 1024:.0f} KiB "
+            f"for {r['alloc_probe']['hands']} hands"
+        )
+    print(f"🤝 scalar vs batch agreement: {report['scalar_vs_batch_agreement']:.6f}")
+    print("Per-class agreement (batch):")
+    for key, value in report["per_class_agreement"].items():
+        print(f"  {key:<8} {value:.4f}")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+        print(f"💾 Report written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+"""
+Soak test: run the pipeline for hours at full speed and watch for drift.
+
+Usage (from project root):
+    python -m benchmarks.soak_test --duration 2h                            # synthetic hands
+    python -m benchmarks.soak_test --log data/logs/session.jsonl --duration 8h --sample-every 5m
+    python -m benchmarks.soak_test --duration 10m --templates data/templates/custom --cache-tolerance 3
+    python -m benchmarks.soak_test --duration 30m --no-tracemalloc          # latency without tracing overhead
+
+Every frame goes through the same stages as the kiosk demo above
+detection: classify → smooth → render onto a frame from the synthetic
+source → debounced events → sequence matcher / analytics (when
+enabled). Hands come from a landmark log (looped) or the synthetic hand
+generator. MediaPipe is not part of the loop (its graphs are native
+code and out of reach of tracemalloc anyway).
+
+On a schedule (`--sample-every`) the harness records RSS, the memory
+traced by `tracemalloc`, throughput and the p50 / p99 frame latency of
+the last interval, and diffs a `tracemalloc` snapshot against the one
+taken after warm-up, printing the allocation sites that grew the most.
+
+At the end, a straight line is fitted to the post-warm-up samples. The
+run fails (exit code 1) when
+
+    RSS or traced memory grows faster than --max-rss-growth / --max-traced-growth (MB per hour), or
+    the fitted p99 latency rises by more than --max-p99-drift percent over the run.
+
+Memory trends only count once the fitted growth over the measured span
+exceeds --noise-floor MB, and the p99 drift once the fitted rise exceeds
+--p99-floor ms, so allocator and scheduler jitter in a short run is not
+extrapolated into a failure.
+
+With tracemalloc on, the trends start after the first snapshot diff,
+and only traced memory is gated: the snapshots and their diffs grow RSS
+by several MB over the first few samples (the harness, not the
+pipeline), so the RSS trend is reported but only fails the run with
+--no-tracemalloc. RSS is recorded net of tracemalloc's own bookkeeping
+(`get_tracemalloc_memory`).
+
+A JSON report with all samples is written to data/soak/.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from src.capture.landmark_log import read_landmark_log
+from src.capture.sources import SyntheticSource
+from src.inference.cache import CachedClassifier
+from src.inference.events import GestureEventTracker, StdoutEventSink
+from src.inference.metrics import process_rss_bytes
+from src.inference.overlay_inference import load_avatars
+from src.inference.pipeline import GesturePipeline
+from src.inference.predictor import detect_gesture_from_landmarks
+from src.inference.template_matcher import load_templates
+from src.processing.synthetic import SyntheticHandGenerator
+
+MB = 1024.0 * 1024.0
+
+
+def parse_duration(spec: str) -> float:
+    """
+    "90", "90s", "30m", "2h" → seconds.
+    """
+    units = {"s": 1.0, "m": 60.0, "h": 3600.0}
+    if spec and spec[-1] in units:
+        return float(spec[:-1]) * units[spec[-1]]
+    return float(spec)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Long-running soak test with memory / latency drift detection")
+    parser.add_argument("--log", default=None, help="landmark log to loop (default: synthetic hands)")
+    parser.add_argument("--duration", type=parse_duration, default=parse_duration("10m"), help="e.g. 30m, 2h, 8h")
+    parser.add_argument("--sample-every", type=parse_duration, default=None,
+                        help="sampling interval (default: duration / 40, at least 5s)")
+    parser.add_argument("--warmup", type=parse_duration, default=None,
+                        help="time excluded from the trends (default: two sampling intervals)")
+    parser.add_argument("--width", type=int, default=640)
+    parser.add_argument("--height", type=int, default=480)
+    parser.add_argument("--templates", metavar="PATH", default=None)
+    parser.add_argument("--cache-tolerance", type=float, default=0.0, metavar="PX")
+    parser.add_argument("--sequences", metavar="FILE", default=None, help="also run the sequence matcher")
+    parser.add_argument("--analytics", metavar="DIR", default=None, help="also write the Parquet analytics log")
+    parser.add_argument("--no-render", action="store_true", help="skip the overlay stage")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="RSS only (no tracing overhead)")
+    parser.add_argument("--top", type=int, default=5, help="allocation sites shown per snapshot diff")
+    parser.add_argument("--max-rss-growth", type=float, default=8.0, metavar="MB_PER_H")
+    parser.add_argument("--max-traced-growth", type=float, default=2.0, metavar="MB_PER_H")
+    parser.add_argument("--noise-floor", type=float, default=2.0, metavar="MB",
+                        help="ignore memory trends whose total fitted growth is below this")
+    parser.add_argument("--max-p99-drift", type=float, default=25.0, metavar="PCT")
+    parser.add_argument("--p99-floor", type=float, default=0.25, metavar="MS",
+                        help="ignore p99 drifts whose fitted rise over the run is below this")
+    parser.add_argument("--out", default=None, help="report path (default: data/soak/soak_<stamp>.json)")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def hand_stream(args):
+    """
+    Endless (hands, w, h) tuples: the log looped, or synthetic gestures held ~1 s each.
+    """
+    if args.log:
+        frames = [(lf.hands, lf.width, lf.height) for lf in read_landmark_log(args.log)]
+        if not frames:
+            raise SystemExit(f"❌ No frames in {args.log}")
+        while True:
+            yield from frames
+    gen = SyntheticHandGenerator(seed=args.seed)
+    gen.config.img_w, gen.config.img_h = args.width, args.height
+    while True:
+        pts, _ = gen.sample(64)
+        for hand in pts.tolist():
+            hands = [[(int(x), int(y), z) for x, y, z in hand]]
+            for _ in range(30):
+                yield hands, args.width, args.height
+            for _ in range(5):
+                yield [], args.width, args.height
+
+
+def fit_slope(xs, ys) -> float:
+    """
+    Least-squares slope of ys over xs (0 with fewer than 3 points).
+    """
+    if len(xs) < 3:
+        return 0.0
+    return float(np.polyfit(np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64), 1)[0])
+
+
+def top_growth(snapshot, baseline, n: int):
+    # compare_to sorts by absolute size_diff: shrinking sites would hide growing ones
+    stats = sorted(snapshot.compare_to(baseline, "lineno"), key=lambda s: s.size_diff, reverse=True)
+    out = []
+    for stat in stats[:n]:
+        if stat.size_diff <= 0:
+            break
+        frame = stat.traceback[0]
+        out.append({
+            "site": f"{os.path.relpath(frame.filename, PROJECT_ROOT)}:{frame.lineno}",
+            "size_diff_kb": round(stat.size_diff / 1024.0, 1),
+            "count_diff": stat.count_diff,
+        })
+    return out
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sample_every = args.sample_every or max(args.duration / 40.0, 5.0)
+    warmup = args.warmup if args.warmup is not None else 2 * sample_every
+
+    classifier = detect_gesture_from_landmarks
+    if args.templates:
+        classifier = load_templates(args.templates)
+    if args.cache_tolerance > 0:
+        classifier = CachedClassifier(classifier, tolerance_px=args.cache_tolerance)
+    render = not args.no_render
+    pipeline = GesturePipeline(classifier=classifier, avatars=load_avatars(size=(150, 150)) if render else {})
+    source = SyntheticSource(args.width, args.height, realtime=False)
+    tracker = GestureEventTracker()
+    sink = StdoutEventSink(open(os.devnull, "w", encoding="utf-8"))
+    sequences = analytics = None
+    if args.sequences:
+        from src.inference.sequences import SequenceMatcher, compile_patterns, load_sequence_file
+
+        sequences = SequenceMatcher(compile_patterns(load_sequence_file(args.sequences)))
+    if args.analytics:
+        from src.inference.analytics import AnalyticsSink
+
+        analytics = AnalyticsSink(args.analytics, kiosk="soak")
+
+    trace = not args.no_tracemalloc
+    if trace:
+        tracemalloc.start()
+
+    hands_iter = hand_stream(args)
+    # latencies of the current interval, preallocated so the harness itself does not grow
+    window = np.zeros(1 << 20, dtype=np.float64)
+    n_window = 0
+    samples = []
+    baseline = None
+    compared = False          # first snapshot diff done: trends start at the next sample
+    frames_total = 0
+    sim_t = time.time()
+
+    print(f"▶️ Soak test: {args.duration / 60:.1f} min, sample every {sample_every:.0f}s, warm-up {warmup:.0f}s, "
+          f"{'log ' + args.log if args.log else 'synthetic hands'}, tracemalloc {'on' if trace else 'off'}")
+    print(f"{'elapsed':>8} {'frames/s':>9} {'p50 ms':>7} {'p99 ms':>7} {'RSS MB':>8} {'traced MB':>10}")
+
+    t_start = time.perf_counter()
+    t_next = t_start + sample_every
+    t_interval = t_start
+    frames_interval = 0
+    try:
+        while True:
+            hands, w, h = next(hands_iter)
+            captured = source.next_frame()
+            t0 = time.perf_counter()
+            result = pipeline.step(hands, w, h)
+            if render:
+                pipeline.render(captured.image, result)
+            labels = [(result.gesture_key, result.confidence)] if hands else []
+            sim_t += 1.0 / 30.0       # event timestamps advance like a 30 fps camera
+            for event in tracker.update(labels, now=sim_t):
+                sink.emit(event)
+                if sequences is not None:
+                    for match in sequences.feed(event):
+                        sink.emit(match)
+                if analytics is not None:
+                    analytics.emit(event)
+            t1 = time.perf_counter()
+            if n_window < len(window):
+                window[n_window] = t1 - t0
+                n_window += 1
+            frames_interval += 1
+
+            if t1 < t_next:
+                continue
+
+            # ---------- sample ----------
+            elapsed = t1 - t_start
+            lat = window[:n_window]
+            traced = tracemalloc.get_traced_memory()[0] / MB if trace else 0.0
+            tracing = tracemalloc.get_tracemalloc_memory() / MB if trace else 0.0
+            sample = {
+                "elapsed_s": round(elapsed, 1),
+                "frames": frames_total + frames_interval,
+                "fps": round(frames_interval / (t1 - t_interval), 1),
+                "p50_ms": round(float(np.percentile(lat, 50)) * 1000.0, 4),
+                "p99_ms": round(float(np.percentile(lat, 99)) * 1000.0, 4),
+                "rss_mb": round(process_rss_bytes() / MB - tracing, 2),
+                "tracing_mb": round(tracing, 2),
+                "traced_mb": round(traced, 3),
+                "warmup": elapsed < warmup,
+            }
+            sample["trend"] = not sample["warmup"] and (compared or not trace)
+            print(f"{elapsed / 60:7.1f}m {sample['fps']:9.0f} {sample['p50_ms']:7.3f} {sample['p99_ms']:7.3f} "
+                  f"{sample['rss_mb']:8.1f} {sample['traced_mb']:10.3f}")
+            if trace and not sample["warmup"]:
+                snapshot = tracemalloc.take_snapshot().filter_traces(
+                    [tracemalloc.Filter(False, tracemalloc.__file__)]
+                )
+                if baseline is None:
+                    baseline = snapshot
+                else:
+                    compared = True
+                    sample["top_growth"] = top_growth(snapshot, baseline, args.top)
+                    for site in sample["top_growth"][:3]:
+                        print(f"         ↳ +{site['size_diff_kb']:.1f} KB ({site['count_diff']:+d} blocks) {site['site']}")
+            samples.append(sample)
+
+            frames_total += frames_interval
+            frames_interval = 0
+            n_window = 0
+            t_interval = time.perf_counter()
+            t_next = t_interval + sample_every
+            if elapsed >= args.duration:
+                break
+    except KeyboardInterrupt:
+        print("👋 Interrupted, evaluating the samples so far...")
+    finally:
+        source.close()
+        sink.close()
+        if analytics is not None:
+            analytics.close()
+        if trace:
+            tracemalloc.stop()
+
+    # ---------- trends ----------
+    steady = [s for s in samples if s["trend"]]
+    hours = [s["elapsed_s"] / 3600.0 for s in steady]
+    rss_slope = fit_slope(hours, [s["rss_mb"] for s in steady])
+    traced_slope = fit_slope(hours, [s["traced_mb"] for s in steady]) if trace else 0.0
+    p99_drift = p99_rise = 0.0
+    if len(steady) >= 3:
+        p99 = [s["p99_ms"] for s in steady]
+        slope, intercept = np.polyfit(np.asarray(hours), np.asarray(p99), 1)
+        start_fit = slope * hours[0] + intercept
+        end_fit = slope * hours[-1] + intercept
+        p99_rise = float(end_fit - start_fit)
+        p99_drift = p99_rise / start_fit * 100.0 if start_fit > 0 else 0.0
+
+    failures = []
+    if len(steady) < 3:
+        failures.append(f"only {len(steady)} trend sample(s) after warm-up"
+                        f"{' and the first snapshot diff' if trace else ''}, need 3 (run longer or sample more often)")
+    span_h = hours[-1] - hours[0] if hours else 0.0
+    if not trace and rss_slope > args.max_rss_growth and rss_slope * span_h > args.noise_floor:
+        failures.append(f"RSS grows {rss_slope:.2f} MB/h (limit {args.max_rss_growth:g})")
+    if traced_slope > args.max_traced_growth and traced_slope * span_h > args.noise_floor:
+        failures.append(f"traced memory grows {traced_slope:.2f} MB/h (limit {args.max_traced_growth:g})")
+    if p99_drift > args.max_p99_drift and p99_rise > args.p99_floor:
+        failures.append(f"p99 latency drifts {p99_drift:+.1f}% / {p99_rise:+.3f} ms "
+                        f"(limit {args.max_p99_drift:g}% and {args.p99_floor:g} ms)")
+
+    report = {
+        "args": {k: v for k, v in vars(args).items()},
+        "frames": frames_total,
+        "rss_mb_per_h": round(rss_slope, 3),
+        "traced_mb_per_h": round(traced_slope, 3),
+        "p99_drift_pct": round(p99_drift, 2),
+        "p99_rise_ms": round(p99_rise, 4),
+        "final_top_growth": steady[-1].get("top_growth", []) if steady else [],
+        "failures": failures,
+        "samples": samples,
+    }
+    if isinstance(classifier, CachedClassifier):
+        report["cache"] = classifier.stats()
+    out = Path(args.out) if args.out else PROJECT_ROOT / "data" / "soak" / f"soak_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    print(f"📈 {frames_total} frame(s); RSS {rss_slope:+.2f} MB/h{' (not gated: tracemalloc on)' if trace else ''}, "
+          f"traced {traced_slope:+.2f} MB/h, p99 drift {p99_drift:+.1f}% ({p99_rise:+.3f} ms)")
+    for site in report["final_top_growth"]:
+        print(f"   ↳ +{site['size_diff_kb']:.1f} KB ({site['count_diff']:+d} blocks) {site['site']}")
+    print(f"📝 Report: {out}")
+    if failures:
+        for f in failures:
+            print(f"❌ {f}")
+        sys.exit(1)
+    print("✅ No drift beyond the configured limits.")
+
+
+if __name__ == "__main__":
+    main()
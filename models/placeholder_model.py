@@ -4,11 +4,10 @@
 """
 Placeholder model definition for RT-Gesture3D.
 
-Currently, RT-Gesture3D uses heuristic rules in
-`src/inference/predictor.py` and does NOT rely on a learned model.
-
-This module defines a minimal interface so that a future ML model
-can plug into the same inference pipeline without changing the app.
+Classifiers are plugged into the pipelines through the backend
+registry in `src/inference/backends.py` (rules, vectorized rules, ONNX,
+templates; `register_backend` for new kinds). This stub only documents
+the original model interface and is not used by any pipeline.
 """
 
 from dataclasses import dataclass
@@ -9,7 +9,7 @@ Modes:
 - Streamlit:
     streamlit run src/app/web_app_placeholder.py
   → Polished dashboard UI:
-      - Dashboard tab (overview + launch button)
+      - Dashboard tab (live metrics + launch button)
       - Gesture Library tab (avatars + ids)
       - Docs tab (architecture + viva points)
 
@@ -27,6 +27,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 AVATARS_DIR = PROJECT_ROOT / "assets" / "avatars"
+METRICS_PORT = 9108
 
 # --------------------------------------------------
 # Import live demo + gesture mapping
@@ -34,6 +35,7 @@ AVATARS_DIR = PROJECT_ROOT / "assets" / "avatars"
 try:
     from src.inference.live_gesture_demo import main as run_live_demo
     from src.inference.mapping import GESTURES
+    from src.inference.metrics import fetch_metrics
 except Exception as e:
     print("❌ Import error in web_app_placeholder.py")
     print("  PROJECT_ROOT:", PROJECT_ROOT)
@@ -41,6 +43,7 @@ except Exception as e:
     print("  Original error:", e)
     # Fallbacks so file at least doesn't explode on import
     GESTURES = {}
+    fetch_metrics = None
     def run_live_demo():
         print("⚠️ live_gesture_demo could not be imported. Check your src/inference folder.")
     # If you want Streamlit to crash instead of fallback, comment out the above
@@ -58,6 +61,45 @@ def run_cli():
     run_live_demo()
 
 
+# ------------------------------
+# Live metrics (served by the demo with --metrics-port)
+# ------------------------------
+def read_session_metrics(url):
+    """
+    Summary of a running demo's metrics endpoint, or None when it is not reachable.
+    """
+    if fetch_metrics is None:
+        return None
+    try:
+        samples = fetch_metrics(url)
+    except (OSError, ValueError):
+        return None
+
+    def value(name, **labels):
+        return samples.get((name, tuple(labels.items())), 0.0)
+
+    def mean_ms(stage):
+        n = value("gesture_stage_latency_seconds_count", stage=stage)
+        return 1000.0 * value("gesture_stage_latency_seconds_sum", stage=stage) / n if n else 0.0
+
+    gestures = {
+        dict(labels)["gesture"]: v
+        for (name, labels), v in samples.items()
+        if name == "gesture_predictions_total"
+    }
+    return {
+        "fps": value("gesture_fps"),
+        "captured": value("gesture_frames_captured_total"),
+        "processed": value("gesture_frames_processed_total"),
+        "dropped": value("gesture_frames_dropped_total"),
+        "hit_rate": value("gesture_detection_hit_ratio"),
+        "detect_ms": mean_ms("detect"),
+        "total_ms": mean_ms("total"),
+        "rss_mb": value("gesture_process_rss_bytes") / (1024 * 1024),
+        "gestures": dict(sorted(gestures.items(), key=lambda kv: -kv[1])),
+    }
+
+
 # ------------------------------
 # Streamlit UI mode
 # ------------------------------
@@ -69,6 +111,7 @@ def run_streamlit_ui():
         streamlit run src/app/web_app_placeholder.py
     """
     import streamlit as st
+    import subprocess
     import time
 
     # --- Page config ---
@@ -164,16 +207,29 @@ def run_streamlit_ui():
         st.markdown("<div class='side-panel'>", unsafe_allow_html=True)
         st.subheader("Session Overview")
 
-        # Static KPIs (placeholder – shows capability)
-        c1, c2 = st.columns(2)
-        with c1:
-            st.markdown("<div class='kpi-card'>", unsafe_allow_html=True)
-            st.metric("Input", "Webcam", "+ live")
-            st.markdown("</div>", unsafe_allow_html=True)
-        with c2:
-            st.markdown("<div class='kpi-card'>", unsafe_allow_html=True)
-            st.metric("Pipeline", "Rule-based", "real-time")
-            st.markdown("</div>", unsafe_allow_html=True)
+        # Live KPIs from the demo's Prometheus endpoint
+        metrics_url = st.text_input("Metrics endpoint", f"http://127.0.0.1:{METRICS_PORT}/metrics")
+        st.button("🔄 Refresh metrics", use_container_width=True)
+        stats = read_session_metrics(metrics_url)
+
+        if stats is None:
+            st.caption("No running demo found at this endpoint. Launch one below.")
+        else:
+            kpis = [
+                ("FPS", f"{stats['fps']:.1f}", f"{stats['total_ms']:.1f} ms/frame"),
+                ("Frames", f"{stats['processed']:.0f}", f"{stats['dropped']:.0f} dropped", "inverse"),
+                ("Hand detected", f"{stats['hit_rate'] * 100:.0f}%", f"detect {stats['detect_ms']:.1f} ms", "off"),
+                ("Memory (RSS)", f"{stats['rss_mb']:.0f} MB", None),
+            ]
+            for row in (kpis[:2], kpis[2:]):
+                for col, (label, val, delta, *mode) in zip(st.columns(2), row):
+                    with col:
+                        st.markdown("<div class='kpi-card'>", unsafe_allow_html=True)
+                        st.metric(label, val, delta, delta_color=mode[0] if mode else "normal")
+                        st.markdown("</div>", unsafe_allow_html=True)
+            if stats["gestures"]:
+                st.caption("Predictions per gesture")
+                st.bar_chart(stats["gestures"])
 
         st.divider()
         st.markdown("**How the system works**")
@@ -187,14 +243,22 @@ def run_streamlit_ui():
 
         st.divider()
         st.markdown("**Launch demo**")
-        st.caption("Webcam-based live demo (same backend as CLI).")
+        st.caption("Webcam-based live demo (same backend as CLI), with metrics enabled.")
 
-        if st.button("🚀 Launch Live Camera Demo", use_container_width=True):
+        demo = st.session_state.get("demo_process")
+        running = demo is not None and demo.poll() is None
+        if st.button("🚀 Launch Live Camera Demo", use_container_width=True, disabled=running):
             st.info(
                 "Launching OpenCV window... "
                 "If you don't see it, check your taskbar and allow camera access."
             )
-            run_live_demo()
+            # separate process so this page keeps refreshing the metrics
+            st.session_state["demo_process"] = subprocess.Popen(
+                [sys.executable, "-m", "src.inference.live_gesture_demo", "--metrics-port", str(METRICS_PORT)],
+                cwd=str(PROJECT_ROOT),
+            )
+        elif running:
+            st.success("Live demo is running.")
 
         st.caption("Press **'q'** in the camera window to stop the demo.")
 
@@ -0,0 +1,266 @@
+"""
+Shared-memory frame bus for RT-Gesture3D.
+
+Passing 1080p BGR frames between processes through pickled queues costs
+a serialize + copy + deserialize per frame. `SharedFrameRing` instead
+preallocates N frame slots in one `multiprocessing.shared_memory` block:
+
+    capture process                          detector process(es)
+    ---------------                          --------------------
+    slot = ring.acquire()                    desc = ring.get()
+    cap.read(image=ring.view(slot))          frame = ring.view(desc.slot)   # zero-copy
+    ring.publish(slot)            ──desc──▶  ...detect...
+                                             ring.release(desc.slot)
+
+Only small (slot, seq, timestamp) descriptors move between processes,
+through two bounded index queues that live in the same shared block and
+are counted with semaphores (a lock is only taken between producers or
+between consumers, never between the two sides). When all slots are in
+use the capture side drops the frame instead of blocking the camera.
+
+Children must receive `ring.handle()` as a Process argument (the
+semaphores / locks can only be inherited at process start).
+"""
+
+import time
+from dataclasses import dataclass
+from multiprocessing import get_context, shared_memory
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+_ALIGN = 64
+
+
+def _aligned(n: int) -> int:
+    return (n + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+@dataclass(frozen=True)
+class SlotDescriptor:
+    slot: int
+    seq: int             # frame sequence number, increases by one per published frame
+    timestamp_ns: int    # capture time, time.perf_counter_ns() by default
+
+
+@dataclass
+class FrameRingHandle:
+    """
+    Everything a child process needs to attach to a ring (picklable at Process start).
+    """
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+    slots: int
+    sync: Tuple[Any, ...]   # (ready_items, ready_spaces, free_items, free_spaces, push_lock, pop_lock, ...)
+
+
+class _IndexQueue:
+    """
+    Bounded MPMC queue of int64 records in shared memory.
+
+    `items` counts readable records, `spaces` free positions; the two
+    locks only serialize producers among themselves and consumers among
+    themselves.
+    """
+
+    def __init__(self, records: np.ndarray, cursors: np.ndarray, items, spaces, push_lock, pop_lock) -> None:
+        self._records = records        # (capacity, width) int64
+        self._cursors = cursors        # [head, tail] int64
+        self._capacity = records.shape[0]
+        self._items = items
+        self._spaces = spaces
+        self._push_lock = push_lock
+        self._pop_lock = pop_lock
+
+    def push(self, record, timeout: Optional[float] = None) -> bool:
+        if not self._spaces.acquire(timeout=timeout):
+            return False
+        with self._push_lock:
+            tail = int(self._cursors[1])
+            self._records[tail % self._capacity] = record
+            self._cursors[1] = tail + 1
+        self._items.release()
+        return True
+
+    def pop(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        if not self._items.acquire(timeout=timeout):
+            return None
+        with self._pop_lock:
+            head = int(self._cursors[0])
+            record = self._records[head % self._capacity].copy()
+            self._cursors[0] = head + 1
+        self._spaces.release()
+        return record
+
+    def __len__(self) -> int:
+        return int(self._cursors[1] - self._cursors[0])
+
+
+class SharedFrameRing:
+    """
+    Ring of preallocated frame slots in shared memory.
+
+    Example (owner / capture side):
+        ok, first = cap.read()
+        ring = SharedFrameRing.create(first.shape, slots=4)
+        worker = ctx.Process(target=detect_worker, args=(ring.handle(),))
+
+    Example (detector process):
+        ring = SharedFrameRing.attach(handle)
+        desc = ring.get(timeout=1.0)
+        frame = ring.view(desc.slot)
+        ...
+        ring.release(desc.slot)
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, handle: FrameRingHandle, owner: bool) -> None:
+        self._shm = shm
+        self._handle = handle
+        self.owner = owner
+        self.shape = tuple(handle.shape)
+        self.dtype = np.dtype(handle.dtype)
+        self.slots = handle.slots
+
+        frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+        slot_bytes = _aligned(frame_bytes)
+        buf = shm.buf
+
+        # layout: [cursors 4 x int64][ready records slots x 3][free records slots x 1][frame slots]
+        off = 0
+        self._cursors = np.ndarray((4,), dtype=np.int64, buffer=buf, offset=off)
+        off = _aligned(off + 4 * 8)
+        ready_records = np.ndarray((self.slots, 3), dtype=np.int64, buffer=buf, offset=off)
+        off = _aligned(off + self.slots * 3 * 8)
+        free_records = np.ndarray((self.slots, 1), dtype=np.int64, buffer=buf, offset=off)
+        off = _aligned(off + self.slots * 8)
+        self._frames = [
+            np.ndarray(self.shape, dtype=self.dtype, buffer=buf, offset=off + i * slot_bytes)
+            for i in range(self.slots)
+        ]
+
+        ready_items, ready_spaces, free_items, free_spaces, ready_push, ready_pop, free_push, free_pop = handle.sync
+        self._ready = _IndexQueue(ready_records, self._cursors[0:2], ready_items, ready_spaces, ready_push, ready_pop)
+        self._free = _IndexQueue(free_records, self._cursors[2:4], free_items, free_spaces, free_push, free_pop)
+
+        self._seq = 0
+        self.dropped = 0
+
+    @staticmethod
+    def layout_bytes(shape: Tuple[int, ...], dtype, slots: int) -> int:
+        frame_bytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        return _aligned(4 * 8) + _aligned(slots * 3 * 8) + _aligned(slots * 8) + slots * _aligned(frame_bytes)
+
+    @classmethod
+    def create(cls, shape: Tuple[int, ...], slots: int = 4, dtype=np.uint8, context=None) -> "SharedFrameRing":
+        """
+        Allocate a ring sized for frames of `shape` (e.g. `frame.shape` of the capture source).
+        """
+        if slots <= 0:
+            raise ValueError("slots must be > 0")
+        ctx = context or get_context()
+
+        shm = shared_memory.SharedMemory(create=True, size=cls.layout_bytes(shape, dtype, slots))
+        sync = (
+            ctx.Semaphore(0), ctx.Semaphore(slots),       # ready queue: items, spaces
+            ctx.Semaphore(0), ctx.Semaphore(slots),       # free queue: items, spaces
+            ctx.Lock(), ctx.Lock(), ctx.Lock(), ctx.Lock(),
+        )
+        handle = FrameRingHandle(shm.name, tuple(shape), np.dtype(dtype).str, slots, sync)
+        ring = cls(shm, handle, owner=True)
+        ring._cursors[:] = 0
+        for i in range(slots):
+            ring._free.push((i,))
+        return ring
+
+    @classmethod
+    def attach(cls, handle: FrameRingHandle) -> "SharedFrameRing":
+        try:
+            shm = shared_memory.SharedMemory(name=handle.name, track=False)   # Python 3.13+
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=handle.name)
+        return cls(shm, handle, owner=False)
+
+    def handle(self) -> FrameRingHandle:
+        return self._handle
+
+    def view(self, slot: int) -> np.ndarray:
+        """
+        Zero-copy array for a slot. Only valid until the slot is released.
+        """
+        return self._frames[slot]
+
+    # ---------- producer side ----------
+    def acquire(self, timeout: Optional[float] = 0.0) -> Optional[int]:
+        """
+        Reserve a free slot; None (and a dropped frame) when every slot is busy.
+        """
+        record = self._free.pop(timeout=timeout)
+        if record is None:
+            self.dropped += 1
+            return None
+        return int(record[0])
+
+    def publish(self, slot: int, timestamp_ns: Optional[int] = None) -> SlotDescriptor:
+        if timestamp_ns is None:
+            timestamp_ns = time.perf_counter_ns()
+        desc = SlotDescriptor(slot, self._seq, timestamp_ns)
+        self._seq += 1
+        self._ready.push((desc.slot, desc.seq, desc.timestamp_ns))
+        return desc
+
+    def write(self, frame: np.ndarray, timestamp_ns: Optional[int] = None) -> Optional[SlotDescriptor]:
+        """
+        Copy a frame in and publish it (for sources that cannot read into a buffer).
+        """
+        slot = self.acquire()
+        if slot is None:
+            return None
+        np.copyto(self._frames[slot], frame)
+        return self.publish(slot, timestamp_ns)
+
+    # ---------- consumer side ----------
+    def get(self, timeout: Optional[float] = None) -> Optional[SlotDescriptor]:
+        record = self._ready.pop(timeout=timeout)
+        if record is None:
+            return None
+        return SlotDescriptor(int(record[0]), int(record[1]), int(record[2]))
+
+    def release(self, slot: int) -> None:
+        self._free.push((slot,))
+
+    def pending(self) -> int:
+        """
+        Published frames not yet taken by a consumer (queue depth).
+        """
+        return len(self._ready)
+
+    def close(self) -> None:
+        self._frames = []
+        self._ready = self._free = None
+        self._cursors = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+
+def capture_into_ring(cap, ring: SharedFrameRing, scratch: Optional[np.ndarray] = None) -> Tuple[bool, Optional[SlotDescriptor]]:
+    """
+    Read one frame from a `cv2.VideoCapture` straight into a free slot.
+
+    When no slot is free the frame is still read (into `scratch`) so the
+    camera never falls behind, and (True, None) is returned.
+    """
+    slot = ring.acquire()
+    if slot is None:
+        ok, _ = cap.read(image=scratch) if scratch is not None else cap.read()
+        return ok, None
+
+    ok, frame = cap.read(image=ring.view(slot))
+    if not ok:
+        ring.release(slot)
+        return False, None
+    if frame is not None and frame.ctypes.data != ring.view(slot).ctypes.data:
+        # backend allocated a new array (e.g. size mismatch): fall back to a copy
+        np.copyto(ring.view(slot), frame)
+    return True, ring.publish(slot)
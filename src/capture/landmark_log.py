@@ -0,0 +1,149 @@
+"""
+Landmark stream logs for RT-Gesture3D.
+
+A landmark log is a JSONL file recorded from a live session:
+
+    {"format": "rt-gesture3d-landmarks", "version": 1, "created": 1718000000.0, "source": "webcam:0"}
+    {"t": 0.000, "w": 640, "h": 480, "hands": [[[x, y, z], ... 21 points], ...]}
+    {"t": 0.033, "w": 640, "h": 480, "hands": []}
+    ...
+
+`t` is seconds since the first frame. Replaying a log feeds the same
+hands into classification / smoothing / overlay without a camera, either
+at the original timing or as fast as possible.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+LOG_FORMAT = "rt-gesture3d-landmarks"
+LOG_VERSION = 1
+
+Point3D = Tuple[int, int, float]  # (x, y, z)
+
+
+@dataclass
+class LandmarkFrame:
+    """
+    Landmarks of one captured frame.
+    """
+    timestamp: float                 # seconds since the first frame
+    width: int
+    height: int
+    hands: List[List[Point3D]]       # per hand: 21 (x, y, z) pixel points
+
+
+class LandmarkLogWriter:
+    """
+    Appends one JSON line per frame.
+
+    Example:
+        with LandmarkLogWriter("session.jsonl", source="webcam:0") as log:
+            log.write(hands, w, h)
+    """
+
+    def __init__(self, path: Path, source: str = "") -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._f = open(self.path, "w", encoding="utf-8")
+        self._t0: Optional[float] = None
+        self.frames = 0
+
+        header = {"format": LOG_FORMAT, "version": LOG_VERSION, "created": time.time(), "source": source}
+        self._f.write(json.dumps(header) + "\n")
+
+    def write(self, hands: List[List[Point3D]], img_w: int, img_h: int, timestamp: Optional[float] = None) -> None:
+        """
+        Record one frame. `timestamp` defaults to `time.perf_counter()`.
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if self._t0 is None:
+            self._t0 = timestamp
+
+        record = {
+            "t": round(timestamp - self._t0, 6),
+            "w": img_w,
+            "h": img_h,
+            "hands": [[[x, y, round(float(z), 6)] for x, y, z in pts] for pts in hands],
+        }
+        self._f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self.frames += 1
+
+    def close(self) -> None:
+        self._f.close()
+
+    def __enter__(self) -> "LandmarkLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_landmark_log(path: Path) -> Iterator[LandmarkFrame]:
+    """
+    Yield every frame of a landmark log, in order.
+    """
+    with open(path, encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("format") != LOG_FORMAT:
+            raise ValueError(f"{path} is not a landmark log")
+        if header.get("version", 0) > LOG_VERSION:
+            raise ValueError(f"{path}: unsupported landmark log version {header.get('version')}")
+
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            hands = [[(p[0], p[1], p[2]) for p in pts] for pts in rec["hands"]]
+            yield LandmarkFrame(rec["t"], rec["w"], rec["h"], hands)
+
+
+class LandmarkReplay:
+    """
+    Frame source that replays a landmark log.
+
+    realtime=True sleeps so frames come out at their recorded timing
+    (scaled by `speed`); realtime=False yields them as fast as possible.
+    Frames are loaded once, so the file is not re-parsed on every loop.
+    """
+
+    def __init__(self, path: Path, realtime: bool = True, speed: float = 1.0, loops: int = 1) -> None:
+        if speed <= 0:
+            raise ValueError("speed must be > 0")
+
+        self.path = Path(path)
+        self.realtime = realtime
+        self.speed = speed
+        self.loops = loops
+        self.frames = list(read_landmark_log(self.path))
+
+    def __len__(self) -> int:
+        return len(self.frames) * max(self.loops, 0)
+
+    def duration(self) -> float:
+        """
+        Recorded duration of one pass, in seconds.
+        """
+        return self.frames[-1].timestamp if self.frames else 0.0
+
+    def __iter__(self) -> Iterator[LandmarkFrame]:
+        if not self.frames:
+            return
+
+        # each loop continues the clock where the previous one ended
+        period = self.duration() + (self.frames[1].timestamp if len(self.frames) > 1 else 0.0)
+        start = time.perf_counter()
+
+        for loop in range(self.loops):
+            offset = loop * period
+            for frame in self.frames:
+                if self.realtime:
+                    due = start + (offset + frame.timestamp) / self.speed
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        time.sleep(delay)
+                yield frame
@@ -2,70 +2,134 @@
 Simple capture tool for recording raw frames for future training.
 
 Usage (from project root):
-    python src/capture/recorder.py
+    python src/capture/recorder.py --label ok
+    python src/capture/recorder.py --label ok --mode segments
+    python src/capture/recorder.py --label ok --capture-width 1280 --capture-height 720
+
+Modes:
+    frames   - one JPG per saved frame under data/raw/<label>/
+    segments - frames appended to rolling MJPG segments under data/segments/
+               with a shared index.csv (see src/capture/segments.py)
 
 Controls:
     q - quit
-    s - save current frame as JPG under data/raw/<label>/
+    s - save current frame
+    r - start / stop continuous recording (segments mode only)
 """
 
-import time
+import argparse
+import sys
 from pathlib import Path
 
 import cv2
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-def ensure_dir(path: Path):
-    path.mkdir(parents=True, exist_ok=True)
+from src.capture.segments import SegmentWriter
+from src.capture.sources import add_source_args, source_from_args
 
 
-def main():
-    project_root = Path(__file__).resolve().parents[2]
-    data_raw = project_root / "data" / "raw"
+def ensure_dir(path: Path):
+    path.mkdir(parents=True, exist_ok=True)
 
-    label = "custom"  # TODO: change this before recording (e.g. "ok", "rock")
-    out_dir = data_raw / label
-    ensure_dir(out_dir)
 
-    cap = cv2.VideoCapture(0)
-    if not cap.isOpened():
-        print("❌ Could not open camera.")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RT-Gesture3D capture recorder")
+    parser.add_argument("--label", default="custom", help="gesture label to record (e.g. ok, rock)")
+    parser.add_argument("--mode", choices=["frames", "segments"], default="frames")
+    parser.add_argument("--segment-frames", type=int, default=300, help="frames per video segment")
+    parser.add_argument("--fps", type=float, default=30.0, help="nominal FPS stored in segments")
+    add_source_args(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    label = args.label
+
+    if args.mode == "frames":
+        out_dir = PROJECT_ROOT / "data" / "raw" / label
+        ensure_dir(out_dir)
+        writer = None
+    else:
+        out_dir = PROJECT_ROOT / "data" / "segments"
+        writer = SegmentWriter(out_dir, fps=args.fps, segment_frames=args.segment_frames)
+
+    source = source_from_args(args)
+    if not source.isOpened():
+        print(f"❌ Could not open {source.name}.")
+        source.close()
+        if writer is not None:
+            writer.close()
         return
 
     print("📷 RT-Gesture3D Capture Recorder")
+    print(f"Source: {source.describe()}")
     print(f"Output directory: {out_dir}")
-    print("Press 's' to save frame, 'q' to quit.")
+    if writer is None:
+        print("Press 's' to save frame, 'q' to quit.")
+    else:
+        print("Press 's' to save frame, 'r' to start/stop recording, 'q' to quit.")
+
+    recording = False
+    saved = 0
 
     while True:
-        ret, frame = cap.read()
-        if not ret:
+        captured = source.next_frame()
+        if captured is None:
             print("❌ Failed to read frame.")
             break
-
+        frame = captured.image
+
+        if recording:
+            writer.write(frame, label, timestamp_ms=int(captured.wall_time * 1000))
+            saved += 1
+
+        # the overlay is drawn on a copy so stored frames stay clean
+        preview = frame.copy()
+        if recording:
+            hint = f"REC ({saved}) | 'r' = stop, 'q' = quit"
+        elif writer is not None:
+            hint = "'s' = save, 'r' = rec, 'q' = quit"
+        else:
+            hint = "'s' = save, 'q' = quit"
         cv2.putText(
-            frame,
-            f"Label: {label} | 's' = save, 'q' = quit",
+            preview,
+            f"Label: {label} | {hint}",
             (10, 30),
             cv2.FONT_HERSHEY_SIMPLEX,
             0.7,
-            (0, 255, 0),
+            (0, 0, 255) if recording else (0, 255, 0),
             2,
         )
 
-        cv2.imshow("RT-Gesture3D - Capture Recorder", frame)
+        cv2.imshow("RT-Gesture3D - Capture Recorder", preview)
         key = cv2.waitKey(1) & 0xFF
 
         if key == ord("q"):
             print("👋 Exiting.")
             break
         elif key == ord("s"):
-            ts = int(time.time() * 1000)
-            out_path = out_dir / f"{label}_{ts}.jpg"
-            cv2.imwrite(str(out_path), frame)
-            print(f"💾 Saved: {out_path}")
-
-    cap.release()
+            if writer is None:
+                ts = int(captured.wall_time * 1000)
+                out_path = out_dir / f"{label}_{ts}.jpg"
+                cv2.imwrite(str(out_path), frame)
+                print(f"💾 Saved: {out_path}")
+            elif not recording:
+                ref = writer.write(frame, label, timestamp_ms=int(captured.wall_time * 1000))
+                saved += 1
+                print(f"💾 Saved: {ref.segment} #{ref.offset}")
+        elif key == ord("r") and writer is not None:
+            recording = not recording
+            print("⏺  Recording..." if recording else f"⏹  Stopped ({saved} frame(s) so far).")
+
+    source.close()
     cv2.destroyAllWindows()
+    if writer is not None:
+        writer.close()
+        print(f"💾 Stored {saved} frame(s) in {out_dir}")
 
 
 if __name__ == "__main__":
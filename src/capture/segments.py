@@ -0,0 +1,243 @@
+"""
+Segment-based frame storage for RT-Gesture3D.
+
+Instead of writing one JPG per captured frame, frames are appended to
+rolling fixed-length video segments (MJPG/AVI by default) and every
+frame gets one row in a shared index file:
+
+    data/segments/
+        index.csv                      # timestamp_ms,segment,offset,label
+        seg_<session>_00000.avi
+        seg_<session>_00001.avi
+        ...
+
+MJPG stores every frame as a key frame, so any labelled frame can be
+seeked to exactly, while building a dataset reads each segment
+sequentially.
+"""
+
+import csv
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+INDEX_FILE = "index.csv"
+INDEX_FIELDS = ["timestamp_ms", "segment", "offset", "label"]
+
+
+@dataclass(frozen=True)
+class FrameRef:
+    """
+    One row of the segment index.
+    """
+    timestamp_ms: int
+    segment: str   # segment filename, relative to the segments root
+    offset: int    # frame number inside the segment
+    label: str
+
+
+class SegmentWriter:
+    """
+    Appends frames to rolling video segments and records them in the index.
+
+    Example:
+        writer = SegmentWriter(project_root / "data" / "segments")
+        writer.write(frame, label="ok")
+        ...
+        writer.close()
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        fps: float = 30.0,
+        segment_frames: int = 300,
+        fourcc: str = "MJPG",
+        extension: str = ".avi",
+    ) -> None:
+        if segment_frames <= 0:
+            raise ValueError("segment_frames must be > 0")
+
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        self._fps = fps
+        self._segment_frames = segment_frames
+        self._fourcc = cv2.VideoWriter_fourcc(*fourcc)
+        self._extension = extension
+        self._session = str(int(time.time() * 1000))
+
+        self._writer: Optional[cv2.VideoWriter] = None
+        self._segment_name = ""
+        self._segment_count = 0
+        self._offset = 0
+        self._frame_size: Optional[Tuple[int, int]] = None
+
+        index_path = self.root / INDEX_FILE
+        new_index = not index_path.exists()
+        self._index_file = open(index_path, "a", newline="", encoding="utf-8")
+        self._index = csv.writer(self._index_file)
+        if new_index:
+            self._index.writerow(INDEX_FIELDS)
+
+    @property
+    def frames_in_segment(self) -> int:
+        return self._offset
+
+    def _open_segment(self) -> None:
+        self._segment_name = f"seg_{self._session}_{self._segment_count:05d}{self._extension}"
+        self._segment_count += 1
+        self._offset = 0
+
+        path = self.root / self._segment_name
+        self._writer = cv2.VideoWriter(str(path), self._fourcc, self._fps, self._frame_size)
+        if not self._writer.isOpened():
+            raise RuntimeError(f"Could not open video segment for writing: {path}")
+
+    def _close_segment(self) -> None:
+        if self._writer is not None:
+            self._writer.release()
+            self._writer = None
+        self._index_file.flush()
+
+    def write(self, frame_bgr: np.ndarray, label: str, timestamp_ms: Optional[int] = None) -> FrameRef:
+        """
+        Append one BGR frame and return its index entry.
+
+        All frames of a writer must share the size of the first frame.
+        """
+        h, w = frame_bgr.shape[:2]
+        if self._frame_size is None:
+            self._frame_size = (w, h)
+        elif self._frame_size != (w, h):
+            raise ValueError(f"Frame size changed from {self._frame_size} to {(w, h)}")
+
+        if self._writer is None or self._offset >= self._segment_frames:
+            self._close_segment()
+            self._open_segment()
+
+        if timestamp_ms is None:
+            timestamp_ms = int(time.time() * 1000)
+
+        self._writer.write(frame_bgr)
+        ref = FrameRef(timestamp_ms, self._segment_name, self._offset, label)
+        self._index.writerow([ref.timestamp_ms, ref.segment, ref.offset, ref.label])
+        self._offset += 1
+        return ref
+
+    def close(self) -> None:
+        self._close_segment()
+        self._index_file.close()
+
+    def __enter__(self) -> "SegmentWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_index(root: Path) -> List[FrameRef]:
+    """
+    Load all index rows under `root`, ordered as they were recorded.
+    """
+    refs: List[FrameRef] = []
+    with open(Path(root) / INDEX_FILE, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            refs.append(
+                FrameRef(
+                    timestamp_ms=int(row["timestamp_ms"]),
+                    segment=row["segment"],
+                    offset=int(row["offset"]),
+                    label=row["label"],
+                )
+            )
+    return refs
+
+
+class SegmentReader:
+    """
+    Random and sequential access to frames stored by `SegmentWriter`.
+
+    Reading consecutive frames of a segment never seeks; jumping to a
+    different position costs one seek into the MJPG stream.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.refs = read_index(self.root)
+
+        self._cap: Optional[cv2.VideoCapture] = None
+        self._cap_segment = ""
+        self._cap_pos = 0
+
+    def __len__(self) -> int:
+        return len(self.refs)
+
+    def labels(self) -> Dict[str, int]:
+        """
+        Number of indexed frames per label.
+        """
+        counts: Dict[str, int] = {}
+        for ref in self.refs:
+            counts[ref.label] = counts.get(ref.label, 0) + 1
+        return counts
+
+    def indices_for_label(self, label: str) -> List[int]:
+        return [i for i, ref in enumerate(self.refs) if ref.label == label]
+
+    def _decode(self, ref: FrameRef) -> np.ndarray:
+        if self._cap is None or self._cap_segment != ref.segment:
+            self.close()
+            path = self.root / ref.segment
+            self._cap = cv2.VideoCapture(str(path))
+            if not self._cap.isOpened():
+                raise RuntimeError(f"Could not open video segment: {path}")
+            self._cap_segment = ref.segment
+            self._cap_pos = 0
+
+        if self._cap_pos != ref.offset:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, ref.offset)
+            self._cap_pos = ref.offset
+
+        ok, frame = self._cap.read()
+        if not ok:
+            raise RuntimeError(f"Could not decode frame {ref.offset} of {ref.segment}")
+        self._cap_pos += 1
+        return frame
+
+    def read(self, i: int) -> np.ndarray:
+        """
+        Decode the i-th indexed frame.
+        """
+        return self._decode(self.refs[i])
+
+    def read_range(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[FrameRef, np.ndarray]]:
+        """
+        Yield (ref, frame) for index rows [start, stop) in recording order.
+        """
+        for ref in self.refs[start:stop]:
+            yield ref, self._decode(ref)
+
+    def iter_label(self, label: str) -> Iterator[Tuple[FrameRef, np.ndarray]]:
+        """
+        Yield (ref, frame) for every frame recorded under `label`.
+        """
+        for i in self.indices_for_label(label):
+            ref = self.refs[i]
+            yield ref, self._decode(ref)
+
+    def close(self) -> None:
+        if self._cap is not None:
+            self._cap.release()
+            self._cap = None
+            self._cap_segment = ""
+
+    def __enter__(self) -> "SegmentReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,492 @@
+"""
+Frame sources for RT-Gesture3D.
+
+Every entry point reads frames through a `FrameSource` instead of a bare
+`cv2.VideoCapture(0)`:
+
+    camera       0, 1, ...                      webcam index
+    stream       rtsp://..., http(s)://..., udp://...
+    video file   path/to/clip.mp4
+    image dir    path/to/folder                 sorted *.jpg / *.png
+    synthetic    synthetic, synthetic:1280x720@60   moving test pattern, no hardware
+
+    source = open_source("0", CaptureSettings(width=1280, height=720, fps=30))
+    while (captured := source.next_frame()) is not None:
+        frame, t_capture = captured.image, captured.timestamp
+
+Cameras and streams are tuned on open: internal buffer of 1 frame (no
+queue of stale frames in the driver), MJPG FOURCC (USB cameras deliver
+higher resolutions / frame rates than raw YUYV) and the requested
+resolution / FPS. Drivers may ignore any of these; `source.describe()`
+reports what was actually granted.
+
+`PrefetchSource` moves `read()` onto a background thread. For live
+sources the consumer always gets the newest frame (older ones are
+dropped and counted); files and image folders are delivered in order
+through a short bounded queue.
+
+Sources also expose `read()` / `isOpened()` / `release()`, so they drop
+into code written for `cv2.VideoCapture` (e.g. `capture_into_ring`).
+"""
+
+import argparse
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import cv2
+import numpy as np
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+STREAM_SCHEMES = ("rtsp://", "rtmp://", "http://", "https://", "udp://", "tcp://")
+
+
+@dataclass
+class CaptureSettings:
+    """
+    Requested capture properties; 0 / "" leaves the driver default.
+    """
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    fourcc: str = "MJPG"
+    buffer_size: int = 1
+
+
+class CapturedFrame(NamedTuple):
+    image: np.ndarray
+    timestamp: float     # time.perf_counter() when the frame was read
+    wall_time: float     # time.time() at the same moment
+    index: int           # frames read from this source so far, starting at 0
+
+
+class FrameSource:
+    """
+    Base class: subclasses implement `_read()`.
+    """
+
+    live = False          # True: frames go stale (camera / stream), False: every frame matters (files)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.frames = 0
+        self.last: Optional[CapturedFrame] = None
+
+    def _read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        raise NotImplementedError
+
+    def isOpened(self) -> bool:
+        return True
+
+    def next_frame(self) -> Optional[CapturedFrame]:
+        """
+        Next frame with its capture timestamp, or None at the end / on error.
+        """
+        ok, image = self._read()
+        if not ok or image is None:
+            return None
+        self.last = CapturedFrame(image, time.perf_counter(), time.time(), self.frames)
+        self.frames += 1
+        return self.last
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        """
+        `cv2.VideoCapture.read` compatible. Sources whose `_read` fills
+        `image` in place return it as is; otherwise it is copied in.
+        """
+        ok, frame = self._read(image)
+        if not ok or frame is None:
+            return False, None
+        self.last = CapturedFrame(frame, time.perf_counter(), time.time(), self.frames)
+        self.frames += 1
+        if image is not None and frame is not image and image.shape == frame.shape:
+            np.copyto(image, frame)
+            return True, image
+        return True, frame
+
+    def __iter__(self) -> Iterator[CapturedFrame]:
+        while True:
+            captured = self.next_frame()
+            if captured is None:
+                return
+            yield captured
+
+    def describe(self) -> Dict[str, object]:
+        return {"source": self.name}
+
+    def close(self) -> None:
+        pass
+
+    def release(self) -> None:
+        self.close()
+
+    def __enter__(self) -> "FrameSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _Pacer:
+    """
+    Optional real-time pacing for non-live sources (files, folders, synthetic).
+    """
+
+    def __init__(self, fps: float, realtime: bool) -> None:
+        self.fps = fps
+        self.enabled = realtime and fps > 0
+        self._next_t: Optional[float] = None
+
+    def wait(self) -> None:
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._next_t is None:
+            self._next_t = now
+        elif self._next_t > now:
+            time.sleep(self._next_t - now)
+        # never more than one frame of catch-up after a slow consumer
+        self._next_t = max(self._next_t, now - 1.0 / self.fps) + 1.0 / self.fps
+
+
+class VideoCaptureSource(FrameSource):
+    """
+    Webcam, video file or network stream through `cv2.VideoCapture`.
+    """
+
+    def __init__(
+        self,
+        target,
+        settings: Optional[CaptureSettings] = None,
+        live: bool = True,
+        api: int = cv2.CAP_ANY,
+    ) -> None:
+        super().__init__(str(target))
+        self.target = target
+        self.settings = settings or CaptureSettings()
+        self.live = live
+        self._cap = cv2.VideoCapture(target, api)
+        if self._cap.isOpened() and live:
+            self._tune()
+
+    def _tune(self) -> None:
+        s = self.settings
+        cap = self._cap
+        if s.buffer_size > 0:
+            cap.set(cv2.CAP_PROP_BUFFERSIZE, s.buffer_size)
+        if s.fourcc:
+            cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*s.fourcc))
+        if s.width > 0:
+            cap.set(cv2.CAP_PROP_FRAME_WIDTH, s.width)
+        if s.height > 0:
+            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, s.height)
+        if s.fps > 0:
+            cap.set(cv2.CAP_PROP_FPS, s.fps)
+
+    def isOpened(self) -> bool:
+        return self._cap.isOpened()
+
+    def _read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        return self._cap.read(image=image) if image is not None else self._cap.read()
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        # straight into the caller's buffer when given (zero-copy capture into a frame ring)
+        ok, frame = self._read(image)
+        if ok and frame is not None:
+            self.last = CapturedFrame(frame, time.perf_counter(), time.time(), self.frames)
+            self.frames += 1
+        return ok, frame
+
+    def describe(self) -> Dict[str, object]:
+        cap = self._cap
+        code = int(cap.get(cv2.CAP_PROP_FOURCC))
+        fourcc = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4)) if code > 0 else ""
+        return {
+            "source": self.name,
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+            "fps": round(cap.get(cv2.CAP_PROP_FPS), 2),
+            "fourcc": fourcc.strip("\x00"),
+            "buffer_size": int(cap.get(cv2.CAP_PROP_BUFFERSIZE)),
+        }
+
+    def close(self) -> None:
+        self._cap.release()
+
+
+class VideoFileSource(VideoCaptureSource):
+    """
+    Video file, optionally played back at its own frame rate.
+    """
+
+    def __init__(self, path, realtime: bool = False, loop: bool = False) -> None:
+        super().__init__(str(path), live=False)
+        self.fps = self._cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self.frame_count = max(int(self._cap.get(cv2.CAP_PROP_FRAME_COUNT)), 0)   # 0 = unknown
+        self.loop = loop
+        self._pacer = _Pacer(self.fps, realtime)
+
+    def _read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        self._pacer.wait()
+        ok, frame = super()._read(image)
+        if not ok and self.loop and self.frames > 0:
+            self._cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ok, frame = super()._read(image)
+        return ok, frame
+
+
+class StreamSource(VideoCaptureSource):
+    """
+    RTSP / HTTP / UDP stream through FFmpeg; reconnects when the stream drops.
+    """
+
+    def __init__(self, url: str, settings: Optional[CaptureSettings] = None, reconnect: int = 3) -> None:
+        super().__init__(url, settings, live=True, api=cv2.CAP_FFMPEG)
+        self.reconnect = reconnect
+        self.reconnects = 0
+
+    def _read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        ok, frame = super()._read(image)
+        attempts = 0
+        while not ok and attempts < self.reconnect:
+            attempts += 1
+            self.reconnects += 1
+            self._cap.release()
+            time.sleep(0.5 * attempts)
+            self._cap = cv2.VideoCapture(self.target, cv2.CAP_FFMPEG)
+            if self._cap.isOpened():
+                self._tune()
+                ok, frame = super()._read(image)
+        return ok, frame
+
+
+class ImageDirSource(FrameSource):
+    """
+    Sorted images of a folder as a frame sequence.
+    """
+
+    def __init__(self, folder, fps: float = 30.0, realtime: bool = False, loop: bool = False) -> None:
+        super().__init__(str(folder))
+        self.fps = fps
+        self._pacer = _Pacer(fps, realtime)
+        self.files: List[Path] = sorted(p for p in Path(folder).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+        self.loop = loop
+        self._pos = 0
+
+    def isOpened(self) -> bool:
+        return bool(self.files)
+
+    def _read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if self._pos >= len(self.files):
+            if not (self.loop and self.files):
+                return False, None
+            self._pos = 0
+        self._pacer.wait()
+        frame = cv2.imread(str(self.files[self._pos]))
+        self._pos += 1
+        return frame is not None, frame
+
+    def describe(self) -> Dict[str, object]:
+        return {"source": self.name, "images": len(self.files), "fps": self.fps}
+
+
+class SyntheticSource(FrameSource):
+    """
+    Moving test pattern (gradient background, sliding bar, frame counter).
+    """
+
+    def __init__(
+        self,
+        width: int = 640,
+        height: int = 480,
+        fps: float = 30.0,
+        frames: Optional[int] = None,
+        realtime: bool = True,
+    ) -> None:
+        super().__init__(f"synthetic:{width}x{height}@{fps:g}")
+        self.width, self.height, self.fps = width, height, fps
+        self.live = realtime          # paced like a camera: late frames may be dropped
+        self._pacer = _Pacer(fps, realtime)
+        self.limit = frames
+        gx = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+        gy = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+        self._base = np.stack(
+            [np.broadcast_to(gx, (height, width)), np.broadcast_to(gy, (height, width)), np.full((height, width), 64.0)],
+            axis=2,
+        ).astype(np.uint8)
+        self._bar = max(width // 16, 4)
+
+    def _read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.limit is not None and self.frames >= self.limit:
+            return False, None
+        self._pacer.wait()
+        if image is not None and image.shape == self._base.shape:
+            frame = image
+            np.copyto(frame, self._base)
+        else:
+            frame = self._base.copy()
+        x = (self.frames * 8) % max(self.width - self._bar, 1)
+        frame[:, x:x + self._bar] = 255
+        cv2.putText(frame, str(self.frames), (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 0, 0), 2)
+        return True, frame
+
+    def describe(self) -> Dict[str, object]:
+        return {"source": self.name, "width": self.width, "height": self.height, "fps": self.fps}
+
+
+class PrefetchSource(FrameSource):
+    """
+    Reads the wrapped source on a background thread.
+
+    Live sources: only the newest frame is kept (`dropped` counts the
+    frames that were overwritten before the consumer got to them).
+    Other sources: frames are queued in order, up to `depth`.
+    """
+
+    def __init__(self, source: FrameSource, depth: int = 2) -> None:
+        super().__init__(source.name)
+        self.source = source
+        self.live = source.live
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[CapturedFrame]]" = queue.Queue(maxsize=1 if source.live else max(depth, 1))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Optional[CapturedFrame]) -> None:
+        if self.live:
+            try:
+                self._queue.get_nowait()     # stale frame nobody read yet
+                if item is not None:
+                    self.dropped += 1
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(item)
+            return
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            captured = self.source.next_frame()
+            self._put(captured)
+            if captured is None:
+                return
+
+    def isOpened(self) -> bool:
+        return self.source.isOpened()
+
+    def next_frame(self) -> Optional[CapturedFrame]:
+        while True:
+            try:
+                captured = self._queue.get(timeout=0.5)
+                break
+            except queue.Empty:
+                if not self._thread.is_alive():
+                    return None
+        if captured is None:
+            return None
+        self.frames += 1
+        self.last = captured
+        return captured
+
+    def read(self, image: Optional[np.ndarray] = None) -> Tuple[bool, Optional[np.ndarray]]:
+        # frames come from the reader thread: keep their capture timestamps, copy into `image`
+        captured = self.next_frame()
+        if captured is None:
+            return False, None
+        if image is not None and image.shape == captured.image.shape:
+            np.copyto(image, captured.image)
+            return True, image
+        return True, captured.image
+
+    def describe(self) -> Dict[str, object]:
+        return {**self.source.describe(), "prefetch": True}
+
+    def close(self) -> None:
+        self._stop.set()
+        try:
+            while True:
+                self._queue.get_nowait()    # unblock a producer waiting on a full queue
+        except queue.Empty:
+            pass
+        self._thread.join(timeout=2.0)
+        self.source.close()
+
+
+def _parse_synthetic(spec: str) -> Tuple[int, int, float]:
+    """
+    "synthetic" / "synthetic:1280x720" / "synthetic:1280x720@60" → (w, h, fps)
+    """
+    _, _, arg = spec.partition(":")
+    size, _, fps = arg.partition("@")
+    w, _, h = size.partition("x")
+    return int(w or 640), int(h or 480), float(fps or 30.0)
+
+
+def open_source(
+    spec="0",
+    settings: Optional[CaptureSettings] = None,
+    prefetch: bool = False,
+    realtime: bool = True,
+    loop: bool = False,
+) -> FrameSource:
+    """
+    Frame source for a spec (see module docstring). `realtime` paces
+    files / folders / synthetic frames at their nominal FPS.
+    """
+    spec = str(spec)
+    if spec.isdigit():
+        source: FrameSource = VideoCaptureSource(int(spec), settings, live=True)
+    elif spec.startswith(STREAM_SCHEMES):
+        source = StreamSource(spec, settings)
+    elif spec == "synthetic" or spec.startswith("synthetic:"):
+        w, h, fps = _parse_synthetic(spec)
+        if settings is not None:
+            w, h, fps = settings.width or w, settings.height or h, settings.fps or fps
+        source = SyntheticSource(w, h, fps, realtime=realtime)
+    elif Path(spec).is_dir():
+        source = ImageDirSource(spec, fps=(settings.fps if settings and settings.fps else 30.0), realtime=realtime, loop=loop)
+    elif Path(spec).exists():
+        source = VideoFileSource(spec, realtime=realtime, loop=loop)
+    else:
+        raise FileNotFoundError(f"Frame source not found: {spec}")
+    if prefetch and source.isOpened():
+        return PrefetchSource(source)
+    return source
+
+
+def add_source_args(parser: argparse.ArgumentParser) -> None:
+    """
+    --source / --camera and capture tuning flags shared by the entry points.
+    """
+    parser.add_argument("--source", default=None, metavar="SPEC",
+                        help="camera index, video file, image folder, rtsp:// URL or synthetic[:WxH@FPS]")
+    parser.add_argument("--camera", type=int, default=0, help="camera index (shorthand for --source N)")
+    parser.add_argument("--capture-width", type=int, default=0, help="requested capture width (0 = driver default)")
+    parser.add_argument("--capture-height", type=int, default=0, help="requested capture height (0 = driver default)")
+    parser.add_argument("--capture-fps", type=float, default=0.0, help="requested capture FPS (0 = driver default)")
+    parser.add_argument("--fourcc", default="MJPG", help="requested camera pixel format ('' = driver default)")
+    parser.add_argument("--buffer-size", type=int, default=1, help="driver frame buffer (1 = always the newest frame)")
+    parser.add_argument("--no-prefetch", action="store_true", help="read frames on the main thread")
+    parser.add_argument("--loop", action="store_true", help="restart video files / image folders at the end")
+
+
+def source_from_args(args) -> FrameSource:
+    spec = args.source if args.source is not None else str(args.camera)
+    settings = CaptureSettings(
+        width=args.capture_width,
+        height=args.capture_height,
+        fps=args.capture_fps,
+        fourcc=args.fourcc,
+        buffer_size=args.buffer_size,
+    )
+    realtime = not getattr(args, "fast", False)
+    return open_source(spec, settings, prefetch=not args.no_prefetch, realtime=realtime, loop=args.loop)
@@ -5,15 +5,34 @@ Responsibility:
     - Take a BGR frame (OpenCV)
     - Run MediaPipe Hands
     - Return per-hand landmarks in pixel coordinates
+
+Runtime settings:
+    - graph settings (max_num_hands, model_complexity, confidences) pick
+      the MediaPipe graph; graphs are built once per settings combination
+      and kept, so switching back and forth is cheap.
+    - inference_scale downsizes the frame before MediaPipe (landmarks are
+      still returned in full-frame pixels).
+    - detect_interval > 1 reuses the last result on in-between frames.
+    - static_image_mode runs palm detection on every call instead of
+      tracking; needed when consecutive inputs are unrelated images
+      (e.g. per-hand crops, see `roi.py`).
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import cv2
 import mediapipe as mp
 
 Point3D = Tuple[int, int, float]  # (x, y, z)
 
+_GRAPH_SETTINGS = (
+    "max_num_hands",
+    "model_complexity",
+    "detection_confidence",
+    "tracking_confidence",
+    "static_image_mode",
+)
+
 
 class MediaPipeHandDetector:
     """
@@ -22,6 +41,7 @@ class MediaPipeHandDetector:
     Example:
         detector = MediaPipeHandDetector()
         hands_pts = detector.detect(frame)
+        detector.configure(model_complexity=0, inference_scale=0.5)
     """
 
     def __init__(
@@ -29,15 +49,83 @@ class MediaPipeHandDetector:
         max_num_hands: int = 1,
         detection_confidence: float = 0.5,
         tracking_confidence: float = 0.5,
+        model_complexity: int = 1,
+        inference_scale: float = 1.0,
+        detect_interval: int = 1,
+        static_image_mode: bool = False,
     ) -> None:
         self._mp_hands = mp.solutions.hands
         self._mp_draw = mp.solutions.drawing_utils
 
-        self._hands = self._mp_hands.Hands(
-            max_num_hands=max_num_hands,
-            min_detection_confidence=detection_confidence,
-            min_tracking_confidence=tracking_confidence,
-        )
+        self.max_num_hands = max_num_hands
+        self.detection_confidence = detection_confidence
+        self.tracking_confidence = tracking_confidence
+        self.model_complexity = model_complexity
+        self.inference_scale = inference_scale
+        self.detect_interval = max(1, detect_interval)
+        self.static_image_mode = static_image_mode
+
+        self._graphs: Dict[tuple, object] = {}
+        self._hands = self._graph()
+
+        self._frame_count = 0
+        self._last_hands: List[List[Point3D]] = []
+        self._last_count = 0
+
+    def _graph(self):
+        key = tuple(getattr(self, name) for name in _GRAPH_SETTINGS)
+        hands = self._graphs.get(key)
+        if hands is None:
+            hands = self._mp_hands.Hands(
+                static_image_mode=self.static_image_mode,
+                max_num_hands=self.max_num_hands,
+                model_complexity=self.model_complexity,
+                min_detection_confidence=self.detection_confidence,
+                min_tracking_confidence=self.tracking_confidence,
+            )
+            self._graphs[key] = hands
+        return hands
+
+    def settings(self) -> Dict[str, float]:
+        return {
+            "max_num_hands": self.max_num_hands,
+            "model_complexity": self.model_complexity,
+            "detection_confidence": self.detection_confidence,
+            "tracking_confidence": self.tracking_confidence,
+            "inference_scale": self.inference_scale,
+            "detect_interval": self.detect_interval,
+            "static_image_mode": self.static_image_mode,
+        }
+
+    def configure(self, **settings) -> None:
+        """
+        Change detector settings at runtime.
+
+        Only graph settings switch the MediaPipe graph (built on first use,
+        then reused); inference_scale / detect_interval apply immediately.
+        """
+        unknown = set(settings) - set(self.settings())
+        if unknown:
+            raise ValueError(f"Unknown detector setting(s): {sorted(unknown)}")
+
+        for name, value in settings.items():
+            setattr(self, name, value)
+        self.detect_interval = max(1, int(self.detect_interval))
+
+        if any(name in _GRAPH_SETTINGS for name in settings):
+            self._hands = self._graph()
+
+    def _process(self, frame_bgr):
+        if self.inference_scale != 1.0:
+            frame_bgr = cv2.resize(
+                frame_bgr,
+                None,
+                fx=self.inference_scale,
+                fy=self.inference_scale,
+                interpolation=cv2.INTER_AREA,
+            )
+        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        return self._hands.process(rgb)
 
     def detect(self, frame_bgr) -> List[List[Point3D]]:
         """
@@ -45,9 +133,12 @@ class MediaPipeHandDetector:
             List of hands.
             Each hand = list of 21 (x, y, z) points in pixel coordinates.
         """
+        self._frame_count += 1
+        if self.detect_interval > 1 and (self._frame_count - 1) % self.detect_interval:
+            return self._last_hands
+
         h, w, _ = frame_bgr.shape
-        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        result = self._hands.process(rgb)
+        result = self._process(frame_bgr)
 
         all_hands: List[List[Point3D]] = []
         if result.multi_hand_landmarks:
@@ -58,16 +149,52 @@ class MediaPipeHandDetector:
                     pts.append((x, y, lm.z))
                 all_hands.append(pts)
 
+        self._last_hands = all_hands
         return all_hands
 
+    def detect_into(self, frame_bgr, out, rgb=None, small=None) -> int:
+        """
+        `detect` without per-frame result lists: writes up to len(out)
+        hands as pixel (x, y, z) into `out` (float32, (H, 21, 3)) and
+        returns the number of hands.
+
+        `rgb` (frame-sized, or `small`-sized with inference_scale != 1)
+        and `small` are reused as cvtColor / resize destinations, so no
+        frame-sized arrays are allocated on the Python side.
+        """
+        self._frame_count += 1
+        if self.detect_interval > 1 and (self._frame_count - 1) % self.detect_interval:
+            return self._last_count
+
+        h, w = frame_bgr.shape[:2]
+        src = frame_bgr
+        if self.inference_scale != 1.0:
+            src = cv2.resize(frame_bgr, None if small is None else (small.shape[1], small.shape[0]),
+                             dst=small, fx=self.inference_scale, fy=self.inference_scale,
+                             interpolation=cv2.INTER_AREA)
+        rgb = cv2.cvtColor(src, cv2.COLOR_BGR2RGB, dst=rgb)
+        result = self._hands.process(rgb)
+
+        n = 0
+        if result.multi_hand_landmarks:
+            for hand_lms in result.multi_hand_landmarks:
+                if n >= out.shape[0]:
+                    break
+                row = out[n]
+                for j, lm in enumerate(hand_lms.landmark):
+                    row[j, 0] = int(lm.x * w)
+                    row[j, 1] = int(lm.y * h)
+                    row[j, 2] = lm.z
+                n += 1
+        self._last_count = n
+        return n
+
     def draw_on_frame(self, frame_bgr) -> None:
         """
         Convenience: re-run mediapipe and draw landmarks on the given frame.
         (Not used in main pipeline yet, but handy for quick debugging.)
         """
-        h, w, _ = frame_bgr.shape
-        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-        result = self._hands.process(rgb)
+        result = self._process(frame_bgr)
 
         if result.multi_hand_landmarks:
             for hand_lms in result.multi_hand_landmarks:
@@ -78,4 +205,6 @@ class MediaPipeHandDetector:
                 )
 
     def close(self) -> None:
-        self._hands.close()
+        for hands in self._graphs.values():
+            hands.close()
+        self._graphs.clear()
@@ -0,0 +1,122 @@
+"""
+Motion gate for RT-Gesture3D.
+
+Skips MediaPipe when nothing in front of the camera changed.
+
+Each frame is shrunk to a tiny grayscale thumbnail (32x24 by default)
+and compared with the thumbnail of the last frame the detector actually
+ran on. A thumbnail pixel "changed" when it differs by more than
+`pixel_threshold` grey levels; small global shifts (auto exposure,
+sensor noise) stay below that. The detector is skipped (and its last
+result reused) while:
+    - the previous result had no hands, and
+    - the fraction of changed pixels stays below `threshold`.
+
+After `idle_timeout_s` without motion the gate reports `idle`, and the
+capture loop should poll at `idle_poll_interval_s` instead of every
+frame. The first frame that differs wakes it up again.
+"""
+
+import time
+from typing import Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+
+class MotionGate:
+    """
+    Example:
+        gate = MotionGate()
+        if gate.update(frame, hands_present=bool(last_hands)):
+            last_hands = detector.detect(frame)
+        key = cv2.waitKey(gate.wait_ms())
+    """
+
+    def __init__(
+        self,
+        thumb_size: Tuple[int, int] = (32, 24),
+        threshold: float = 0.004,
+        pixel_threshold: int = 15,
+        idle_timeout_s: float = 10.0,
+        idle_poll_interval_s: float = 0.25,
+        refresh_interval_s: float = 2.0,
+    ) -> None:
+        self.thumb_size = thumb_size
+        self.threshold = threshold
+        self.pixel_threshold = pixel_threshold
+        self.idle_timeout_s = idle_timeout_s
+        self.idle_poll_interval_s = idle_poll_interval_s
+        self.refresh_interval_s = refresh_interval_s
+
+        w, h = thumb_size
+        # nearest-neighbour to 4x the thumbnail first (reads only a few pixels of the
+        # full frame), then area-average down so sensor noise is smoothed out
+        self._sample = np.zeros((h * 4, w * 4, 3), dtype=np.uint8)
+        self._small = np.zeros((h, w, 3), dtype=np.uint8)
+        self._thumb = np.zeros((h, w), dtype=np.uint8)
+        self._ref = np.zeros((h, w), dtype=np.uint8)
+        self._diff = np.zeros((h, w), dtype=np.uint8)
+        self._has_ref = False
+
+        self._last_motion = 0.0
+        self._last_detect = 0.0
+        self.idle = False
+        self.last_score = 0.0
+
+        self.frames = 0
+        self.detections = 0
+
+    def motion_score(self, frame_bgr: np.ndarray) -> float:
+        """
+        Fraction (0..1) of thumbnail pixels that changed since the reference.
+        """
+        cv2.resize(frame_bgr, self._sample.shape[1::-1], dst=self._sample, interpolation=cv2.INTER_NEAREST)
+        cv2.resize(self._sample, self.thumb_size, dst=self._small, interpolation=cv2.INTER_AREA)
+        cv2.cvtColor(self._small, cv2.COLOR_BGR2GRAY, dst=self._thumb)
+        if not self._has_ref:
+            return float("inf")
+        cv2.absdiff(self._thumb, self._ref, dst=self._diff)
+        cv2.threshold(self._diff, self.pixel_threshold, 255, cv2.THRESH_BINARY, dst=self._diff)
+        return cv2.countNonZero(self._diff) / self._diff.size
+
+    def update(self, frame_bgr: np.ndarray, hands_present: bool, now: Optional[float] = None) -> bool:
+        """
+        Returns True when the detector should run on this frame.
+        """
+        if now is None:
+            now = time.perf_counter()
+        self.frames += 1
+
+        self.last_score = self.motion_score(frame_bgr)
+        motion = self.last_score > self.threshold
+        if motion:
+            self._last_motion = now
+            self.idle = False
+        elif not hands_present and now - self._last_motion > self.idle_timeout_s:
+            self.idle = True
+
+        # hands in view → keep MediaPipe tracking every frame
+        run = hands_present or motion or (now - self._last_detect > self.refresh_interval_s)
+        if run:
+            self._ref, self._thumb = self._thumb, self._ref
+            self._has_ref = True
+            self._last_detect = now
+            self.detections += 1
+            if hands_present:
+                self.idle = False
+        return run
+
+    def wait_ms(self, active_ms: int = 1) -> int:
+        """
+        Delay for `cv2.waitKey` (or sleep) before grabbing the next frame.
+        """
+        return int(self.idle_poll_interval_s * 1000) if self.idle else active_ms
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "frames": self.frames,
+            "detections": self.detections,
+            "skipped": self.frames - self.detections,
+            "idle": self.idle,
+        }
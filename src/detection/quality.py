@@ -0,0 +1,161 @@
+"""
+Adaptive quality control for RT-Gesture3D.
+
+`AdaptiveQualityController` watches the rolling per-frame processing
+time and walks a quality ladder on `MediaPipeHandDetector` to hold a
+target FPS:
+
+    level 0  best quality  (full model, full resolution, every frame)
+    ...
+    level N  cheapest      (lite model, half resolution, detect every 3rd frame)
+
+Hysteresis:
+    - decisions need a full window of samples and a cooldown since the
+      last change;
+    - degrade when the mean is above budget * degrade_ratio, upgrade only
+      when it is below budget * upgrade_ratio (a wide dead band);
+    - if an upgrade is undone by a degrade shortly after, the next upgrade
+      to that level waits twice as long (exponential back-off), so the
+      controller settles instead of oscillating.
+
+Measure processing time only (detect → classify → render), not the time
+spent blocked in `cap.read()`, or a 30 FPS camera will always look slow
+against a 60 FPS target.
+"""
+
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    model_complexity: int
+    inference_scale: float
+    detect_interval: int
+    max_num_hands: int
+
+    def settings(self) -> Dict[str, float]:
+        return asdict(self)
+
+
+def default_ladder(max_num_hands: int = 1) -> List[QualityLevel]:
+    """
+    Quality ladder from best to cheapest. Hand count is reduced first.
+    """
+    ladder = [QualityLevel(1, 1.0, 1, n) for n in range(max_num_hands, 0, -1)]
+    ladder += [
+        QualityLevel(0, 1.0, 1, 1),
+        QualityLevel(0, 0.75, 1, 1),
+        QualityLevel(0, 0.5, 1, 1),
+        QualityLevel(0, 0.5, 2, 1),
+        QualityLevel(0, 0.5, 3, 1),
+    ]
+    return ladder
+
+
+class AdaptiveQualityController:
+    """
+    Example:
+        controller = AdaptiveQualityController(detector, target_fps=30)
+        while True:
+            t0 = time.perf_counter()
+            ...  # detect / classify / render
+            controller.record(time.perf_counter() - t0)
+    """
+
+    def __init__(
+        self,
+        detector,
+        target_fps: float = 30.0,
+        ladder: Optional[Sequence[QualityLevel]] = None,
+        start_level: int = 0,
+        window: int = 30,
+        cooldown_frames: int = 60,
+        degrade_ratio: float = 1.0,
+        upgrade_ratio: float = 0.6,
+        log: Callable[[str], None] = print,
+    ) -> None:
+        if target_fps <= 0:
+            raise ValueError("target_fps must be > 0")
+
+        self.detector = detector
+        self.budget_s = 1.0 / target_fps
+        self.ladder = list(ladder) if ladder is not None else default_ladder(getattr(detector, "max_num_hands", 1))
+        self.level = min(max(start_level, 0), len(self.ladder) - 1)
+        self.window = window
+        self.cooldown_frames = cooldown_frames
+        self.degrade_ratio = degrade_ratio
+        self.upgrade_ratio = upgrade_ratio
+        self.log = log
+
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._frame = 0
+        self._last_change = 0
+        self._last_upgrade_frame = -1
+        self._upgrade_backoff: Dict[int, int] = {}   # level → extra frames to wait before upgrading into it
+        self.decisions: List[Dict[str, float]] = []
+
+        self._apply()
+
+    @property
+    def current(self) -> QualityLevel:
+        return self.ladder[self.level]
+
+    def _apply(self) -> None:
+        self.detector.configure(**self.current.settings())
+
+    def _change(self, new_level: int, mean_s: float, reason: str) -> QualityLevel:
+        old = self.level
+        self.level = new_level
+        self._apply()
+        self._samples.clear()
+        self._last_change = self._frame
+
+        decision = {
+            "frame": self._frame,
+            "time": time.time(),
+            "from_level": old,
+            "to_level": new_level,
+            "mean_ms": mean_s * 1000.0,
+            "budget_ms": self.budget_s * 1000.0,
+            "reason": reason,
+            **self.current.settings(),
+        }
+        self.decisions.append(decision)
+        arrow = "↓" if new_level > old else "↑"
+        self.log(
+            f"⚙️ Quality {arrow} level {old} → {new_level} ({reason}: mean {mean_s * 1000:.1f} ms, "
+            f"budget {self.budget_s * 1000:.1f} ms) {self.current.settings()}"
+        )
+        return self.current
+
+    def record(self, frame_seconds: float) -> Optional[QualityLevel]:
+        """
+        Add one frame's processing time. Returns the new level when it changed.
+        """
+        self._frame += 1
+        self._samples.append(frame_seconds)
+
+        if len(self._samples) < self.window:
+            return None
+        if self._frame - self._last_change < self.cooldown_frames:
+            return None
+
+        mean_s = sum(self._samples) / len(self._samples)
+
+        if mean_s > self.budget_s * self.degrade_ratio and self.level < len(self.ladder) - 1:
+            # an upgrade that could not hold makes the next attempt wait longer
+            if self._last_upgrade_frame == self._last_change:
+                self._upgrade_backoff[self.level] = max(self.cooldown_frames, 2 * self._upgrade_backoff.get(self.level, 0))
+            return self._change(self.level + 1, mean_s, "over budget")
+
+        if mean_s < self.budget_s * self.upgrade_ratio and self.level > 0:
+            target = self.level - 1
+            if self._frame - self._last_change < self.cooldown_frames + self._upgrade_backoff.get(target, 0):
+                return None
+            self._last_upgrade_frame = self._frame
+            return self._change(target, mean_s, "headroom")
+
+        return None
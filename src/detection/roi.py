@@ -0,0 +1,232 @@
+"""
+ROI crop-and-redetect hand detection for RT-Gesture3D.
+
+On a 4K ceiling camera a hand covers a few hundred pixels. MediaPipe
+shrinks its input to a couple of hundred pixels anyway, so on the full
+frame small hands are lost, and the RGB conversion of the whole frame
+is most of the cost. `RoiHandDetector` works in two levels:
+
+    1. proposals: hand boxes from the previous frame's landmarks
+       (tracking), or from a cheap pass on a downscaled copy of the
+       frame (`proposal_width` pixels wide) when there is nothing to
+       track or tracking was lost
+    2. refinement: each box is made square, padded, clamped to the
+       frame and cut out at full resolution (a view, no copy; only
+       crops larger than `max_crop` are downscaled), MediaPipe runs on
+       the crop, and the landmarks are mapped back to full-frame pixels
+
+Per-frame cost follows hand area rather than frame area; the downscaled
+pass only runs when a hand has to be (re)found, plus every
+`propose_interval` frames while fewer than `max_num_hands` are tracked.
+
+    detector = RoiHandDetector(max_num_hands=2)
+    hands = detector.detect(frame_4k)      # same output as MediaPipeHandDetector.detect
+
+Frames no wider than `proposal_width` skip the crop stage (the single
+pass already sees the hand at full resolution).
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import cv2
+
+from .mediapipe_wrapper import MediaPipeHandDetector, Point3D
+
+Box = Tuple[int, int, int, int]   # x0, y0, x1, y1 (exclusive), full-frame pixels
+
+
+def hand_box(pts: Sequence[Point3D]) -> Box:
+    xs = [p[0] for p in pts]
+    ys = [p[1] for p in pts]
+    return min(xs), min(ys), max(xs) + 1, max(ys) + 1
+
+
+def expand_box(box: Box, pad: float, min_size: int, frame_w: int, frame_h: int) -> Box:
+    """
+    Square box around `box`, `pad` x its longest side added on every
+    side, at least `min_size`, shifted (then clipped) to stay inside the frame.
+    """
+    x0, y0, x1, y1 = box
+    side = max(int(max(x1 - x0, y1 - y0) * (1.0 + 2.0 * pad)), min_size)
+    side = min(side, frame_w, frame_h)
+    cx, cy = (x0 + x1) // 2, (y0 + y1) // 2
+    nx0 = min(max(cx - side // 2, 0), frame_w - side)
+    ny0 = min(max(cy - side // 2, 0), frame_h - side)
+    return nx0, ny0, nx0 + side, ny0 + side
+
+
+def box_iou(a: Box, b: Box) -> float:
+    ix = max(0, min(a[2], b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0.0
+
+
+def merge_boxes(boxes: Sequence[Box], iou: float = 0.3) -> List[Box]:
+    """
+    Drop boxes overlapping an earlier one by more than `iou` (one crop per hand).
+    """
+    kept: List[Box] = []
+    for b in boxes:
+        if all(box_iou(b, k) <= iou for k in kept):
+            kept.append(b)
+    return kept
+
+
+def crop_to_frame(hand: Sequence[Point3D], box: Box, scale: float, frame_w: int) -> List[Point3D]:
+    """
+    Landmarks detected on a crop (optionally resized by `scale`) → full-frame pixels.
+
+    z is in image-width units (MediaPipe): crop width → frame width.
+    """
+    x0, y0, x1, _ = box
+    z_scale = (x1 - x0) / frame_w
+    inv = 1.0 / scale
+    return [(x0 + int(round(x * inv)), y0 + int(round(y * inv)), z * z_scale) for x, y, z in hand]
+
+
+class RoiHandDetector:
+    """
+    Two-level detector with the `MediaPipeHandDetector` interface
+    (`detect`, `settings`, `configure`, `close`), so it also works with
+    `AdaptiveQualityController` and the motion gate.
+
+    `proposer` / `refiner` can be passed in (anything with `detect`,
+    `configure` and `close`); by default the proposer is a light
+    graph on the downscaled frame and the refiner a single-hand graph
+    for the crops.
+    """
+
+    def __init__(
+        self,
+        max_num_hands: int = 1,
+        proposal_width: int = 640,
+        pad: float = 0.35,
+        min_crop: int = 160,
+        max_crop: int = 480,
+        model_complexity: int = 1,
+        propose_interval: int = 15,
+        detect_interval: int = 1,
+        proposer=None,
+        refiner=None,
+    ) -> None:
+        self.max_num_hands = max_num_hands
+        self.proposal_width = proposal_width
+        self.pad = pad
+        self.min_crop = min_crop
+        self.max_crop = max_crop
+        self.model_complexity = model_complexity
+        self.propose_interval = max(1, propose_interval)
+        self.detect_interval = max(1, detect_interval)
+        self.inference_scale = 1.0
+
+        # both graphs see unrelated images from call to call: no MediaPipe tracking
+        self.proposer = proposer or MediaPipeHandDetector(
+            max_num_hands=max_num_hands, model_complexity=0, static_image_mode=True
+        )
+        self.refiner = refiner or MediaPipeHandDetector(
+            max_num_hands=1, model_complexity=model_complexity, static_image_mode=True
+        )
+
+        self._frame_count = 0
+        self._last_hands: List[List[Point3D]] = []
+        self.last_boxes: List[Box] = []
+        self.stats_counts = {"frames": 0, "proposal_passes": 0, "crops": 0, "lost": 0}
+        self._pixels = 0
+        self._frame_pixels = 0
+
+    # ---------- MediaPipeHandDetector-compatible settings ----------
+    def settings(self) -> Dict[str, float]:
+        return {
+            "max_num_hands": self.max_num_hands,
+            "model_complexity": self.model_complexity,
+            "inference_scale": self.inference_scale,
+            "detect_interval": self.detect_interval,
+        }
+
+    def configure(self, **settings) -> None:
+        """
+        inference_scale shrinks the proposal pass and the crop size limit;
+        model_complexity applies to the crops.
+        """
+        unknown = set(settings) - set(self.settings())
+        if unknown:
+            raise ValueError(f"Unknown detector setting(s): {sorted(unknown)}")
+        for name, value in settings.items():
+            setattr(self, name, value)
+        self.detect_interval = max(1, int(self.detect_interval))
+        self.proposer.configure(max_num_hands=self.max_num_hands)
+        self.refiner.configure(model_complexity=self.model_complexity)
+
+    # ---------- detection ----------
+    def _propose(self, frame) -> List[Box]:
+        self.stats_counts["proposal_passes"] += 1
+        w = frame.shape[1]
+        scale = min(1.0, self.proposal_width * self.inference_scale / w)
+        self.proposer.configure(inference_scale=scale)
+        self._pixels += int(frame.shape[0] * w * scale * scale)
+        return [hand_box(h) for h in self.proposer.detect(frame)]
+
+    def _refine(self, frame, boxes: Sequence[Box]) -> List[List[Point3D]]:
+        h, w = frame.shape[:2]
+        limit = max(int(self.max_crop * self.inference_scale), 64)
+        hands: List[List[Point3D]] = []
+        self.last_boxes = []
+        for box in merge_boxes([expand_box(b, self.pad, self.min_crop, w, h) for b in boxes]):
+            x0, y0, x1, y1 = box
+            crop = frame[y0:y1, x0:x1]
+            scale = min(1.0, limit / (x1 - x0))
+            if scale < 1.0:
+                crop = cv2.resize(crop, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+            self.stats_counts["crops"] += 1
+            self._pixels += crop.shape[0] * crop.shape[1]
+            found = self.refiner.detect(crop)
+            if found:
+                hands.append(crop_to_frame(found[0], box, scale, w))
+                self.last_boxes.append(box)
+            if len(hands) >= self.max_num_hands:
+                break
+        return hands
+
+    def detect(self, frame_bgr) -> List[List[Point3D]]:
+        self._frame_count += 1
+        if self.detect_interval > 1 and (self._frame_count - 1) % self.detect_interval:
+            return self._last_hands
+
+        h, w = frame_bgr.shape[:2]
+        self.stats_counts["frames"] += 1
+        self._frame_pixels += h * w
+
+        if w <= self.proposal_width:
+            self.proposer.configure(inference_scale=self.inference_scale)
+            self._pixels += int(h * w * self.inference_scale ** 2)
+            self.stats_counts["proposal_passes"] += 1
+            self._last_hands = self.proposer.detect(frame_bgr)
+            return self._last_hands
+
+        tracked = [hand_box(p) for p in self._last_hands]
+        searching = len(tracked) < self.max_num_hands and (self._frame_count - 1) % self.propose_interval == 0
+        boxes = tracked + (self._propose(frame_bgr) if searching or not tracked else [])
+        hands = self._refine(frame_bgr, boxes)
+
+        if tracked and len(hands) < len(tracked) and not searching:
+            # a tracked hand left its box: search the whole (downscaled) frame again
+            self.stats_counts["lost"] += 1
+            hands = self._refine(frame_bgr, [hand_box(p) for p in hands] + self._propose(frame_bgr))
+
+        self._last_hands = hands
+        return hands
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Counters plus `pixel_ratio`: pixels handed to MediaPipe / full-frame pixels.
+        """
+        return {
+            **self.stats_counts,
+            "pixel_ratio": round(self._pixels / self._frame_pixels, 4) if self._frame_pixels else 0.0,
+        }
+
+    def close(self) -> None:
+        self.proposer.close()
+        self.refiner.close()
@@ -1,121 +1,14 @@
 import cv2
 import mediapipe as mp
-import math
+import sys
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-# ==============================
-# Gesture helper functions
-# ==============================
-
-def _dist(a, b):
-    """Euclidean distance between two (x,y) points."""
-    return math.hypot(a[0] - b[0], a[1] - b[1])
-
-
-def finger_extended_states(landmarks):
-    """
-    landmarks: list of 21 (x,y,z) in pixel coords
-    returns: dict -> thumb, index, middle, ring, pinky (True = extended)
-    """
-    tips_idx = {
-        "thumb": 4,
-        "index": 8,
-        "middle": 12,
-        "ring": 16,
-        "pinky": 20,
-    }
-
-    pips_idx = {
-        "thumb": 3,
-        "index": 6,
-        "middle": 10,
-        "ring": 14,
-        "pinky": 18,
-    }
-
-    states = {"thumb": False, "index": False, "middle": False, "ring": False, "pinky": False}
-
-    # Index..pinky: tip y < pip y => extended (camera upright)
-    for name in ["index", "middle", "ring", "pinky"]:
-        tip_id = tips_idx[name]
-        pip_id = pips_idx[name]
-        tip_y = landmarks[tip_id][1]
-        pip_y = landmarks[pip_id][1]
-        states[name] = (tip_y < pip_y - 5)
-
-    # Thumb: horizontal distance from wrist + IP joint
-    wrist_x = landmarks[0][0]
-    thumb_tip_x = landmarks[tips_idx["thumb"]][0]
-    thumb_ip_x = landmarks[pips_idx["thumb"]][0]
-
-    if abs(thumb_tip_x - wrist_x) > 30:
-        states["thumb"] = True
-    else:
-        states["thumb"] = abs(thumb_tip_x - thumb_ip_x) > 20
-
-    return states
-
-
-def detect_gesture_from_landmarks(pts, img_w, img_h):
-    """
-    Returns (gid, label, confidence)
-
-    ID mapping:
-      0 - neutral
-      1 - victory (✌️)
-      2 - ok (👍🏻)
-      3 - perfect (👌🏻)
-      4 - stop (🤚🏻)
-      5 - rock (🤘🏻)
-      6 - calm (☝🏻)
-    """
-    st = finger_extended_states(pts)
-    ext_count = sum(st.values())
-
-    tip = lambda idx: (pts[idx][0], pts[idx][1])
-    thumb_tip = tip(4)
-    index_tip = tip(8)
-
-    # thumb–index distance for perfect
-    d_thumb_index = _dist(thumb_tip, index_tip)
-    scale_thresh = max(40, int(img_w * 0.07))   # ~7% of width or min 40px
-
-    # PERFECT (👌)
-    if d_thumb_index < scale_thresh and st["thumb"] and st["index"]:
-        return 3, "perfect", 0.95
-
-    # STOP (🤚🏻)
-    non_thumb_ext = [st["index"], st["middle"], st["ring"], st["pinky"]]
-    if sum(non_thumb_ext) >= 4:
-        return 4, "stop", 0.9
-
-    # ROCK (🤘)
-    if st["index"] and st["pinky"] and (not st["middle"]) and (not st["ring"]):
-        return 5, "rock", 0.9
-
-    # VICTORY (✌️)
-    if st["index"] and st["middle"] and (not st["ring"]) and (not st["pinky"]):
-        return 1, "victory", 0.92
-
-    # CALM (☝🏻)
-    if st["index"] and (not st["middle"]) and (not st["ring"]) and (not st["pinky"]):
-        return 6, "calm", 0.9
-
-    # OK / thumbs-up (👍🏻)
-    if st["thumb"] and (not st["index"]) and (not st["middle"]) and (not st["ring"]) and (not st["pinky"]):
-        return 2, "ok", 0.9
-
-    # fallback: agar sirf 1 finger extended hai
-    if ext_count == 1:
-        if st["thumb"]:
-            return 2, "ok", 0.8
-        if st["index"]:
-            return 6, "calm", 0.8
-        if st["pinky"]:
-            return 5, "rock", 0.75
-
-    return 0, "neutral", 0.5
+from src.capture.sources import open_source
+from src.inference.backends import load_backend
 
 
 # ==============================
@@ -201,16 +94,18 @@ def main():
     hands = mp_hands.Hands(max_num_hands=1)
     mp_draw = mp.solutions.drawing_utils
 
-    cap = cv2.VideoCapture(0)
+    source = open_source(sys.argv[1] if len(sys.argv) > 1 else "0", prefetch=True)
+    # same rule engine as the main pipeline (src/inference/predictor.py) unless another backend spec is given
+    classifier = load_backend(sys.argv[2] if len(sys.argv) > 2 else "rules")
 
-    if not cap.isOpened():
+    if not source.isOpened():
         print("❌ Error: Camera could not be opened. Check if another app is using it.")
         return
 
     print("✅ Camera opened. Press 'q' to quit.")
 
     while True:
-        ret, frame = cap.read()
+        ret, frame = source.read()
         if not ret:
             print("❌ Error: Failed to read from camera.")
             break
@@ -232,7 +127,7 @@ def main():
                     x, y = int(lm.x * w), int(lm.y * h)
                     pts.append((x, y, lm.z))
 
-                gid, label, conf = detect_gesture_from_landmarks(pts, w, h)
+                label, gid, conf = classifier(pts, w, h)
                 label_text = label
                 conf_text = conf
 
@@ -258,7 +153,7 @@ def main():
             print("👋 Q pressed, exiting...")
             break
 
-    cap.release()
+    source.close()
     cv2.destroyAllWindows()
     print("✅ Clean exit.")
 
@@ -0,0 +1,359 @@
+"""
+Gesture-event analytics log for RT-Gesture3D.
+
+Keeps a per-kiosk history of recognised gestures (when, which hand, how
+confident, how long) without writing a line per frame:
+
+    - `AnalyticsSink.emit` appends a gesture event (see `events.py`) to
+      typed in-memory columns; that is all the frame loop ever does
+    - when `flush_rows` events are buffered or `flush_interval_s` has
+      passed, the columns are handed to a background thread that writes
+      them as one compressed Parquet row group
+    - files rotate every hour and when they grow past `max_file_mb`:
+
+        <root>/<kiosk>/<YYYY-MM-DD>/<HH>-<part>.parquet
+
+The background thread only receives whole batches through a bounded
+queue; if the disk falls behind, whole batches are dropped and counted
+(`stats()["dropped_rows"]`) rather than stalling the frame loop.
+
+A file becomes readable once it is rotated or the sink is closed (the
+Parquet footer is written last). `query_events` reads only the files of
+the requested hours and only the requested columns, and lets Parquet
+skip row groups outside the time range using their min/max statistics:
+
+    sink = AnalyticsSink("data/analytics", kiosk="lobby-1")
+    sink.emit(event)
+    df = query_events("data/analytics", kiosk="lobby-1", columns=["t", "gesture"], start=time.time() - 3600)
+
+    python -m src.inference.headless --analytics data/analytics --kiosk lobby-1
+    python -m src.inference.analytics data/analytics --since 24h --summary
+"""
+
+import argparse
+import queue
+import threading
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+COLUMNS = ("t", "type", "gesture", "gesture_id", "hand", "confidence", "dwell_s")
+
+SCHEMA = pa.schema([
+    ("t", pa.float64()),                                   # unix time (s)
+    ("type", pa.dictionary(pa.int8(), pa.string())),       # "start" / "end"
+    ("gesture", pa.dictionary(pa.int8(), pa.string())),
+    ("gesture_id", pa.int16()),
+    ("hand", pa.int8()),
+    ("confidence", pa.float32()),
+    ("dwell_s", pa.float32()),                             # NaN for "start"
+])
+
+
+class _Columns:
+    """
+    Typed column buffers for one batch.
+    """
+
+    def __init__(self) -> None:
+        self.t = array("d")
+        self.type: List[str] = []
+        self.gesture: List[str] = []
+        self.gesture_id = array("h")
+        self.hand = array("b")
+        self.confidence = array("f")
+        self.dwell_s = array("f")
+        self.created = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.t)
+
+    def append(self, event: Dict[str, object]) -> None:
+        self.t.append(float(event["t"]))
+        self.type.append(str(event["type"]))
+        self.gesture.append(str(event["gesture"]))
+        self.gesture_id.append(int(event.get("gesture_id", -1)))
+        self.hand.append(int(event.get("hand", 0)))
+        self.confidence.append(float(event.get("confidence", 0.0)))
+        self.dwell_s.append(float(event.get("dwell_s", float("nan"))))
+
+    def to_table(self) -> pa.Table:
+        return pa.table({
+            "t": pa.array(self.t, pa.float64()),
+            "type": pa.array(self.type, pa.string()).dictionary_encode().cast(SCHEMA.field("type").type),
+            "gesture": pa.array(self.gesture, pa.string()).dictionary_encode().cast(SCHEMA.field("gesture").type),
+            "gesture_id": pa.array(self.gesture_id, pa.int16()),
+            "hand": pa.array(self.hand, pa.int8()),
+            "confidence": pa.array(self.confidence, pa.float32()),
+            "dwell_s": pa.array(self.dwell_s, pa.float32()),
+        }, schema=SCHEMA)
+
+
+class AnalyticsSink:
+    """
+    Event sink (`emit` / `close` / `emitted`, like the sinks in
+    `events.py`) writing batched Parquet files from a background thread.
+
+    Events other than "start" / "end" (e.g. "sequence") are ignored.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        kiosk: str = "default",
+        flush_rows: int = 4096,
+        flush_interval_s: float = 60.0,
+        max_file_mb: float = 64.0,
+        compression: str = "zstd",
+        max_pending: int = 16,
+    ) -> None:
+        self.root = Path(root)
+        self.kiosk = kiosk
+        self.flush_rows = max(1, flush_rows)
+        self.flush_interval_s = flush_interval_s
+        self.max_file_bytes = int(max_file_mb * 1024 * 1024)
+        self.compression = compression
+
+        self._lock = threading.Lock()
+        self._buffer = _Columns()
+        self._queue: "queue.Queue[Optional[_Columns]]" = queue.Queue(maxsize=max_pending)
+        self._writer: Optional[pq.ParquetWriter] = None
+        self._writer_hour: Optional[str] = None
+        self._writer_path: Optional[Path] = None
+        self.files: List[Path] = []
+        self.emitted = 0
+        self.written_rows = 0
+        self.dropped_rows = 0
+        self.batches = 0
+        self.error: Optional[BaseException] = None
+
+        self._thread = threading.Thread(target=self._write_loop, name="analytics-writer", daemon=True)
+        self._thread.start()
+
+    # ---------- frame-loop side ----------
+    def emit(self, event: Dict[str, object]) -> None:
+        if event.get("type") not in ("start", "end"):
+            return
+        with self._lock:
+            self._buffer.append(event)
+            self.emitted += 1
+            if len(self._buffer) >= self.flush_rows:
+                self._hand_off()
+
+    def _hand_off(self) -> None:
+        # caller holds the lock
+        batch, self._buffer = self._buffer, _Columns()
+        if not len(batch):
+            return
+        try:
+            self._queue.put_nowait(batch)
+        except queue.Full:
+            self.dropped_rows += len(batch)
+
+    def flush(self) -> None:
+        """
+        Hand the current buffer to the writer thread now (non-blocking).
+        """
+        with self._lock:
+            self._hand_off()
+
+    # ---------- writer thread ----------
+    def _write_loop(self) -> None:
+        tick = max(min(self.flush_interval_s / 4.0, 1.0), 0.01)
+        while True:
+            try:
+                batch = self._queue.get(timeout=tick)
+            except queue.Empty:
+                with self._lock:
+                    if len(self._buffer) and time.monotonic() - self._buffer.created >= self.flush_interval_s:
+                        self._hand_off()
+                continue
+            if batch is None:
+                break
+            try:
+                self._write(batch)
+            except Exception as e:  # keep the frame loop alive; reported by stats() / close()
+                self.error = e
+                self.dropped_rows += len(batch)
+
+    def _path_for(self, hour: str) -> Path:
+        day, hh = hour.split("T")
+        folder = self.root / self.kiosk / day
+        folder.mkdir(parents=True, exist_ok=True)
+        part = 0
+        while (folder / f"{hh}-{part:03d}.parquet").exists():
+            part += 1
+        return folder / f"{hh}-{part:03d}.parquet"
+
+    def _close_writer(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self.files.append(self._writer_path)
+            self._writer = None
+
+    def _write(self, batch: _Columns) -> None:
+        table = batch.to_table()
+        # one file per hour: split the batch at hour boundaries (local time, like the folder names)
+        hours = [datetime.fromtimestamp(t).strftime("%Y-%m-%dT%H") for t in (batch.t[0], batch.t[-1])]
+        if hours[0] == hours[1]:
+            parts = [(hours[0], table)]
+        else:
+            keys = pd.Series([datetime.fromtimestamp(t).strftime("%Y-%m-%dT%H") for t in batch.t])
+            parts = [(hour, table.take(pa.array(idx.to_numpy())))
+                     for hour, idx in keys.groupby(keys, sort=False).groups.items()]
+
+        for hour, part in parts:
+            if self._writer is not None and (
+                hour != self._writer_hour or self._writer_path.stat().st_size >= self.max_file_bytes
+            ):
+                self._close_writer()
+            if self._writer is None:
+                self._writer_path = self._path_for(hour)
+                self._writer_hour = hour
+                self._writer = pq.ParquetWriter(self._writer_path, SCHEMA, compression=self.compression)
+            self._writer.write_table(part)       # one row group per batch
+            self.written_rows += part.num_rows
+        self.batches += 1
+
+    # ---------- shutdown / stats ----------
+    def close(self) -> None:
+        self.flush()
+        self._queue.put(None)
+        self._thread.join(timeout=30.0)
+        self._close_writer()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "emitted": self.emitted,
+            "written_rows": self.written_rows,
+            "dropped_rows": self.dropped_rows,
+            "batches": self.batches,
+            "files": len(self.files) + (self._writer is not None),
+            "error": repr(self.error) if self.error is not None else None,
+        }
+
+    def __enter__(self) -> "AnalyticsSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ---------- reading ----------
+def _hour_files(root: Path, kiosk: Optional[str], start: Optional[float], end: Optional[float]) -> List[Path]:
+    """
+    Parquet files whose hour (from the path) overlaps [start, end].
+    """
+    lo = datetime.fromtimestamp(start).replace(minute=0, second=0, microsecond=0) if start is not None else None
+    hi = datetime.fromtimestamp(end) if end is not None else None
+    files = []
+    for path in sorted(root.glob(f"{kiosk or '*'}/*/*.parquet")):
+        try:
+            hour = datetime.strptime(f"{path.parent.name} {path.stem.split('-')[0]}", "%Y-%m-%d %H")
+        except ValueError:
+            continue
+        if (lo is None or hour >= lo) and (hi is None or hour <= hi):
+            files.append(path)
+    return files
+
+
+def query_events(
+    root: Union[str, Path],
+    kiosk: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    gestures: Optional[Sequence[str]] = None,
+) -> pd.DataFrame:
+    """
+    Events with `start <= t < end` (unix seconds) as a DataFrame.
+
+    Only files of the overlapping hours are opened and only `columns`
+    are decoded (a "kiosk" column is added when several kiosks are read).
+    Files still being written (no footer yet) are skipped.
+    """
+    root = Path(root)
+    columns = list(columns) if columns else list(COLUMNS)
+    unknown = set(columns) - set(COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown analytics column(s): {sorted(unknown)}")
+
+    filters = []
+    if start is not None:
+        filters.append(("t", ">=", float(start)))
+    if end is not None:
+        filters.append(("t", "<", float(end)))
+    if gestures:
+        filters.append(("gesture", "in", list(gestures)))
+
+    frames = []
+    for path in _hour_files(root, kiosk, start, end):
+        try:
+            table = pq.read_table(path, columns=columns, filters=filters or None)
+        except (pa.ArrowInvalid, OSError):
+            continue       # in progress or truncated
+        df = table.to_pandas()
+        if kiosk is None:
+            df["kiosk"] = path.parent.parent.name
+        frames.append(df)
+    if not frames:
+        return pd.DataFrame(columns=columns + ([] if kiosk else ["kiosk"]))
+    return pd.concat(frames, ignore_index=True)
+
+
+# ---------- CLI ----------
+def _parse_since(spec: str) -> float:
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    if spec[-1] in units:
+        return time.time() - float(spec[:-1]) * units[spec[-1]]
+    return time.time() - float(spec)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Query the RT-Gesture3D gesture analytics log")
+    parser.add_argument("root", help="analytics folder (--analytics of the live demo / headless mode)")
+    parser.add_argument("--kiosk", default=None, help="only this kiosk (default: all)")
+    parser.add_argument("--since", default=None, help="e.g. 30m, 24h, 7d")
+    parser.add_argument("--columns", nargs="*", default=None, choices=list(COLUMNS))
+    parser.add_argument("--gesture", nargs="*", default=None)
+    parser.add_argument("--summary", action="store_true", help="per-gesture counts, confidence and dwell time")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    start = _parse_since(args.since) if args.since else None
+    columns = args.columns
+    if args.summary:
+        columns = ["t", "type", "gesture", "confidence", "dwell_s"]
+
+    t0 = time.perf_counter()
+    df = query_events(args.root, kiosk=args.kiosk, columns=columns, start=start, gestures=args.gesture)
+    elapsed = time.perf_counter() - t0
+    print(f"📊 {len(df)} event(s) in {elapsed * 1000:.1f} ms")
+    if df.empty:
+        return
+    if args.summary:
+        starts = df[df["type"] == "start"].groupby("gesture", observed=True)
+        ends = df[df["type"] == "end"].groupby("gesture", observed=True)
+        summary = pd.DataFrame({
+            "count": starts.size(),
+            "mean_confidence": starts["confidence"].mean().round(3),
+            "mean_dwell_s": ends["dwell_s"].mean().round(2),
+            "total_dwell_s": ends["dwell_s"].sum().round(1),
+        }).fillna(0).sort_values("count", ascending=False)
+        first, last = datetime.fromtimestamp(df["t"].min()), datetime.fromtimestamp(df["t"].max())
+        print(f"🕒 {first:%Y-%m-%d %H:%M:%S} → {last:%Y-%m-%d %H:%M:%S}")
+        print(summary.to_string())
+    else:
+        print(df.to_string(max_rows=50))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,448 @@
+"""
+Gesture classifier backends for RT-Gesture3D.
+
+A backend wraps one classifier implementation behind a common interface:
+
+    backend = load_backend("onnx:models/checkpoints/gesture_mlp.onnx")
+    key, gid, conf = backend(pts, img_w, img_h)               # one hand
+    keys, confs = backend.predict_batch(pts_array, img_w, img_h)   # (N, 21, 3)
+
+Backend specs (also used on the command line):
+
+    rules               scalar rule engine (`predictor.py`)
+    rules-vectorized    the same rules over whole batches (`batch_predictor.py`)
+    onnx:PATH           learned model (`OnnxGestureClassifier`)
+    template:PATH       few-shot template index (`TemplateMatcher`), rules as fallback
+    auto                fastest backend on this machine that agrees with `rules`
+    auto:SPEC,SPEC,...  the same, among the given candidates
+
+Specs are plain strings so worker processes can rebuild the same backend.
+Backend kinds live in `BACKENDS`; `register_backend` adds new ones.
+
+Auto selection (`select_backend`): every candidate classifies a fixed
+fixture set (seeded synthetic hands, optionally plus a landmark dataset);
+candidates whose gesture keys agree with the reference (`rules`) on at
+least `min_agreement` of the fixtures are timed on this host, per hand
+(the path the live pipelines use) or per batch, and the fastest one
+wins. The choice is cached per machine (~/.cache/rt-gesture3d/backends.json,
+keyed by host, Python / NumPy versions, candidates and model file
+stamps), so later startups skip the measurement:
+
+    python -m src.inference.backends list
+    python -m src.inference.backends select                     # rules, rules-vectorized, onnx if present
+    python -m src.inference.backends select --batch --candidate rules --candidate rules-vectorized
+    python -m src.inference.live_gesture_demo --backend auto
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+
+from ..processing.preprocess import hand_features_batch
+from .batch_predictor import ID_KEYS, detect_gestures_batch
+from .predictor import Point3D, detect_gesture_from_landmarks
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_ONNX_MODEL = PROJECT_ROOT / "models" / "checkpoints" / "gesture_mlp.onnx"
+CACHE_PATH = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "rt-gesture3d" / "backends.json"
+_CACHE_VERSION = 1
+
+
+class GestureBackend:
+    """
+    Base backend: `predict_batch` classifies hand by hand through `__call__`;
+    subclasses with a real batch path override it.
+    """
+
+    name = "backend"
+    needs_path = False
+
+    def __init__(self, spec: str, path: str = "") -> None:
+        self.spec = spec
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        raise NotImplementedError
+
+    def predict_batch(self, pts: np.ndarray, img_w: int, img_h: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        pts: (N, 21, 3) pixel landmarks of one image size
+        returns: gesture keys (N,) object, confidences (N,) float32
+        """
+        n = len(pts)
+        keys = np.empty(n, dtype=object)
+        confs = np.empty(n, dtype=np.float32)
+        for i, hand in enumerate(np.asarray(pts).tolist()):
+            keys[i], _, confs[i] = self(hand, img_w, img_h)
+        return keys, confs
+
+
+# backend kind (spec prefix) → class
+BACKENDS: Dict[str, Type[GestureBackend]] = {}
+
+
+def register_backend(cls: Type[GestureBackend]) -> Type[GestureBackend]:
+    """
+    Class decorator: make `cls` loadable as spec `cls.name` (`cls.name:PATH`
+    when `cls.needs_path`).
+    """
+    BACKENDS[cls.name] = cls
+    return cls
+
+
+@register_backend
+class RulesBackend(GestureBackend):
+    name = "rules"
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        return detect_gesture_from_landmarks(pts, img_w, img_h)
+
+
+@register_backend
+class VectorizedRulesBackend(GestureBackend):
+    name = "rules-vectorized"
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        ids, confs = detect_gestures_batch(np.asarray(pts, dtype=np.float32)[None], img_w, img_h)
+        gid = int(ids[0])
+        return ID_KEYS[gid], gid, float(confs[0])
+
+    def predict_batch(self, pts: np.ndarray, img_w: int, img_h: int) -> Tuple[np.ndarray, np.ndarray]:
+        if len(pts) == 0:
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.float32)
+        ids, confs = detect_gestures_batch(pts, img_w, img_h)
+        return ID_KEYS[ids], confs
+
+
+@register_backend
+class OnnxBackend(GestureBackend):
+    name = "onnx"
+    needs_path = True
+
+    def __init__(self, spec: str, path: str) -> None:
+        from .onnx_classifier import OnnxGestureClassifier   # onnxruntime only when asked for
+
+        if not Path(path).exists():
+            raise FileNotFoundError(f"ONNX model not found: {path}")
+        super().__init__(spec)
+        self.classifier = OnnxGestureClassifier(path)
+        self._keys = np.array(self.classifier.classes, dtype=object)
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        return self.classifier(pts, img_w, img_h)
+
+    def predict_batch(self, pts: np.ndarray, img_w: int, img_h: int) -> Tuple[np.ndarray, np.ndarray]:
+        if len(pts) == 0:
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.float32)
+        proba = self.classifier.predict_proba(hand_features_batch(pts, img_w))
+        best = proba.argmax(axis=1)
+        return self._keys[best], proba[np.arange(len(best)), best].astype(np.float32)
+
+
+@register_backend
+class TemplateBackend(GestureBackend):
+    name = "template"
+    needs_path = True
+
+    def __init__(self, spec: str, path: str) -> None:
+        from .template_matcher import TemplateMatcher
+
+        super().__init__(spec)
+        self.matcher = TemplateMatcher.load(path, fallback=detect_gesture_from_landmarks)
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        return self.matcher(pts, img_w, img_h)
+
+
+def load_backend(spec: str) -> GestureBackend:
+    """
+    Backend for a spec string (see module docstring).
+    """
+    kind, _, arg = spec.partition(":")
+    if kind == "auto":
+        candidates = [c for c in arg.split(",") if c] if arg else None
+        return select_backend(candidates).backend
+    cls = BACKENDS.get(kind)
+    if cls is None:
+        known = ", ".join(f"{k}:PATH" if c.needs_path else k for k, c in BACKENDS.items())
+        raise ValueError(f"Unknown backend {spec!r} (expected {known} or auto)")
+    if cls.needs_path and not arg:
+        raise ValueError(f"Backend {kind!r} needs a path: {kind}:PATH")
+    if arg and not cls.needs_path:
+        raise ValueError(f"Backend {kind!r} takes no path")
+    return cls(spec, arg) if cls.needs_path else cls(spec)
+
+
+# ---------- auto selection ----------
+def default_candidates() -> List[str]:
+    """
+    Both rule engines, plus the trained ONNX model when it and onnxruntime exist.
+    """
+    candidates = ["rules", "rules-vectorized"]
+    if DEFAULT_ONNX_MODEL.exists():
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            candidates.append(f"onnx:{DEFAULT_ONNX_MODEL}")
+    return candidates
+
+
+def fixture_set(n: int = 1000, seed: int = 0, extra: Optional[Sequence[str]] = None) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Agreement / timing fixtures: `n` seeded synthetic hands (integer pixel
+    coordinates, as the detector produces them) of one image size, plus
+    the hands of `extra` landmark datasets of that size.
+    """
+    from ..processing.synthetic import SyntheticHandGenerator
+
+    gen = SyntheticHandGenerator(seed=seed)
+    pts, _ = gen.sample(n)
+    size = (gen.config.img_w, gen.config.img_h)
+    parts = [pts]
+    if extra:
+        from ..training.datasets import load_landmark_dataset
+
+        ds = load_landmark_dataset(list(extra))
+        sel = (ds.image_size[:, 0] == size[0]) & (ds.image_size[:, 1] == size[1])
+        parts.append(ds.landmarks[sel])
+    pts = np.concatenate(parts).astype(np.float32)
+    pts[..., :2] = np.rint(pts[..., :2])
+    return pts, size
+
+
+def _host_key() -> Dict[str, object]:
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+    }
+
+
+def _spec_stamp(spec: str) -> str:
+    """
+    Spec plus size / mtime of its model file, so a retrained model is re-measured.
+    """
+    _, _, arg = spec.partition(":")
+    if arg and Path(arg).exists():
+        st = Path(arg).stat()
+        return f"{spec}@{st.st_size}:{int(st.st_mtime)}"
+    return spec
+
+
+def _cache_key(candidates: Sequence[str], reference: str, batch: bool, min_agreement: float, n_fixtures: int) -> str:
+    payload = {
+        "version": _CACHE_VERSION,
+        "host": _host_key(),
+        "candidates": sorted(_spec_stamp(c) for c in candidates),
+        "reference": _spec_stamp(reference),
+        "batch": batch,
+        "min_agreement": min_agreement,
+        "fixtures": n_fixtures,
+    }
+    return hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _read_cache(path: Path) -> Dict[str, dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_cache(path: Path, cache: Dict[str, dict]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        print(f"⚠️ Could not write backend cache {path}: {e}")
+
+
+def agreement(backend: GestureBackend, reference_keys: np.ndarray, pts: np.ndarray, size: Tuple[int, int]) -> float:
+    """
+    Fraction of fixture hands on which `backend` (per-hand path and batch
+    path) gives the reference gesture key.
+    """
+    if len(pts) == 0:
+        return 1.0
+    batch_keys, _ = backend.predict_batch(pts, *size)
+    single_keys = np.array([backend(hand, *size)[0] for hand in pts.tolist()], dtype=object)
+    same = (batch_keys.astype(str) == reference_keys.astype(str)) & (single_keys.astype(str) == reference_keys.astype(str))
+    return float(same.mean())
+
+
+def time_backend(
+    backend: GestureBackend, pts: np.ndarray, size: Tuple[int, int], batch: bool = False, repeats: int = 5
+) -> float:
+    """
+    Median µs per hand over `repeats` passes: hands one by one through
+    `__call__` (the live pipelines), or the whole set through `predict_batch`.
+    """
+    hands = pts.tolist()
+    backend.predict_batch(pts[:8], *size)           # warm-up (lazy sessions, caches)
+    samples = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        if batch:
+            backend.predict_batch(pts, *size)
+        else:
+            for hand in hands:
+                backend(hand, *size)
+        samples.append((time.perf_counter() - t0) / max(len(pts), 1) * 1e6)
+    return statistics.median(samples)
+
+
+class Selection:
+    """
+    Result of `select_backend`: the chosen backend plus, when measured
+    here, per-candidate agreement and µs per hand.
+    """
+
+    def __init__(self, backend: GestureBackend, results: Dict[str, dict], cached: bool) -> None:
+        self.backend = backend
+        self.results = results
+        self.cached = cached
+
+    @property
+    def spec(self) -> str:
+        return self.backend.spec
+
+    def format(self) -> str:
+        lines = []
+        width = max((len(spec) for spec in self.results), default=0) + 2
+        for spec, r in self.results.items():
+            if "error" in r:
+                lines.append(f"   {spec:<{width}} ❌ {r['error']}")
+                continue
+            us = f"{r['us_per_hand']:8.2f} µs/hand" if r.get("us_per_hand") is not None else "       (not timed)"
+            mark = "  ✅" if spec == self.spec else ""
+            lines.append(f"   {spec:<{width}} agreement {r['agreement'] * 100.0:6.2f}%  {us}{mark}")
+        source = "cached choice" if self.cached else "measured"
+        lines.append(f"🧠 Classifier backend: {self.spec} ({source})")
+        return "\n".join(lines)
+
+
+def select_backend(
+    candidates: Optional[Sequence[str]] = None,
+    reference: str = "rules",
+    min_agreement: float = 0.99,
+    batch: bool = False,
+    n_fixtures: int = 1000,
+    extra_fixtures: Optional[Sequence[str]] = None,
+    benchmark: bool = True,
+    cache_path: Optional[Path] = CACHE_PATH,
+    refresh: bool = False,
+) -> Selection:
+    """
+    Pick the fastest candidate that agrees with `reference` on the fixture set.
+
+    With `benchmark=False` no timing is done: the first agreeing
+    candidate (in the given order) wins. Candidates that fail to load or
+    disagree are skipped; the reference itself is the last resort. A cached
+    choice for the same host and candidates is reused unless `refresh`;
+    `cache_path=None` disables the cache.
+    """
+    candidates = list(candidates) if candidates else default_candidates()
+    key = None
+    if cache_path is not None and benchmark and not extra_fixtures:
+        key = _cache_key(candidates, reference, batch, min_agreement, n_fixtures)
+        entry = _read_cache(cache_path).get(key)
+        if entry is not None and not refresh:
+            try:
+                return Selection(load_backend(entry["spec"]), entry["results"], cached=True)
+            except (ValueError, OSError, ImportError):
+                pass                                    # model gone / broken: measure again
+
+    pts, size = fixture_set(n_fixtures, extra=extra_fixtures)
+    ref = load_backend(reference)
+    reference_keys, _ = ref.predict_batch(pts, *size)
+
+    results: Dict[str, dict] = {}
+    loaded: Dict[str, GestureBackend] = {}
+    for spec in candidates:
+        try:
+            backend = ref if spec == reference else load_backend(spec)
+        except (ValueError, OSError, ImportError) as e:
+            results[spec] = {"error": str(e)}
+            continue
+        results[spec] = {"agreement": agreement(backend, reference_keys, pts, size), "us_per_hand": None}
+        if results[spec]["agreement"] >= min_agreement:
+            loaded[spec] = backend
+
+    if not loaded:
+        chosen = ref
+    elif benchmark:
+        for spec, backend in loaded.items():
+            results[spec]["us_per_hand"] = time_backend(backend, pts, size, batch=batch)
+        chosen = loaded[min(loaded, key=lambda s: results[s]["us_per_hand"])]
+    else:
+        chosen = next(iter(loaded.values()))
+
+    if key is not None:
+        cache = _read_cache(cache_path)
+        cache[key] = {"spec": chosen.spec, "results": results, "time": time.time(), "batch": batch}
+        _write_cache(cache_path, cache)
+    return Selection(chosen, results, cached=False)
+
+
+# ---------- CLI ----------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RT-Gesture3D classifier backends")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="registered backend kinds and default auto candidates")
+
+    select = sub.add_parser("select", help="agreement check + micro-benchmark, cache the fastest agreeing backend")
+    select.add_argument("--candidate", action="append", default=None, metavar="SPEC",
+                        help="candidate backend (repeatable, default: rules, rules-vectorized, onnx if present)")
+    select.add_argument("--reference", default="rules", help="backend the others must agree with")
+    select.add_argument("--min-agreement", type=float, default=0.99)
+    select.add_argument("--batch", action="store_true", help="time predict_batch instead of hand-by-hand calls")
+    select.add_argument("--fixtures", type=int, default=1000, help="synthetic fixture hands")
+    select.add_argument("--fixture-data", nargs="*", default=None, metavar="NPZ",
+                        help="add hands from processed landmark datasets (not cached)")
+    select.add_argument("--no-benchmark", action="store_true", help="first agreeing candidate, no timing")
+    select.add_argument("--refresh", action="store_true", help="ignore a cached choice and measure again")
+    select.add_argument("--no-cache", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "list":
+        for kind, cls in BACKENDS.items():
+            print(f"  {kind + (':PATH' if cls.needs_path else ''):<20} {cls.__name__}")
+        print(f"🔎 auto candidates here: {', '.join(default_candidates())}")
+        return
+
+    t0 = time.perf_counter()
+    selection = select_backend(
+        args.candidate,
+        reference=args.reference,
+        min_agreement=args.min_agreement,
+        batch=args.batch,
+        n_fixtures=args.fixtures,
+        extra_fixtures=args.fixture_data,
+        benchmark=not args.no_benchmark,
+        cache_path=None if args.no_cache else CACHE_PATH,
+        refresh=args.refresh,
+    )
+    print(selection.format())
+    print(f"⏱ {(time.perf_counter() - t0) * 1000.0:.0f} ms" + ("" if args.no_cache else f", cache: {CACHE_PATH}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Vectorized version of the heuristic rule engine.
+
+Same rules, thresholds and precedence as
+`predictor.detect_gesture_from_landmarks`, evaluated for a whole
+(N, 21, 3) batch of pixel landmarks with NumPy.
+
+`BufferRules` evaluates the same rules hand by hand on a preallocated
+landmark buffer through a lookup table built from them, creating no
+objects per call; the steady-state frame loop uses it.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .mapping import ID_TO_KEY
+
+# gesture id → key, indexable with an array of ids
+ID_KEYS = np.array([ID_TO_KEY[i] for i in range(len(ID_TO_KEY))], dtype=object)
+
+_TIPS = np.array([8, 12, 16, 20])
+_PIPS = np.array([6, 10, 14, 18])
+
+
+def finger_extended_states_batch(pts: np.ndarray) -> np.ndarray:
+    """
+    pts: (N, 21, 3) pixel landmarks
+    returns: (N, 5) bool, columns thumb, index, middle, ring, pinky
+    """
+    states = np.empty((pts.shape[0], 5), dtype=bool)
+
+    # Index..pinky: tip y < pip y => extended (camera upright)
+    states[:, 1:] = pts[:, _TIPS, 1] < pts[:, _PIPS, 1] - 5
+
+    # Thumb: horizontal distance from wrist + IP joint
+    thumb_tip_x = pts[:, 4, 0]
+    states[:, 0] = (np.abs(thumb_tip_x - pts[:, 0, 0]) > 30) | (np.abs(thumb_tip_x - pts[:, 3, 0]) > 20)
+
+    return states
+
+
+def detect_gestures_batch(pts: np.ndarray, img_w: int, img_h: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns:
+        gesture_ids: (N,) int64
+        confidences: (N,) float32
+    Use `ID_KEYS[gesture_ids]` for the gesture keys.
+    """
+    pts = np.asarray(pts)
+    st = finger_extended_states_batch(pts)
+    d_thumb_index = np.hypot(pts[:, 4, 0] - pts[:, 8, 0], pts[:, 4, 1] - pts[:, 8, 1])
+    return _select_rules(st, d_thumb_index < _scale_thresh(img_w))
+
+
+def _scale_thresh(img_w: int) -> int:
+    return max(40, int(img_w * 0.07))
+
+
+def _select_rules(st: np.ndarray, pinch: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    st: (N, 5) finger states, pinch: (N,) thumb tip near index tip
+    """
+    thumb, index, middle, ring, pinky = st.T
+    ext_count = st.sum(axis=1)
+
+    only_index = index & ~middle & ~ring & ~pinky
+    conditions = [
+        pinch & thumb & index,                                  # perfect
+        index & middle & ring & pinky,                          # stop
+        index & pinky & ~middle & ~ring,                        # rock
+        index & middle & ~ring & ~pinky,                        # victory
+        only_index,                                             # calm
+        thumb & ~index & ~middle & ~ring & ~pinky,              # ok
+        (ext_count == 1) & pinky,                               # fallback: only pinky
+    ]
+    ids = np.select(conditions, [3, 4, 5, 1, 6, 2, 5], default=0)
+    conf = np.select(conditions, [0.95, 0.9, 0.9, 0.92, 0.9, 0.9, 0.75], default=0.5)
+
+    return ids.astype(np.int64), conf.astype(np.float32)
+
+
+# rule outcome for every (thumb, index, middle, ring, pinky, pinch) bit pattern
+_BIT_WEIGHTS = np.array([1, 2, 4, 8, 16, 32], dtype=np.int64)
+_PATTERNS = (np.arange(64)[:, None] & _BIT_WEIGHTS[None, :]).astype(bool)      # (64, 6)
+_TABLE_IDS, _TABLE_CONF = _select_rules(_PATTERNS[:, :5], _PATTERNS[:, 5])
+
+
+class BufferRules:
+    """
+    The same rules for the hands of one preallocated (max_hands, 21, 3)
+    landmark buffer, without creating objects per call: coordinates are
+    read as Python floats (`ndarray.item`, served from the float free
+    list), the six rule bits (thumb, index, middle, ring, pinky, pinch)
+    are packed into a small int, and id and confidence come from the
+    64-entry table built from `detect_gestures_batch`'s rules. Even
+    `out=` ufunc calls allocate iterator scratch for hand-sized arrays,
+    so this is what the steady-state loop uses. `classify` returns the
+    gesture id and leaves the confidence in `confidence` (a returned
+    tuple would be one more object per call).
+
+    Example:
+        rules = BufferRules(buffers.landmarks)
+        gid = rules.classify(h, img_w)             # hand h of the buffer
+        conf = rules.confidence
+    """
+
+    def __init__(self, landmarks: np.ndarray) -> None:
+        self.landmarks = landmarks
+        self._item = landmarks.item
+        self._ids = _TABLE_IDS.tolist()
+        self._conf = _TABLE_CONF.tolist()
+        self._pinch_w: Optional[int] = None
+        self._pinch_sq = 0
+        self.confidence = 0.0
+
+    def classify(self, h: int, img_w: int) -> int:
+        if img_w != self._pinch_w:
+            thresh = _scale_thresh(img_w)
+            self._pinch_sq = thresh * thresh      # integer: no rounding at the boundary
+            self._pinch_w = img_w
+        item = self._item
+        x4 = item(h, 4, 0)
+        code = 0
+        if abs(x4 - item(h, 0, 0)) > 30 or abs(x4 - item(h, 3, 0)) > 20:
+            code |= 1
+        if item(h, 8, 1) < item(h, 6, 1) - 5:
+            code |= 2
+        if item(h, 12, 1) < item(h, 10, 1) - 5:
+            code |= 4
+        if item(h, 16, 1) < item(h, 14, 1) - 5:
+            code |= 8
+        if item(h, 20, 1) < item(h, 18, 1) - 5:
+            code |= 16
+        dx = x4 - item(h, 8, 0)
+        dy = item(h, 4, 1) - item(h, 8, 1)
+        if dx * dx + dy * dy < self._pinch_sq:
+            code |= 32
+        self.confidence = self._conf[code]
+        return self._ids[code]
@@ -0,0 +1,184 @@
+"""
+Classification cache for RT-Gesture3D.
+
+When the hand is still, consecutive frames give nearly identical
+landmarks, so re-running the classifier is wasted work. `CachedClassifier`
+sits in front of any classifier with the `detect_gesture_from_landmarks`
+signature and reuses a previous result when the new hand is close enough
+to one it has already classified.
+
+Signature:
+    landmarks relative to the wrist, quantized to `quantum_px` (x, y) and
+    `z_quantum` (z). The rules only use differences between points, so
+    wrist normalization never changes their result.
+
+Match:
+    a cached entry is reused when every signature coordinate is within
+    `tolerance_px` (Chebyshev distance). A reused label was therefore
+    computed on a hand whose wrist-relative landmarks differ from the
+    current one by at most `tolerance_px + quantum_px` pixels per
+    coordinate — labels can only differ from an uncached run when the
+    hand sits within that distance of a rule threshold.
+
+Lookup:
+    the entry that answered the previous call is checked first (one
+    (21, 3) Chebyshev test into preallocated buffers); only when it
+    misses are all entries compared. A still hand almost always hits on
+    that first test.
+
+Cost:
+    building the signature of a detector-style point list costs ~10 µs
+    per hand, already more than the rule engine itself (~4 µs), so the
+    cache only pays off in front of classifiers costing more than ~20 µs
+    per hand (learned models, template matching). It also changes a few
+    labels near rule thresholds (~0.5% at tolerance 3 px in
+    `benchmarks/bench_cache.py`). Wrapping the plain rules emits a
+    RuntimeWarning.
+
+Each stream / pipeline should own its own cache (per-stream LRU).
+"""
+
+import warnings
+from itertools import chain
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+
+from .predictor import Point3D, detect_gesture_from_landmarks
+
+Classifier = Callable[[List[Point3D], int, int], Tuple[str, int, float]]
+
+
+class CachedClassifier:
+    """
+    LRU cache in front of a classifier.
+
+    Example:
+        classify = CachedClassifier(tolerance_px=3.0)
+        key, gid, conf = classify(pts, w, h)
+        print(classify.stats())
+    """
+
+    def __init__(
+        self,
+        classifier: Classifier = detect_gesture_from_landmarks,
+        tolerance_px: float = 3.0,
+        quantum_px: float = 0.5,
+        z_quantum: float = 0.005,
+        max_entries: int = 32,
+    ) -> None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        if quantum_px <= 0 or z_quantum <= 0:
+            raise ValueError("quantum_px and z_quantum must be > 0")
+
+        if _is_rule_engine(classifier):
+            warnings.warn(
+                "CachedClassifier in front of the rule engine makes classification slower "
+                "(the cache costs more per hand than the rules) and can change labels near thresholds",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+        self.classifier = classifier
+        self.tolerance_px = tolerance_px
+        self.quantum_px = quantum_px
+        self.max_entries = max_entries
+
+        self._scale = np.array([1.0 / quantum_px, 1.0 / quantum_px, 1.0 / z_quantum], dtype=np.float32)
+        self._tol_bins = int(tolerance_px / quantum_px)
+
+        self._sigs = np.zeros((max_entries, 21, 3), dtype=np.float32)     # rounded: exact small integers
+        self._results: List[Tuple[str, int, float]] = [("neutral", 0, 0.0)] * max_entries
+        self._last_used = np.zeros(max_entries, dtype=np.int64)
+        self._last_hit = -1
+        self._size = 0
+        self._clock = 0
+        self._img_size = (0, 0)
+
+        self._diff = np.zeros((21, 3), dtype=np.float32)
+
+        self.hits = 0
+        self.misses = 0
+
+    def signature(self, pts: List[Point3D]) -> np.ndarray:
+        """
+        Quantized, wrist-normalized landmark signature, (21, 3) int32.
+        """
+        arr = np.asarray(pts, dtype=np.float32)
+        return np.rint((arr - arr[0]) * self._scale).astype(np.int32)
+
+    def _signature_into(self, pts: List[Point3D]) -> np.ndarray:
+        # `signature` as float32, transformed in place
+        sig = np.fromiter(chain.from_iterable(pts), dtype=np.float32, count=63).reshape(21, 3)
+        np.subtract(sig, sig[0], out=sig)
+        np.multiply(sig, self._scale, out=sig)
+        return np.rint(sig, out=sig)
+
+    def _within(self, slot: int, sig: np.ndarray) -> bool:
+        np.subtract(self._sigs[slot], sig, out=self._diff)
+        np.abs(self._diff, out=self._diff)
+        return self._diff.max() <= self._tol_bins
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        # thresholds depend on the image width, so a new size starts a fresh cache
+        if (img_w, img_h) != self._img_size:
+            self.clear()
+            self._img_size = (img_w, img_h)
+
+        self._clock += 1
+        sig = self._signature_into(pts)
+
+        last = self._last_hit
+        if last >= 0 and self._within(last, sig):
+            self.hits += 1
+            self._last_used[last] = self._clock
+            return self._results[last]
+
+        if self._size > 1:
+            dist = np.abs(self._sigs[: self._size] - sig).max(axis=(1, 2))
+            best = int(dist.argmin())
+            if dist[best] <= self._tol_bins:
+                self.hits += 1
+                self._last_used[best] = self._clock
+                self._last_hit = best
+                return self._results[best]
+
+        self.misses += 1
+        result = self.classifier(pts, img_w, img_h)
+
+        if self._size < self.max_entries:
+            slot = self._size
+            self._size += 1
+        else:
+            slot = int(self._last_used.argmin())   # least recently used
+        self._sigs[slot] = sig
+        self._results[slot] = result
+        self._last_used[slot] = self._clock
+        self._last_hit = slot
+        return result
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "entries": self._size,
+        }
+
+    def clear(self) -> None:
+        """
+        Drop all entries (counters are kept).
+        """
+        self._size = 0
+        self._last_hit = -1
+        self._last_used[:] = 0
+
+
+def _is_rule_engine(classifier) -> bool:
+    # the scalar rules, directly or as a `rules` / `rules-vectorized` backend
+    return classifier is detect_gesture_from_landmarks or getattr(classifier, "spec", None) in ("rules", "rules-vectorized")
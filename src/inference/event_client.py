@@ -0,0 +1,79 @@
+"""
+Consumer library for RT-Gesture3D gesture events.
+
+Example:
+    from src.inference.event_client import iter_events
+
+    for event in iter_events("tcp://127.0.0.1:8765"):
+        if event["type"] == "start" and event["gesture"] == "stop":
+            pause_video()
+
+Or from a shell:
+    python -m src.inference.event_client tcp://127.0.0.1:8765
+"""
+
+import argparse
+import json
+import socket
+import time
+from typing import Dict, Iterator, Optional
+
+from .events import parse_address
+
+
+def connect(address: str, timeout: Optional[float] = None) -> socket.socket:
+    """
+    Open a socket to a headless event server ("unix:/path" or "tcp://host:port").
+    """
+    kind, target = parse_address(address)
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    elif kind == "tcp":
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    else:
+        raise ValueError("connect() needs a unix or tcp address; read stdout events with parse_lines()")
+    sock.settimeout(timeout)
+    sock.connect(target)
+    return sock
+
+
+def parse_lines(lines: Iterator[str]) -> Iterator[Dict[str, object]]:
+    """
+    Decode JSONL event lines (e.g. `sys.stdin` piped from headless mode).
+    """
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def iter_events(address: str, reconnect: bool = True, retry_s: float = 1.0) -> Iterator[Dict[str, object]]:
+    """
+    Yield events from a headless event server, reconnecting when it restarts.
+    """
+    while True:
+        try:
+            with connect(address) as sock, sock.makefile("r", encoding="utf-8") as f:
+                yield from parse_lines(f)
+        except (ConnectionError, FileNotFoundError, OSError):
+            if not reconnect:
+                raise
+        if not reconnect:
+            return
+        time.sleep(retry_s)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print gesture events from a headless RT-Gesture3D process")
+    parser.add_argument("address", help="unix:/path or tcp://host:port")
+    args = parser.parse_args(argv)
+
+    try:
+        for event in iter_events(args.address):
+            print(json.dumps(event), flush=True)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,298 @@
+"""
+Gesture transition events for RT-Gesture3D.
+
+Instead of one message per frame, `GestureEventTracker` turns per-frame
+labels into debounced *transitions*:
+
+    {"type": "start", "gesture": "rock", "gesture_id": 5, "hand": 0, "t": 1718000000.12, "confidence": 0.9}
+    {"type": "end",   "gesture": "rock", "gesture_id": 5, "hand": 0, "t": 1718000002.40, "confidence": 0.9, "dwell_s": 2.28}
+
+A gesture starts once it has been seen for `min_frames` frames and
+`min_duration_s` seconds, and ends when another gesture starts or the
+hand shows no (or an ignored) gesture for `end_grace_s`. `hand` is the
+index of the hand in the detector output (MediaPipe does not provide
+stable track ids).
+
+Sinks write events as JSON lines to stdout, a Unix socket or a local
+TCP socket; see `open_event_sink`. Consumers can use
+`src/inference/event_client.py`.
+"""
+
+import json
+import queue
+import socket
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .mapping import GESTURES
+
+# (kind, target): ("stdout", ""), ("unix", "/tmp/gestures.sock"), ("tcp", ("127.0.0.1", 8765))
+Address = Tuple[str, object]
+
+
+@dataclass
+class _HandState:
+    active: Optional[str] = None
+    active_since: float = 0.0
+    conf_sum: float = 0.0
+    conf_n: int = 0
+    last_seen: float = 0.0          # last frame the active gesture was observed
+    candidate: Optional[str] = None
+    candidate_since: float = 0.0
+    candidate_frames: int = 0
+    candidate_conf: List[float] = field(default_factory=list)
+
+
+class GestureEventTracker:
+    """
+    Debounces per-frame, per-hand labels into start / end events.
+
+    Example:
+        tracker = GestureEventTracker()
+        for event in tracker.update([("rock", 0.9)], now=time.time()):
+            sink.emit(event)
+    """
+
+    def __init__(
+        self,
+        min_frames: int = 3,
+        min_duration_s: float = 0.1,
+        end_grace_s: float = 0.25,
+        ignore: Iterable[str] = ("neutral",),
+    ) -> None:
+        self.min_frames = min_frames
+        self.min_duration_s = min_duration_s
+        self.end_grace_s = end_grace_s
+        self.ignore = set(ignore)
+        self._hands: Dict[int, _HandState] = {}
+
+    @staticmethod
+    def _event(kind: str, hand: int, gesture: str, t: float, confidence: float, **extra) -> Dict[str, object]:
+        info = GESTURES.get(gesture)
+        event = {
+            "type": kind,
+            "gesture": gesture,
+            "gesture_id": info.id if info is not None else -1,
+            "hand": hand,
+            "t": round(t, 4),
+            "confidence": round(confidence, 4),
+        }
+        event.update(extra)
+        return event
+
+    def _end(self, hand: int, st: _HandState, t: float) -> Dict[str, object]:
+        event = self._event(
+            "end",
+            hand,
+            st.active,
+            t,
+            st.conf_sum / max(st.conf_n, 1),
+            dwell_s=round(t - st.active_since, 4),
+        )
+        st.active = None
+        st.conf_sum, st.conf_n = 0.0, 0
+        return event
+
+    def update(self, labels: List[Tuple[str, float]], now: float) -> List[Dict[str, object]]:
+        """
+        labels: (gesture_key, confidence) per detected hand, in detector order.
+        now: frame timestamp in seconds (wall clock recommended, it is emitted as `t`).
+        """
+        events: List[Dict[str, object]] = []
+
+        for hand, (key, conf) in enumerate(labels):
+            st = self._hands.setdefault(hand, _HandState())
+            gesture = None if key in self.ignore else key
+
+            if gesture is not None and gesture == st.active:
+                st.last_seen = now
+                st.conf_sum += conf
+                st.conf_n += 1
+                st.candidate = None
+                continue
+
+            if gesture != st.candidate:
+                st.candidate = gesture
+                st.candidate_since = now
+                st.candidate_frames = 0
+                st.candidate_conf = []
+            st.candidate_frames += 1
+            st.candidate_conf.append(conf)
+
+            confirmed = (
+                st.candidate_frames >= self.min_frames
+                and now - st.candidate_since >= self.min_duration_s
+            )
+            if gesture is not None and confirmed:
+                if st.active is not None:
+                    events.append(self._end(hand, st, st.candidate_since))
+                st.active = gesture
+                st.active_since = st.candidate_since
+                st.last_seen = now
+                st.conf_sum = sum(st.candidate_conf)
+                st.conf_n = len(st.candidate_conf)
+                st.candidate = None
+                events.append(self._event("start", hand, gesture, st.active_since, st.conf_sum / st.conf_n))
+
+        # hands that are gone, or stopped showing their gesture, end after the grace period
+        for hand, st in self._hands.items():
+            if st.active is not None and now - st.last_seen > self.end_grace_s:
+                events.append(self._end(hand, st, st.last_seen))
+
+        return events
+
+    def flush(self, now: float) -> List[Dict[str, object]]:
+        """
+        End every active gesture (call on shutdown).
+        """
+        return [self._end(hand, st, now) for hand, st in self._hands.items() if st.active is not None]
+
+
+def parse_address(spec: str) -> Address:
+    """
+    "-" / "stdout"            → stdout
+    "unix:/tmp/gestures.sock" → Unix domain socket
+    "tcp://127.0.0.1:8765"    → TCP socket (host defaults to 127.0.0.1)
+    """
+    if spec in ("-", "stdout"):
+        return "stdout", ""
+    if spec.startswith("unix:"):
+        path = spec[len("unix:"):]
+        if path.startswith("//"):   # unix:///tmp/x.sock
+            path = path[2:]
+        return "unix", path
+    if spec.startswith("tcp://"):
+        host, _, port = spec[len("tcp://"):].rpartition(":")
+        return "tcp", (host or "127.0.0.1", int(port))
+    raise ValueError(f"Unsupported event address: {spec!r} (use '-', 'unix:/path' or 'tcp://host:port')")
+
+
+class StdoutEventSink:
+    """
+    One JSON line per event on stdout.
+    """
+
+    def __init__(self, stream=None) -> None:
+        self._stream = stream or sys.stdout
+        self.emitted = 0
+
+    def emit(self, event: Dict[str, object]) -> None:
+        self._stream.write(json.dumps(event, separators=(",", ":")) + "\n")
+        self._stream.flush()
+        self.emitted += 1
+
+    def close(self) -> None:
+        self._stream.flush()
+
+
+class SocketEventServer:
+    """
+    Broadcasts JSON lines to every connected client.
+
+    Accepting and sending happen on background threads; `emit` only puts
+    the event on a bounded queue, so a slow or stuck client never blocks
+    the frame loop (its events are dropped, then it is disconnected).
+    """
+
+    def __init__(self, address: Address, max_queue: int = 1024) -> None:
+        kind, target = address
+        if kind == "unix":
+            path = Path(target)
+            if path.exists():
+                path.unlink()
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        elif kind == "tcp":
+            self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        else:
+            raise ValueError(f"SocketEventServer needs a unix or tcp address, got {kind!r}")
+
+        self.address = address
+        self._server.bind(target)
+        self._server.listen()
+        self._server.settimeout(0.5)
+
+        self._clients: List[socket.socket] = []
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=max_queue)
+        self._running = True
+        self.emitted = 0
+        self.dropped = 0
+
+        self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
+        self._send_thread = threading.Thread(target=self._send_loop, daemon=True)
+        self._accept_thread.start()
+        self._send_thread.start()
+
+    def _accept_loop(self) -> None:
+        while self._running:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                break
+            conn.settimeout(1.0)
+            with self._lock:
+                self._clients.append(conn)
+
+    def _send_loop(self) -> None:
+        while True:
+            data = self._queue.get()
+            if data is None:
+                break
+            with self._lock:
+                clients = list(self._clients)
+            for conn in clients:
+                try:
+                    conn.sendall(data)
+                except OSError:
+                    with self._lock:
+                        if conn in self._clients:
+                            self._clients.remove(conn)
+                    conn.close()
+
+    @property
+    def clients(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def pending(self) -> int:
+        """
+        Events queued but not yet sent (queue depth).
+        """
+        return self._queue.qsize()
+
+    def emit(self, event: Dict[str, object]) -> None:
+        data = (json.dumps(event, separators=(",", ":")) + "\n").encode("utf-8")
+        try:
+            self._queue.put_nowait(data)
+            self.emitted += 1
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        self._running = False
+        self._queue.put(None)
+        self._send_thread.join(timeout=2.0)
+        self._server.close()
+        self._accept_thread.join(timeout=2.0)
+        with self._lock:
+            for conn in self._clients:
+                conn.close()
+            self._clients.clear()
+        if self.address[0] == "unix":
+            Path(self.address[1]).unlink(missing_ok=True)
+
+
+def open_event_sink(spec: str):
+    """
+    Sink for an address spec (see `parse_address`).
+    """
+    address = parse_address(spec)
+    if address[0] == "stdout":
+        return StdoutEventSink()
+    return SocketEventServer(address)
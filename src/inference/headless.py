@@ -0,0 +1,251 @@
+"""
+Headless gesture-event mode for RT-Gesture3D.
+
+Runs detection + classification without any rendering or display
+window and emits only debounced gesture transitions (see `events.py`).
+
+Usage (from project root):
+    python -m src.inference.headless                                   # JSONL on stdout
+    python -m src.inference.headless --events tcp://127.0.0.1:8765      # local TCP server
+    python -m src.inference.headless --events unix:/tmp/gestures.sock   # Unix socket server
+    python -m src.inference.headless --replay data/logs/session.jsonl   # no camera
+    python -m src.inference.headless --source rtsp://camera.local/stream  # any frame source
+    python -m src.inference.headless --metrics-port 9108                # + Prometheus metrics
+    python -m src.inference.headless --sequences data/sequences.txt   # + "sequence" combo events
+    python -m src.inference.headless --analytics data/analytics --kiosk lobby-1   # + Parquet event history
+    python -m src.inference.headless --replay data/logs/session.jsonl --fast --profile
+
+Status messages go to stderr so stdout stays pure JSONL.
+Stop with Ctrl+C; active gestures get their "end" event on shutdown.
+"""
+
+import argparse
+import sys
+import time
+from typing import Iterator, List, Tuple
+
+from ..capture.landmark_log import LandmarkReplay
+from ..capture.sources import PrefetchSource, add_source_args, source_from_args
+from ..processing.filters import add_filter_args, filter_from_args
+from .backends import load_backend
+from .cache import CachedClassifier
+from .events import GestureEventTracker, SocketEventServer, open_event_sink
+from .metrics import add_metrics_args, start_metrics
+from .predictor import Point3D, detect_gesture_from_landmarks
+from .profiling import add_profile_args, no_mark, profiler_from_args
+from .sequences import SequenceMatcher, compile_patterns, load_sequence_file
+from .template_matcher import load_templates
+
+# (hands, img_w, img_h, timestamp)
+FrameHands = Tuple[List[List[Point3D]], int, int, float]
+
+
+def log(msg: str) -> None:
+    print(msg, file=sys.stderr, flush=True)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RT-Gesture3D headless gesture events")
+    add_source_args(parser)
+    parser.add_argument("--replay", metavar="PATH", default=None, help="read hands from a landmark log instead of a camera")
+    parser.add_argument("--fast", action="store_true", help="ignore recorded timing (--replay) or the file frame rate (--source FILE)")
+    parser.add_argument("--events", default="-", help="'-' (stdout), 'unix:/path' or 'tcp://host:port'")
+    parser.add_argument("--max-hands", type=int, default=2)
+    parser.add_argument("--min-frames", type=int, default=3, help="frames a gesture must be held before 'start'")
+    parser.add_argument("--min-duration", type=float, default=0.1, help="seconds a gesture must be held before 'start'")
+    parser.add_argument("--end-grace", type=float, default=0.25, help="seconds without the gesture before 'end'")
+    parser.add_argument("--cache-tolerance", type=float, default=0.0, metavar="PX",
+                        help="classification cache tolerance in pixels (0 = off)")
+    parser.add_argument("--templates", metavar="PATH", default=None, help="template index of user-defined gestures")
+    parser.add_argument("--backend", default="rules", metavar="SPEC",
+                        help="classifier backend: rules, rules-vectorized, onnx:PATH, template:PATH or auto (see backends.py)")
+    parser.add_argument("--sequences", metavar="FILE", default=None,
+                        help="gesture-sequence patterns ('name = pattern' per line, see sequences.py)")
+    parser.add_argument("--analytics", metavar="DIR", default=None,
+                        help="also keep gesture events as hourly Parquet files in DIR (see analytics.py)")
+    parser.add_argument("--kiosk", default="default", help="kiosk name for --analytics")
+    parser.add_argument("--motion-gate", action="store_true", help="skip MediaPipe on static frames without hands")
+    parser.add_argument("--roi", action="store_true",
+                        help="high-resolution sources: redetect hands in full-resolution crops")
+    parser.add_argument("--target-fps", type=float, default=0.0, help="adaptive detector quality target (0 = off)")
+    add_filter_args(parser)
+    add_metrics_args(parser)
+    add_profile_args(parser)
+    return parser.parse_args(argv)
+
+
+def camera_hands(args, metrics=None, mark=no_mark) -> Iterator[FrameHands]:
+    # imported here so --replay works on machines without MediaPipe
+    from ..detection.mediapipe_wrapper import MediaPipeHandDetector
+    from ..detection.motion_gate import MotionGate
+    from ..detection.quality import AdaptiveQualityController
+    from ..detection.roi import RoiHandDetector
+
+    source = source_from_args(args)
+    if not source.isOpened():
+        log(f"❌ Error: Could not open {source.name}. Check if another app is using the camera.")
+        source.close()
+        return
+    log(f"📷 {source.describe()}")
+
+    if args.roi:
+        detector = RoiHandDetector(max_num_hands=args.max_hands)
+    else:
+        detector = MediaPipeHandDetector(max_num_hands=args.max_hands)
+    gate = MotionGate() if args.motion_gate else None
+    controller = (
+        AdaptiveQualityController(detector, target_fps=args.target_fps, log=log) if args.target_fps > 0 else None
+    )
+    hands: List[List[Point3D]] = []
+    dropped = 0
+
+    try:
+        while True:
+            mark("capture")
+            captured = source.next_frame()
+            if captured is None:
+                if not source.live:
+                    log("⏹ End of input.")
+                    break
+                log("❌ Error: Failed to read from camera.")
+                if metrics is not None:
+                    metrics.frame_dropped()
+                break
+            frame = captured.image
+
+            t0 = time.perf_counter()
+            mark("detect")
+            h, w, _ = frame.shape
+            if gate is None or gate.update(frame, hands_present=bool(hands)):
+                hands = detector.detect(frame)
+            if metrics is not None:
+                metrics.frame_captured()
+                if isinstance(source, PrefetchSource) and source.dropped > dropped:
+                    metrics.frame_dropped(source.dropped - dropped)
+                    dropped = source.dropped
+                metrics.observe_stage("frame_age", t0 - captured.timestamp)
+                metrics.observe_stage("detect", time.perf_counter() - t0)
+            # capture time, not processing time: dwell times follow the camera clock
+            yield hands, w, h, captured.wall_time
+            if controller is not None:
+                controller.record(time.perf_counter() - t0)
+            if gate is not None and gate.idle:
+                time.sleep(gate.wait_ms() / 1000.0)
+    finally:
+        source.close()
+        if args.roi:
+            log(f"🔍 ROI detection: {detector.stats()}")
+        detector.close()
+
+
+def replay_hands(args, metrics=None, mark=no_mark) -> Iterator[FrameHands]:
+    # recorded timestamps keep dwell times meaningful even with --fast
+    t0 = time.time()
+    mark("replay")
+    for lf in LandmarkReplay(args.replay, realtime=not args.fast):
+        if metrics is not None:
+            metrics.frame_captured()
+        yield lf.hands, lf.width, lf.height, t0 + lf.timestamp
+        mark("replay")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    classifier = detect_gesture_from_landmarks
+    if args.templates:
+        classifier = load_templates(args.templates)
+    elif args.backend != "rules":
+        classifier = load_backend(args.backend)
+        log(f"🧠 Classifier backend: {classifier.spec}")
+    if args.cache_tolerance > 0:
+        classifier = CachedClassifier(classifier, tolerance_px=args.cache_tolerance)
+
+    landmark_filter = filter_from_args(args)
+    tracker = GestureEventTracker(
+        min_frames=args.min_frames,
+        min_duration_s=args.min_duration,
+        end_grace_s=args.end_grace,
+    )
+    sequences = None
+    if args.sequences:
+        patterns = load_sequence_file(args.sequences)
+        sequences = SequenceMatcher(compile_patterns(patterns))
+        log(f"🔗 {len(patterns)} sequence pattern(s) from {args.sequences}")
+    sink = open_event_sink(args.events)
+    analytics = None
+    if args.analytics:
+        # imported here so pandas / pyarrow are only needed with --analytics
+        from .analytics import AnalyticsSink
+
+        analytics = AnalyticsSink(args.analytics, kiosk=args.kiosk)
+    metrics, metrics_server = start_metrics(args.metrics_port, log=log)
+    profiler = profiler_from_args(args, name="headless", log=log)
+    mark = profiler.mark if profiler is not None else no_mark
+    frames = replay_hands(args, metrics, mark) if args.replay else camera_hands(args, metrics, mark)
+
+    log(f"▶️ RT-Gesture3D headless mode → events: {args.events}")
+    n_frames = 0
+    t_start = time.perf_counter()
+
+    if profiler is not None:
+        profiler.start()
+
+    try:
+        now = time.time()
+        for hands, w, h, now in frames:
+            t0 = time.perf_counter()
+            mark("classify")
+            if landmark_filter is not None:
+                hands = landmark_filter.filter_hands(hands, now)
+            labels = []
+            for pts in hands:
+                key, _, conf = classifier(pts, w, h)
+                labels.append((key, conf))
+            t_classify = time.perf_counter()
+            mark("events")
+
+            for event in tracker.update(labels, now=now):
+                sink.emit(event)
+                if analytics is not None:
+                    analytics.emit(event)
+                if sequences is not None:
+                    for match in sequences.feed(event):
+                        sink.emit(match)
+            n_frames += 1
+
+            if metrics is not None:
+                t_end = time.perf_counter()
+                metrics.observe_stage("classify", t_classify - t0)
+                metrics.observe_stage("events", t_end - t_classify)
+                # same "last hand wins" convention as GesturePipeline
+                metrics.frame_processed(bool(labels), labels[-1][0] if labels else "neutral", now=t_end)
+                if isinstance(sink, SocketEventServer):
+                    metrics.queue_depth.labels("events").set(sink.pending())
+            if profiler is not None:
+                profiler.tick()
+    except KeyboardInterrupt:
+        log("👋 Interrupted, exiting...")
+    finally:
+        for event in tracker.flush(now=now):
+            sink.emit(event)
+            if analytics is not None:
+                analytics.emit(event)
+        sink.close()
+        if analytics is not None:
+            analytics.close()
+        if metrics_server is not None:
+            metrics_server.close()
+        if profiler is not None:
+            profiler.stop()
+
+    elapsed = time.perf_counter() - t_start
+    log(f"✅ {n_frames} frame(s) in {elapsed:.1f}s, {sink.emitted} event(s) emitted.")
+    if analytics is not None:
+        log(f"📊 Analytics: {analytics.stats()}")
+    if isinstance(classifier, CachedClassifier):
+        log(f"🧠 Classification cache: {classifier.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,80 +1,270 @@
+import argparse
+import time
+
 import cv2
-import mediapipe as mp
-from collections import deque, Counter
 
+from ..capture.landmark_log import LandmarkLogWriter
+from ..capture.sources import PrefetchSource, add_source_args, source_from_args
+from ..detection.motion_gate import MotionGate
+from ..detection.quality import AdaptiveQualityController
+from ..processing.filters import add_filter_args, filter_from_args, smoothing_window_from_args
+from .backends import load_backend
+from .cache import CachedClassifier
+from .events import GestureEventTracker
+from .metrics import add_metrics_args, start_metrics
+from .overlay_inference import load_avatars
+from .pipeline import GesturePipeline
 from .predictor import detect_gesture_from_landmarks
-from .overlay_inference import load_avatars, overlay_avatar, overlay_gesture_text
+from .profiling import add_profile_args, no_mark, profiler_from_args
+from .startup import WarmStart, warm_detector
+from .steady_loop import run_steady
+from .template_matcher import load_templates
 
 
-def main():
-    print("▶️ Starting RT-Gesture3D demo...")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RT-Gesture3D live demo")
+    add_source_args(parser)
+    parser.add_argument(
+        "--record-landmarks",
+        metavar="PATH",
+        default=None,
+        help="also write the landmark stream to a JSONL log for replay",
+    )
+    parser.add_argument(
+        "--cache-tolerance",
+        type=float,
+        default=0.0,
+        metavar="PX",
+        help="reuse the previous classification while landmarks move less than PX pixels (0 = off)",
+    )
+    parser.add_argument(
+        "--templates",
+        metavar="PATH",
+        default=None,
+        help="template index of user-defined gestures (rules are used when no template matches)",
+    )
+    parser.add_argument(
+        "--backend",
+        default="rules",
+        metavar="SPEC",
+        help="classifier backend: rules, rules-vectorized, onnx:PATH, template:PATH or auto (see backends.py)",
+    )
+    parser.add_argument(
+        "--motion-gate",
+        action="store_true",
+        help="skip MediaPipe on static frames without hands and poll slowly when idle",
+    )
+    parser.add_argument(
+        "--roi",
+        action="store_true",
+        help="high-resolution sources: find hands on a downscaled frame, then redetect in full-resolution crops",
+    )
+    parser.add_argument(
+        "--analytics",
+        metavar="DIR",
+        default=None,
+        help="keep debounced gesture events as hourly Parquet files in DIR (see analytics.py)",
+    )
+    parser.add_argument("--kiosk", default="default", help="kiosk name for --analytics")
+    parser.add_argument(
+        "--steady-state",
+        action="store_true",
+        help="preallocated, allocation-free frame loop (rules classifier; see steady_loop.py)",
+    )
+    parser.add_argument(
+        "--serial-startup",
+        action="store_true",
+        help="open the source, build the detector and load assets one after another (for comparison)",
+    )
+    parser.add_argument("--idle-timeout", type=float, default=10.0, help="seconds without motion before idle polling")
+    parser.add_argument(
+        "--target-fps",
+        type=float,
+        default=0.0,
+        help="adapt detector quality to keep per-frame processing within this FPS budget (0 = off)",
+    )
+    parser.add_argument("--smoothing", type=int, default=None,
+                        help="label smoothing window in frames (default: 7, or 1 with --one-euro)")
+    add_filter_args(parser)
+    add_metrics_args(parser)
+    add_profile_args(parser)
+    return parser.parse_args(argv)
 
-    avatars = load_avatars(size=(150, 150))
 
-    mp_hands = mp.solutions.hands
-    hands = mp_hands.Hands(max_num_hands=1)
-    mp_draw = mp.solutions.drawing_utils
+def _make_detector(args):
+    # imported here: loading MediaPipe is part of the detector's startup task
+    if args.roi:
+        from ..detection.roi import RoiHandDetector
+
+        return RoiHandDetector(max_num_hands=1)
+    from ..detection.mediapipe_wrapper import MediaPipeHandDetector
+
+    return MediaPipeHandDetector(max_num_hands=1)
 
-    # last few predictions ke liye (to reduce flicker)
-    label_history = deque(maxlen=7)
 
-    cap = cv2.VideoCapture(0)
+def main(args=None):
+    if args is None:
+        args = parse_args([])
 
-    if not cap.isOpened():
-        print("❌ Error: Camera could not be opened. Check if another app is using it.")
+    print("▶️ Starting RT-Gesture3D demo...")
+    if args.steady_state:
+        run_steady(args)
         return
 
-    print("✅ Camera opened. Press 'q' to quit.")
+    # camera, detector (MediaPipe import + graph + warm-up frame) and assets load concurrently
+    startup = WarmStart(parallel=not args.serial_startup)
+    warmup_shape = (args.capture_height or 480, args.capture_width or 640, 3)
+    startup.submit("source", source_from_args, args)
+    startup.submit("detector", warm_detector, lambda: _make_detector(args), warmup_shape)
+    startup.submit("avatars", load_avatars, (150, 150))
+    auto_backend = not args.templates and args.backend.partition(":")[0] == "auto"
+    if args.templates:
+        startup.submit("classifier", load_templates, args.templates)
+    elif args.backend != "rules" and not auto_backend:
+        startup.submit("classifier", load_backend, args.backend)
+    source = startup.get("source")
+    detector = startup.get("detector")
+    startup.wait()
 
-    while True:
-        ret, frame = cap.read()
-        if not ret:
-            print("❌ Error: Failed to read from camera.")
-            break
+    classifier = detect_gesture_from_landmarks
+    if args.templates:
+        classifier = startup.get("classifier")
+    elif auto_backend:
+        # after the startup tasks: the selection times the candidates (and caches the
+        # winner for this machine), so it must not compete with them for the CPU
+        classifier = load_backend(args.backend)
+    elif args.backend != "rules":
+        classifier = startup.get("classifier")
+    if args.backend != "rules" and not args.templates:
+        print(f"🧠 Classifier backend: {classifier.spec}")
+    if args.cache_tolerance > 0:
+        classifier = CachedClassifier(classifier, tolerance_px=args.cache_tolerance)
 
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = hands.process(rgb)
+    # last few predictions ke liye (to reduce flicker)
+    pipeline = GesturePipeline(
+        classifier=classifier,
+        smoothing_window=smoothing_window_from_args(args),
+        avatars=startup.get("avatars"),
+        landmark_filter=filter_from_args(args),
+    )
 
-        h, w, _ = frame.shape
-        gesture_key = "neutral"
-        conf = 0.0
+    if not source.isOpened():
+        print(f"❌ Error: Could not open {source.name}. Check if another app is using the camera.")
+        source.close()
+        detector.close()
+        return
 
-        if result.multi_hand_landmarks:
-            for handLms in result.multi_hand_landmarks:
-                mp_draw.draw_landmarks(frame, handLms, mp_hands.HAND_CONNECTIONS)
+    log = None
+    if args.record_landmarks:
+        log = LandmarkLogWriter(args.record_landmarks, source=source.name)
+        print(f"📝 Recording landmarks to: {log.path}")
 
-                # mediapipe → pixel coords list
-                pts = []
-                for lm in handLms.landmark:
-                    x, y = int(lm.x * w), int(lm.y * h)
-                    pts.append((x, y, lm.z))
+    gate = MotionGate(idle_timeout_s=args.idle_timeout) if args.motion_gate else None
+    controller = AdaptiveQualityController(detector, target_fps=args.target_fps) if args.target_fps > 0 else None
+    analytics = tracker = None
+    if args.analytics:
+        from .analytics import AnalyticsSink
 
-                gesture_key, gid, conf = detect_gesture_from_landmarks(pts, w, h)
+        analytics = AnalyticsSink(args.analytics, kiosk=args.kiosk)
+        tracker = GestureEventTracker()
+        print(f"📊 Gesture analytics → {analytics.root / analytics.kiosk}")
+    metrics, metrics_server = start_metrics(args.metrics_port)
+    profiler = profiler_from_args(args, name="live")
+    mark = profiler.mark if profiler is not None else no_mark
+    hands = []
+    dropped = 0
 
-        # prediction smoothing
-        label_history.append(gesture_key)
-        stable_label = gesture_key
-        if len(label_history) > 0:
-            stable_label = Counter(label_history).most_common(1)[0][0]
+    print(f"✅ Source opened: {source.describe()}. Press 'q' to quit.")
+    if profiler is not None:
+        profiler.start()
 
-        # text overlay
-        frame = overlay_gesture_text(frame, stable_label, conf)
+    while True:
+        mark("capture")
+        captured = source.next_frame()
+        if captured is None:
+            if not source.live:
+                print("⏹ End of input.")
+                break
+            print("❌ Error: Failed to read from camera.")
+            if metrics is not None:
+                metrics.frame_dropped()
+            break
+        frame = captured.image
+        startup.first_frame()
+
+        t_start = time.perf_counter()
+        mark("detect")
+        h, w, _ = frame.shape
+        if gate is None or gate.update(frame, hands_present=bool(hands)):
+            hands = detector.detect(frame)
+        t_detect = time.perf_counter()
+        if log is not None:
+            log.write(hands, w, h)
 
-        # avatar overlay
-        avatar_img = avatars.get(stable_label)
-        if avatar_img is not None:
-            frame = overlay_avatar(frame, avatar_img)
+        mark("classify")
+        result = pipeline.step(hands, w, h, t=captured.timestamp)
+        t_classify = time.perf_counter()
+        if startup.first_prediction_s is None:
+            startup.first_prediction()
+            print(startup.format_report())
+            if metrics is not None:
+                metrics.record_startup(startup.report())
+        if tracker is not None:
+            labels = [(result.gesture_key, result.confidence)] if hands else []
+            for event in tracker.update(labels, now=captured.wall_time):
+                analytics.emit(event)
+        mark("render")
+        frame = pipeline.render(frame, result)
+        t_end = time.perf_counter()
+        if controller is not None:
+            controller.record(t_end - t_start)
+        if metrics is not None:
+            metrics.frame_captured()
+            if isinstance(source, PrefetchSource) and source.dropped > dropped:
+                metrics.frame_dropped(source.dropped - dropped)
+                dropped = source.dropped
+            metrics.observe_stage("frame_age", t_start - captured.timestamp)
+            metrics.observe_stage("detect", t_detect - t_start)
+            metrics.observe_stage("classify", t_classify - t_detect)
+            metrics.observe_stage("render", t_end - t_classify)
+            metrics.observe_stage("total", t_end - t_start)
+            metrics.frame_processed(bool(hands), result.gesture_key, now=t_end)
 
+        mark("display")
         cv2.imshow("RT-Gesture3D - Live Demo", frame)
 
-        if cv2.waitKey(1) & 0xFF == ord("q"):
+        if cv2.waitKey(gate.wait_ms() if gate is not None else 1) & 0xFF == ord("q"):
             print("👋 Q pressed, exiting...")
             break
+        if profiler is not None:
+            profiler.tick()
+
+    if profiler is not None:
+        profiler.stop()
 
-    cap.release()
+    source.close()
+    detector.close()
+    if metrics_server is not None:
+        metrics_server.close()
+    if analytics is not None:
+        for event in tracker.flush(now=time.time()):
+            analytics.emit(event)
+        analytics.close()
+        print(f"📊 Analytics: {analytics.stats()}")
+    if log is not None:
+        log.close()
+        print(f"📝 Saved {log.frames} landmark frame(s) to: {log.path}")
+    if isinstance(classifier, CachedClassifier):
+        print(f"🧠 Classification cache: {classifier.stats()}")
+    if gate is not None:
+        print(f"💤 Motion gate: {gate.stats()}")
+    if args.roi:
+        print(f"🔍 ROI detection: {detector.stats()}")
+    if controller is not None:
+        print(f"⚙️ Quality: level {controller.level} after {len(controller.decisions)} change(s)")
     cv2.destroyAllWindows()
     print("✅ Clean exit.")
 
 
 if __name__ == "__main__":
-    main()
+    main(parse_args())
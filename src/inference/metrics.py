@@ -0,0 +1,391 @@
+"""
+Runtime metrics for RT-Gesture3D.
+
+A small, dependency-free metrics registry (counters, gauges,
+histograms) served on a local HTTP port in Prometheus text format:
+
+    python -m src.inference.live_gesture_demo --metrics-port 9108
+    curl http://127.0.0.1:9108/metrics
+
+Updates are plain attribute arithmetic (no locks): each metric is
+expected to be written by one thread (the frame loop) while the HTTP
+thread only reads. `PipelineMetrics` bundles the metrics the live and
+headless pipelines record.
+"""
+
+import bisect
+import os
+import sys
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# seconds; covers ~0.1 ms classification up to slow 4K detection
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.02, 0.033, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{v}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if not float(v).is_integer() else str(int(v))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+
+    def labels(self, *values: str) -> "_Metric":
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._new_child()
+            self._children[key] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        raise NotImplementedError
+
+    def _series(self) -> List[Tuple[Tuple[str, ...], "_Metric"]]:
+        if self.labelnames:
+            return list(self._children.items())
+        return [((), self)]
+
+    def _render_child(self, labels: Tuple[str, ...]) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, child in self._series():
+            lines.extend(child._render_child(labels))
+        return lines
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self.value = 0.0
+
+    def _new_child(self) -> "Counter":
+        child = Counter(self.name, self.help)
+        child.labelnames = self.labelnames
+        return child
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def _render_child(self, labels):
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(self.value)}"]
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self.value = 0.0
+        self._fn: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> "Gauge":
+        child = Gauge(self.name, self.help)
+        child.labelnames = self.labelnames
+        return child
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """
+        Compute the value at scrape time instead of on every frame.
+        """
+        self._fn = fn
+
+    def get(self) -> float:
+        return self._fn() if self._fn is not None else self.value
+
+    def _render_child(self, labels):
+        return [f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(self.get())}"]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)   # last = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def _new_child(self) -> "Histogram":
+        child = Histogram(self.name, self.help, buckets=self.buckets)
+        child.labelnames = self.labelnames
+        return child
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - t0)
+
+    def _render_child(self, labels):
+        lines = []
+        cumulative = 0
+        for bound, n in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += n
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+        lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(self.sum)}")
+        lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {self.count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+def process_rss_bytes() -> float:
+    """
+    Current resident set size of this process (peak RSS where /proc is unavailable).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:   # Windows
+        return 0.0
+
+
+class MetricsServer:
+    """
+    Serves `registry.render()` on http://host:port/metrics from a daemon thread.
+    """
+
+    def __init__(self, registry: MetricsRegistry, port: int = 9108, host: str = "127.0.0.1") -> None:
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):   # keep the console quiet
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self.host, self.port = self._httpd.server_address[:2]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def close(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class PipelineMetrics:
+    """
+    Standard metrics of the live / headless pipelines.
+
+    Example:
+        metrics = PipelineMetrics()
+        server = MetricsServer(metrics.registry, port=9108)
+        metrics.frame_captured()
+        with metrics.stage("detect"):
+            hands = detector.detect(frame)
+        metrics.frame_processed(bool(hands), gesture_key)
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None, fps_smoothing: float = 0.1) -> None:
+        r = self.registry = registry or MetricsRegistry()
+        self.captured = r.counter("gesture_frames_captured_total", "Frames read from the source")
+        self.processed = r.counter("gesture_frames_processed_total", "Frames that went through the pipeline")
+        self.dropped = r.counter("gesture_frames_dropped_total", "Frames lost (read failures, full queues)")
+        self.detections = r.counter(
+            "gesture_detection_frames_total", "Processed frames by detection result", ("result",)
+        )
+        self.predictions = r.counter("gesture_predictions_total", "Per-frame predictions by gesture", ("gesture",))
+        self.latency = r.histogram("gesture_stage_latency_seconds", "Per-stage processing time", ("stage",))
+        self.fps = r.gauge("gesture_fps", "Processed frames per second (exponential moving average)")
+        self.queue_depth = r.gauge("gesture_queue_depth", "Items waiting in pipeline queues", ("queue",))
+        self.hit_rate = r.gauge("gesture_detection_hit_ratio", "Fraction of processed frames with a hand")
+        self.rss = r.gauge("gesture_process_rss_bytes", "Resident set size of the process")
+        self.startup = r.gauge("gesture_startup_seconds", "Startup timings (time to first prediction, per task)", ("phase",))
+
+        self._hit = self.detections.labels("hand")
+        self._miss = self.detections.labels("none")
+        self.hit_rate.set_function(
+            lambda: self._hit.value / (self._hit.value + self._miss.value) if self._hit.value + self._miss.value else 0.0
+        )
+        self.rss.set_function(process_rss_bytes)
+
+        self._stages: Dict[str, Histogram] = {}
+        self._gestures: Dict[str, Counter] = {}
+        self._alpha = fps_smoothing
+        self._last_frame: Optional[float] = None
+
+    def record_startup(self, report: Dict[str, object]) -> None:
+        """
+        Gauges from a `WarmStart.report()`.
+        """
+        for phase in ("first_prediction_ms", "first_frame_ms", "ready_ms", "process_ms"):
+            if report.get(phase) is not None:
+                self.startup.labels(phase[:-3]).set(report[phase] / 1000.0)
+        for name, t in report["tasks"].items():
+            self.startup.labels(f"task_{name}").set(t["ms"] / 1000.0)
+
+    def frame_captured(self) -> None:
+        self.captured.inc()
+
+    def frame_dropped(self, n: int = 1) -> None:
+        self.dropped.inc(n)
+
+    def stage_histogram(self, name: str) -> Histogram:
+        hist = self._stages.get(name)
+        if hist is None:
+            hist = self._stages[name] = self.latency.labels(name)
+        return hist
+
+    def observe_stage(self, name: str, seconds: float) -> None:
+        self.stage_histogram(name).observe(seconds)
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_histogram(name).observe(time.perf_counter() - t0)
+
+    def frame_processed(self, hand_detected: bool, gesture: str, now: Optional[float] = None) -> None:
+        self.processed.inc()
+        (self._hit if hand_detected else self._miss).inc()
+
+        counter = self._gestures.get(gesture)
+        if counter is None:
+            counter = self._gestures[gesture] = self.predictions.labels(gesture)
+        counter.inc()
+
+        if now is None:
+            now = time.perf_counter()
+        if self._last_frame is not None and now > self._last_frame:
+            fps = 1.0 / (now - self._last_frame)
+            self.fps.set(fps if self.fps.value == 0 else self.fps.value + self._alpha * (fps - self.fps.value))
+        self._last_frame = now
+
+
+def add_metrics_args(parser) -> None:
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=0,
+        help="serve Prometheus metrics on http://127.0.0.1:PORT/metrics (0 = off)",
+    )
+
+
+def start_metrics(port: int, log: Callable[[str], None] = print) -> Tuple[Optional[PipelineMetrics], Optional[MetricsServer]]:
+    """
+    (metrics, server) for a --metrics-port value; (None, None) when disabled.
+    """
+    if not port:
+        return None, None
+    metrics = PipelineMetrics()
+    server = MetricsServer(metrics.registry, port=port)
+    log(f"📈 Metrics at {server.url}")
+    return metrics, server
+
+
+def parse_prometheus_text(text: str) -> Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]:
+    """
+    Minimal parser for the text format above: {(name, ((label, value), ...)): value}.
+    """
+    samples: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        series, _, value = line.rpartition(" ")
+        name, labels = series, ()
+        if "{" in series:
+            name, _, rest = series.partition("{")
+            pairs = []
+            for part in rest.rstrip("}").split(","):
+                if part:
+                    k, _, v = part.partition("=")
+                    pairs.append((k, v.strip('"')))
+            labels = tuple(pairs)
+        samples[(name, labels)] = float(value.replace("+Inf", "inf"))
+    return samples
+
+
+def fetch_metrics(url: str, timeout: float = 0.5) -> Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]:
+    """
+    Scrape and parse a metrics endpoint (used by the Streamlit dashboard).
+    """
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        return parse_prometheus_text(resp.read().decode("utf-8"))
@@ -0,0 +1,95 @@
+"""
+ONNX gesture classifier for RT-Gesture3D.
+
+Runs a model exported by `src/training/train_classifier.py` with
+onnxruntime. It has the same call signature as the rule engine, so it can
+be passed anywhere a classifier is expected:
+
+    classifier = OnnxGestureClassifier("models/checkpoints/gesture_mlp.int8.onnx")
+    pipeline = GesturePipeline(classifier=classifier)
+
+Each model has a JSON sidecar (`gesture_mlp.json`) with the class order
+and the feature version it was trained with.
+
+Per-hand calls build features in plain Python and run the session through
+a preallocated IO binding, so an instance must not be shared between
+threads.
+"""
+
+import json
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import numpy as np
+import onnxruntime as ort
+
+from ..processing.preprocess import FEATURE_DIM, FEATURE_VERSION, hand_features, hand_features_batch
+from .mapping import GESTURES
+from .predictor import Point3D
+
+METADATA_FORMAT = "rt-gesture3d-classifier"
+
+
+def metadata_path(model_path: Union[str, Path]) -> Path:
+    """
+    models/checkpoints/gesture_mlp.int8.onnx → models/checkpoints/gesture_mlp.json
+    """
+    path = Path(model_path)
+    return path.with_name(path.name.split(".")[0] + ".json")
+
+
+class OnnxGestureClassifier:
+    def __init__(self, model_path: Union[str, Path], threads: int = 1) -> None:
+        self.model_path = Path(model_path)
+        meta = json.loads(metadata_path(self.model_path).read_text(encoding="utf-8"))
+        if meta.get("format") != METADATA_FORMAT:
+            raise ValueError(f"{metadata_path(self.model_path)} is not a {METADATA_FORMAT} sidecar")
+        if meta.get("feature_version") != FEATURE_VERSION:
+            raise ValueError(
+                f"Model was trained on feature version {meta.get('feature_version')}, "
+                f"this build produces version {FEATURE_VERSION}; retrain the model"
+            )
+        self.metadata = meta
+        self.classes = list(meta["classes"])
+        self._class_ids = np.array([GESTURES[k].id if k in GESTURES else -1 for k in self.classes], dtype=np.int64)
+        self._class_keys = np.array(self.classes, dtype=object)
+
+        # one thread: per-hand calls are latency-bound, not throughput-bound
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = threads
+        opts.inter_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self._session = ort.InferenceSession(str(self.model_path), opts, providers=["CPUExecutionProvider"])
+        self._input = self._session.get_inputs()[0].name
+        self._output = meta.get("probability_output", self._session.get_outputs()[-1].name)
+
+        # single-hand path: fixed input / output buffers bound once
+        self._x = np.zeros((1, FEATURE_DIM), dtype=np.float32)
+        self._proba = np.zeros((1, len(self.classes)), dtype=np.float32)
+        self._binding = self._session.io_binding()
+        self._binding.bind_cpu_input(self._input, self._x)
+        self._binding.bind_output(
+            self._output, "cpu", 0, np.float32, list(self._proba.shape), self._proba.ctypes.data
+        )
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        """
+        features: (N, FEATURE_DIM) float32 → (N, n_classes) probabilities
+        """
+        return self._session.run([self._output], {self._input: features})[0]
+
+    def predict_batch(self, pts: np.ndarray, img_w) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        pts: (N, 21, 3) pixel landmarks
+        returns: gesture ids (N,) int64, confidences (N,) float32
+        """
+        proba = self.predict_proba(hand_features_batch(pts, img_w))
+        best = proba.argmax(axis=1)
+        return self._class_ids[best], proba[np.arange(len(best)), best].astype(np.float32)
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        self._x[0] = hand_features(pts, img_w)
+        self._session.run_with_iobinding(self._binding)
+        proba = self._proba[0]
+        best = int(proba.argmax())
+        return self.classes[best], int(self._class_ids[best]), float(proba[best])
@@ -5,6 +5,15 @@ import numpy as np
 
 from .mapping import GESTURES, get_avatars_dir
 
+# Same topology as mediapipe.solutions.hands.HAND_CONNECTIONS
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),          # thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),          # index
+    (5, 9), (9, 10), (10, 11), (11, 12),     # middle
+    (9, 13), (13, 14), (14, 15), (15, 16),   # ring
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # pinky + palm
+)
+
 
 def load_avatars(size=(150, 150)) -> Dict[str, np.ndarray]:
     """
@@ -92,3 +101,16 @@ def overlay_gesture_text(frame, gesture_key: str, confidence: float):
         )
 
     return frame
+
+
+def draw_hand_landmarks(frame, pts):
+    """
+    Pixel-coordinate landmarks (detector / replay output) ko frame par draw karta hai.
+    """
+    for a, b in HAND_CONNECTIONS:
+        cv2.line(frame, (int(pts[a][0]), int(pts[a][1])), (int(pts[b][0]), int(pts[b][1])), (224, 224, 224), 2)
+
+    for x, y, _ in pts:
+        cv2.circle(frame, (int(x), int(y)), 3, (0, 0, 255), -1)
+
+    return frame
@@ -0,0 +1,87 @@
+"""
+Stages above detection, shared by the live demo and landmark replay.
+
+    hands (pixel landmarks) → [filter] → classify → smooth → overlay
+
+Keeping these out of the capture loop means they can be driven by a
+camera, a replayed landmark log, or a benchmark with the same code.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..processing.filters import OneEuroFilterBank
+from ..processing.smoothing import LabelSmoother
+from .overlay_inference import draw_hand_landmarks, overlay_avatar, overlay_gesture_text
+from .predictor import Point3D, detect_gesture_from_landmarks
+
+# (pts, img_w, img_h) -> (gesture_key, gesture_id, confidence)
+Classifier = Callable[[List[Point3D], int, int], Tuple[str, int, float]]
+
+
+@dataclass
+class GestureResult:
+    gesture_key: str       # raw prediction of this frame
+    gesture_id: int
+    confidence: float
+    stable_key: str        # smoothed label shown to the user
+    hands: List[List[Point3D]] = field(default_factory=list)
+
+
+class GesturePipeline:
+    """
+    Classification + smoothing + overlay for one stream.
+
+    Example:
+        pipeline = GesturePipeline(avatars=load_avatars())
+        result = pipeline.step(hands, w, h)
+        frame = pipeline.render(frame, result)
+
+    With a `landmark_filter` (see `processing/filters.py`) hands are
+    filtered before classification; pass the frame time as `t` to `step`
+    (default: now), e.g. the log timestamp when replaying.
+    """
+
+    def __init__(
+        self,
+        classifier: Classifier = detect_gesture_from_landmarks,
+        smoothing_window: int = 7,
+        avatars: Optional[Dict[str, np.ndarray]] = None,
+        landmark_filter: Optional[OneEuroFilterBank] = None,
+    ) -> None:
+        self.classifier = classifier
+        self.landmark_filter = landmark_filter
+        self.smoother = LabelSmoother(smoothing_window)
+        self.avatars = avatars or {}
+
+    def classify(self, hands: List[List[Point3D]], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        """
+        Classify all hands; like the original demo, the last hand wins.
+        """
+        gesture_key, gid, conf = "neutral", 0, 0.0
+        for pts in hands:
+            gesture_key, gid, conf = self.classifier(pts, img_w, img_h)
+        return gesture_key, gid, conf
+
+    def step(self, hands: List[List[Point3D]], img_w: int, img_h: int, t: Optional[float] = None) -> GestureResult:
+        if self.landmark_filter is not None:
+            hands = self.landmark_filter.filter_hands(hands, time.perf_counter() if t is None else t)
+        gesture_key, gid, conf = self.classify(hands, img_w, img_h)
+        stable_key = self.smoother.update(gesture_key)
+        return GestureResult(gesture_key, gid, conf, stable_key, hands)
+
+    def render(self, frame, result: GestureResult, draw_landmarks: bool = True):
+        if draw_landmarks:
+            for pts in result.hands:
+                draw_hand_landmarks(frame, pts)
+
+        frame = overlay_gesture_text(frame, result.stable_key, result.confidence)
+
+        avatar_img = self.avatars.get(result.stable_key)
+        if avatar_img is not None:
+            frame = overlay_avatar(frame, avatar_img)
+
+        return frame
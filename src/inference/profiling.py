@@ -0,0 +1,290 @@
+"""
+Built-in profiler for RT-Gesture3D pipelines.
+
+`--profile` on the live demo, headless mode, replay and the video
+renderer runs a sampling profiler for a fixed number of seconds or
+frames and then writes:
+
+    data/profiles/<name>_<stamp>.collapsed   # flame-graph input (flamegraph.pl, speedscope, inferno)
+    data/profiles/<name>_<stamp>.txt         # per-stage totals + top-N hotspots
+
+Modes:
+    sample    SIGPROF stack sampler (Linux / macOS, main thread). Every
+              tick records the interrupted Python stack, weighted by the
+              process CPU time since the previous tick, so long C calls
+              (MediaPipe, cv2) are charged to the Python line that made them.
+    cprofile  deterministic cProfile for the same window (any platform,
+              higher overhead); collapsed output is caller;callee pairs.
+    auto      sample where SIGPROF exists, else cprofile.
+
+Stage attribution: the frame loop calls `mark("detect")`, `mark("classify")`,
+... before each stage; every sample is tagged with the current stage and
+the stage becomes the root frame of the flame graph.
+"""
+
+import cProfile
+import pstats
+import signal
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_PROFILE_DIR = PROJECT_ROOT / "data" / "profiles"
+
+IDLE_STAGE = "other"
+
+
+def _code_label(code) -> str:
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _pstats_label(file: str, line: int, func: str) -> str:
+    return func if file == "~" else f"{func} ({Path(file).name}:{line})"
+
+
+def sampling_supported() -> bool:
+    return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF") and threading.current_thread() is threading.main_thread()
+
+
+class PipelineProfiler:
+    """
+    Example:
+        profiler = PipelineProfiler("live", max_seconds=10)
+        profiler.start()
+        while True:
+            profiler.mark("capture")
+            ok, frame = cap.read()
+            profiler.mark("detect")
+            ...
+            profiler.tick()   # writes the report once the window is over
+    """
+
+    def __init__(
+        self,
+        name: str = "pipeline",
+        max_seconds: Optional[float] = 10.0,
+        max_frames: Optional[int] = None,
+        interval_s: float = 0.005,
+        mode: str = "auto",
+        out_dir: Path = DEFAULT_PROFILE_DIR,
+        top: int = 20,
+        log: Callable[[str], None] = print,
+    ) -> None:
+        if mode not in ("auto", "sample", "cprofile"):
+            raise ValueError(f"Unknown profile mode: {mode!r}")
+        if mode == "auto":
+            mode = "sample" if sampling_supported() else "cprofile"
+        elif mode == "sample" and not sampling_supported():
+            raise RuntimeError("Sampling needs signal.setitimer/SIGPROF and the main thread; use mode='cprofile'")
+
+        self.name = name
+        self.max_seconds = max_seconds
+        self.max_frames = max_frames
+        self.interval_s = interval_s
+        self.mode = mode
+        self.out_dir = Path(out_dir)
+        self.top = top
+        self.log = log
+
+        self.active = False
+        self.finished = False
+        self.frames = 0
+        self.samples = 0
+        self._stage = IDLE_STAGE
+        self._stage_since = 0.0
+        self.stage_wall: Dict[str, float] = defaultdict(float)
+        # (stage, code objects root → leaf) → CPU seconds
+        self._stacks: Dict[Tuple[str, tuple], float] = defaultdict(float)
+        self._last_cpu = 0.0
+        self._t_start = 0.0
+        self._prev_handler = None
+        self._cprofile: Optional[cProfile.Profile] = None
+
+    # ---------- control ----------
+    def start(self) -> None:
+        if self.active or self.finished:
+            return
+        self.active = True
+        self._t_start = self._stage_since = time.perf_counter()
+        if self.mode == "sample":
+            self._last_cpu = time.process_time()
+            self._prev_handler = signal.signal(signal.SIGPROF, self._on_sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval_s, self.interval_s)
+        else:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self.log(f"🔬 Profiling ({self.mode}) for "
+                 + (f"{self.max_frames} frame(s)" if self.max_frames else f"{self.max_seconds:.0f}s"))
+
+    def _on_sample(self, signum, frame) -> None:
+        now = time.process_time()
+        weight = now - self._last_cpu
+        self._last_cpu = now
+        codes = []
+        while frame is not None:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        self._stacks[(self._stage, tuple(codes))] += weight
+        self.samples += 1
+
+    def mark(self, stage: str) -> None:
+        """
+        Start of a pipeline stage (the previous stage ends here).
+        """
+        if not self.active:
+            return
+        now = time.perf_counter()
+        self.stage_wall[self._stage] += now - self._stage_since
+        self._stage = stage
+        self._stage_since = now
+
+    def tick(self) -> None:
+        """
+        End of one frame; stops and writes the report when the window is over.
+        """
+        if not self.active:
+            return
+        self.frames += 1
+        if (self.max_frames and self.frames >= self.max_frames) or (
+            not self.max_frames and self.max_seconds and time.perf_counter() - self._t_start >= self.max_seconds
+        ):
+            self.stop()
+
+    def stop(self) -> Optional[Tuple[Path, Path]]:
+        """
+        Stop profiling and write the report (no-op when not running).
+        """
+        if not self.active:
+            return None
+        self.mark(IDLE_STAGE)
+        self.active = False
+        self.finished = True
+        elapsed = time.perf_counter() - self._t_start
+
+        if self.mode == "sample":
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self._prev_handler or signal.SIG_DFL)
+        else:
+            self._cprofile.disable()
+
+        paths = self._write(elapsed)
+        self.log(f"🔬 Profile written: {paths[0]} (flame graph), {paths[1]} (summary)")
+        return paths
+
+    # ---------- reports ----------
+    def _collapsed_lines(self) -> List[str]:
+        if self.mode == "sample":
+            labels: Dict[object, str] = {}
+            merged: Dict[str, float] = defaultdict(float)
+            for (stage, codes), seconds in self._stacks.items():
+                names = [labels.setdefault(c, _code_label(c)) for c in codes]
+                merged[";".join([stage] + names)] += seconds
+        else:
+            merged = defaultdict(float)
+            for (file, line, func), (_, _, _, _, callers) in pstats.Stats(self._cprofile).stats.items():
+                callee = _pstats_label(file, line, func)
+                for caller, (_, _, tt, _) in callers.items():
+                    merged[f"{_pstats_label(*caller)};{callee}"] += tt
+        # flame graph tools expect integer weights: microseconds
+        return [f"{stack} {int(seconds * 1e6)}" for stack, seconds in sorted(merged.items()) if seconds > 0]
+
+    def hotspots(self) -> List[Tuple[str, float, float, str]]:
+        """
+        (function, self seconds, inclusive seconds, dominant stage), by self time.
+        """
+        self_time: Dict[str, float] = defaultdict(float)
+        incl_time: Dict[str, float] = defaultdict(float)
+        by_stage: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+
+        if self.mode == "sample":
+            for (stage, codes), seconds in self._stacks.items():
+                if not codes:
+                    continue
+                leaf = _code_label(codes[-1])
+                self_time[leaf] += seconds
+                by_stage[leaf][stage] += seconds
+                for label in {_code_label(c) for c in codes}:
+                    incl_time[label] += seconds
+        else:
+            for (file, line, func), (_, _, tt, ct, _) in pstats.Stats(self._cprofile).stats.items():
+                label = _pstats_label(file, line, func)
+                self_time[label] += tt
+                incl_time[label] += ct
+
+        rows = []
+        for label, seconds in sorted(self_time.items(), key=lambda kv: -kv[1])[: self.top]:
+            stages = by_stage.get(label)
+            stage = max(stages.items(), key=lambda kv: kv[1])[0] if stages else "-"
+            rows.append((label, seconds, incl_time[label], stage))
+        return rows
+
+    def format_report(self, elapsed: float) -> str:
+        lines = [
+            f"RT-Gesture3D profile: {self.name} ({self.mode}), {self.frames} frame(s) in {elapsed:.2f}s, "
+            f"{self.samples} sample(s)",
+            "",
+            f"{'stage':<12} {'wall ms':>10} {'ms/frame':>9} {'cpu ms':>10} {'share':>7}",
+        ]
+        cpu_by_stage: Dict[str, float] = defaultdict(float)
+        for (stage, _), seconds in self._stacks.items():
+            cpu_by_stage[stage] += seconds
+        total_wall = sum(self.stage_wall.values()) or 1.0
+        for stage, wall in sorted(self.stage_wall.items(), key=lambda kv: -kv[1]):
+            cpu = f"{cpu_by_stage[stage] * 1000:>10.1f}" if self.mode == "sample" else f"{'-':>10}"
+            lines.append(
+                f"{stage:<12} {wall * 1000:>10.1f} {wall * 1000 / max(self.frames, 1):>9.2f} {cpu} "
+                f"{wall / total_wall * 100:>6.1f}%"
+            )
+
+        lines += ["", f"Top {self.top} functions by self time:",
+                  f"{'self ms':>10} {'incl ms':>10}  {'stage':<10} function"]
+        for label, self_s, incl_s, stage in self.hotspots():
+            lines.append(f"{self_s * 1000:>10.1f} {incl_s * 1000:>10.1f}  {stage:<10} {label}")
+        return "\n".join(lines) + "\n"
+
+    def _write(self, elapsed: float) -> Tuple[Path, Path]:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stem = f"{self.name}_{time.strftime('%Y%m%d_%H%M%S')}"
+        collapsed = self.out_dir / f"{stem}.collapsed"
+        summary = self.out_dir / f"{stem}.txt"
+        collapsed.write_text("\n".join(self._collapsed_lines()) + "\n", encoding="utf-8")
+        summary.write_text(self.format_report(elapsed), encoding="utf-8")
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(str(self.out_dir / f"{stem}.pstats"))
+        return collapsed, summary
+
+
+def add_profile_args(parser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", action="store_true", help="profile the frame loop and write a flame graph + hotspot summary")
+    group.add_argument("--profile-seconds", type=float, default=10.0, help="profile window in seconds")
+    group.add_argument("--profile-frames", type=int, default=0, help="profile window in frames (overrides --profile-seconds)")
+    group.add_argument("--profile-interval-ms", type=float, default=5.0, help="sampling interval")
+    group.add_argument("--profile-mode", choices=("auto", "sample", "cprofile"), default="auto")
+    group.add_argument("--profile-top", type=int, default=20, help="hotspots listed in the summary")
+    group.add_argument("--profile-out", default=str(DEFAULT_PROFILE_DIR), help="output directory")
+
+
+def profiler_from_args(args, name: str, log: Callable[[str], None] = print) -> Optional[PipelineProfiler]:
+    if not getattr(args, "profile", False):
+        return None
+    return PipelineProfiler(
+        name=name,
+        max_seconds=args.profile_seconds,
+        max_frames=args.profile_frames or None,
+        interval_s=args.profile_interval_ms / 1000.0,
+        mode=args.profile_mode,
+        out_dir=Path(args.profile_out),
+        top=args.profile_top,
+        log=log,
+    )
+
+
+def no_mark(stage: str) -> None:
+    """
+    Stand-in for `PipelineProfiler.mark` when profiling is off.
+    """
@@ -0,0 +1,309 @@
+"""
+Offline annotated-video renderer for RT-Gesture3D.
+
+Reads a video file, runs detection → classification → smoothing →
+overlay on every frame and writes the annotated result with
+`cv2.VideoWriter`, as fast as the machine allows (no window, no pacing).
+
+Usage (from project root):
+    python -m src.inference.render_video data/videos/incident.mp4
+    python -m src.inference.render_video in.mp4 -o out.mp4 --roi --templates data/templates/custom
+    python -m src.inference.render_video in.mp4 --landmarks data/logs/in.jsonl   # recorded hands, no MediaPipe
+    python -m src.inference.render_video in.mp4 --serial                         # one thread, for comparison
+    python -m src.inference.render_video in.mp4 --profile --profile-frames 500   # flame graph per stage
+
+The four stages run on their own threads, connected by bounded queues:
+
+    decode ──▶ detect ──▶ classify + render ──▶ encode
+
+so throughput is set by the slowest stage instead of the sum of all
+four, and memory stays at a few frames per queue. OpenCV and MediaPipe
+release the GIL inside their native code, so threads are enough (and
+frames are not pickled between processes). Frames stay in order, so
+MediaPipe tracking and label smoothing see the video as it was shot.
+
+At the end, each stage's busy time is printed; the stage close to 100%
+is the bottleneck. `--profile` (see profiling.py) runs the stages on
+one thread like `--serial`, since the profiler only sees the main
+thread, and attributes samples to decode / detect / classify / render /
+encode.
+"""
+
+import argparse
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import cv2
+from tqdm import tqdm
+
+from ..capture.landmark_log import read_landmark_log
+from ..capture.sources import VideoFileSource
+from ..processing.filters import add_filter_args, filter_from_args, smoothing_window_from_args
+from .backends import load_backend
+from .cache import CachedClassifier
+from .mapping import get_project_root
+from .overlay_inference import load_avatars
+from .pipeline import GesturePipeline
+from .predictor import detect_gesture_from_landmarks
+from .profiling import add_profile_args, no_mark, profiler_from_args
+from .template_matcher import load_templates
+
+_DONE = object()   # end-of-stream marker passed down the queues
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Render an annotated copy of a video file")
+    parser.add_argument("video", help="input video file")
+    parser.add_argument("-o", "--output", default=None,
+                        help="output video (default: data/renders/<name>_annotated.mp4)")
+    parser.add_argument("--fourcc", default="mp4v", help="output codec FOURCC (e.g. mp4v, avc1, MJPG)")
+    parser.add_argument("--max-hands", type=int, default=1)
+    parser.add_argument("--roi", action="store_true",
+                        help="high-resolution input: detect on a downscaled frame, then in full-resolution crops")
+    parser.add_argument("--landmarks", metavar="PATH", default=None,
+                        help="take hands from a landmark log of this video instead of running MediaPipe")
+    parser.add_argument("--templates", metavar="PATH", default=None,
+                        help="template index of user-defined gestures (rules as fallback)")
+    parser.add_argument("--backend", default="rules", metavar="SPEC",
+                        help="classifier backend: rules, rules-vectorized, onnx:PATH, template:PATH or auto (see backends.py)")
+    parser.add_argument("--cache-tolerance", type=float, default=0.0, metavar="PX")
+    parser.add_argument("--smoothing", type=int, default=None,
+                        help="label smoothing window in frames (default: 7, or 1 with --one-euro)")
+    add_filter_args(parser)
+    parser.add_argument("--no-landmarks-overlay", action="store_true", help="only draw label and avatar")
+    parser.add_argument("--queue-size", type=int, default=8, help="frames buffered between two stages")
+    parser.add_argument("--serial", action="store_true", help="run all stages one after another on one thread")
+    add_profile_args(parser)
+    return parser.parse_args(argv)
+
+
+class Stage(threading.Thread):
+    """
+    One pipeline stage: takes items from `inbox`, puts `fn(item)` into
+    `outbox` (unless it returns None). `fn` is None for the source stage,
+    which pulls items from `produce()` instead.
+
+    On an error the stage records it and sets `stop`, so every other
+    stage (blocked on a full or empty queue) gives up as well.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fn: Optional[Callable],
+        inbox: Optional[queue.Queue],
+        outbox: Optional[queue.Queue],
+        stop: threading.Event,
+        produce: Optional[Callable] = None,
+    ) -> None:
+        super().__init__(name=name, daemon=True)
+        self.fn = fn
+        self.inbox = inbox
+        self.outbox = outbox
+        self.stop = stop
+        self.produce = produce
+        self.busy_s = 0.0
+        self.items = 0
+        self.error: Optional[BaseException] = None
+
+    def _get(self):
+        while not self.stop.is_set():
+            try:
+                return self.inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def _put(self, item) -> None:
+        while not self.stop.is_set():
+            try:
+                self.outbox.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def run(self) -> None:
+        try:
+            if self.produce is not None:
+                items = iter(self.produce())
+                while not self.stop.is_set():
+                    t0 = time.perf_counter()
+                    item = next(items, _DONE)
+                    self.busy_s += time.perf_counter() - t0
+                    if item is _DONE:
+                        break
+                    self.items += 1
+                    self._put(item)
+            else:
+                while True:
+                    item = self._get()
+                    if item is _DONE:
+                        break
+                    t0 = time.perf_counter()
+                    out = self.fn(item)
+                    self.busy_s += time.perf_counter() - t0
+                    self.items += 1
+                    if out is not None and self.outbox is not None:
+                        self._put(out)
+        except BaseException as e:  # surfaced by run_stages()
+            self.error = e
+            self.stop.set()
+        finally:
+            if self.outbox is not None:
+                self._put(_DONE)
+
+
+def run_stages(produce: Callable, fns: List[tuple], queue_size: int = 8) -> List[Stage]:
+    """
+    Run `produce()` and the (name, fn) stages as a threaded pipeline and
+    wait for it to drain. Re-raises the first stage error.
+    """
+    stop = threading.Event()
+    queues = [queue.Queue(maxsize=max(1, queue_size)) for _ in fns]
+    stages = [Stage("decode", None, None, queues[0], stop, produce=produce)]
+    for i, (name, fn) in enumerate(fns):
+        stages.append(Stage(name, fn, queues[i], queues[i + 1] if i + 1 < len(fns) else None, stop))
+    for s in stages:
+        s.start()
+    try:
+        for s in stages:
+            while s.is_alive():
+                s.join(timeout=0.5)
+    except KeyboardInterrupt:
+        stop.set()
+        raise
+    for s in stages:
+        if s.error is not None:
+            raise s.error
+    return stages
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    source = VideoFileSource(args.video)
+    if not source.isOpened():
+        print(f"❌ Could not open {args.video}")
+        return
+    info = source.describe()
+    w, h, fps = info["width"], info["height"], source.fps
+
+    out_path = Path(args.output) if args.output else (
+        get_project_root() / "data" / "renders" / f"{Path(args.video).stem}_annotated.mp4"
+    )
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    writer = cv2.VideoWriter(str(out_path), cv2.VideoWriter_fourcc(*args.fourcc), fps, (w, h))
+    if not writer.isOpened():
+        source.close()
+        print(f"❌ Could not open a {args.fourcc} writer for {out_path}")
+        return
+
+    detector = None
+    if args.landmarks:
+        logged = iter(read_landmark_log(args.landmarks))
+
+        def detect(frame):
+            lf = next(logged, None)
+            return lf.hands if lf is not None else []
+    else:
+        from ..detection.mediapipe_wrapper import MediaPipeHandDetector
+        from ..detection.roi import RoiHandDetector
+
+        detector = (RoiHandDetector if args.roi else MediaPipeHandDetector)(max_num_hands=args.max_hands)
+        detect = detector.detect
+
+    classifier = detect_gesture_from_landmarks
+    if args.templates:
+        classifier = load_templates(args.templates)
+    elif args.backend != "rules":
+        classifier = load_backend(args.backend)
+        print(f"🧠 Classifier backend: {classifier.spec}")
+    if args.cache_tolerance > 0:
+        classifier = CachedClassifier(classifier, tolerance_px=args.cache_tolerance)
+    pipeline = GesturePipeline(classifier=classifier, smoothing_window=smoothing_window_from_args(args),
+                               avatars=load_avatars(size=(150, 150)), landmark_filter=filter_from_args(args))
+    draw_landmarks = not args.no_landmarks_overlay
+    labels: Dict[str, int] = {}
+    rendered = [0]
+    profiler = profiler_from_args(args, name="render_video")
+    mark = profiler.mark if profiler is not None else no_mark
+    if profiler is not None and not args.serial:
+        print("ℹ️ --profile runs the stages on one thread (the profiler samples the main thread)")
+
+    def decode():
+        for captured in source:
+            yield captured.image
+
+    def detect_stage(frame):
+        return frame, detect(frame)
+
+    def render_stage(item):
+        frame, hands = item
+        mark("classify")
+        result = pipeline.step(hands, frame.shape[1], frame.shape[0], t=rendered[0] / fps)   # video time
+        rendered[0] += 1
+        labels[result.stable_key] = labels.get(result.stable_key, 0) + 1
+        mark("render")
+        return pipeline.render(frame, result, draw_landmarks=draw_landmarks)
+
+    print(f"▶️ Rendering {args.video} ({w}x{h} @ {fps:.1f} fps) → {out_path}")
+    progress = tqdm(total=source.frame_count or None, unit="frame", desc=Path(args.video).name)
+
+    def encode_stage(frame):
+        writer.write(frame)
+        progress.update(1)
+
+    stage_fns = [("detect", detect_stage), ("render", render_stage), ("encode", encode_stage)]
+    t_start = time.perf_counter()
+    if profiler is not None:
+        profiler.start()
+    try:
+        if args.serial or profiler is not None:
+            busy = {name: 0.0 for name in ["decode"] + [n for n, _ in stage_fns]}
+            frames = iter(decode())
+            while True:
+                mark("decode")
+                t0 = time.perf_counter()
+                item = next(frames, None)
+                busy["decode"] += time.perf_counter() - t0
+                if item is None:
+                    break
+                for name, fn in stage_fns:
+                    if name != "render":        # render_stage marks classify / render itself
+                        mark(name)
+                    t0 = time.perf_counter()
+                    item = fn(item)
+                    busy[name] += time.perf_counter() - t0
+                if profiler is not None:
+                    profiler.tick()
+        else:
+            stages = run_stages(decode, stage_fns, queue_size=args.queue_size)
+            busy = {s.name: s.busy_s for s in stages}
+    except KeyboardInterrupt:
+        print("\n👋 Interrupted, output is truncated.")
+        busy = {}
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        progress.close()
+        writer.release()
+        source.close()
+        if detector is not None:
+            detector.close()
+
+    elapsed = time.perf_counter() - t_start
+    n = progress.n
+    print(f"✅ {n} frame(s) in {elapsed:.2f}s → {n / elapsed if elapsed > 0 else 0.0:.1f} frames/s "
+          f"({n / fps / elapsed if elapsed > 0 else 0.0:.1f}x real time), saved to {out_path}")
+    if busy and elapsed > 0:
+        print("⏱ Stage busy time: " + ", ".join(f"{k} {v:.2f}s ({v / elapsed:.0%})" for k, v in busy.items()))
+    if isinstance(classifier, CachedClassifier):
+        print(f"🧠 Classification cache: {classifier.stats()}")
+    print("Stable labels:", ", ".join(f"{k}={v}" for k, v in sorted(labels.items(), key=lambda kv: -kv[1])))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Replay a recorded landmark log through the stages above detection.
+
+Usage (from project root):
+    python -m src.inference.live_gesture_demo --record-landmarks data/logs/session.jsonl
+    python -m src.inference.replay data/logs/session.jsonl            # original timing
+    python -m src.inference.replay data/logs/session.jsonl --fast     # as fast as possible
+    python -m src.inference.replay data/logs/session.jsonl --fast --no-render --loops 50
+    python -m src.inference.replay data/logs/session.jsonl --fast --profile --profile-frames 2000
+
+No camera or display is needed (unless --show is given), so the numbers
+are reproducible on headless Linux boxes.
+"""
+
+import argparse
+import time
+
+import cv2
+import numpy as np
+
+from ..capture.landmark_log import LandmarkReplay
+from ..processing.filters import add_filter_args, filter_from_args, smoothing_window_from_args
+from .backends import load_backend
+from .cache import CachedClassifier
+from .overlay_inference import load_avatars
+from .pipeline import GesturePipeline
+from .predictor import detect_gesture_from_landmarks
+from .profiling import add_profile_args, no_mark, profiler_from_args
+from .template_matcher import load_templates
+from .timing import LatencyRecorder
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a landmark log through classification / smoothing / overlay")
+    parser.add_argument("log", help="landmark log (.jsonl) recorded with --record-landmarks")
+    parser.add_argument("--fast", action="store_true", help="ignore recorded timing, run as fast as possible")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed factor (real-time mode)")
+    parser.add_argument("--loops", type=int, default=1, help="replay the log this many times")
+    parser.add_argument("--smoothing", type=int, default=None,
+                        help="label smoothing window in frames (default: 7, or 1 with --one-euro)")
+    parser.add_argument("--cache-tolerance", type=float, default=0.0, metavar="PX",
+                        help="put a CachedClassifier with this tolerance in front of the rules (0 = off)")
+    parser.add_argument("--templates", metavar="PATH", default=None,
+                        help="classify with a template index of user-defined gestures (rules as fallback)")
+    parser.add_argument("--backend", default="rules", metavar="SPEC",
+                        help="classifier backend: rules, rules-vectorized, onnx:PATH, template:PATH or auto (see backends.py)")
+    parser.add_argument("--no-render", action="store_true", help="skip the overlay stage")
+    parser.add_argument("--show", action="store_true", help="display rendered frames in a window")
+    add_filter_args(parser)
+    add_profile_args(parser)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    replay = LandmarkReplay(args.log, realtime=not args.fast, speed=args.speed, loops=args.loops)
+    if not replay.frames:
+        print(f"❌ No frames in {args.log}")
+        return
+
+    render = not args.no_render
+    avatars = load_avatars(size=(150, 150)) if render else {}
+    classifier = detect_gesture_from_landmarks
+    if args.templates:
+        classifier = load_templates(args.templates)
+    elif args.backend != "rules":
+        classifier = load_backend(args.backend)
+        print(f"🧠 Classifier backend: {classifier.spec}")
+    if args.cache_tolerance > 0:
+        classifier = CachedClassifier(classifier, tolerance_px=args.cache_tolerance)
+    pipeline = GesturePipeline(classifier=classifier, smoothing_window=smoothing_window_from_args(args),
+                               avatars=avatars, landmark_filter=filter_from_args(args))
+    latency = LatencyRecorder()
+    profiler = profiler_from_args(args, name="replay")
+    mark = profiler.mark if profiler is not None else no_mark
+
+    print(f"▶️ Replaying {len(replay.frames)} frame(s) x {args.loops} from {args.log}")
+
+    canvas = None
+    n_frames = 0
+    n_hands = 0
+    labels = {}
+    t_start = time.perf_counter()
+    if profiler is not None:
+        profiler.start()
+
+    for lf in replay:
+        t0 = time.perf_counter()
+        mark("classify")
+        result = pipeline.step(lf.hands, lf.width, lf.height, t=lf.timestamp)
+        t1 = time.perf_counter()
+        latency.add("classify", t1 - t0)
+
+        if render:
+            mark("render")
+            if canvas is None or canvas.shape[:2] != (lf.height, lf.width):
+                canvas = np.zeros((lf.height, lf.width, 3), dtype=np.uint8)
+            canvas.fill(0)
+            pipeline.render(canvas, result)
+            latency.add("render", time.perf_counter() - t1)
+
+        latency.add("total", time.perf_counter() - t0)
+
+        if args.show and canvas is not None:
+            mark("display")
+            cv2.imshow("RT-Gesture3D - Replay", canvas)
+            if cv2.waitKey(1) & 0xFF == ord("q"):
+                break
+
+        n_frames += 1
+        n_hands += len(lf.hands)
+        labels[result.stable_key] = labels.get(result.stable_key, 0) + 1
+        mark("replay")
+        if profiler is not None:
+            profiler.tick()
+
+    elapsed = time.perf_counter() - t_start
+    if profiler is not None:
+        profiler.stop()
+
+    print(f"✅ {n_frames} frame(s), {n_hands} hand(s) in {elapsed:.3f}s "
+          f"→ {n_frames / elapsed if elapsed > 0 else 0.0:.1f} frames/s")
+    print(latency.format_report())
+    if isinstance(classifier, CachedClassifier):
+        print(f"🧠 Classification cache: {classifier.stats()}")
+    print("Stable labels:", ", ".join(f"{k}={v}" for k, v in sorted(labels.items(), key=lambda kv: -kv[1])))
+
+    if args.show:
+        cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Gesture-sequence (combo) matching for RT-Gesture3D.
+
+Actions such as "stop → calm → victory within 2 s" are declared as
+patterns over debounced gesture *start* events (see `events.py`):
+
+    unlock  = stop calm victory within 2s
+    double  = rock{2} within 1.5s
+    confirm = (ok|perfect) stop? victory
+    scroll  = calm{2,4}
+
+Pattern syntax (tokens separated by spaces, `->` or `→`):
+
+    key          one gesture
+    (a|b)        any of several gestures
+    X?           optional token
+    X{m} X{m,n}  token repeated m, or m to n, times (bounded)
+    within T     optional: first to last event in at most T seconds ("2", "2s", "500ms")
+
+Repeats are bounded, so every pattern is a finite set of gesture strings.
+All strings of all patterns are compiled into one Aho-Corasick automaton
+with a dense transition table: each event costs one table lookup plus
+the matches that end at it, independent of how many patterns are
+registered. Overlapping and nested matches are all reported (shorter
+patterns inside longer ones, and matches that share events).
+
+Timing: every stream keeps the timestamps of its last `max_len` events,
+so a match of length k is checked against its own `within` in O(1).
+When no event arrives for longer than the largest `within` of any
+pattern, no timed partial match can still complete and the stream
+resets. Patterns without `within` never time out: when a set mixes
+both, the unbounded ones get a second automaton whose state survives
+those resets (one more table lookup per event).
+
+    automaton = compile_patterns(load_sequence_file("data/sequences.txt"))
+    matcher = SequenceMatcher(automaton)
+    for event in tracker.update(labels, now):
+        for match in matcher.feed(event):
+            sink.emit(match)
+
+    python -m src.inference.sequences bench --patterns 500   # µs per event vs pattern count
+"""
+
+import argparse
+import re
+import time
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+MAX_EXPANSIONS = 10_000           # strings per pattern after expanding repeats / alternatives
+
+_TOKEN = re.compile(r"^(?:\((?P<alts>[\w|-]+)\)|(?P<name>[\w-]+(?:\|[\w-]+)*))(?P<quant>\?|\{\d+(?:,\d+)?\})?$")
+_WITHIN = re.compile(r"\s+within\s+(?P<value>[\d.]+)\s*(?P<unit>ms|s)?\s*$")
+
+
+@dataclass(frozen=True)
+class SequencePattern:
+    name: str
+    text: str
+    strings: Tuple[Tuple[str, ...], ...]     # every gesture sequence the pattern accepts
+    within_s: Optional[float] = None
+
+
+def parse_pattern(name: str, text: str) -> SequencePattern:
+    """
+    Parse one pattern (see module docstring) and expand it to gesture strings.
+    """
+    body, within = text.strip(), None
+    m = _WITHIN.search(" " + body)
+    if m:
+        within = float(m.group("value")) / (1000.0 if m.group("unit") == "ms" else 1.0)
+        body = (" " + body)[: m.start()].strip()
+
+    choices: List[List[Tuple[str, ...]]] = []     # per token: possible gesture runs
+    for token in body.replace("→", " ").replace("->", " ").split():
+        t = _TOKEN.match(token)
+        if t is None:
+            raise ValueError(f"Sequence {name!r}: cannot parse token {token!r}")
+        alts = (t.group("alts") or t.group("name")).split("|")
+        quant = t.group("quant") or ""
+        if quant == "?":
+            lo, hi = 0, 1
+        elif quant:
+            lo, _, hi_s = quant[1:-1].partition(",")
+            lo, hi = int(lo), int(hi_s or lo)
+        else:
+            lo, hi = 1, 1
+        if hi < lo:
+            raise ValueError(f"Sequence {name!r}: bad repeat {quant} in {token!r}")
+        runs = [run for n in range(lo, hi + 1) for run in product(alts, repeat=n)]
+        choices.append(runs)
+
+    n_strings = 1
+    for runs in choices:
+        n_strings *= len(runs)
+    if n_strings > MAX_EXPANSIONS:
+        raise ValueError(f"Sequence {name!r} expands to {n_strings} gesture strings (max {MAX_EXPANSIONS})")
+
+    strings = sorted({sum(parts, ()) for parts in product(*choices)} - {()})
+    if not strings:
+        raise ValueError(f"Sequence {name!r} matches nothing")
+    return SequencePattern(name, text.strip(), tuple(strings), within)
+
+
+def load_sequence_file(path: Union[str, Path]) -> List[SequencePattern]:
+    """
+    One `name = pattern` per line; blank lines and `#` comments are skipped.
+    """
+    patterns = []
+    for lineno, line in enumerate(Path(path).read_text(encoding="utf-8").splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        name, sep, text = line.partition("=")
+        if not sep or not name.strip():
+            raise ValueError(f"{path}:{lineno}: expected 'name = pattern'")
+        patterns.append(parse_pattern(name.strip(), text))
+    return patterns
+
+
+class SequenceAutomaton:
+    """
+    Aho-Corasick automaton over gesture symbols with a dense goto table.
+
+    `delta[state][symbol]` is the next state (failure links already
+    folded in); `outputs[state]` lists (pattern index, match length) for
+    every pattern string ending in that state, including the ones
+    reached through suffix links. Symbol 0 stands for any gesture no
+    pattern mentions.
+    """
+
+    def __init__(self, patterns: Sequence[SequencePattern]) -> None:
+        if not patterns:
+            raise ValueError("No sequence patterns")
+        self.patterns = list(patterns)
+        self.max_len = max(len(s) for p in patterns for s in p.strings)
+        windows = [p.within_s for p in patterns if p.within_s is not None]
+        # a gap longer than every finite window ends all timed partial matches
+        self.reset_after_s = max(windows) if windows else None
+        self.untimed: Optional[SequenceAutomaton] = None
+        if windows and len(windows) < len(patterns):
+            # unbounded patterns must outlive those resets: separate automaton, never reset
+            self.untimed = SequenceAutomaton([p for p in patterns if p.within_s is None])
+            patterns = [p for p in patterns if p.within_s is not None]
+        self.table_patterns = list(patterns)      # the patterns `outputs` refers to
+        keys = sorted({g for p in patterns for s in p.strings for g in s})
+        self.symbols: Dict[str, int] = {g: i + 1 for i, g in enumerate(keys)}
+        n_sym = len(keys) + 1
+
+        # trie
+        goto: List[Dict[int, int]] = [{}]
+        out: List[List[Tuple[int, int]]] = [[]]
+        for pi, p in enumerate(patterns):
+            for s in p.strings:
+                state = 0
+                for g in s:
+                    sym = self.symbols[g]
+                    nxt = goto[state].get(sym)
+                    if nxt is None:
+                        nxt = len(goto)
+                        goto[state][sym] = nxt
+                        goto.append({})
+                        out.append([])
+                    state = nxt
+                out[state].append((pi, len(s)))
+
+        # BFS: failure links → dense transitions, merged outputs
+        delta = [[0] * n_sym for _ in goto]
+        fail = [0] * len(goto)
+        order = []
+        for sym, nxt in goto[0].items():
+            delta[0][sym] = nxt
+            order.append(nxt)
+        i = 0
+        while i < len(order):
+            state = order[i]
+            i += 1
+            out[state] = out[state] + out[fail[state]]
+            for sym in range(n_sym):
+                nxt = goto[state].get(sym)
+                if nxt is None:
+                    delta[state][sym] = delta[fail[state]][sym]
+                else:
+                    fail[nxt] = delta[fail[state]][sym]
+                    delta[state][sym] = nxt
+                    order.append(nxt)
+
+        self.delta = delta
+        self.outputs: List[Tuple[Tuple[int, int], ...]] = [tuple(o) for o in out]
+
+    def __len__(self) -> int:
+        return len(self.delta) + (len(self.untimed) if self.untimed is not None else 0)
+
+    def stream(self) -> "SequenceStream":
+        return SequenceStream(self)
+
+
+class SequenceStream:
+    """
+    Matching state of one event stream (one hand).
+    """
+
+    def __init__(self, automaton: SequenceAutomaton, reset_after_s: Optional[float] = None) -> None:
+        self.automaton = automaton
+        self.reset_after_s = reset_after_s if reset_after_s is not None else automaton.reset_after_s
+        self.state = 0
+        self.untimed_state = 0
+        self._times = [0.0] * automaton.max_len
+        self._keys = [""] * automaton.max_len
+        self._pos = 0                  # events pushed so far (ring position)
+        self._timed_len = 0            # events since the last reset of `state`
+        self._untimed_len = 0          # events since the last reset of `untimed_state`
+        self._last_t: Optional[float] = None
+        self.resets = 0
+
+    def reset(self) -> None:
+        self.state = 0
+        self.untimed_state = 0
+        self._timed_len = 0
+        self._untimed_len = 0
+
+    def push(self, gesture: str, t: float) -> List[Tuple[SequencePattern, float, Tuple[str, ...]]]:
+        """
+        Advance by one gesture start event at time `t`.
+
+        Returns (pattern, start time, gestures) for every pattern that
+        completes with this event and satisfies its `within`.
+        """
+        a = self.automaton
+        if self._last_t is not None and self.reset_after_s is not None and t - self._last_t > self.reset_after_s:
+            # timed partial matches only: unbounded patterns (a.untimed) keep their state
+            self.state = 0
+            self._timed_len = 0
+            self.resets += 1
+        self._last_t = t
+
+        slot = self._pos % a.max_len
+        self._times[slot] = t
+        self._keys[slot] = gesture
+        self._pos += 1
+        self._timed_len += 1
+        self._untimed_len += 1
+        self.state = a.delta[self.state][a.symbols.get(gesture, 0)]
+        matches = self._matches(a, self.state, self._timed_len, t)
+        if a.untimed is not None:
+            u = a.untimed
+            self.untimed_state = u.delta[self.untimed_state][u.symbols.get(gesture, 0)]
+            matches += self._matches(u, self.untimed_state, self._untimed_len, t)
+        return matches
+
+    def _matches(
+        self, a: SequenceAutomaton, state: int, available: int, t: float
+    ) -> List[Tuple[SequencePattern, float, Tuple[str, ...]]]:
+        n = len(self._times)
+        matches = []
+        for pi, length in a.outputs[state]:
+            if length > available:
+                continue       # string started before the last reset
+            first = (self._pos - length) % n
+            pattern = a.table_patterns[pi]
+            if pattern.within_s is not None and t - self._times[first] > pattern.within_s:
+                continue
+            gestures = tuple(self._keys[(first + i) % n] for i in range(length))
+            matches.append((pattern, self._times[first], gestures))
+        return matches
+
+
+class SequenceMatcher:
+    """
+    Feeds gesture events into one `SequenceStream` per hand and returns
+    sequence events:
+
+        {"type": "sequence", "name": "unlock", "hand": 0, "t": ..., "t_start": ...,
+         "gestures": ["stop", "calm", "victory"]}
+
+    With `reset_on_match` a hand's stream restarts after a match, so the
+    same events never complete a second (overlapping) pattern.
+    """
+
+    def __init__(self, automaton: SequenceAutomaton, reset_on_match: bool = False) -> None:
+        self.automaton = automaton
+        self.reset_on_match = reset_on_match
+        self._streams: Dict[int, SequenceStream] = {}
+        self.matched = 0
+
+    def feed(self, event: Dict[str, object]) -> List[Dict[str, object]]:
+        if event.get("type") != "start":
+            return []
+        hand = int(event.get("hand", 0))
+        stream = self._streams.get(hand)
+        if stream is None:
+            stream = self._streams[hand] = self.automaton.stream()
+        t = float(event["t"])
+
+        out = []
+        seen = set()
+        for pattern, t_start, gestures in stream.push(str(event["gesture"]), t):
+            if pattern.name in seen:
+                continue           # one event per pattern, even if several of its strings end here
+            seen.add(pattern.name)
+            out.append({
+                "type": "sequence",
+                "name": pattern.name,
+                "hand": hand,
+                "t": round(t, 4),
+                "t_start": round(t_start, 4),
+                "gestures": list(gestures),
+            })
+        if out and self.reset_on_match:
+            stream.reset()
+        self.matched += len(out)
+        return out
+
+
+def compile_patterns(patterns: Union[Iterable[SequencePattern], Dict[str, str]]) -> SequenceAutomaton:
+    """
+    Automaton for parsed patterns, or for a {name: pattern text} dict.
+    """
+    if isinstance(patterns, dict):
+        patterns = [parse_pattern(name, text) for name, text in patterns.items()]
+    return SequenceAutomaton(list(patterns))
+
+
+# ---------- CLI ----------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RT-Gesture3D gesture-sequence patterns")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    check = sub.add_parser("check", help="parse a sequence file and show its automaton size")
+    check.add_argument("file")
+
+    bench = sub.add_parser("bench", help="per-event cost with N random patterns")
+    bench.add_argument("--patterns", type=int, nargs="*", default=[10, 100, 500])
+    bench.add_argument("--events", type=int, default=100_000)
+    bench.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+def _bench(args) -> None:
+    import random
+
+    from .mapping import GESTURES
+
+    rng = random.Random(args.seed)
+    keys = [k for k in GESTURES if k != "neutral"]
+    events = [rng.choice(keys) for _ in range(args.events)]
+    for n in args.patterns:
+        texts = {}
+        for i in range(n):
+            tokens = [rng.choice(keys) + rng.choice(["", "", "", "?", "{1,2}"]) for _ in range(rng.randint(2, 5))]
+            texts[f"p{i}"] = " ".join(tokens) + f" within {rng.uniform(1.0, 5.0):.1f}s"
+        t0 = time.perf_counter()
+        automaton = compile_patterns(texts)
+        build_ms = (time.perf_counter() - t0) * 1000.0
+
+        stream = automaton.stream()
+        matches = 0
+        t0 = time.perf_counter()
+        for i, g in enumerate(events):
+            matches += len(stream.push(g, i * 0.3))
+        per_event_us = (time.perf_counter() - t0) / len(events) * 1e6
+        print(f"📐 {n:5d} pattern(s): {len(automaton):6d} states, built in {build_ms:7.1f} ms, "
+              f"{per_event_us:5.2f} µs/event, {matches / len(events):.2f} match(es)/event")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "bench":
+        _bench(args)
+        return
+    patterns = load_sequence_file(args.file)
+    automaton = compile_patterns(patterns)
+    for p in patterns:
+        within = f", within {p.within_s:g}s" if p.within_s is not None else ""
+        print(f"  {p.name:<16} {len(p.strings)} gesture string(s){within}")
+    print(f"✅ {len(patterns)} pattern(s), {len(automaton)} automaton state(s), longest sequence {automaton.max_len}")
+
+
+if __name__ == "__main__":
+    main()
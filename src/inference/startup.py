@@ -0,0 +1,142 @@
+"""
+Parallel warm start for RT-Gesture3D.
+
+Serial startup pays for every step in turn: importing MediaPipe and
+building the Hands graph, opening the camera (often the slowest part:
+device negotiation, auto exposure), reading and resizing every avatar,
+and then MediaPipe's lazy initialisation on the first real frame.
+`WarmStart` runs these as independent tasks on a thread pool (graph
+construction, device I/O and image decoding all release the GIL) and
+warms the detector up on a blank frame while the camera is still
+opening, so the first real frame gets a ready graph:
+
+    startup = WarmStart()
+    startup.submit("source", source_from_args, args)
+    startup.submit("detector", warm_detector, make_detector, (480, 640, 3))
+    startup.submit("avatars", load_avatars, (150, 150))
+    source, detector, avatars = startup.get("source"), startup.get("detector"), startup.get("avatars")
+    ...
+    startup.first_prediction()          # after the first frame was classified
+    print(startup.format_report())
+
+The report has per-task start / end times, `ready_ms` (all tasks done),
+`first_frame_ms`, `first_prediction_ms` (time to first prediction,
+measured from `WarmStart()`), and `process_ms`: the same moment measured
+from process start, so interpreter start-up and imports are included.
+
+    python -m src.inference.live_gesture_demo                    # parallel warm start (default)
+    python -m src.inference.live_gesture_demo --serial-startup   # old order, for comparison
+    python -m benchmarks.bench_startup                           # tracks time-to-first-prediction
+"""
+
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def process_age_s() -> Optional[float]:
+    """
+    Seconds since this process started (Linux /proc), None elsewhere.
+    """
+    try:
+        with open("/proc/self/stat") as f:
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            uptime = float(f.read().split()[0])
+        return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def warm_detector(factory: Callable[[], object], shape: Tuple[int, int, int] = (480, 640, 3)):
+    """
+    Build a detector and run it once on a blank frame of `shape`, so
+    lazy graph / model initialisation happens before the first real frame.
+    """
+    detector = factory()
+    detector.detect(np.zeros(shape, dtype=np.uint8))
+    return detector
+
+
+class WarmStart:
+    """
+    Named startup tasks, run concurrently (or one after another with
+    `parallel=False`, for comparison), with timing.
+    """
+
+    def __init__(self, parallel: bool = True, max_workers: int = 4) -> None:
+        self.parallel = parallel
+        self.t0 = time.perf_counter()
+        self._age0 = process_age_s()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="warm-start") if parallel else None
+        self._futures: Dict[str, Future] = {}
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self.first_frame_s: Optional[float] = None
+        self.first_prediction_s: Optional[float] = None
+
+    def _timed(self, name: str, fn: Callable, *args):
+        start = time.perf_counter() - self.t0
+        try:
+            return fn(*args)
+        finally:
+            self.timings[name] = (start, time.perf_counter() - self.t0)
+
+    def submit(self, name: str, fn: Callable, *args) -> None:
+        if self._executor is not None:
+            self._futures[name] = self._executor.submit(self._timed, name, fn, *args)
+            return
+        future: Future = Future()
+        try:
+            future.set_result(self._timed(name, fn, *args))
+        except BaseException as e:
+            future.set_exception(e)
+        self._futures[name] = future
+
+    def get(self, name: str):
+        """
+        Result of a task (waits for it; re-raises its exception).
+        """
+        return self._futures[name].result()
+
+    def wait(self) -> Dict[str, object]:
+        results = {name: f.result() for name, f in self._futures.items()}
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        return results
+
+    def first_frame(self) -> None:
+        if self.first_frame_s is None:
+            self.first_frame_s = time.perf_counter() - self.t0
+
+    def first_prediction(self) -> None:
+        if self.first_prediction_s is None:
+            self.first_prediction_s = time.perf_counter() - self.t0
+
+    def report(self) -> Dict[str, object]:
+        def ms(s):
+            return round(s * 1000.0, 1) if s is not None else None
+
+        ready = max((end for _, end in self.timings.values()), default=0.0)
+        process = None
+        if self._age0 is not None and self.first_prediction_s is not None:
+            process = self._age0 + self.first_prediction_s
+        return {
+            "parallel": self.parallel,
+            "tasks": {name: {"start_ms": ms(s), "end_ms": ms(e), "ms": ms(e - s)} for name, (s, e) in self.timings.items()},
+            "ready_ms": ms(ready),
+            "first_frame_ms": ms(self.first_frame_s),
+            "first_prediction_ms": ms(self.first_prediction_s),
+            "process_ms": ms(process),
+        }
+
+    def format_report(self) -> str:
+        r = self.report()
+        tasks = ", ".join(f"{name} {t['ms']:.0f} ms" for name, t in r["tasks"].items())
+        line = (f"⏱ Time to first prediction: {r['first_prediction_ms']:.0f} ms "
+                f"({'parallel' if self.parallel else 'serial'} startup: {tasks})")
+        if r["process_ms"] is not None:
+            line += f", {r['process_ms']:.0f} ms since process start"
+        return line
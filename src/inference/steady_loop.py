@@ -0,0 +1,572 @@
+"""
+Steady-state (allocation-free) frame loop for RT-Gesture3D.
+
+The regular demo loop allocates per frame: the captured frame, the
+RGB copy for MediaPipe, landmark tuple lists, a `Counter` for
+smoothing, formatted label strings and overlay slices. At 60 FPS and
+1080p that is hundreds of MB/s through the allocator plus regular GC
+passes. `SteadyStateLoop` allocates its buffers once per resolution:
+
+    frame      (h, w, 3) uint8     captured into with `read(image=frame)`
+    rgb        (h, w, 3) uint8     `cvtColor(..., dst=rgb)` for MediaPipe
+    small/rgb  scaled copies       only with inference_scale != 1
+    landmarks  (H, 21, 3) float32  written by `detect_into`
+    pixels / palm / dots           int32 arrays (and views) used to draw the skeleton
+    stamps     per label line      rendered text masks (`TextStamp`), built on first use
+
+and then classifies hand by hand from the landmark buffer
+(`batch_predictor.BufferRules`), smooths with a fixed-size vote
+counter, and draws label, landmarks and avatar in place into `frame`
+from prebuilt views and cached text stamps. After warm-up (every
+buffer, view and label line built once) a frame creates no Python
+objects at all: no NumPy temporaries, no views, no tuples, no ints
+outside the small-int cache. The real detector still returns
+MediaPipe's result protobufs; everything around it allocates nothing.
+
+    python -m src.inference.live_gesture_demo --steady-state        # live, rules classifier only
+    python -m src.inference.steady_loop check                       # allocation check (no camera / MediaPipe)
+    python -m src.inference.steady_loop check --width 1920 --height 1080 --frames 2000
+
+`check` replays synthetic frames through the loop with a stand-in
+detector (synthetic landmarks written into the buffer) and measures,
+per frame with `tracemalloc`, the peak Python-heap allocation (NumPy
+buffers included), the net traced growth and net allocated blocks,
+GC passes, and whether the buffers kept their addresses; the regular
+`GesturePipeline` path is measured next to it. It exits 1 unless every
+frame allocates 0 bytes and leaves no block behind.
+"""
+
+import argparse
+import gc
+import itertools
+import sys
+import time
+import tracemalloc
+from typing import Dict, Optional
+
+import cv2
+import numpy as np
+
+from .batch_predictor import BufferRules
+from .mapping import GESTURES, ID_TO_KEY
+
+_LINE_COLOR = (224, 224, 224)
+_DOT_COLOR = (0, 0, 255)
+_LABEL_COLOR = (0, 255, 0)
+_MEANING_COLOR = (255, 255, 255)
+_LABEL_ORG = (10, 40)
+_MEANING_ORG = (10, 80)
+# HAND_CONNECTIONS as polylines over the 21 joints: the open chains
+# 0-1-2-3-4 (thumb, from the wrist), 5-8, 9-12, 13-16, 17-20 and the
+# closed palm 0-5-9-13-17; slices of `pixels`, so nothing is gathered
+_CHAINS = ((0, 5), (5, 9), (9, 13), (13, 17), (17, 21))
+_PALM = (0, 5, 9, 13, 17)
+_U16_255 = np.array(255, dtype=np.uint16)
+
+
+class VoteSmoother:
+    """
+    `LabelSmoother` over gesture ids without per-frame objects: a ring of
+    ids plus a vote count per id. Ties go to the id seen first in the
+    window, like `Counter.most_common`.
+    """
+
+    def __init__(self, window: int = 7, n_ids: int = len(ID_TO_KEY)) -> None:
+        self.ring = [0] * max(1, window)
+        self.counts = [0] * n_ids
+        self.size = 0
+        self.pos = 0
+
+    def update(self, gid: int) -> int:
+        window = len(self.ring)
+        if self.size == window:
+            self.counts[self.ring[self.pos]] -= 1
+        else:
+            self.size += 1
+        self.ring[self.pos] = gid
+        self.counts[gid] += 1
+        self.pos = (self.pos + 1) % window
+
+        best = 0
+        i = len(self.counts)
+        while i:                        # max() / for would allocate an iterator
+            i -= 1
+            if self.counts[i] > best:
+                best = self.counts[i]
+        i = (self.pos + window - self.size) % window     # oldest entry; no negative ints below -5
+        while self.counts[self.ring[i]] != best:
+            i = (i + 1) % window
+        return self.ring[i]
+
+
+class TextStamp:
+    """
+    One line of text rendered once into a coverage mask, then blended into
+    the frame with copies and in-place integer ops on contiguous buffers
+    (within one level of `cv2.putText`, without its per-call string
+    conversion; NumPy ufuncs writing straight into a strided frame region
+    buffer internally, hence the scratch copy).
+    """
+
+    def __init__(self, frame: np.ndarray, text: str, org, scale: float, color, thickness: int) -> None:
+        (tw, th), baseline = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, scale, thickness)
+        pad = thickness + 2
+        height, width = frame.shape[:2]
+        x0, y0 = min(max(org[0] - pad, 0), width), min(max(org[1] - th - pad, 0), height)
+        x1, y1 = min(max(org[0] + tw + pad, x0), width), min(max(org[1] + baseline + pad, y0), height)
+        alpha = np.zeros((y1 - y0, x1 - x0, 3), dtype=np.uint8)
+        if alpha.size:               # else: the line is outside a (tiny) frame
+            cv2.putText(alpha, text, (org[0] - x0, org[1] - y0), cv2.FONT_HERSHEY_SIMPLEX, scale, (255, 255, 255), thickness)
+        # out = (frame * (255 - a) + color * a + 127) // 255, all in uint16
+        alpha = alpha.astype(np.uint16)
+        self.keep = 255 - alpha
+        self.ink = alpha * np.array(color, dtype=np.uint16) + 127
+        self.scratch = np.empty_like(alpha)
+        self.region = frame[y0:y1, x0:x1]
+
+    def apply(self) -> None:
+        np.copyto(self.scratch, self.region)
+        np.multiply(self.scratch, self.keep, out=self.scratch)
+        np.add(self.scratch, self.ink, out=self.scratch)
+        np.floor_divide(self.scratch, _U16_255, out=self.scratch)
+        np.copyto(self.region, self.scratch, casting="unsafe")
+
+    def nbytes(self) -> int:
+        return self.keep.nbytes + self.ink.nbytes + self.scratch.nbytes
+
+
+class FrameBuffers:
+    """
+    Everything the loop writes to, for one resolution.
+    """
+
+    def __init__(self, width: int, height: int, max_hands: int, inference_scale: float = 1.0) -> None:
+        self.width, self.height = width, height
+        self.inference_scale = inference_scale
+        self.frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self.small = None
+        if inference_scale != 1.0:
+            sw, sh = max(int(round(width * inference_scale)), 1), max(int(round(height * inference_scale)), 1)
+            self.small = np.zeros((sh, sw, 3), dtype=np.uint8)
+        self.rgb = np.zeros_like(self.small if self.small is not None else self.frame)
+
+        self.landmarks = np.zeros((max_hands, 21, 3), dtype=np.float32)
+        self.pixels = np.zeros((max_hands, 21, 2), dtype=np.int32)
+        self.palm = np.zeros((max_hands, len(_PALM), 2), dtype=np.int32)
+        self.dots = np.zeros((max_hands, 21, 2, 2), dtype=np.int32)      # zero-length segments per joint
+        self.avatar_views: Dict[str, Optional[np.ndarray]] = {}     # top-right corner, per gesture key
+        self.stamps: Dict[str, TextStamp] = {}      # label / meaning lines, rendered on first use
+
+        # every view the loop needs, per hand count / per hand: slicing per frame creates objects
+        self.rules = BufferRules(self.landmarks)
+        self.pixels_n = [self.pixels[:n] for n in range(max_hands + 1)]
+        self.landmarks_xy_n = [self.landmarks[:n, :, :2] for n in range(max_hands + 1)]
+        self.hand_views = tuple(
+            (
+                [self.pixels[h, a:b] for a, b in _CHAINS],              # open polylines
+                [self.palm[h]],                                          # closed polyline
+                self.palm[h, 1:], self.pixels[h, _PALM[1]::4],           # palm knuckles 5, 9, 13, 17
+                self.palm[h, 0], self.pixels[h, 0],                      # wrist
+                self.dots[h], self.pixels[h, :, None, :], [self.dots[h, j] for j in range(21)],
+            )
+            for h in range(max_hands)
+        )
+
+    def stamp(self, text: str, org, scale: float, color) -> TextStamp:
+        stamp = self.stamps.get(text)
+        if stamp is None:
+            stamp = self.stamps[text] = TextStamp(self.frame, text, org, scale, color, 2)
+        return stamp
+
+    def nbytes(self) -> int:
+        arrays = [self.frame, self.rgb, self.landmarks, self.pixels, self.palm, self.dots]
+        if self.small is not None:
+            arrays.append(self.small)
+        return sum(a.nbytes for a in arrays) + sum(s.nbytes() for s in self.stamps.values())
+
+
+class SteadyStateLoop:
+    """
+    capture → detect → classify → smooth → draw, reusing `FrameBuffers`.
+
+    `detector` needs `detect_into(frame, out, rgb=None, small=None) -> n`
+    (see `MediaPipeHandDetector.detect_into`) and `inference_scale`.
+
+    Example:
+        loop = SteadyStateLoop(MediaPipeHandDetector(), avatars=load_avatars())
+        while (frame := loop.step(source)) is not None:
+            cv2.imshow("demo", frame)
+    """
+
+    def __init__(
+        self,
+        detector,
+        avatars: Optional[Dict[str, np.ndarray]] = None,
+        max_hands: int = 1,
+        smoothing_window: int = 7,
+        draw_landmarks: bool = True,
+    ) -> None:
+        self.detector = detector
+        self.avatars = avatars or {}
+        self.max_hands = max_hands
+        self.draw_landmarks = draw_landmarks
+        self.smoother = VoteSmoother(smoothing_window)
+        self.buffers: Optional[FrameBuffers] = None
+        self.allocations = 0            # buffer (re)allocations: 1 per resolution
+        self.n_hands = 0
+        self.gesture_id = 0
+        self.confidence = 0.0
+        self.stable_id = 0
+        # label lines for every (gesture id, confidence in %), built once
+        self._labels = [
+            [f"{ID_TO_KEY[gid]} ({pct / 100.0:.2f})" for pct in range(101)] for gid in range(len(ID_TO_KEY))
+        ]
+
+    def ensure_buffers(self, width: int, height: int) -> FrameBuffers:
+        b = self.buffers
+        scale = getattr(self.detector, "inference_scale", 1.0)
+        if b is None or (b.width, b.height, b.inference_scale) != (width, height, scale):
+            b = self.buffers = FrameBuffers(width, height, self.max_hands, scale)
+            self.allocations += 1
+        return b
+
+    def _label(self, gid: int, confidence: float) -> str:
+        pct = int(confidence * 100.0 + 0.5)       # no min()/max(): they allocate an argument tuple
+        return self._labels[gid][0 if pct < 0 else 100 if pct > 100 else pct]
+
+    def process(self, b: FrameBuffers) -> None:
+        """
+        Detect, classify, smooth and draw on `b.frame` (already captured).
+        """
+        n = self.detector.detect_into(b.frame, b.landmarks, rgb=b.rgb, small=b.small)
+        self.n_hands = n
+
+        if n:
+            # like GesturePipeline: the last hand wins
+            self.gesture_id = b.rules.classify(n - 1, b.width)
+            self.confidence = b.rules.confidence
+        else:
+            self.gesture_id = 0
+            self.confidence = 0.0
+        self.stable_id = self.smoother.update(self.gesture_id)
+        self.draw(b, n)
+
+    def draw(self, b: FrameBuffers, n: int) -> None:
+        frame = b.frame
+        if self.draw_landmarks and n:
+            np.copyto(b.pixels_n[n], b.landmarks_xy_n[n], casting="unsafe")
+            h = 0
+            while h < n:                  # no range / iterator object per frame
+                chains, palm, knuckles, knuckle_px, wrist, wrist_px, dots, joints, dot_views = b.hand_views[h]
+                np.copyto(knuckles, knuckle_px)
+                np.copyto(wrist, wrist_px)
+                np.copyto(dots, joints)
+                cv2.polylines(frame, chains, False, _LINE_COLOR, 2)
+                cv2.polylines(frame, palm, True, _LINE_COLOR, 2)
+                cv2.polylines(frame, dot_views, False, _DOT_COLOR, 6)   # round caps → filled dots
+                h += 1
+
+        key = ID_TO_KEY[self.stable_id]
+        b.stamp(self._label(self.stable_id, self.confidence), _LABEL_ORG, 1, _LABEL_COLOR).apply()
+        info = GESTURES[key]
+        if info.meaning:
+            b.stamp(info.meaning, _MEANING_ORG, 0.8, _MEANING_COLOR).apply()
+
+        avatar = self.avatars.get(key)
+        if avatar is not None:
+            if key not in b.avatar_views:
+                ah, aw = avatar.shape[:2]
+                x2 = b.width - 10
+                fits = x2 - aw >= 0 and 10 + ah <= b.height
+                b.avatar_views[key] = frame[10:10 + ah, x2 - aw:x2] if fits else None
+            view = b.avatar_views[key]
+            if view is not None:
+                np.copyto(view, avatar)
+
+    def step(self, source) -> Optional[np.ndarray]:
+        """
+        Read the next frame of `source` into the buffers and process it.
+        Returns the annotated frame (the same array every call) or None.
+        """
+        b = self.buffers
+        ok, frame = source.read(b.frame if b is not None else None)
+        if not ok or frame is None:
+            return None
+        if b is None or frame is not b.frame:
+            # first frame or new resolution (or a source that cannot read in place)
+            b = self.ensure_buffers(frame.shape[1], frame.shape[0])
+            if frame is not b.frame:
+                np.copyto(b.frame, frame)
+        self.process(b)
+        return b.frame
+
+
+def run_steady(args) -> None:
+    """
+    `live_gesture_demo --steady-state`: the demo window on `SteadyStateLoop`.
+    """
+    from ..capture.sources import source_from_args
+    from ..detection.mediapipe_wrapper import MediaPipeHandDetector
+    from .overlay_inference import load_avatars
+
+    ignored = [flag for flag, on in (
+        ("--templates", args.templates), ("--cache-tolerance", args.cache_tolerance > 0), ("--roi", args.roi),
+        ("--motion-gate", args.motion_gate), ("--target-fps", args.target_fps > 0),
+        ("--record-landmarks", args.record_landmarks), ("--analytics", args.analytics),
+        ("--backend", args.backend != "rules"), ("--one-euro", args.one_euro), ("--profile", args.profile),
+        ("--metrics-port", args.metrics_port > 0),
+    ) if on]
+    if ignored:
+        print(f"⚠️ Not available in steady-state mode (ignored): {', '.join(ignored)}")
+
+    args.no_prefetch = True          # read straight into the loop's frame buffer
+    source = source_from_args(args)
+    if not source.isOpened():
+        print(f"❌ Error: Could not open {source.name}.")
+        source.close()
+        return
+    detector = MediaPipeHandDetector(max_num_hands=1)
+    loop = SteadyStateLoop(detector, avatars=load_avatars(size=(150, 150)),
+                           smoothing_window=args.smoothing if args.smoothing is not None else 7)
+
+    print(f"✅ Source opened: {source.describe()}. Steady-state loop, press 'q' to quit.")
+    frames = 0
+    collections = [0]
+    gc.callbacks.append(lambda phase, info: collections.__setitem__(0, collections[0] + (phase == "start")))
+    t0 = time.perf_counter()
+    while True:
+        frame = loop.step(source)
+        if frame is None:
+            print("⏹ End of input." if not source.live else "❌ Error: Failed to read from camera.")
+            break
+        frames += 1
+        cv2.imshow("RT-Gesture3D - Live Demo", frame)
+        if cv2.waitKey(1) & 0xFF == ord("q"):
+            print("👋 Q pressed, exiting...")
+            break
+    elapsed = time.perf_counter() - t0
+    gc.callbacks.pop()
+
+    source.close()
+    detector.close()
+    cv2.destroyAllWindows()
+    print(f"✅ {frames} frame(s), {frames / elapsed if elapsed > 0 else 0.0:.1f} FPS, "
+          f"{loop.allocations} buffer allocation(s), {collections[0]} GC pass(es).")
+
+
+# ---------- allocation check ----------
+class StandInDetector:
+    """
+    `detect_into` with synthetic landmarks (no MediaPipe): does the same
+    buffer work as the real one (BGR→RGB into `rgb`) and writes one hand
+    per frame (every 8th frame: none) into `out`.
+    """
+
+    def __init__(self, width: int, height: int, n_poses: int = 64, seed: int = 0) -> None:
+        from ..processing.synthetic import SyntheticHandGenerator
+
+        gen = SyntheticHandGenerator(seed=seed)
+        gen.config.img_w, gen.config.img_h = width, height
+        self.poses, _ = gen.sample(n_poses)
+        self.poses = self.poses.astype(np.float32)
+        self.pose_views = list(self.poses)
+        self.inference_scale = 1.0
+        # counters kept below 257 (cached small ints): a growing frame count allocates a new int per frame
+        self.tick = 0              # frame number mod 120 (every 8th: no hand, a new pose every 15th)
+        self.pose = 0
+        self._out = self._hand = None
+
+    def _advance(self) -> int:
+        """Next frame: index of its pose, or -1 for no hand."""
+        self.tick += 1
+        if self.tick == 120:
+            self.tick = 0
+        if self.tick % 15 == 0:
+            self.pose += 1
+            if self.pose == len(self.pose_views):
+                self.pose = 0
+        return -1 if self.tick % 8 == 0 else self.pose
+
+    def detect_into(self, frame_bgr, out, rgb=None, small=None) -> int:
+        cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB, rgb)    # dst=rgb as a keyword allocates a little per call
+        pose = self._advance()
+        if pose < 0:
+            return 0
+        if out is not self._out:
+            self._out, self._hand = out, out[0]
+        np.copyto(self._hand, self.pose_views[pose])
+        return 1
+
+    def detect(self, frame_bgr):
+        rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+        pose = self._advance()
+        if pose < 0 or rgb is None:
+            return []
+        return [[(int(x), int(y), float(z)) for x, y, z in self.poses[pose].tolist()]]
+
+
+class ReplaySource:
+    """
+    Frames recorded from another source, played back in a cycle into the
+    caller's buffer (`read(image)`), so the measured frames contain no
+    capture-side objects: `FrameSource.read` records a `CapturedFrame`
+    with timestamps, the synthetic source formats its frame counter.
+    """
+
+    live = False
+
+    def __init__(self, source, n_frames: int = 8) -> None:
+        self.frames = [source.next_frame().image.copy() for _ in range(n_frames)]
+        self.pos = 0
+
+    def read(self, image: Optional[np.ndarray] = None):
+        frame = self.frames[self.pos]
+        self.pos += 1
+        if self.pos == len(self.frames):
+            self.pos = 0
+        if image is None:
+            return True, frame.copy()
+        np.copyto(image, frame)
+        return True, image
+
+
+def measure(step, frames: int) -> Dict[str, float]:
+    """
+    Per-frame tracemalloc peak above the pre-frame level (bytes), frames
+    that allocated at all, net traced growth and net new allocated blocks
+    (`sys.getallocatedblocks`) from the first to the last frame, and GC
+    passes while running `step()` `frames` times. The loop itself keeps
+    the same objects alive at both readings (no counter, readings stored
+    in an array, counters read by index: unpacking their tuples costs a
+    few objects until the interpreter has specialized this code).
+    """
+    collections = [0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    get, reset = tracemalloc.get_traced_memory, tracemalloc.reset_peak
+    marks = np.zeros((2, 2), dtype=np.int64)      # traced bytes, allocated blocks after the first / the last frame
+    row = 0
+    worst_peak = 0
+    total_peak = 0
+    allocating = 0
+    gc.callbacks.append(on_gc)
+    tracemalloc.start()
+    step()     # objects replaced every frame (e.g. a source's last frame record) are now traced too
+    for _ in itertools.repeat(None, frames):
+        before = get()[0]
+        reset()
+        step()
+        peak = get()[1] - before
+        if peak > worst_peak:
+            worst_peak = peak
+        if peak > 0:
+            allocating += 1
+        total_peak += peak
+        marks[row, 0] = get()[0]
+        marks[row, 1] = sys.getallocatedblocks()
+        row = 1
+    tracemalloc.stop()
+    gc.callbacks.remove(on_gc)
+    growth, new_blocks = (marks[1] - marks[0]).tolist() if frames > 1 else (0, 0)
+    return {
+        "max_frame_peak": worst_peak,
+        "mean_frame_peak_kb": total_peak / frames / 1024.0,
+        "allocating_frames": allocating,
+        "net_growth": growth,
+        "new_blocks": new_blocks,
+        "gc_passes": collections[0],
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="RT-Gesture3D steady-state frame loop")
+    sub = parser.add_subparsers(dest="command", required=True)
+    check = sub.add_parser("check", help="prove that steady state does not allocate")
+    check.add_argument("--width", type=int, default=1280)
+    check.add_argument("--height", type=int, default=720)
+    check.add_argument("--frames", type=int, default=1000, help="measured frames")
+    check.add_argument("--warmup", type=int, default=1000,
+                       help="frames before measuring: buffers, and every label line of the stand-in's "
+                            "960-frame pose cycle rendered once")
+    check.add_argument("--max-frame-peak", type=int, default=0, metavar="BYTES",
+                       help="largest transient allocation allowed per frame (one NumPy temporary of a "
+                            "(1, 21, 3) hand already costs ~0.6 KB, a frame w*h*3 bytes)")
+    check.add_argument("--max-new-blocks", type=int, default=0,
+                       help="net allocated blocks left behind over all measured frames")
+    check.add_argument("--max-growth", type=int, default=0, metavar="BYTES",
+                       help="net heap growth allowed over all measured frames")
+    return parser.parse_args(argv)
+
+
+def _check(args) -> bool:
+    from ..capture.sources import SyntheticSource
+    from .overlay_inference import load_avatars
+    from .pipeline import GesturePipeline
+
+    w, h = args.width, args.height
+    avatars = load_avatars(size=(150, 150))
+    frame_kb = w * h * 3 / 1024.0
+
+    # steady-state loop, on replayed frames: the capture side is not what is measured
+    source = ReplaySource(SyntheticSource(w, h, realtime=False))
+    loop = SteadyStateLoop(StandInDetector(w, h), avatars=avatars)
+    for _ in range(args.warmup):
+        loop.step(source)
+    b = loop.buffers
+    addresses = [a.ctypes.data for a in (b.frame, b.rgb, b.landmarks, b.pixels, b.palm)]
+    allocations = loop.allocations
+    steady = measure(lambda: loop.step(source), args.frames)
+    same_buffers = addresses == [a.ctypes.data for a in (b.frame, b.rgb, b.landmarks, b.pixels, b.palm)]
+
+    # regular pipeline, same frames and hands
+    source2 = SyntheticSource(w, h, realtime=False)
+    detector = StandInDetector(w, h)
+    pipeline = GesturePipeline(avatars=avatars)
+
+    def regular_step():
+        frame = source2.next_frame().image
+        hands = detector.detect(frame)
+        pipeline.render(frame, pipeline.step(hands, w, h))
+
+    for _ in range(args.warmup):
+        regular_step()
+    regular = measure(regular_step, args.frames)
+
+    print(f"▶️ {args.frames} frame(s) at {w}x{h} after {args.warmup} warm-up frame(s); one frame = {frame_kb:,.0f} KB")
+    for name, m in (("regular pipeline", regular), ("steady-state loop", steady)):
+        print(f"   {name:<18} peak/frame max {m['max_frame_peak'] / 1024.0:9.1f} KB, mean {m['mean_frame_peak_kb']:9.1f} KB, "
+              f"{m['allocating_frames']} frame(s) allocating, net growth {m['net_growth']:+,d} B, "
+              f"new blocks {m['new_blocks']:+d}, GC passes {m['gc_passes']}")
+    print(f"   buffers: {b.nbytes() / 1024.0:,.0f} KB allocated {allocations}x, "
+          f"{'same addresses' if same_buffers else 'REALLOCATED'} while measuring")
+
+    failures = []
+    if steady["max_frame_peak"] > args.max_frame_peak:
+        failures.append(f"{steady['allocating_frames']} frame(s) allocated, up to {steady['max_frame_peak']} B "
+                        f"(limit {args.max_frame_peak})")
+    if steady["net_growth"] > args.max_growth:
+        failures.append(f"heap grew by {steady['net_growth']} B (limit {args.max_growth})")
+    if steady["new_blocks"] > args.max_new_blocks:
+        failures.append(f"{steady['new_blocks']} new block(s) left allocated (limit {args.max_new_blocks})")
+    if steady["gc_passes"]:
+        failures.append(f"{steady['gc_passes']} GC pass(es)")
+    if not same_buffers or loop.allocations != allocations:
+        failures.append("buffers were reallocated")
+    for f in failures:
+        print(f"❌ {f}")
+    if not failures:
+        print("✅ Steady state allocates nothing per frame (0 B peak, no new blocks, no GC passes).")
+    return not failures
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command == "check":
+        sys.exit(0 if _check(args) else 1)
+
+
+if __name__ == "__main__":
+    main()
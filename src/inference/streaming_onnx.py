@@ -0,0 +1,237 @@
+"""
+Stateful streaming inference for temporal ONNX models in RT-Gesture3D.
+
+A recurrent gesture model (GRU / LSTM, exported with the interface in
+`src/training/export_temporal.py`) can be run two ways on live input:
+
+    windowed    keep the last T feature vectors per hand (`RingBuffer`)
+                and re-run the network over the whole window every
+                frame: T recurrent steps per hand per frame
+    streaming   keep the network's hidden state per hand and feed only
+                the new frame: one recurrent step per hand per frame
+
+`StreamingOnnxModel` does the latter. State lives in preallocated
+(layers, max_streams, hidden) arrays, one slot per stream (hand track);
+each call gathers the slots of the streams present in this frame, runs
+ONE session call for all of them (batch = number of hands), and
+scatters the new state back. A stream that is not seen for `timeout_s`
+(track lost) or is `end`ed gets a zeroed state when it comes back, so a
+new hand never inherits another hand's history.
+
+    model = StreamingOnnxModel("models/checkpoints/gesture_gru.onnx", max_streams=16)
+    keys, confs = model.predict(track_ids, features, t=now)     # features: (B, FEATURE_DIM)
+    keys, confs = model.predict_hands({track: pts, ...}, img_w, t=now)
+    model.end(track)                                            # hand left: drop its state
+
+From zero state both give the same outputs while the window still
+covers the whole stream; afterwards the sliding window forgets older
+frames, the streaming model does not (that is what it was trained for).
+
+    python -m benchmarks.bench_streaming      # streaming vs windowed cost, equivalence check
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Hashable, List, Sequence, Tuple, Union
+
+import numpy as np
+import onnxruntime as ort
+
+from ..processing.buffer import RingBuffer
+from ..processing.preprocess import FEATURE_VERSION, hand_features_batch
+from .onnx_classifier import metadata_path
+from .predictor import Point3D
+
+TEMPORAL_FORMAT = "rt-gesture3d-temporal"
+
+
+class _TemporalSession:
+    """
+    Session + sidecar of a temporal model (shared by both wrappers).
+    """
+
+    def __init__(self, model_path: Union[str, Path], threads: int = 1) -> None:
+        self.model_path = Path(model_path)
+        meta = json.loads(metadata_path(self.model_path).read_text(encoding="utf-8"))
+        if meta.get("format") != TEMPORAL_FORMAT:
+            raise ValueError(f"{metadata_path(self.model_path)} is not a {TEMPORAL_FORMAT} sidecar")
+        if meta.get("feature_version") != FEATURE_VERSION:
+            raise ValueError(
+                f"Model was trained on feature version {meta.get('feature_version')}, "
+                f"this build produces version {FEATURE_VERSION}; retrain the model"
+            )
+        self.metadata = meta
+        self.classes = list(meta["classes"])
+        self._class_keys = np.array(self.classes, dtype=object)
+        self.feature_dim = int(meta["feature_dim"])
+        self.states = meta["state"]                  # [{"input", "output", "shape": [layers, hidden], "batch_axis"}]
+
+        opts = ort.SessionOptions()
+        opts.intra_op_num_threads = threads
+        opts.inter_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(str(self.model_path), opts, providers=["CPUExecutionProvider"])
+        self.input = meta["input"]
+        self.outputs = [meta["probability_output"]] + [s["output"] for s in self.states]
+
+    def run(self, x: np.ndarray, states: List[np.ndarray]) -> List[np.ndarray]:
+        """
+        x: (T, B, F), states: initial states → [probabilities (B, C), final states...]
+        """
+        feeds = {self.input: x}
+        for spec, value in zip(self.states, states):
+            feeds[spec["input"]] = value
+        return self.session.run(self.outputs, feeds)
+
+    def zero_states(self, batch: int) -> List[np.ndarray]:
+        return [np.zeros(_batch_shape(s, batch), dtype=np.float32) for s in self.states]
+
+    def top(self, proba: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        best = proba.argmax(axis=1)
+        return self._class_keys[best], proba[np.arange(len(best)), best].astype(np.float32)
+
+
+def _batch_shape(spec: dict, batch: int) -> Tuple[int, ...]:
+    shape = list(spec["shape"])
+    shape.insert(spec.get("batch_axis", 1), batch)
+    return tuple(shape)
+
+
+class StreamingOnnxModel:
+    """
+    One recurrent step per stream per frame, all streams in one session call.
+    """
+
+    def __init__(
+        self,
+        model_path: Union[str, Path],
+        max_streams: int = 16,
+        timeout_s: float = 0.5,
+        threads: int = 1,
+    ) -> None:
+        self._model = _TemporalSession(model_path, threads)
+        self.classes = self._model.classes
+        self.max_streams = max_streams
+        self.timeout_s = timeout_s
+
+        # state per slot, batch axis at the model's position
+        self._state = [np.zeros(_batch_shape(s, max_streams), dtype=np.float32) for s in self._model.states]
+        self._axes = [s.get("batch_axis", 1) for s in self._model.states]
+        self._slots: Dict[Hashable, int] = {}
+        self._last_seen = np.full(max_streams, -np.inf)
+        self._x = np.zeros((1, max_streams, self._model.feature_dim), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slot(self, stream: Hashable, t: float, taken: set) -> int:
+        slot = self._slots.get(stream)
+        if slot is not None and t - self._last_seen[slot] > self.timeout_s:
+            self.end(stream)                                  # track lost in between: start over
+            slot = None
+        if slot is None:
+            used = set(self._slots.values())
+            free = [s for s in range(self.max_streams) if s not in used]
+            if not free:                                      # evict the stalest stream not in this frame
+                candidates = [(self._last_seen[s], key) for key, s in self._slots.items() if s not in taken]
+                if not candidates:
+                    raise ValueError(f"More than max_streams={self.max_streams} streams in one call")
+                self.end(min(candidates, key=lambda c: c[0])[1])
+                used = set(self._slots.values())
+                free = [s for s in range(self.max_streams) if s not in used]
+            slot = free[0]
+            self._slots[stream] = slot
+        return slot
+
+    def _reset_slot(self, slot: int) -> None:
+        for state, axis in zip(self._state, self._axes):
+            np.moveaxis(state, axis, 0)[slot] = 0.0
+
+    def end(self, stream: Hashable) -> None:
+        """
+        Forget a stream (its hand left); its slot is zeroed for reuse.
+        """
+        slot = self._slots.pop(stream, None)
+        if slot is not None:
+            self._reset_slot(slot)
+            self._last_seen[slot] = -np.inf
+
+    def reset(self) -> None:
+        for stream in list(self._slots):
+            self.end(stream)
+
+    def step(self, streams: Sequence[Hashable], features: np.ndarray, t: float = 0.0) -> np.ndarray:
+        """
+        streams: B distinct stream ids, features: (B, F) this frame's
+        features, t: frame time (s) for the track-loss timeout.
+        returns: (B, n_classes) probabilities
+        """
+        n = len(streams)
+        if n == 0:
+            return np.empty((0, len(self.classes)), dtype=np.float32)
+        taken: set = set()
+        slots = []
+        for stream in streams:
+            slot = self._slot(stream, t, taken)
+            taken.add(slot)
+            slots.append(slot)
+        slots = np.array(slots)
+        self._last_seen[slots] = t
+
+        x = self._x[:, :n]
+        x[0] = features
+        states = [np.take(state, slots, axis=axis) for state, axis in zip(self._state, self._axes)]
+        proba, *new_states = self._model.run(x, states)
+        for state, new, axis in zip(self._state, new_states, self._axes):
+            np.moveaxis(state, axis, 0)[slots] = np.moveaxis(new, axis, 0)
+        return proba
+
+    def predict(self, streams: Sequence[Hashable], features: np.ndarray, t: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gesture keys (B,) and confidences (B,) after this frame.
+        """
+        return self._model.top(self.step(streams, features, t))
+
+    def predict_hands(
+        self, hands: Dict[Hashable, List[Point3D]], img_w: int, t: float = 0.0
+    ) -> Dict[Hashable, Tuple[str, float]]:
+        """
+        {track id: 21 pixel landmarks} → {track id: (gesture key, confidence)}.
+        """
+        if not hands:
+            return {}
+        streams = list(hands)
+        keys, confs = self.predict(streams, hand_features_batch(np.asarray([hands[s] for s in streams]), img_w), t)
+        return {s: (k, float(c)) for s, k, c in zip(streams, keys, confs)}
+
+
+class WindowedOnnxModel:
+    """
+    The sliding-window baseline: the last `window` feature vectors per
+    stream, re-run from zero state every frame (streams with equally long
+    windows share one session call).
+    """
+
+    def __init__(self, model_path: Union[str, Path], window: int = 30, threads: int = 1) -> None:
+        self._model = _TemporalSession(model_path, threads)
+        self.classes = self._model.classes
+        self.window = window
+        self._buffers: Dict[Hashable, RingBuffer] = {}
+
+    def end(self, stream: Hashable) -> None:
+        self._buffers.pop(stream, None)
+
+    def step(self, streams: Sequence[Hashable], features: np.ndarray, t: float = 0.0) -> np.ndarray:
+        proba = np.empty((len(streams), len(self.classes)), dtype=np.float32)
+        by_length: Dict[int, List[int]] = {}
+        for i, stream in enumerate(streams):
+            buf = self._buffers.setdefault(stream, RingBuffer(self.window))
+            buf.append(np.asarray(features[i], dtype=np.float32))
+            by_length.setdefault(len(buf), []).append(i)
+        for length, rows in by_length.items():
+            x = np.stack([np.stack(self._buffers[streams[i]].to_list()) for i in rows], axis=1)   # (T, B, F)
+            proba[rows] = self._model.run(x, self._model.zero_states(len(rows)))[0]
+        return proba
+
+    def predict(self, streams: Sequence[Hashable], features: np.ndarray, t: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        return self._model.top(self.step(streams, features, t))
@@ -0,0 +1,616 @@
+"""
+Few-shot template matcher for user-defined gestures (RT-Gesture3D).
+
+Operators record a dozen samples of a new gesture and register them as
+templates; no new `if` branches in `predictor.py`.
+
+    python -m src.inference.live_gesture_demo --record-landmarks data/logs/wave.jsonl
+    python -m src.inference.template_matcher add data/templates/custom --label wave --log data/logs/wave.jsonl
+    python -m src.inference.template_matcher list data/templates/custom
+    python -m src.inference.replay data/logs/session.jsonl --templates data/templates/custom
+
+Templates are `hand_features` vectors (wrist-relative, scale-normalized,
+see `src/processing/preprocess.py`) in a flat float32 matrix. Queries:
+
+    small index   exact squared distances with one BLAS mat-vec
+    large index   k-means cells (about sqrt(n), each stored contiguously
+                  in a cell-ordered copy); exact distances only for the
+                  templates of the `probe` cells nearest to the query:
+                  a fixed amount of work per query, so the latency tail
+                  stays flat (recall vs exhaustive search: `bench`)
+
+followed by a distance-weighted k-NN vote. A query whose nearest
+template is farther than `reject_distance` is rejected (falls back to
+the rule engine, or "neutral").
+
+Inserts append (reusing deleted rows) and go into a free slot of their
+nearest cell, deletes are tombstones; the cells are refit when the
+index has doubled since the last fit, or when inserts have piled into
+one cell (more than twice the average). `save` compacts to
+`<path>.npy` (vectors, loaded with a memory map) plus `<path>.json`
+(labels, cell centroids, settings).
+
+    python -m src.inference.template_matcher bench       # exits 1 if p99 > 100 µs at 10k templates
+                                                         # (quietest of --rounds passes)
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..capture.landmark_log import read_landmark_log
+from ..processing.preprocess import FEATURE_DIM, FEATURE_VERSION, hand_features, hand_features_batch
+from .mapping import GESTURES
+from .predictor import Point3D, detect_gesture_from_landmarks
+
+INDEX_FORMAT = "rt-gesture3d-templates"
+
+Classifier = Callable[[List[Point3D], int, int], Tuple[str, int, float]]
+
+
+def _index_paths(path: Union[str, Path]) -> Tuple[Path, Path]:
+    path = Path(path)
+    if path.suffix in (".npy", ".json"):
+        path = path.with_suffix("")
+    return path.with_name(path.name + ".npy"), path.with_name(path.name + ".json")
+
+
+def _nearest(vectors: np.ndarray, centroids: np.ndarray, centroid_norm2: np.ndarray) -> np.ndarray:
+    """
+    Index of the nearest centroid for every row of `vectors`.
+    """
+    return np.argmin(centroid_norm2 - 2.0 * (vectors @ centroids.T), axis=1)
+
+
+def _kmeans(data: np.ndarray, n_cells: int, iters: int = 8, seed: int = 0) -> np.ndarray:
+    """
+    Lloyd's k-means from a random sample of rows (fit on at most 64 rows
+    per cell); empty cells keep their previous centroid.
+    """
+    rng = np.random.default_rng(seed)
+    if len(data) > 64 * n_cells:
+        data = data[rng.choice(len(data), 64 * n_cells, replace=False)]
+    centroids = np.array(data[rng.choice(len(data), n_cells, replace=False)], dtype=np.float32)
+    for _ in range(iters):
+        cells = _nearest(data, centroids, np.einsum("ij,ij->i", centroids, centroids))
+        counts = np.bincount(cells, minlength=n_cells)
+        order = np.argsort(cells, kind="stable")
+        filled = counts > 0
+        sums = np.add.reduceat(data[order], (np.cumsum(counts) - counts)[filled], axis=0)
+        centroids[filled] = sums / counts[filled, None]
+    return centroids
+
+
+class TemplateMatcher:
+    """
+    k-NN gesture classifier over registered templates.
+
+    Example:
+        matcher = TemplateMatcher(fallback=detect_gesture_from_landmarks)
+        matcher.add_hands("wave", hands, img_w=640)
+        key, gid, conf = matcher(pts, w, h)
+        matcher.save("data/templates/custom")
+    """
+
+    def __init__(
+        self,
+        k: int = 5,
+        reject_distance: float = 1.2,
+        fallback: Optional[Classifier] = None,
+        capacity: int = 256,
+        cells: int = 0,
+        probe: int = 4,
+        coarse_min: int = 1024,
+    ) -> None:
+        self.k = k
+        self.reject_distance = reject_distance
+        self.fallback = fallback
+        self.cells = cells                      # 0: about sqrt(templates) at each fit
+        self.probe = probe
+        self.coarse_min = coarse_min
+
+        self.classes: List[str] = []            # label vocabulary
+        self._class_index: Dict[str, int] = {}
+        self._size = 0                          # rows in use (alive + tombstones)
+        self._free: List[int] = []              # tombstoned rows to reuse
+
+        # cells (None until the index is large enough)
+        self._centroids: Optional[np.ndarray] = None      # (cells, dim)
+        self._fit_size = 0
+        self._alloc(capacity)
+
+    # ---------- storage ----------
+    def _alloc(self, capacity: int) -> None:
+        self._vectors = np.zeros((capacity, FEATURE_DIM), dtype=np.float32)
+        self._norm2 = np.full(capacity, np.inf, dtype=np.float32)   # inf = dead / unused
+        self._labels = np.full(capacity, -1, dtype=np.int32)
+        self._dist = np.empty(capacity, dtype=np.float32)           # query scratch
+        self._cell_of = np.full(capacity, -1, dtype=np.int64)       # row → cell
+        self._cell_pos = np.full(capacity, -1, dtype=np.int64)      # row → slot in the cell-ordered copy
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._vectors.shape[0]
+        if needed <= capacity and self._vectors.flags.writeable:
+            return
+        new_cap = max(needed, capacity * 2 if needed > capacity else capacity)
+        old = self._vectors, self._norm2, self._labels, self._cell_of, self._cell_pos
+        n = self._size
+        self._alloc(new_cap)
+        for new, prev in zip((self._vectors, self._norm2, self._labels, self._cell_of, self._cell_pos), old):
+            new[:n] = prev[:n]                 # also detaches a memory-mapped index
+
+    def __len__(self) -> int:
+        return self._size - len(self._free)
+
+    def counts(self) -> Dict[str, int]:
+        alive = self._labels[: self._size][np.isfinite(self._norm2[: self._size])]
+        ids, n = np.unique(alive, return_counts=True)
+        return {self.classes[i]: int(c) for i, c in zip(ids, n)}
+
+    # ---------- cells ----------
+    def rebuild_cells(self) -> None:
+        """
+        Fit the k-means cells on the current templates and lay them out.
+        Done automatically when the index reaches `coarse_min` templates
+        and whenever it has doubled since the last fit.
+        """
+        n = self._size
+        alive = np.flatnonzero(np.isfinite(self._norm2[:n]))
+        n_cells = min(self.cells or max(int(round(np.sqrt(len(alive)))), 1), len(alive))
+        self._centroids = _kmeans(self._vectors[alive], n_cells)
+        self._fit_size = len(alive)
+        self._layout(alive)
+
+    def _layout(self, rows: np.ndarray) -> None:
+        """
+        Cell-ordered copy of `rows`: every cell is one contiguous block of
+        [-2 * vector, |vector|^2] rows with free slots for inserts (dead
+        slots hold an infinite norm), so one mat-vec with [q, 1] gives
+        |x - q|^2 - |q|^2 for a whole cell.
+        """
+        centroids = self._centroids
+        self._centroid_norm2 = np.einsum("ij,ij->i", centroids, centroids)
+        self._centroids_aug = np.hstack([-2.0 * centroids, self._centroid_norm2[:, None]]).astype(np.float32)
+        self._centroid_dist = np.empty(len(centroids), dtype=np.float32)     # query scratch
+        self._query_aug = np.ones(FEATURE_DIM + 1, dtype=np.float32)
+
+        cells = _nearest(self._vectors[rows], centroids, self._centroid_norm2)
+        counts = np.bincount(cells, minlength=len(centroids))
+        room = np.maximum(counts * 2, 8)
+        starts = np.cumsum(room) - room
+        total = int(room.sum())
+        self._cell_aug = np.zeros((total, FEATURE_DIM + 1), dtype=np.float32)
+        self._cell_aug[:, FEATURE_DIM] = np.inf
+        self._cell_rows = np.full(total, -1, dtype=np.int64)
+        self._cand_dist = np.empty(total, dtype=np.float32)                  # query scratch
+        self._cell_start, self._cell_room = starts, room
+        self._cell_used = np.zeros(len(centroids), dtype=np.int64)
+        self._cell_live = np.zeros(len(centroids), dtype=np.int64)
+        self._cell_views: List[Tuple[np.ndarray, List[int]]] = [()] * len(centroids)
+        self._cell_of[: self._size] = -1
+        self._cell_pos[: self._size] = -1
+        self._place(rows, cells)
+
+    def _place(self, rows: np.ndarray, cells: Optional[np.ndarray] = None) -> None:
+        """
+        Put (new or re-used) rows into a free slot of their nearest cell;
+        lays everything out again when a cell has no room left, and refits
+        the cells when one has outgrown the others (inserts far from the
+        fitted data pile into a few cells and lengthen every query there).
+        """
+        if cells is None:
+            cells = _nearest(self._vectors[rows], self._centroids, self._centroid_norm2)
+        # a re-used row's previous slot was tombstoned by `remove`
+        counts = np.bincount(cells, minlength=len(self._centroids))
+        if np.any(self._cell_used + counts > self._cell_room):
+            if (self._cell_live + counts).max() > 2 * len(self) / len(self._centroids):
+                self.rebuild_cells()
+            else:
+                n = self._size
+                self._layout(np.flatnonzero(np.isfinite(self._norm2[:n])))
+            return
+        order = np.argsort(cells, kind="stable")
+        cells, rows = cells[order], rows[order]
+        rank = np.arange(len(rows)) - (np.cumsum(counts) - counts)[cells]
+        pos = self._cell_start[cells] + self._cell_used[cells] + rank
+        self._cell_aug[pos, :FEATURE_DIM] = -2.0 * self._vectors[rows]
+        self._cell_aug[pos, FEATURE_DIM] = self._norm2[rows]
+        self._cell_rows[pos] = rows
+        self._cell_of[rows] = cells
+        self._cell_pos[rows] = pos
+        self._cell_used += counts
+        self._cell_live += counts
+        # the used slots of every touched cell (row ids as a list: the query
+        # maps only its k best back to ids), prebuilt for the query loop
+        for c in np.flatnonzero(counts).tolist():
+            span = slice(int(self._cell_start[c]), int(self._cell_start[c] + self._cell_used[c]))
+            self._cell_views[c] = (self._cell_aug[span], self._cell_rows[span].tolist())
+        self._cell_live_n = self._cell_live.tolist()
+
+    # ---------- insert / delete ----------
+    def add(self, vectors: np.ndarray, label: str) -> np.ndarray:
+        """
+        Add feature vectors (N, FEATURE_DIM) for one label. Returns template ids.
+        """
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, FEATURE_DIM)
+        if label not in self._class_index:
+            self._class_index[label] = len(self.classes)
+            self.classes.append(label)
+        cls = self._class_index[label]
+
+        n_new = len(vectors)
+        reuse = [self._free.pop() for _ in range(min(n_new, len(self._free)))]
+        self._grow(self._size + n_new - len(reuse))
+        rows = np.array(reuse + list(range(self._size, self._size + n_new - len(reuse))), dtype=np.int64)
+        self._size += n_new - len(reuse)
+
+        self._vectors[rows] = vectors
+        self._norm2[rows] = (vectors * vectors).sum(axis=1)
+        self._labels[rows] = cls
+        if self._centroids is None:
+            if len(self) >= self.coarse_min:
+                self.rebuild_cells()
+        elif len(self) >= 2 * self._fit_size:
+            self.rebuild_cells()
+        else:
+            self._place(rows)
+        return rows
+
+    def add_hands(self, label: str, hands: Sequence[List[Point3D]], img_w) -> np.ndarray:
+        """
+        Add detector hands (lists of 21 (x, y, z)) for one label.
+        """
+        if not len(hands):
+            return np.zeros(0, dtype=np.int64)
+        return self.add(hand_features_batch(np.asarray(hands, dtype=np.float32).reshape(-1, 21, 3), img_w), label)
+
+    def remove(self, ids: Sequence[int]) -> int:
+        """
+        Delete templates by id (tombstones; the row is reused by later inserts).
+        """
+        removed = 0
+        for i in ids:
+            i = int(i)
+            if 0 <= i < self._size and np.isfinite(self._norm2[i]):
+                self._norm2[i] = np.inf
+                if self._centroids is not None and self._cell_pos[i] >= 0:
+                    self._cell_aug[self._cell_pos[i], FEATURE_DIM] = np.inf
+                    self._cell_live[self._cell_of[i]] -= 1
+                self._free.append(i)
+                removed += 1
+        if removed and self._centroids is not None:
+            self._cell_live_n = self._cell_live.tolist()
+        return removed
+
+    def remove_label(self, label: str) -> int:
+        cls = self._class_index.get(label)
+        if cls is None:
+            return 0
+        n = self._size
+        rows = np.flatnonzero((self._labels[:n] == cls) & np.isfinite(self._norm2[:n]))
+        return self.remove(rows)
+
+    # ---------- queries ----------
+    def _cell_search(self, q: np.ndarray, k: int) -> Tuple[np.ndarray, List[Tuple[int, List[int]]]]:
+        """
+        Squared distances minus |q|^2 for every slot of the `probe` cells
+        whose centroids are nearest to `q` (more cells only while those
+        hold fewer than k live templates), and the (offset, row ids) span
+        of each probed cell in that array.
+        """
+        qa = self._query_aug
+        qa[:FEATURE_DIM] = q
+        dc = self._centroid_dist
+        np.matmul(self._centroids_aug, qa, out=dc)      # |c|^2 - 2 c.q: same order as the distance
+        views, live = self._cell_views, self._cell_live_n
+        dist = self._cand_dist
+        probe = self.probe
+        order = np.argpartition(dc, probe - 1)[:probe] if probe < len(dc) else np.arange(len(dc))
+        while True:
+            p = found = 0
+            spans = []
+            for c in order.tolist():
+                if not live[c]:
+                    continue
+                block, rows = views[c]
+                used = len(rows)
+                np.matmul(block, qa, out=dist[p:p + used])
+                spans.append((p, rows))
+                p += used
+                found += live[c]
+            if found >= k or len(order) == len(dc):
+                break
+            # the nearest cells are (mostly) deleted templates: widen, nearest first
+            order = np.argsort(dc)[: 2 * len(order)]
+        return dist[:p], spans
+
+    def _k_nearest(self, query: np.ndarray, k: int) -> List[Tuple[float, int]]:
+        """
+        (squared distance, id) of the k nearest templates, nearest first.
+        The k best are picked with one partition; everything after that
+        works on k Python floats instead of NumPy arrays.
+        """
+        n = self._size
+        k = min(k, n - len(self._free))
+        if k <= 0:
+            return []
+        q = np.asarray(query, dtype=np.float32)
+
+        # squared distances minus |q|^2, |q|^2 added to the k best only
+        if self._centroids is not None:
+            d2, spans = self._cell_search(q, k)
+        else:
+            spans = None
+            d2 = self._dist[:n]
+            np.matmul(self._vectors[:n], q, out=d2)
+            d2 *= -2.0
+            d2 += self._norm2[:n]
+
+        best = np.argpartition(d2, k - 1)[:k].tolist() if k < len(d2) else list(range(len(d2)))
+        q2 = float(q @ q)
+        found = sorted(zip(d2[best].tolist(), best))
+        result = []
+        for d, i in found:
+            if d == math.inf:
+                break                   # free / deleted slots of the probed cells
+            if spans is not None:
+                for offset, rows in reversed(spans):
+                    if i >= offset:
+                        i = rows[i - offset]
+                        break
+            result.append((max(d + q2, 0.0), i))
+        return result
+
+    def knn(self, query: np.ndarray, k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ids and Euclidean distances of the k nearest templates, nearest first.
+        """
+        found = self._k_nearest(query, k or self.k)
+        ids = np.array([i for _, i in found], dtype=np.int64)
+        return ids, np.sqrt(np.array([d for d, _ in found], dtype=np.float32))
+
+    def classify_features(self, features: np.ndarray) -> Optional[Tuple[str, float, float]]:
+        """
+        (label, confidence, nearest distance), or None when rejected / empty.
+        """
+        found = self._k_nearest(features, self.k)
+        if not found or math.sqrt(found[0][0]) > self.reject_distance:
+            return None
+        labels = self._labels
+        votes: Dict[int, float] = {}
+        for d2, i in found:
+            d = math.sqrt(d2)
+            if d <= self.reject_distance:
+                cls = int(labels[i])
+                votes[cls] = votes.get(cls, 0.0) + 1.0 / (d + 1e-3)
+        cls, weight = max(votes.items(), key=lambda kv: kv[1])
+        return self.classes[cls], weight / sum(votes.values()), math.sqrt(found[0][0])
+
+    def __call__(self, pts: List[Point3D], img_w: int, img_h: int) -> Tuple[str, int, float]:
+        match = self.classify_features(np.asarray(hand_features(pts, img_w), dtype=np.float32))
+        if match is None:
+            if self.fallback is not None:
+                return self.fallback(pts, img_w, img_h)
+            return "neutral", 0, 0.0
+        label, conf, _ = match
+        info = GESTURES.get(label)
+        return label, info.id if info is not None else -1, conf
+
+    # ---------- persistence ----------
+    def save(self, path: Union[str, Path]) -> Tuple[Path, Path]:
+        """
+        Write the live templates (compacted) to `<path>.npy` + `<path>.json`.
+        """
+        npy_path, json_path = _index_paths(path)
+        npy_path.parent.mkdir(parents=True, exist_ok=True)
+        n = self._size
+        alive = np.isfinite(self._norm2[:n])
+        np.save(npy_path, np.ascontiguousarray(self._vectors[:n][alive]))
+        meta = {
+            "format": INDEX_FORMAT,
+            "feature_version": FEATURE_VERSION,
+            "dim": FEATURE_DIM,
+            "classes": self.classes,
+            "labels": self._labels[:n][alive].tolist(),
+            "k": self.k,
+            "reject_distance": self.reject_distance,
+            "cells": self.cells,
+            "probe": self.probe,
+            "coarse_min": self.coarse_min,
+            "centroids": self._centroids.tolist() if self._centroids is not None else None,
+        }
+        json_path.write_text(json.dumps(meta), encoding="utf-8")
+        return npy_path, json_path
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True, fallback: Optional[Classifier] = None) -> "TemplateMatcher":
+        """
+        Load a saved index; with `mmap` the vectors stay in the page cache
+        (shared between processes) until the first insert copies them.
+        """
+        npy_path, json_path = _index_paths(path)
+        meta = json.loads(json_path.read_text(encoding="utf-8"))
+        if meta.get("format") != INDEX_FORMAT:
+            raise ValueError(f"{json_path} is not a {INDEX_FORMAT} index")
+        if meta.get("feature_version") != FEATURE_VERSION:
+            raise ValueError(f"{json_path}: templates use feature version {meta.get('feature_version')}, "
+                             f"expected {FEATURE_VERSION}; re-record them")
+
+        matcher = cls(
+            k=meta["k"],
+            reject_distance=meta["reject_distance"],
+            fallback=fallback,
+            capacity=1,
+            cells=meta.get("cells", 0),
+            probe=meta.get("probe", 4),
+            coarse_min=meta["coarse_min"],
+        )
+        vectors = np.load(npy_path, mmap_mode="r" if mmap else None)
+        n = len(vectors)
+        matcher.classes = list(meta["classes"])
+        matcher._class_index = {c: i for i, c in enumerate(matcher.classes)}
+        matcher._vectors = vectors
+        matcher._norm2 = np.einsum("ij,ij->i", vectors, vectors).astype(np.float32)
+        matcher._labels = np.asarray(meta["labels"], dtype=np.int32)
+        matcher._dist = np.empty(n, dtype=np.float32)
+        matcher._cell_of = np.full(n, -1, dtype=np.int64)
+        matcher._cell_pos = np.full(n, -1, dtype=np.int64)
+        matcher._size = n
+        if meta.get("centroids") is not None:
+            matcher._centroids = np.asarray(meta["centroids"], dtype=np.float32)
+            matcher._fit_size = n
+            matcher._layout(np.arange(n))
+        elif n >= matcher.coarse_min:
+            matcher.rebuild_cells()       # index saved before cells (PCA projection)
+        return matcher
+
+
+def load_templates(path: Union[str, Path], fallback: Optional[Classifier] = detect_gesture_from_landmarks) -> TemplateMatcher:
+    """
+    Matcher for `--templates PATH` flags: an empty one when PATH does not exist yet.
+    """
+    if _index_paths(path)[1].exists():
+        return TemplateMatcher.load(path, fallback=fallback)
+    return TemplateMatcher(fallback=fallback)
+
+
+# ---------- CLI ----------
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Manage RT-Gesture3D gesture templates")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    add = sub.add_parser("add", help="add every hand of a landmark log as templates of one label")
+    add.add_argument("index", help="index path (without extension)")
+    add.add_argument("--label", required=True)
+    add.add_argument("--log", required=True, help="landmark log recorded with --record-landmarks")
+    add.add_argument("--every", type=int, default=1, help="use every Nth frame")
+    add.add_argument("--max-samples", type=int, default=0, help="stop after N hands (0 = all)")
+    add.add_argument("--reject-distance", type=float, default=None, help="also update the rejection distance")
+
+    rm = sub.add_parser("remove", help="delete all templates of a label")
+    rm.add_argument("index")
+    rm.add_argument("--label", required=True)
+
+    ls = sub.add_parser("list", help="templates per label")
+    ls.add_argument("index")
+
+    bench = sub.add_parser("bench", help="query latency with N synthetic templates")
+    bench.add_argument("--templates", type=int, default=10_000)
+    bench.add_argument("--queries", type=int, default=2_000)
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--rounds", type=int, default=3, help="time the queries this many times, keep the quietest")
+    bench.add_argument("--max-p99-us", type=float, default=100.0, help="fail above this p99 query latency")
+    return parser.parse_args(argv)
+
+
+def _bench(args) -> None:
+    from ..processing.synthetic import SyntheticHandGenerator
+    from .timing import summarize
+
+    gen = SyntheticHandGenerator(seed=args.seed)
+    pts, labels = gen.sample(args.templates + args.queries)
+    feats = hand_features_batch(pts, gen.config.img_w)
+
+    matcher = TemplateMatcher()
+    t0 = time.perf_counter()
+    for label in np.unique(labels):
+        sel = np.flatnonzero(labels[: args.templates] == label)
+        matcher.add(feats[sel], str(label))
+    build_s = time.perf_counter() - t0
+
+    queries = feats[args.templates:]
+    # every query in each round; the quietest round is reported (and gated)
+    # so a busy host does not read as a slow index
+    rounds = []
+    for _ in range(max(args.rounds, 1)):
+        samples, correct = [], 0
+        for q, label in zip(queries, labels[args.templates:]):
+            t0 = time.perf_counter()
+            match = matcher.classify_features(q)
+            samples.append(time.perf_counter() - t0)
+            correct += match is not None and match[0] == label
+        rounds.append(summarize(samples))
+    s = min(rounds, key=lambda r: r["p99_ms"])
+    found = 0
+
+    # recall in a separate pass, so the timed loop only runs lookups
+    n = matcher._size
+    for q in queries:
+        exact_d2 = matcher._norm2[:n] - 2.0 * (matcher._vectors[:n] @ q)     # exhaustive search
+        ids, _ = matcher.knn(q)
+        found += len(np.intersect1d(ids, np.argpartition(exact_d2, matcher.k - 1)[: matcher.k]))
+    recall = found / (len(queries) * matcher.k)
+
+    t0 = time.perf_counter()
+    ids = matcher.add(queries[:100], "extra")
+    insert_us = (time.perf_counter() - t0) / 100 * 1e6
+    t0 = time.perf_counter()
+    matcher.remove(ids)
+    delete_us = (time.perf_counter() - t0) / 100 * 1e6
+
+    search = "exact"
+    if matcher._centroids is not None:
+        search = f"{len(matcher._centroids)} cells, {min(matcher.probe, len(matcher._centroids))} probed"
+    round_p99 = ", ".join(f"{r['p99_ms'] * 1000:.0f}" for r in rounds)
+    print(f"📦 {len(matcher)} templates, built in {build_s * 1000:.1f} ms ({search})")
+    print(f"⏱️ query: p50 {s['p50_ms'] * 1000:.1f} µs, p95 {s['p95_ms'] * 1000:.1f} µs, "
+          f"p99 {s['p99_ms'] * 1000:.1f} µs over {s['count']} queries "
+          f"(best of {len(rounds)} rounds: p99 {round_p99} µs)")
+    print(f"➕ insert {insert_us:.1f} µs/template, ➖ delete {delete_us:.1f} µs/template")
+    print(f"🎯 accuracy vs intended gesture: {correct / len(queries) * 100:.2f}%, "
+          f"recall@{matcher.k} vs exhaustive search: {recall * 100:.2f}%")
+    if s["p99_ms"] * 1000 > args.max_p99_us:
+        print(f"❌ p99 {s['p99_ms'] * 1000:.1f} µs is above the {args.max_p99_us:g} µs target")
+        sys.exit(1)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.command == "bench":
+        _bench(args)
+        return
+
+    if args.command == "list":
+        matcher = TemplateMatcher.load(args.index)
+        print(f"📦 {len(matcher)} template(s), reject distance {matcher.reject_distance}")
+        for label, n in sorted(matcher.counts().items()):
+            print(f"  {label:<16} {n}")
+        return
+
+    matcher = load_templates(args.index, fallback=None)
+
+    if args.command == "remove":
+        n = matcher.remove_label(args.label)
+        matcher.save(args.index)
+        print(f"🗑️ Removed {n} template(s) of '{args.label}'")
+        return
+
+    hands, widths = [], []
+    for i, lf in enumerate(read_landmark_log(args.log)):
+        if i % args.every:
+            continue
+        for pts in lf.hands:
+            hands.append(pts)
+            widths.append(lf.width)
+    if args.max_samples:
+        hands, widths = hands[: args.max_samples], widths[: args.max_samples]
+    if not hands:
+        print(f"❌ No hands in {args.log}")
+        return
+
+    matcher.add_hands(args.label, hands, np.asarray(widths))
+    if args.reject_distance is not None:
+        matcher.reject_distance = args.reject_distance
+    npy_path, _ = matcher.save(args.index)
+    print(f"✅ Added {len(hands)} template(s) of '{args.label}' → {npy_path} ({len(matcher)} total)")
+
+
+if __name__ == "__main__":
+    main()
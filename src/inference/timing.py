@@ -0,0 +1,77 @@
+"""
+Latency bookkeeping for RT-Gesture3D pipelines.
+
+`LatencyRecorder` collects per-stage durations (seconds) and summarizes
+them as percentiles in milliseconds for benchmark / replay reports.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    """
+    Linear-interpolated percentile of an already sorted sequence (q in 0..100).
+    """
+    if not sorted_values:
+        return 0.0
+    pos = (len(sorted_values) - 1) * q / 100.0
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    frac = pos - lo
+    return sorted_values[lo] * (1.0 - frac) + sorted_values[hi] * frac
+
+
+def summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """
+    count / mean / p50 / p95 / p99 / max of durations given in seconds, reported in ms.
+    """
+    values = sorted(samples)
+    n = len(values)
+    return {
+        "count": n,
+        "mean_ms": (sum(values) / n * 1000.0) if n else 0.0,
+        "p50_ms": percentile(values, 50) * 1000.0,
+        "p95_ms": percentile(values, 95) * 1000.0,
+        "p99_ms": percentile(values, 99) * 1000.0,
+        "max_ms": (values[-1] * 1000.0) if n else 0.0,
+    }
+
+
+class LatencyRecorder:
+    """
+    Per-stage latency samples.
+
+    Example:
+        rec = LatencyRecorder()
+        with rec.measure("classify"):
+            ...
+        print(rec.format_report())
+    """
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - t0)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {stage: summarize(values) for stage, values in self.samples.items()}
+
+    def format_report(self) -> str:
+        lines = [f"{'stage':<12} {'count':>8} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9}  (ms)"]
+        for stage, s in self.summary().items():
+            lines.append(
+                f"{stage:<12} {s['count']:>8} {s['mean_ms']:>9.3f} {s['p50_ms']:>9.3f} "
+                f"{s['p95_ms']:>9.3f} {s['p99_ms']:>9.3f}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,235 @@
+"""
+Landmark augmentation for RT-Gesture3D training data.
+
+Augmented copies are never written to disk: `LandmarkAugmenter` transforms
+whole batches on the fly and `AugmentedStream` feeds a training loop from
+a background thread, so the next batch is ready before it is needed.
+
+    augmenter = LandmarkAugmenter(AugmentConfig(rotate_deg=20), seed=0)
+    with AugmentedStream(ds.landmarks, labels, batch_size=512, epochs=20,
+                         augmenter=augmenter, image_size=ds.image_size) as stream:
+        for pts, y, size in stream:
+            model.partial_fit(hand_features_batch(pts, size[:, 0]), y)
+
+Per sample (one random draw, shared by every frame of a sequence):
+    - in-plane rotation and isotropic scale about the hand centroid
+    - horizontal mirror (a right hand becomes a left hand; handedness
+      labels, when given, are swapped)
+    - translation, limited so the hand stays inside the image when
+      possible
+    - per-joint gaussian jitter (x, y in pixels)
+    - sequences only: temporal resampling (random playback speed and
+      start offset, linear interpolation between frames)
+
+Rotation, scale and mirror are folded into one 2x2 matrix per sample and
+applied with a single batched matmul. Input is `(N, 21, 3)` hands or
+`(N, T, 21, 3)` sequences in pixel coordinates (z in image-width units,
+as produced by the detector and `datasets.py`).
+"""
+
+import queue
+import threading
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_IMAGE_SIZE = (640, 480)
+
+
+@dataclass
+class AugmentConfig:
+    """
+    Ranges sampled by `LandmarkAugmenter`. A zero disables that transform.
+    """
+    rotate_deg: float = 15.0                        # max |in-plane rotation|
+    scale: Tuple[float, float] = (0.85, 1.15)       # multiplicative range
+    translate_px: float = 40.0                      # max |shift| per axis
+    mirror_prob: float = 0.5
+    jitter_px: float = 1.5                          # per-joint std-dev
+    speed: Tuple[float, float] = (0.8, 1.25)        # sequence playback speed range
+
+
+def resample_time(seqs: np.ndarray, speed: np.ndarray, offset: np.ndarray) -> np.ndarray:
+    """
+    Linearly resample sequences to the same length at a new speed.
+
+    seqs: (N, T, ...) ; speed, offset: (N,) frames per output frame, start frame
+    Output frame i reads input time `offset + i * speed`, clamped to the
+    last frame (a slowed-down clip holds its final pose).
+    """
+    n, t = seqs.shape[:2]
+    pos = np.clip(offset[:, None] + np.arange(t)[None, :] * speed[:, None], 0.0, t - 1)   # (N, T)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, t - 1)
+    frac = (pos - lo).astype(seqs.dtype).reshape((n, t) + (1,) * (seqs.ndim - 2))
+    rows = np.arange(n)[:, None]
+    return seqs[rows, lo] * (1 - frac) + seqs[rows, hi] * frac
+
+
+class LandmarkAugmenter:
+    """
+    Seeded, vectorized random transforms for landmark batches.
+
+    The same seed and the same sequence of calls give identical output.
+    """
+
+    def __init__(self, config: Optional[AugmentConfig] = None, seed: Optional[int] = None) -> None:
+        self.config = config or AugmentConfig()
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(
+        self,
+        pts: np.ndarray,
+        image_size: Optional[np.ndarray] = None,
+        handedness: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        pts: (N, 21, 3) or (N, T, 21, 3) pixel landmarks
+        image_size: (N, 2) width, height (default 640x480)
+        handedness: optional (N,) "Left" / "Right" labels
+        returns: augmented float32 copy of pts, handedness after mirroring
+        """
+        cfg = self.config
+        rng = self.rng
+        pts = np.array(pts, dtype=np.float32)
+        n = pts.shape[0]
+        if n == 0:
+            return pts, handedness
+        if image_size is None:
+            image_size = np.tile(np.array(DEFAULT_IMAGE_SIZE, dtype=np.float32), (n, 1))
+        image_size = np.asarray(image_size, dtype=np.float32).reshape(n, 2)
+
+        if pts.ndim == 4 and cfg.speed != (1.0, 1.0):
+            t = pts.shape[1]
+            speed = rng.uniform(*cfg.speed, size=n)
+            slack = np.maximum((t - 1) * (1.0 - speed), 0.0)        # unused input frames when sped up
+            pts = resample_time(pts, speed, rng.uniform(0.0, 1.0, size=n) * slack)
+
+        flat = pts.reshape(n, -1, 3)                                 # sequences: all frames share the draw
+        xy = flat[..., :2]
+
+        # ---- rotation · scale · mirror as one (N, 2, 2) matrix about the centroid ----
+        angle = np.radians(rng.uniform(-cfg.rotate_deg, cfg.rotate_deg, size=n))
+        scale = rng.uniform(*cfg.scale, size=n)
+        mirror = rng.random(n) < cfg.mirror_prob
+        cos, sin = np.cos(angle) * scale, np.sin(angle) * scale
+        sx = np.where(mirror, -1.0, 1.0)
+        mat = np.stack([np.stack([cos * sx, -sin], axis=1), np.stack([sin * sx, cos], axis=1)], axis=1)
+
+        center = xy.mean(axis=1, keepdims=True)
+        xy[:] = np.matmul(xy - center, mat.transpose(0, 2, 1).astype(np.float32)) + center
+        flat[..., 2] *= scale[:, None].astype(np.float32)            # relative depth scales with the hand
+
+        # ---- translation, clipped so the hand stays in frame where it fits ----
+        if cfg.translate_px > 0:
+            lo = np.maximum(-xy.min(axis=1), -cfg.translate_px)     # (N, 2)
+            hi = np.minimum(image_size - xy.max(axis=1), cfg.translate_px)
+            shift = lo + rng.random((n, 2)) * (hi - lo)
+            shift = np.where(hi >= lo, shift, 0.0)
+            xy += shift[:, None, :].astype(np.float32)
+
+        if cfg.jitter_px > 0:
+            xy += rng.normal(0.0, cfg.jitter_px, size=xy.shape).astype(np.float32)
+
+        if handedness is not None:
+            handedness = np.asarray(handedness, dtype=object).copy()
+            swap = {"Left": "Right", "Right": "Left"}
+            handedness[mirror] = [swap.get(h, h) for h in handedness[mirror]]
+        return pts, handedness
+
+
+class AugmentedStream:
+    """
+    Shuffled, augmented mini-batches produced by a background thread.
+
+    Yields `(pts, labels, image_size)` for `epochs` passes over the data
+    (forever with `epochs=None`). Up to `prefetch` batches are kept ready;
+    NumPy releases the GIL in the heavy ops, so augmentation overlaps with
+    the consumer's own work. Exceptions in the worker are re-raised in the
+    consumer. Shuffling and augmentation use one seeded generator in a
+    single thread, so the batch sequence is reproducible.
+    """
+
+    def __init__(
+        self,
+        landmarks: np.ndarray,
+        labels: np.ndarray,
+        batch_size: int = 256,
+        epochs: Optional[int] = 1,
+        augmenter: Optional[LandmarkAugmenter] = None,
+        image_size: Optional[np.ndarray] = None,
+        prefetch: int = 4,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.landmarks = np.asarray(landmarks, dtype=np.float32)
+        self.labels = np.asarray(labels)
+        n = len(self.landmarks)
+        if len(self.labels) != n:
+            raise ValueError(f"{n} landmark rows but {len(self.labels)} labels")
+        if image_size is None:
+            image_size = np.tile(np.array(DEFAULT_IMAGE_SIZE, dtype=np.int32), (n, 1))
+        self.image_size = np.asarray(image_size).reshape(n, 2)
+        self.batch_size = batch_size
+        self.epochs = epochs
+        self.augmenter = augmenter if augmenter is not None else LandmarkAugmenter(seed=seed)
+        self.rng = np.random.default_rng(seed)
+        self.batches_per_epoch = -(-n // batch_size)
+
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max(prefetch, 1))
+        self._stop = threading.Event()
+        self._done = object()
+        self.consumer_waits = 0       # batches the consumer had to wait for (0 = never starved)
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+        self._thread.start()
+
+    def _put(self, item: object) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            epoch = 0
+            while self.epochs is None or epoch < self.epochs:
+                order = self.rng.permutation(len(self.landmarks))
+                for start in range(0, len(order), self.batch_size):
+                    idx = order[start:start + self.batch_size]
+                    pts, _ = self.augmenter(self.landmarks[idx], self.image_size[idx])
+                    if not self._put((pts, self.labels[idx], self.image_size[idx])):
+                        return
+                epoch += 1
+            self._put(self._done)
+        except BaseException as e:   # surfaced in __next__
+            self._put(e)
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        return self
+
+    def __next__(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self._stop.is_set():
+            raise StopIteration
+        if self._queue.empty():
+            self.consumer_waits += 1
+        item = self._queue.get()
+        if item is self._done:
+            self._stop.set()
+            raise StopIteration
+        if isinstance(item, BaseException):
+            self._stop.set()
+            raise item
+        return item
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join(timeout=2.0)
+
+    def __enter__(self) -> "AugmentedStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
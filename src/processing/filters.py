@@ -0,0 +1,192 @@
+"""
+Landmark filtering for RT-Gesture3D.
+
+The rule engine compares landmarks against hard pixel thresholds, so a
+few pixels of detector jitter near a threshold flip the label from frame
+to frame; `LabelSmoother` hides that with a majority vote, at the price
+of several frames of label latency. Filtering the landmarks themselves
+removes most of the flicker at its source:
+
+`OneEuroFilterBank` is a One-Euro filter (Casiez et al., CHI 2012) over
+whole `(hands, 21, 3)` landmark arrays. Each coordinate gets an
+exponential low-pass whose cutoff rises with the (low-passed) speed of
+its landmark: still hands are smoothed hard, moving fingers pass almost
+unfiltered, so jitter goes away without lag on real motion. All joints
+of a hand are updated with a handful of NumPy operations on views of the
+track state (~45 µs per hand and frame, ~10x the rule engine).
+
+State is kept per track: hands are matched to the previous frame's
+tracks by nearest centroid (within `max_jump` hand sizes); an unmatched
+hand starts a new track, and tracks not seen for `timeout_s` are
+dropped, so a hand that leaves and comes back starts unfiltered.
+
+    bank = OneEuroFilterBank(min_cutoff=1.0, beta=0.01)
+    hands = bank.filter_hands(hands, t)            # lists of (x, y, z), like the detector output
+    filtered = bank(hands_array, t)                # (H, 21, 3) float arrays
+
+    pipeline = GesturePipeline(landmark_filter=bank, smoothing_window=2)
+
+    python -m benchmarks.bench_filtering            # flicker rate / onset latency, with and without
+"""
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+Point3D = Tuple[int, int, float]  # (x, y, z)
+
+# label smoothing window that pairs with filtered landmarks: filtered labels
+# flicker no more than noise-free ones, so a vote only adds a frame of delay
+# (see bench_filtering)
+FILTERED_SMOOTHING_WINDOW = 1
+
+
+def _alpha(cutoff: np.ndarray, dt: np.ndarray) -> np.ndarray:
+    tau = 1.0 / (2.0 * math.pi * cutoff)
+    return 1.0 / (1.0 + tau / dt)
+
+
+class OneEuroFilterBank:
+    """
+    One-Euro filters for up to `max_tracks` hands of 21 (x, y, z) landmarks.
+
+    min_cutoff: cutoff (Hz) for a still landmark; lower = smoother, more lag
+    beta:       cutoff increase per px/s of landmark speed; higher = less lag
+    d_cutoff:   cutoff (Hz) of the speed estimate
+    """
+
+    def __init__(
+        self,
+        min_cutoff: float = 1.0,
+        beta: float = 0.01,
+        d_cutoff: float = 1.0,
+        max_tracks: int = 4,
+        max_jump: float = 1.0,
+        timeout_s: float = 0.3,
+    ) -> None:
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self.max_jump = max_jump
+        self.timeout_s = timeout_s
+
+        self._x = np.zeros((max_tracks, 21, 3), dtype=np.float64)    # last filtered landmarks
+        self._dx = np.zeros((max_tracks, 21), dtype=np.float64)      # last filtered speed (px/s)
+        self._t = np.full(max_tracks, -np.inf)                       # last update time
+        self._center = np.zeros((max_tracks, 2), dtype=np.float64)   # centroid of _x (matching)
+        self._size = np.ones(max_tracks, dtype=np.float64)           # bbox diagonal of _x, >= 1 px
+        self.track_ids = np.empty(0, dtype=np.int64)                 # track of each hand, last call
+
+    def reset(self) -> None:
+        self._t[:] = -np.inf
+        self.track_ids = np.empty(0, dtype=np.int64)
+
+    def _assign(self, hands: np.ndarray, t: float) -> List[int]:
+        """
+        Track slot per hand: greedy nearest-centroid matching against
+        live tracks, free (or stalest) slots for the rest.
+        """
+        n = len(hands)
+        slots = [-1] * n
+        live = np.flatnonzero(t - self._t <= self.timeout_s)
+        if len(live):
+            d = hands[:, :, :2].mean(axis=1)[:, None, :] - self._center[live]       # (H, T, 2)
+            dist = np.hypot(d[..., 0], d[..., 1])
+            dist[dist > self.max_jump * self._size[live]] = np.inf
+            for _ in range(min(n, len(live))):
+                i, j = divmod(int(dist.argmin()), len(live))
+                if dist[i, j] == np.inf:
+                    break
+                slots[i] = int(live[j])
+                dist[i, :] = np.inf
+                dist[:, j] = np.inf
+
+        if -1 in slots:
+            taken = set(slots)
+            free = [s for s in np.argsort(self._t).tolist() if s not in taken]
+            for i in range(n):
+                if slots[i] < 0 and free:                   # no free slot: more hands than tracks, left unfiltered
+                    slots[i] = free.pop(0)
+                    self._t[slots[i]] = -np.inf             # new track: starts from this frame's landmarks
+        return slots
+
+    def _update(self, slot: int, x: np.ndarray, t: float) -> None:
+        """
+        Filter one hand's (21, 3) landmarks `x` in place with track `slot`.
+        """
+        dt = t - self._t[slot]
+        prev = self._x[slot]
+        if 0.0 < dt < np.inf:
+            step = x - prev                                                         # (21, 3)
+            speed = np.hypot(step[:, 0], step[:, 1]) / dt                           # (21,) px/s
+            a_d = _alpha(self.d_cutoff, dt)
+            dx = self._dx[slot]
+            dx += a_d * (speed - dx)
+            cutoff = self.min_cutoff + self.beta * dx
+            a = cutoff / (cutoff + 1.0 / (2.0 * math.pi * dt))                      # _alpha(cutoff, dt)
+            step *= a[:, None]
+            np.add(prev, step, out=x)
+        else:
+            self._dx[slot] = 0.0
+        prev[...] = x
+        self._t[slot] = t
+        xy = x[:, :2]
+        lo, hi = xy.min(axis=0), xy.max(axis=0)
+        self._center[slot] = xy.mean(axis=0)
+        self._size[slot] = max(math.hypot(hi[0] - lo[0], hi[1] - lo[1]), 1.0)      # bbox diagonal
+
+    def __call__(self, hands: np.ndarray, t: float) -> np.ndarray:
+        """
+        hands: (H, 21, 3) pixel landmarks of one frame, t: its time (s)
+        returns: filtered (H, 21, 3) float64 landmarks
+        """
+        out = np.array(hands, dtype=np.float64).reshape(-1, 21, 3)
+        slots = self._assign(out, t)
+        self.track_ids = np.array(slots, dtype=np.int64)
+        for i, slot in enumerate(slots):
+            if slot >= 0:
+                self._update(slot, out[i], t)
+        return out
+
+    def filter_hands(self, hands: Sequence[Sequence[Point3D]], t: float) -> List[List[Point3D]]:
+        """
+        Detector-style hands in and out (x, y rounded to pixels, z float).
+        """
+        if not len(hands):
+            self(np.empty((0, 21, 3)), t)
+            return []
+        filtered = self(np.asarray(hands, dtype=np.float64), t)
+        xy = np.rint(filtered[:, :, :2]).astype(np.int64).tolist()
+        z = filtered[:, :, 2].tolist()
+        return [[(p[0], p[1], zz) for p, zz in zip(hand_xy, hand_z)] for hand_xy, hand_z in zip(xy, z)]
+
+
+# ---------- CLI ----------
+def add_filter_args(parser) -> None:
+    """
+    --one-euro landmark filtering flags, shared by the demo, replay,
+    headless mode and the video renderer.
+    """
+    parser.add_argument("--one-euro", action="store_true",
+                        help=f"One-Euro filter landmarks before classification "
+                             f"(label smoothing then defaults to {FILTERED_SMOOTHING_WINDOW} frame, i.e. none)")
+    parser.add_argument("--one-euro-min-cutoff", type=float, default=1.0, metavar="HZ",
+                        help="cutoff for still landmarks (lower = smoother)")
+    parser.add_argument("--one-euro-beta", type=float, default=0.01,
+                        help="cutoff increase per px/s of landmark speed (higher = less lag)")
+
+
+def filter_from_args(args) -> Optional[OneEuroFilterBank]:
+    if not getattr(args, "one_euro", False):
+        return None
+    return OneEuroFilterBank(min_cutoff=args.one_euro_min_cutoff, beta=args.one_euro_beta)
+
+
+def smoothing_window_from_args(args, default: int = 7) -> int:
+    """
+    --smoothing if given, else a short window with --one-euro and `default` without.
+    """
+    if getattr(args, "smoothing", None) is not None:
+        return args.smoothing
+    return FILTERED_SMOOTHING_WINDOW if getattr(args, "one_euro", False) else default
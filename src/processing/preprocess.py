@@ -0,0 +1,88 @@
+"""
+Landmark → feature vector preprocessing for RT-Gesture3D.
+
+The same function is used for training (`src/training/train_classifier.py`)
+and inference (`src/inference/onnx_classifier.py`), so a model always
+sees features built exactly like the ones it was trained on.
+
+Per hand (FEATURE_DIM = 70 float32 values):
+    - x, y of joints 1..20 relative to the wrist, divided by the hand
+      scale (mean wrist → MCP distance)                          40
+    - z of joints 1..20 relative to the wrist, in the same units  20
+    - pairwise fingertip distances, in the same units             10
+
+Translation and scale invariant; orientation is kept (the gestures are
+defined for an upright hand).
+"""
+
+import math
+from itertools import combinations
+from typing import List, Sequence
+
+import numpy as np
+
+FEATURE_VERSION = 1
+FEATURE_DIM = 70
+
+_MCPS = np.array([5, 9, 13, 17])
+_TIPS = np.array([4, 8, 12, 16, 20])
+_TIP_PAIRS = np.array(list(combinations(range(len(_TIPS)), 2)))
+_TIP_PAIRS_PY = [(4 * a + 3, 4 * b + 3) for a, b in _TIP_PAIRS.tolist()]   # tip rows in `rel` below
+
+
+def hand_features_batch(pts: np.ndarray, img_w) -> np.ndarray:
+    """
+    pts: (N, 21, 3) pixel landmarks (z in image-width units, as MediaPipe)
+    img_w: image width, scalar or (N,) per hand
+    returns: (N, FEATURE_DIM) float32
+    """
+    pts = np.asarray(pts, dtype=np.float32)
+    rel = pts - pts[:, :1]
+    rel[..., 2] *= np.reshape(np.asarray(img_w, dtype=np.float32), (-1, 1))   # z → pixels
+
+    mcp = rel[:, _MCPS, :2]
+    scale = np.sqrt((mcp * mcp).sum(axis=2)).mean(axis=1)
+    rel /= np.maximum(scale, 1e-6)[:, None, None]
+
+    tips = rel[:, _TIPS]
+    diff = tips[:, _TIP_PAIRS[:, 0]] - tips[:, _TIP_PAIRS[:, 1]]
+    tip_dist = np.sqrt((diff * diff).sum(axis=2))
+
+    n = pts.shape[0]
+    return np.concatenate(
+        [rel[:, 1:, :2].reshape(n, 40), rel[:, 1:, 2], tip_dist],
+        axis=1,
+    ).astype(np.float32, copy=False)
+
+
+def hand_features(landmarks: Sequence[Sequence[float]], img_w: int) -> List[float]:
+    """
+    Single-hand version of `hand_features_batch` in plain Python.
+
+    For one hand this is several times faster than going through NumPy
+    (no per-call array overhead), which matters for per-frame inference.
+
+    landmarks: list of 21 (x, y, z) as produced by the detector
+    returns: FEATURE_DIM floats (same order as the batch version)
+    """
+    wx, wy, wz = landmarks[0]
+    rel = [(x - wx, y - wy, (z - wz) * img_w) for x, y, z in landmarks[1:]]   # joints 1..20
+    scale = (
+        math.hypot(rel[4][0], rel[4][1]) + math.hypot(rel[8][0], rel[8][1])
+        + math.hypot(rel[12][0], rel[12][1]) + math.hypot(rel[16][0], rel[16][1])
+    ) / 4.0
+    inv = 1.0 / max(scale, 1e-6)
+
+    out = [c * inv for p in rel for c in (p[0], p[1])]
+    out += [p[2] * inv for p in rel]
+    out += [math.dist(rel[a], rel[b]) * inv for a, b in _TIP_PAIRS_PY]
+    return out
+
+
+def stack_hands(hands: List[Sequence[Sequence[float]]]) -> np.ndarray:
+    """
+    List of detector hands → (N, 21, 3) float32 array.
+    """
+    if not hands:
+        return np.zeros((0, 21, 3), dtype=np.float32)
+    return np.asarray(hands, dtype=np.float32).reshape(len(hands), 21, 3)
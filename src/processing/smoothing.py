@@ -0,0 +1,30 @@
+"""
+Label smoothing for RT-Gesture3D.
+
+Per-frame predictions flicker when a hand sits near a rule threshold.
+`LabelSmoother` reports the most common label of the last N frames.
+"""
+
+from collections import Counter
+
+from .buffer import RingBuffer
+
+
+class LabelSmoother:
+    """
+    Majority vote over the last `window` labels.
+
+    Example:
+        smoother = LabelSmoother(window=7)
+        stable = smoother.update("rock")
+    """
+
+    def __init__(self, window: int = 7):
+        self._history: RingBuffer[str] = RingBuffer(window)
+
+    def update(self, label: str) -> str:
+        self._history.append(label)
+        return Counter(self._history).most_common(1)[0][0]
+
+    def reset(self) -> None:
+        self._history.clear()
@@ -0,0 +1,199 @@
+"""
+Synthetic hand landmark generator for RT-Gesture3D.
+
+Builds hands on the 21-point MediaPipe topology used by
+`src/inference/predictor.py`:
+
+    0 wrist
+    1-4   thumb  (CMC, MCP, IP, TIP)
+    5-8   index  (MCP, PIP, DIP, TIP)
+    9-12  middle
+    13-16 ring
+    17-20 pinky
+
+Each hand is driven by per-finger curl (0 = straight, 1 = fully folded),
+a thumb-index pinch, wrist roll / yaw, scale, position and per-joint
+jitter. Output is an (N, 21, 3) float32 array in pixel coordinates
+(z roughly follows MediaPipe: relative to the wrist, in image-width
+units), so it can be fed to the rule engine or a learned model.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+FINGERS = ("thumb", "index", "middle", "ring", "pinky")
+
+# Canonical right hand, palm facing the camera, in "hand units"
+# (wrist → middle MCP ≈ 1). Image axes: x right, y down.
+_FINGER_MCP = np.array(
+    [
+        [-0.30, -0.95],   # index
+        [-0.05, -1.00],   # middle
+        [0.18, -0.93],    # ring
+        [0.38, -0.82],    # pinky
+    ],
+    dtype=np.float64,
+)
+_FINGER_SEGMENTS = np.array(
+    [
+        [0.45, 0.27, 0.22],
+        [0.50, 0.30, 0.23],
+        [0.46, 0.28, 0.22],
+        [0.36, 0.21, 0.19],
+    ],
+    dtype=np.float64,
+)
+_FINGER_SPREAD = np.radians([-8.0, 0.0, 7.0, 15.0])   # fan angle from vertical
+_FINGER_FLEX = np.radians([90.0, 110.0, 80.0])          # MCP, PIP, DIP flexion at curl=1
+
+_THUMB_CMC = np.array([-0.20, -0.15], dtype=np.float64)
+_THUMB_SEGMENTS = np.array([0.35, 0.30, 0.25], dtype=np.float64)
+_THUMB_BASE_ANGLE = np.radians(50.0)                    # from vertical, towards -x
+_THUMB_FLEX = np.radians([40.0, 70.0, 120.0])           # CMC→MCP, MCP→IP, IP→TIP at curl=1
+
+# Gesture presets: curls (thumb, index, middle, ring, pinky) and pinch.
+GESTURE_POSES: Dict[str, Tuple[Tuple[float, float, float, float, float], float]] = {
+    "neutral": ((1.0, 1.0, 1.0, 1.0, 1.0), 0.0),
+    "victory": ((1.0, 0.0, 0.0, 1.0, 1.0), 0.0),
+    "ok": ((0.0, 1.0, 1.0, 1.0, 1.0), 0.0),
+    "perfect": ((0.0, 0.15, 0.0, 0.0, 0.0), 1.0),
+    "stop": ((0.0, 0.0, 0.0, 0.0, 0.0), 0.0),
+    "rock": ((1.0, 0.0, 1.0, 1.0, 0.0), 0.0),
+    "calm": ((1.0, 0.0, 1.0, 1.0, 1.0), 0.0),
+}
+
+
+@dataclass
+class SyntheticHandConfig:
+    """
+    Sampling ranges used by `SyntheticHandGenerator.sample`.
+    """
+    img_w: int = 640
+    img_h: int = 480
+    scale_px: Tuple[float, float] = (110.0, 170.0)    # wrist → middle MCP, pixels
+    roll_deg: Tuple[float, float] = (-12.0, 12.0)     # in-plane wrist rotation
+    yaw_deg: Tuple[float, float] = (-20.0, 20.0)      # rotation about the vertical axis
+    curl_noise: float = 0.05                           # std-dev added to preset curls
+    jitter_px: float = 1.5                             # per-joint gaussian noise
+
+
+class SyntheticHandGenerator:
+    """
+    Parametric, vectorized hand generator.
+
+    Example:
+        gen = SyntheticHandGenerator(seed=0)
+        pts, labels = gen.sample(10_000)          # (10000, 21, 3), (10000,)
+        pts = gen.pose(curls, pinch, roll, yaw, scale, wrist_xy)   # full control
+    """
+
+    def __init__(self, config: Optional[SyntheticHandConfig] = None, seed: Optional[int] = None) -> None:
+        self.config = config or SyntheticHandConfig()
+        self.rng = np.random.default_rng(seed)
+
+    def pose(
+        self,
+        curls: np.ndarray,
+        pinch: np.ndarray,
+        roll_deg: np.ndarray,
+        yaw_deg: np.ndarray,
+        scale_px: np.ndarray,
+        wrist_xy: np.ndarray,
+        jitter_px: float = 0.0,
+    ) -> np.ndarray:
+        """
+        Build N hands from explicit parameters.
+
+        curls: (N, 5) in thumb..pinky order; pinch / roll / yaw / scale: (N,);
+        wrist_xy: (N, 2) wrist position in pixels.
+        """
+        curls = np.clip(np.asarray(curls, dtype=np.float64), 0.0, 1.0)
+        n = curls.shape[0]
+        pinch = np.clip(np.broadcast_to(np.asarray(pinch, dtype=np.float64), (n,)), 0.0, 1.0)
+        pts = np.zeros((n, 21, 3), dtype=np.float64)
+
+        # --- index..pinky: flexion folds each segment towards the camera (-z) and down ---
+        finger_curl = curls[:, 1:, None]                                   # (N, 4, 1)
+        phi = np.cumsum(finger_curl * _FINGER_FLEX, axis=2)                # (N, 4, 3)
+        sin_s = np.sin(_FINGER_SPREAD)[None, :, None]
+        cos_s = np.cos(_FINGER_SPREAD)[None, :, None]
+        seg = _FINGER_SEGMENTS[None]
+        step = np.stack(
+            [seg * np.cos(phi) * sin_s, -seg * np.cos(phi) * cos_s, -seg * np.sin(phi)],
+            axis=-1,
+        )                                                                  # (N, 4, 3, 3)
+        joints = np.cumsum(step, axis=2)
+        base = np.concatenate([_FINGER_MCP, np.zeros((4, 1))], axis=1)[None, :, None, :]
+        fingers = np.concatenate([np.broadcast_to(base, (n, 4, 1, 3)), base + joints], axis=2)
+        pts[:, 5:21] = fingers.reshape(n, 16, 3)
+
+        # --- thumb: in-plane chain that sweeps across the palm as it curls ---
+        angle = _THUMB_BASE_ANGLE - np.cumsum(curls[:, :1] * _THUMB_FLEX, axis=1)   # (N, 3)
+        t_step = np.stack(
+            [-_THUMB_SEGMENTS * np.sin(angle), -_THUMB_SEGMENTS * np.cos(angle), -0.05 * _THUMB_SEGMENTS * curls[:, :1]],
+            axis=-1,
+        )
+        cmc = np.array([_THUMB_CMC[0], _THUMB_CMC[1], 0.0])
+        pts[:, 1] = cmc
+        pts[:, 2:5] = cmc + np.cumsum(t_step, axis=1)
+
+        # --- pinch: pull the thumb IP / tip onto the index fingertip ---
+        w = pinch[:, None]
+        target_tip = pts[:, 8] + np.array([-0.12, 0.05, 0.0])
+        target_ip = pts[:, 2] + 0.35 * (target_tip - pts[:, 2])
+        pts[:, 4] = (1.0 - w) * pts[:, 4] + w * target_tip
+        pts[:, 3] = (1.0 - w) * pts[:, 3] + w * target_ip
+
+        # --- yaw (about y), roll (about z), scale, translate ---
+        yaw = np.radians(np.broadcast_to(np.asarray(yaw_deg, dtype=np.float64), (n,)))[:, None]
+        x, z = pts[..., 0].copy(), pts[..., 2].copy()
+        pts[..., 0] = x * np.cos(yaw) + z * np.sin(yaw)
+        pts[..., 2] = -x * np.sin(yaw) + z * np.cos(yaw)
+
+        roll = np.radians(np.broadcast_to(np.asarray(roll_deg, dtype=np.float64), (n,)))[:, None]
+        x, y = pts[..., 0].copy(), pts[..., 1].copy()
+        pts[..., 0] = x * np.cos(roll) - y * np.sin(roll)
+        pts[..., 1] = x * np.sin(roll) + y * np.cos(roll)
+
+        scale = np.broadcast_to(np.asarray(scale_px, dtype=np.float64), (n,))[:, None, None]
+        pts *= scale
+        pts[..., 2] /= self.config.img_w
+        pts[..., :2] += np.asarray(wrist_xy, dtype=np.float64)[:, None, :]
+
+        if jitter_px > 0:
+            pts[..., :2] += self.rng.normal(0.0, jitter_px, size=(n, 21, 2))
+
+        return pts.astype(np.float32)
+
+    def sample(self, n: int, gestures: Optional[Sequence[str]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sample n random hands.
+
+        Returns:
+            pts:    (n, 21, 3) float32 pixel landmarks
+            labels: (n,) array of intended gesture keys
+        """
+        cfg = self.config
+        rng = self.rng
+        keys = list(gestures) if gestures else list(GESTURE_POSES)
+
+        choice = rng.integers(0, len(keys), size=n)
+        preset_curls = np.array([GESTURE_POSES[k][0] for k in keys])
+        preset_pinch = np.array([GESTURE_POSES[k][1] for k in keys])
+
+        curls = preset_curls[choice] + rng.normal(0.0, cfg.curl_noise, size=(n, 5))
+        pinch = preset_pinch[choice]
+        roll = rng.uniform(*cfg.roll_deg, size=n)
+        yaw = rng.uniform(*cfg.yaw_deg, size=n)
+        scale = rng.uniform(*cfg.scale_px, size=n)
+
+        # keep the whole hand inside the image: fingers extend ~2 units up from the wrist
+        wrist_x = rng.uniform(scale * 1.0, cfg.img_w - scale * 1.0)
+        wrist_y = rng.uniform(np.minimum(scale * 2.1, cfg.img_h - 1), cfg.img_h - 1)
+        wrist_xy = np.stack([wrist_x, wrist_y], axis=1)
+
+        pts = self.pose(curls, pinch, roll, yaw, scale, wrist_xy, jitter_px=cfg.jitter_px)
+        labels = np.array(keys, dtype=object)[choice]
+        return pts, labels
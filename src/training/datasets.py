@@ -0,0 +1,128 @@
+"""
+Processed landmark datasets for RT-Gesture3D.
+
+A processed dataset is one or more `.npz` files in `data/processed/`:
+
+    landmarks   (N, 21, 3) float32   pixel landmarks (z in image-width units)
+    labels      (N,) str             gesture keys (see datasets/gestures.csv)
+    image_size  (N, 2) int32         optional (width, height), default 640x480
+
+Files without `labels` take the label from their name:
+`landmarks_rock.npz` → "rock".
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..processing.synthetic import SyntheticHandConfig, SyntheticHandGenerator
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_PROCESSED_DIR = PROJECT_ROOT / "data" / "processed"
+DEFAULT_IMAGE_SIZE = (640, 480)
+
+
+@dataclass
+class LandmarkDataset:
+    landmarks: np.ndarray    # (N, 21, 3) float32
+    labels: np.ndarray       # (N,) object, gesture keys
+    image_size: np.ndarray   # (N, 2) int32, (width, height)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def counts(self) -> dict:
+        keys, n = np.unique(self.labels.astype(str), return_counts=True)
+        return dict(zip(keys.tolist(), n.tolist()))
+
+    @staticmethod
+    def concat(parts: List["LandmarkDataset"]) -> "LandmarkDataset":
+        return LandmarkDataset(
+            np.concatenate([p.landmarks for p in parts]),
+            np.concatenate([p.labels for p in parts]),
+            np.concatenate([p.image_size for p in parts]),
+        )
+
+
+def save_landmark_dataset(
+    path: Union[str, Path],
+    landmarks: np.ndarray,
+    labels: np.ndarray,
+    image_size: Optional[np.ndarray] = None,
+) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    landmarks = np.asarray(landmarks, dtype=np.float32)
+    if image_size is None:
+        image_size = np.tile(np.array(DEFAULT_IMAGE_SIZE, dtype=np.int32), (len(landmarks), 1))
+    np.savez_compressed(
+        path,
+        landmarks=landmarks,
+        labels=np.asarray(labels).astype(str),
+        image_size=np.asarray(image_size, dtype=np.int32),
+    )
+    return path
+
+
+def _load_file(path: Path) -> LandmarkDataset:
+    with np.load(path, allow_pickle=False) as data:
+        landmarks = data["landmarks"].astype(np.float32).reshape(-1, 21, 3)
+        n = len(landmarks)
+        if "labels" in data:
+            labels = data["labels"].astype(str).astype(object)
+        else:
+            stem = path.stem
+            label = stem[len("landmarks_"):] if stem.startswith("landmarks_") else stem
+            labels = np.full(n, label, dtype=object)
+        if "image_size" in data:
+            image_size = data["image_size"].astype(np.int32).reshape(n, 2)
+        else:
+            image_size = np.tile(np.array(DEFAULT_IMAGE_SIZE, dtype=np.int32), (n, 1))
+    if len(labels) != n:
+        raise ValueError(f"{path}: {n} landmark rows but {len(labels)} labels")
+    return LandmarkDataset(landmarks, labels, image_size)
+
+
+def load_landmark_dataset(paths: Iterable[Union[str, Path]] = (DEFAULT_PROCESSED_DIR,)) -> LandmarkDataset:
+    """
+    Load and concatenate `.npz` files; directories are searched recursively.
+    """
+    files: List[Path] = []
+    for p in map(Path, paths):
+        files.extend(sorted(p.rglob("*.npz")) if p.is_dir() else [p])
+    if not files:
+        raise FileNotFoundError(f"No .npz landmark datasets found in: {', '.join(map(str, paths))}")
+    return LandmarkDataset.concat([_load_file(f) for f in files])
+
+
+def synthetic_dataset(
+    n: int,
+    seed: Optional[int] = 0,
+    config: Optional[SyntheticHandConfig] = None,
+) -> LandmarkDataset:
+    """
+    Synthetic hands (see `src/processing/synthetic.py`) as a dataset.
+    """
+    gen = SyntheticHandGenerator(config, seed=seed)
+    landmarks, labels = gen.sample(n)
+    size = np.tile(np.array([gen.config.img_w, gen.config.img_h], dtype=np.int32), (n, 1))
+    return LandmarkDataset(landmarks, labels, size)
+
+
+def train_test_split_stratified(
+    labels: np.ndarray, test_size: float = 0.2, seed: int = 0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Index arrays (train, test) with the same label proportions in both.
+    """
+    rng = np.random.default_rng(seed)
+    train, test = [], []
+    for key in np.unique(labels.astype(str)):
+        idx = np.flatnonzero(labels.astype(str) == key)
+        rng.shuffle(idx)
+        n_test = int(round(len(idx) * test_size))
+        test.append(idx[:n_test])
+        train.append(idx[n_test:])
+    return np.sort(np.concatenate(train)), np.sort(np.concatenate(test))
@@ -0,0 +1,343 @@
+"""
+Evaluate gesture classifier backends on labelled data.
+
+Usage (from project root):
+    python -m src.training.evaluate                                   # data/processed, rules
+    python -m src.training.evaluate data/processed --backend rules --backend onnx:models/checkpoints/gesture_mlp.onnx
+    python -m src.training.evaluate data/raw --backend template:data/templates/custom --workers 4
+    python -m src.training.evaluate --synthetic 50000 --backend rules
+
+Inputs:
+    - processed landmark datasets (`.npz`, see `datasets.py`)
+    - image folders with one subfolder per gesture (`data/raw/ok/*.jpg`);
+      landmarks are extracted with MediaPipe first, images without a
+      detected hand count as "no_hand" predictions
+    - synthetic hands (`--synthetic N`)
+
+Backends are spec strings (see `src/inference/backends.py`). The dataset
+is cut into shards and spread over a process pool; every worker builds
+its own backend once and returns predictions plus per-hand timings.
+
+Report (`data/eval/<name>.json` / `.md`), per backend:
+    accuracy, macro F1, per-class precision / recall / F1 / support,
+    confusion matrix (rows = true gesture, columns = predicted),
+    per-hand latency percentiles (µs, hands timed one by one) and
+    throughput (hands/s through the batch path, per worker and overall)
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..inference.backends import GestureBackend, load_backend
+from ..inference.mapping import GESTURES
+from ..inference.timing import summarize
+from .datasets import DEFAULT_PROCESSED_DIR, LandmarkDataset, load_landmark_dataset, synthetic_dataset
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_EVAL_DIR = PROJECT_ROOT / "data" / "eval"
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+NO_HAND = "no_hand"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate RT-Gesture3D classifier backends on labelled data")
+    parser.add_argument("data", nargs="*", default=None,
+                        help=f"processed .npz files / folders or labelled image folders (default: {DEFAULT_PROCESSED_DIR})")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="add N synthetic hands")
+    parser.add_argument("--backend", action="append", default=None, metavar="SPEC",
+                        help="rules, rules-vectorized, onnx:PATH or template:PATH (repeatable, default: rules)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (1 = in-process)")
+    parser.add_argument("--shard-size", type=int, default=5000, help="hands per work item")
+    parser.add_argument("--latency-hands", type=int, default=2000, help="hands timed one by one per backend")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=None, help="report path stem (default: data/eval/eval_<timestamp>)")
+    return parser.parse_args(argv)
+
+
+# ---------- dataset loading ----------
+def _image_files(folder: Path) -> List[Tuple[Path, str]]:
+    """
+    (image, label) pairs from `folder/<label>/*.jpg`.
+    """
+    return [
+        (p, sub.name)
+        for sub in sorted(d for d in folder.iterdir() if d.is_dir())
+        for p in sorted(sub.iterdir())
+        if p.suffix.lower() in IMAGE_EXTENSIONS
+    ]
+
+
+_detector = None
+
+
+def _init_detector() -> None:
+    global _detector
+    from ..detection.mediapipe_wrapper import MediaPipeHandDetector
+
+    _detector = MediaPipeHandDetector(max_num_hands=1)
+
+
+def _detect_images(paths: Sequence[str]) -> List[Optional[Tuple[list, int, int]]]:
+    import cv2
+
+    out: List[Optional[Tuple[list, int, int]]] = []
+    for path in paths:
+        frame = cv2.imread(path)
+        hands = _detector.detect(frame) if frame is not None else []
+        out.append((hands[0], frame.shape[1], frame.shape[0]) if hands else None)
+    return out
+
+
+def load_image_dataset(folders: Sequence[Path], workers: int, shard_size: int = 64) -> Tuple[LandmarkDataset, Dict[str, int]]:
+    """
+    Run MediaPipe over labelled image folders (in parallel).
+
+    Returns the detected hands as a dataset, and per-label counts of
+    images where no hand was found.
+    """
+    files = [f for folder in folders for f in _image_files(folder)]
+    paths = [str(p) for p, _ in files]
+    shards = [paths[i:i + shard_size] for i in range(0, len(paths), shard_size)]
+    if workers > 1 and len(shards) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_detector) as pool:
+            results = [r for shard in pool.map(_detect_images, shards) for r in shard]
+    else:
+        _init_detector()
+        results = [r for shard in shards for r in _detect_images(shard)]
+
+    hands, labels, sizes = [], [], []
+    missed: Dict[str, int] = {}
+    for (_, label), r in zip(files, results):
+        if r is None:
+            missed[label] = missed.get(label, 0) + 1
+            continue
+        hands.append(r[0])
+        labels.append(label)
+        sizes.append(r[1:])
+    ds = LandmarkDataset(
+        np.asarray(hands, dtype=np.float32).reshape(-1, 21, 3),
+        np.asarray(labels, dtype=object),
+        np.asarray(sizes, dtype=np.int32).reshape(-1, 2),
+    )
+    return ds, missed
+
+
+def load_eval_data(args) -> Tuple[LandmarkDataset, Dict[str, int]]:
+    paths = [Path(p) for p in args.data] if args.data else ([DEFAULT_PROCESSED_DIR] if DEFAULT_PROCESSED_DIR.exists() else [])
+    image_dirs = [p for p in paths if p.is_dir() and not any(p.rglob("*.npz")) and _image_files(p)]
+    npz_paths = [p for p in paths if p not in image_dirs]
+
+    parts: List[LandmarkDataset] = []
+    missed: Dict[str, int] = {}
+    if npz_paths:
+        parts.append(load_landmark_dataset(npz_paths))
+    if image_dirs:
+        print(f"📷 Extracting landmarks from {', '.join(map(str, image_dirs))}...")
+        ds, missed = load_image_dataset(image_dirs, args.workers)
+        parts.append(ds)
+    if args.synthetic > 0:
+        parts.append(synthetic_dataset(args.synthetic, seed=args.seed))
+    if not parts:
+        raise SystemExit("❌ No data: pass .npz files / image folders or --synthetic N")
+    return LandmarkDataset.concat(parts), missed
+
+
+# ---------- workers ----------
+_backend: Optional[GestureBackend] = None
+
+
+def _init_backend(spec: str) -> None:
+    global _backend
+    _backend = load_backend(spec)
+
+
+def _ready(_) -> int:
+    return os.getpid()
+
+
+def _eval_shard(item: Tuple[np.ndarray, np.ndarray, int]) -> Tuple[np.ndarray, np.ndarray, List[float], float]:
+    """
+    Classify one shard through the batch path, then time its first
+    `n_timed` hands one by one through the per-hand path.
+    """
+    landmarks, sizes, n_timed = item
+    keys = np.empty(len(landmarks), dtype=object)
+    confs = np.empty(len(landmarks), dtype=np.float32)
+
+    t0 = time.perf_counter()
+    for w, h in np.unique(sizes, axis=0).tolist():
+        sel = (sizes[:, 0] == w) & (sizes[:, 1] == h)
+        keys[sel], confs[sel] = _backend.predict_batch(landmarks[sel], w, h)
+    batch_s = time.perf_counter() - t0
+
+    samples = []
+    for pts, (w, h) in zip(landmarks[:n_timed].tolist(), sizes[:n_timed].tolist()):
+        t0 = time.perf_counter()
+        _backend(pts, w, h)
+        samples.append(time.perf_counter() - t0)
+    return keys, confs, samples, batch_s
+
+
+def run_backend(spec: str, ds: LandmarkDataset, workers: int, shard_size: int, latency_hands: int):
+    """
+    Predictions, confidences, per-hand latency samples (s), summed batch
+    time (s) and wall time (s) for one backend over the whole dataset.
+    """
+    n = len(ds)
+    starts = list(range(0, n, shard_size))
+    per_shard = -(-latency_hands // max(len(starts), 1))
+    items = [
+        (ds.landmarks[s:s + shard_size], ds.image_size[s:s + shard_size], max(0, min(per_shard, latency_hands - i * per_shard)))
+        for i, s in enumerate(starts)
+    ]
+
+    if workers > 1 and len(items) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_backend, initargs=(spec,)) as pool:
+            list(pool.map(_ready, range(workers)))     # workers started and backends loaded before the clock starts
+            t0 = time.perf_counter()
+            results = list(pool.map(_eval_shard, items))
+            wall_s = time.perf_counter() - t0
+    else:
+        _init_backend(spec)
+        t0 = time.perf_counter()
+        results = [_eval_shard(item) for item in items]
+        wall_s = time.perf_counter() - t0
+
+    keys = np.concatenate([r[0] for r in results]) if results else np.empty(0, dtype=object)
+    confs = np.concatenate([r[1] for r in results]) if results else np.empty(0, dtype=np.float32)
+    samples = [s for r in results for s in r[2]]
+    return keys, confs, samples, sum(r[3] for r in results), wall_s
+
+
+# ---------- metrics ----------
+def confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray, classes: List[str]) -> np.ndarray:
+    index = {k: i for i, k in enumerate(classes)}
+    cm = np.zeros((len(classes), len(classes)), dtype=np.int64)
+    if len(y_true) == 0:
+        return cm
+    np.add.at(cm, (np.array([index[k] for k in y_true]), np.array([index[k] for k in y_pred])), 1)
+    return cm
+
+
+def classification_metrics(y_true: np.ndarray, y_pred: np.ndarray, classes: List[str]) -> Dict[str, object]:
+    cm = confusion_matrix(y_true, y_pred, classes)
+    tp = np.diag(cm).astype(np.float64)
+    support = cm.sum(axis=1)
+    predicted = cm.sum(axis=0)
+    precision = np.divide(tp, predicted, out=np.zeros_like(tp), where=predicted > 0)
+    recall = np.divide(tp, support, out=np.zeros_like(tp), where=support > 0)
+    f1 = np.divide(2 * precision * recall, precision + recall, out=np.zeros_like(tp), where=(precision + recall) > 0)
+    present = support > 0
+    return {
+        "accuracy": float(tp.sum() / max(len(y_true), 1)),
+        "macro_f1": float(f1[present].mean()) if present.any() else 0.0,
+        "per_class": {
+            k: {
+                "precision": float(precision[i]),
+                "recall": float(recall[i]),
+                "f1": float(f1[i]),
+                "support": int(support[i]),
+            }
+            for i, k in enumerate(classes)
+        },
+        "confusion_matrix": cm.tolist(),
+    }
+
+
+def _latency_us(samples: List[float]) -> Dict[str, float]:
+    return {k.replace("_ms", "_us"): (v * 1000.0 if k.endswith("_ms") else v) for k, v in summarize(samples).items()}
+
+
+def format_markdown(report: Dict[str, object]) -> str:
+    classes = report["classes"]
+    lines = [
+        f"# Gesture evaluation: {report['name']}",
+        "",
+        f"{report['hands']} hands ({', '.join(f'{k}={v}' for k, v in report['dataset_counts'].items())}), "
+        f"{report['workers']} worker(s).",
+    ]
+    if report["no_hand"]:
+        lines.append(f"Images without a detected hand: {report['no_hand']}.")
+    lines += [
+        "",
+        "| backend | accuracy | macro F1 | p50 µs/hand | p95 µs/hand | p99 µs/hand | hands/s (per worker) | hands/s (overall) |",
+        "|---|---|---|---|---|---|---|---|",
+    ]
+    for spec, r in report["backends"].items():
+        lat = r["latency_us"]
+        lines.append(
+            f"| {spec} | {r['accuracy']:.2%} | {r['macro_f1']:.3f} | {lat['p50_us']:.1f} | {lat['p95_us']:.1f} "
+            f"| {lat['p99_us']:.1f} | {r['hands_per_s_worker']:,.0f} | {r['hands_per_s']:,.0f} |"
+        )
+
+    for spec, r in report["backends"].items():
+        lines += ["", f"## {spec}", "", "| gesture | precision | recall | F1 | support |", "|---|---|---|---|---|"]
+        for k, m in r["per_class"].items():
+            if m["support"] or m["precision"]:
+                lines.append(f"| {k} | {m['precision']:.1%} | {m['recall']:.1%} | {m['f1']:.3f} | {m['support']} |")
+        lines += ["", "Confusion matrix (rows = true, columns = predicted):", ""]
+        lines.append("| | " + " | ".join(classes) + " |")
+        lines.append("|---" * (len(classes) + 1) + "|")
+        for k, row in zip(classes, r["confusion_matrix"]):
+            lines.append(f"| **{k}** | " + " | ".join(str(v) for v in row) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    specs = args.backend or ["rules"]
+    ds, missed = load_eval_data(args)
+    if len(ds) == 0 and not missed:
+        raise SystemExit("❌ Dataset is empty")
+    print(f"📦 {len(ds)} hands: {ds.counts()}")
+
+    # images without a hand are a miss for every backend
+    n_missed = sum(missed.values())
+    y_true = np.concatenate([ds.labels.astype(str), np.repeat(list(missed), list(missed.values())).astype(str)])
+
+    report: Dict[str, object] = {
+        "name": None,
+        "hands": int(len(y_true)),
+        "dataset_counts": ds.counts(),
+        "no_hand": missed,
+        "workers": args.workers,
+        "backends": {},
+    }
+    predictions = {}
+    for spec in specs:
+        print(f"🧪 {spec}...")
+        keys, _, samples, batch_s, wall_s = run_backend(spec, ds, args.workers, args.shard_size, args.latency_hands)
+        predictions[spec] = np.concatenate([keys.astype(str), np.full(n_missed, NO_HAND)])
+        report["backends"][spec] = {
+            "latency_us": _latency_us(samples),
+            "hands_per_s_worker": len(ds) / batch_s if batch_s > 0 else 0.0,
+            "hands_per_s": len(ds) / wall_s if wall_s > 0 else 0.0,
+        }
+
+    # gesture registry order first, then anything else that showed up (custom templates, no_hand)
+    seen = set(y_true.tolist()).union(*(set(p.tolist()) for p in predictions.values()))
+    classes = [k for k in GESTURES if k in seen] + sorted(seen - set(GESTURES))
+    report["classes"] = classes
+    for spec in specs:
+        report["backends"][spec].update(classification_metrics(y_true, predictions[spec], classes))
+
+    stem = Path(args.out) if args.out else DEFAULT_EVAL_DIR / time.strftime("eval_%Y%m%d_%H%M%S")
+    stem.parent.mkdir(parents=True, exist_ok=True)
+    report["name"] = stem.name
+    stem.with_suffix(".json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    markdown = format_markdown(report)
+    stem.with_suffix(".md").write_text(markdown, encoding="utf-8")
+
+    print(markdown)
+    print(f"💾 Report: {stem.with_suffix('.json')} / {stem.with_suffix('.md')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+ONNX export contract for temporal (dynamic-gesture) models.
+
+Usage (from project root):
+    python -m src.training.export_temporal --random                       # untrained GRU stand-in
+    python -m src.training.export_temporal --random --hidden 128 --layers 2 --out models/checkpoints/gesture_gru.onnx
+
+Recurrent models are run frame by frame by
+`src/inference/streaming_onnx.py`, which carries their hidden state, so
+every exported temporal model must have this interface:
+
+    inputs   features       (T, B, FEATURE_DIM) float32, sequence-major
+             h0             (layers, B, hidden) float32 initial state
+    outputs  probabilities  (B, n_classes) for the last time step
+             hn             (layers, B, hidden) state after the last step
+
+plus a JSON sidecar (`gesture_gru.json`, see `metadata_path`) with the
+class order, feature version and state names / sizes. An LSTM adds a
+second state pair (c0 / cn) listed in the sidecar's "state".
+
+`export_gru` writes a GRU + linear + softmax graph with the ONNX `GRU`
+operator from NumPy weights (PyTorch layout: gates r, z, n), either
+given (e.g. from a trained model) or random (`--random`): enough to
+measure inference cost before a trained model exists.
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ..inference.mapping import GESTURES
+from ..inference.onnx_classifier import metadata_path
+from ..inference.streaming_onnx import TEMPORAL_FORMAT
+from ..processing.preprocess import FEATURE_DIM, FEATURE_VERSION
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_OUT = PROJECT_ROOT / "models" / "checkpoints" / "gesture_gru.onnx"
+OPSET = 17
+
+
+def random_gru_weights(
+    feature_dim: int, hidden: int, n_classes: int, layers: int = 1, seed: int = 0
+) -> Dict[str, List[np.ndarray]]:
+    """
+    Uniform(-1/sqrt(hidden), 1/sqrt(hidden)) weights, like PyTorch's GRU init.
+
+    Per layer: W (3H, in), R (3H, H), b_w (3H,), b_r (3H,), gates r, z, n;
+    head: out_w (C, H), out_b (C,).
+    """
+    rng = np.random.default_rng(seed)
+    k = 1.0 / np.sqrt(hidden)
+    weights: Dict[str, List[np.ndarray]] = {"W": [], "R": [], "b_w": [], "b_r": []}
+    for layer in range(layers):
+        in_dim = feature_dim if layer == 0 else hidden
+        weights["W"].append(rng.uniform(-k, k, (3 * hidden, in_dim)).astype(np.float32))
+        weights["R"].append(rng.uniform(-k, k, (3 * hidden, hidden)).astype(np.float32))
+        weights["b_w"].append(rng.uniform(-k, k, 3 * hidden).astype(np.float32))
+        weights["b_r"].append(rng.uniform(-k, k, 3 * hidden).astype(np.float32))
+    weights["out_w"] = [rng.uniform(-k, k, (n_classes, hidden)).astype(np.float32)]
+    weights["out_b"] = [rng.uniform(-k, k, n_classes).astype(np.float32)]
+    return weights
+
+
+def _onnx_gates(m: np.ndarray) -> np.ndarray:
+    # PyTorch stacks gates r, z, n; ONNX expects z, r, h
+    r, z, n = np.split(m, 3, axis=0)
+    return np.concatenate([z, r, n], axis=0)
+
+
+def export_gru(
+    path: Path,
+    classes: Sequence[str],
+    weights: Dict[str, List[np.ndarray]],
+    feature_dim: int = FEATURE_DIM,
+    extra_metadata: Optional[Dict[str, object]] = None,
+) -> Path:
+    """
+    Write a GRU gesture model and its sidecar (see module docstring).
+    """
+    import onnx
+    from onnx import TensorProto, helper, numpy_helper
+
+    layers = len(weights["W"])
+    hidden = weights["R"][0].shape[1]
+    n_classes = len(classes)
+
+    inits, nodes, layer_states = [], [], []
+    x = "features"
+    for layer in range(layers):
+        w = _onnx_gates(weights["W"][layer])[None]
+        r = _onnx_gates(weights["R"][layer])[None]
+        b = np.concatenate([_onnx_gates(weights["b_w"][layer]), _onnx_gates(weights["b_r"][layer])])[None]
+        inits += [
+            numpy_helper.from_array(w.astype(np.float32), f"W{layer}"),
+            numpy_helper.from_array(r.astype(np.float32), f"R{layer}"),
+            numpy_helper.from_array(b.astype(np.float32), f"B{layer}"),
+            numpy_helper.from_array(np.array([layer], dtype=np.int64), f"start{layer}"),
+            numpy_helper.from_array(np.array([layer + 1], dtype=np.int64), f"end{layer}"),
+        ]
+        nodes += [
+            helper.make_node("Slice", ["h0", f"start{layer}", f"end{layer}", "axis0"], [f"h0_{layer}"]),
+            # linear_before_reset=1 matches PyTorch's GRU
+            helper.make_node("GRU", [x, f"W{layer}", f"R{layer}", f"B{layer}", "", f"h0_{layer}"],
+                             [f"Y{layer}", f"hn_{layer}"], hidden_size=hidden, linear_before_reset=1),
+            helper.make_node("Squeeze", [f"Y{layer}", "axis1"], [f"seq{layer}"]),       # (T, 1, B, H) → (T, B, H)
+        ]
+        layer_states.append(f"hn_{layer}")
+        x = f"seq{layer}"
+
+    inits += [
+        numpy_helper.from_array(np.array([0], dtype=np.int64), "axis0"),
+        numpy_helper.from_array(np.array([1], dtype=np.int64), "axis1"),
+        numpy_helper.from_array(weights["out_w"][0].T.astype(np.float32), "out_w"),
+        numpy_helper.from_array(weights["out_b"][0].astype(np.float32), "out_b"),
+    ]
+    nodes += [
+        helper.make_node("Concat", layer_states, ["hn"], axis=0),
+        helper.make_node("Gather", [layer_states[-1], "zero"], ["last"], axis=0),       # (B, H)
+        helper.make_node("MatMul", ["last", "out_w"], ["logits_nobias"]),
+        helper.make_node("Add", ["logits_nobias", "out_b"], ["logits"]),
+        helper.make_node("Softmax", ["logits"], ["probabilities"], axis=-1),
+    ]
+    inits.append(numpy_helper.from_array(np.array(0, dtype=np.int64), "zero"))
+
+    graph = helper.make_graph(
+        nodes,
+        "gesture_gru",
+        inputs=[
+            helper.make_tensor_value_info("features", TensorProto.FLOAT, ["T", "B", feature_dim]),
+            helper.make_tensor_value_info("h0", TensorProto.FLOAT, [layers, "B", hidden]),
+        ],
+        outputs=[
+            helper.make_tensor_value_info("probabilities", TensorProto.FLOAT, ["B", n_classes]),
+            helper.make_tensor_value_info("hn", TensorProto.FLOAT, [layers, "B", hidden]),
+        ],
+        initializer=inits,
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", OPSET)])
+    model.ir_version = min(model.ir_version, 8)                 # readable by older onnxruntime builds
+    onnx.checker.check_model(model)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+
+    meta = {
+        "format": TEMPORAL_FORMAT,
+        "feature_version": FEATURE_VERSION,
+        "feature_dim": feature_dim,
+        "classes": list(classes),
+        "input": "features",
+        "probability_output": "probabilities",
+        "state": [{"input": "h0", "output": "hn", "shape": [layers, hidden], "batch_axis": 1}],
+        "model": "gru",
+        "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    meta.update(extra_metadata or {})
+    metadata_path(path).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return path
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export a temporal RT-Gesture3D model to ONNX")
+    parser.add_argument("--random", action="store_true", help="untrained weights (for benchmarks / integration)")
+    parser.add_argument("--hidden", type=int, default=64)
+    parser.add_argument("--layers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default=str(DEFAULT_OUT))
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if not args.random:
+        raise SystemExit("❌ No temporal training yet: pass --random for an untrained stand-in model")
+    classes = list(GESTURES)
+    weights = random_gru_weights(FEATURE_DIM, args.hidden, len(classes), args.layers, args.seed)
+    path = export_gru(Path(args.out), classes, weights, extra_metadata={"trained": False})
+    print(f"✅ GRU ({args.layers} x {args.hidden}, untrained) → {path} (+ {metadata_path(path).name})")
+
+
+if __name__ == "__main__":
+    main()
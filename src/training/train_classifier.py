@@ -0,0 +1,340 @@
+"""
+Train a learned gesture classifier to replace the heuristic rules.
+
+Usage (from project root):
+    python -m src.training.train_classifier                          # data/processed/*.npz
+    python -m src.training.train_classifier --synthetic 60000 --quantize   # synthetic hands only, + int8 model
+    python -m src.training.train_classifier --data data/processed --synthetic 20000 --model gbt
+    python -m src.training.train_classifier --data data/processed --augment 40   # MLP on augmented batches
+
+Steps:
+    1. load processed landmark datasets (see `datasets.py`) and / or synthetic hands
+    2. build features with `src/processing/preprocess.py`
+    3. train a compact MLP (default) or a gradient-boosted tree model
+       (hgb = HistGradientBoosting, gbt = classic GradientBoosting);
+       with --augment the MLP is fed randomly transformed batches from
+       `src/processing/augment.py` instead of the fixed training set
+    4. export to ONNX (+ int8 dynamic quantization with --quantize)
+    5. compare accuracy and per-hand latency with `detect_gesture_from_landmarks`
+
+Outputs in models/checkpoints/:
+    gesture_mlp.onnx, gesture_mlp.int8.onnx   models
+    gesture_mlp.json                          class order / feature version (read by OnnxGestureClassifier)
+    gesture_mlp.report.json / .report.md      evaluation report
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingClassifier, HistGradientBoostingClassifier
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+
+from ..inference.batch_predictor import ID_KEYS, detect_gestures_batch
+from ..inference.mapping import GESTURES
+from ..inference.onnx_classifier import METADATA_FORMAT, OnnxGestureClassifier, metadata_path
+from ..inference.predictor import detect_gesture_from_landmarks
+from ..inference.timing import summarize
+from ..processing.augment import AugmentConfig, AugmentedStream, LandmarkAugmenter
+from ..processing.preprocess import FEATURE_DIM, FEATURE_VERSION, hand_features_batch
+from ..processing.synthetic import SyntheticHandConfig
+from .datasets import (
+    DEFAULT_PROCESSED_DIR,
+    LandmarkDataset,
+    load_landmark_dataset,
+    synthetic_dataset,
+    train_test_split_stratified,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_CHECKPOINT_DIR = PROJECT_ROOT / "models" / "checkpoints"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Train / export an RT-Gesture3D gesture classifier")
+    parser.add_argument("--data", nargs="*", default=None,
+                        help=f"processed .npz files or folders (default: {DEFAULT_PROCESSED_DIR} if it exists)")
+    parser.add_argument("--synthetic", type=int, default=0, metavar="N", help="add N synthetic hands")
+    parser.add_argument("--synthetic-roll", type=float, default=30.0, help="max |roll| of synthetic hands (deg)")
+    parser.add_argument("--synthetic-yaw", type=float, default=35.0, help="max |yaw| of synthetic hands (deg)")
+    parser.add_argument("--model", choices=("mlp", "hgb", "gbt"), default="mlp")
+    parser.add_argument("--hidden", default="64,32", help="MLP hidden layer sizes")
+    parser.add_argument("--max-iter", type=int, default=300, help="MLP epochs / boosting rounds")
+    parser.add_argument("--augment", type=int, default=0, metavar="EPOCHS",
+                        help="train the MLP for EPOCHS passes over randomly augmented batches")
+    parser.add_argument("--augment-rotate", type=float, default=15.0, help="max |rotation| of augmented hands (deg)")
+    parser.add_argument("--augment-mirror", type=float, default=0.5, help="probability of mirroring a hand")
+    parser.add_argument("--batch-size", type=int, default=512, help="augmented batch size")
+    parser.add_argument("--test-size", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quantize", action="store_true", help="also write an int8 dynamically quantized model")
+    parser.add_argument("--out", default=str(DEFAULT_CHECKPOINT_DIR), help="output folder")
+    parser.add_argument("--name", default=None, help="model file stem (default: gesture_<model>)")
+    parser.add_argument("--latency-hands", type=int, default=2000, help="test hands timed one by one")
+    return parser.parse_args(argv)
+
+
+def load_training_data(args) -> LandmarkDataset:
+    parts: List[LandmarkDataset] = []
+    paths = args.data if args.data is not None else ([DEFAULT_PROCESSED_DIR] if DEFAULT_PROCESSED_DIR.exists() else [])
+    if paths:
+        parts.append(load_landmark_dataset(paths))
+    if args.synthetic > 0:
+        config = SyntheticHandConfig(
+            roll_deg=(-args.synthetic_roll, args.synthetic_roll),
+            yaw_deg=(-args.synthetic_yaw, args.synthetic_yaw),
+        )
+        parts.append(synthetic_dataset(args.synthetic, seed=args.seed, config=config))
+    if not parts:
+        raise SystemExit(f"❌ No data: put .npz files in {DEFAULT_PROCESSED_DIR} or pass --synthetic N")
+    return LandmarkDataset.concat(parts)
+
+
+def build_model(args):
+    if args.model == "mlp":
+        hidden = tuple(int(h) for h in args.hidden.split(",") if h)
+        clf = MLPClassifier(
+            hidden_layer_sizes=hidden,
+            max_iter=args.max_iter,
+            early_stopping=True,
+            random_state=args.seed,
+        )
+        return make_pipeline(StandardScaler(), clf), clf
+    if args.model == "gbt":
+        clf = GradientBoostingClassifier(n_estimators=min(args.max_iter, 100), max_depth=3, random_state=args.seed)
+        return clf, clf
+    clf = HistGradientBoostingClassifier(max_iter=args.max_iter, max_leaf_nodes=15, random_state=args.seed)
+    return clf, clf
+
+
+def fit_augmented(args, model, ds: LandmarkDataset, y: np.ndarray, train_idx: np.ndarray, clean: np.ndarray) -> None:
+    """
+    MLP pipeline trained with `partial_fit` on streamed augmented batches.
+
+    The scaler is fitted once on the clean training features, so the
+    exported pipeline normalizes exactly like it did during training.
+    """
+    scaler, clf = model.steps[0][1], model.steps[-1][1]
+    scaler.fit(clean)
+    clf.set_params(early_stopping=False)    # no held-out split inside partial_fit
+    augmenter = LandmarkAugmenter(
+        AugmentConfig(rotate_deg=args.augment_rotate, mirror_prob=args.augment_mirror), seed=args.seed
+    )
+    classes = np.arange(int(y.max()) + 1)
+    stream = AugmentedStream(
+        ds.landmarks[train_idx], y[train_idx], batch_size=args.batch_size, epochs=args.augment,
+        augmenter=augmenter, image_size=ds.image_size[train_idx], seed=args.seed,
+    )
+    i = 0
+    with stream:
+        for i, (pts, labels, size) in enumerate(stream, 1):
+            batch = scaler.transform(hand_features_batch(pts, size[:, 0]))
+            clf.partial_fit(batch, labels, classes=classes)
+            if i % stream.batches_per_epoch == 0:
+                print(f"   epoch {i // stream.batches_per_epoch}/{args.augment}  loss {clf.loss_:.4f}")
+    print(f"   data stalls: {stream.consumer_waits} of {i} batches")
+
+
+def export_onnx(model, clf, path: Path) -> Path:
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType
+
+    try:
+        onx = convert_sklearn(
+            model,
+            initial_types=[("features", FloatTensorType([None, FEATURE_DIM]))],
+            options={id(clf): {"zipmap": False}},   # plain (N, C) probability tensor
+        )
+    except (ValueError, TypeError, RuntimeError) as e:
+        # e.g. a scikit-learn release newer than the installed skl2onnx converters
+        raise SystemExit(f"❌ ONNX export of {type(clf).__name__} failed ({e.__class__.__name__}): "
+                         "upgrade skl2onnx or try another --model") from e
+    path.write_bytes(onx.SerializeToString())
+    return path
+
+
+def quantize_int8(src: Path, dst: Path) -> Path:
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(str(src), str(dst), weight_type=QuantType.QInt8)
+    return dst
+
+
+def rules_predict(ds: LandmarkDataset) -> np.ndarray:
+    keys = np.empty(len(ds), dtype=object)
+    for w, h in np.unique(ds.image_size, axis=0):
+        sel = (ds.image_size[:, 0] == w) & (ds.image_size[:, 1] == h)
+        ids, _ = detect_gestures_batch(ds.landmarks[sel], int(w), int(h))
+        keys[sel] = ID_KEYS[ids]
+    return keys
+
+
+def accuracy_report(y_true: np.ndarray, y_pred: np.ndarray, classes: List[str]) -> Dict[str, object]:
+    y_true, y_pred = y_true.astype(str), y_pred.astype(str)
+    return {
+        "accuracy": float((y_true == y_pred).mean()),
+        "recall": {k: float((y_pred[y_true == k] == k).mean()) for k in classes if (y_true == k).any()},
+    }
+
+
+def per_hand_latency(fn, hands: List[list], sizes: np.ndarray) -> Dict[str, float]:
+    samples = []
+    for pts, (w, h) in zip(hands, sizes.tolist()):
+        t0 = time.perf_counter()
+        fn(pts, w, h)
+        samples.append(time.perf_counter() - t0)
+    s = summarize(samples)
+    return {k.replace("_ms", "_us"): (v * 1000.0 if k.endswith("_ms") else v) for k, v in s.items()}
+
+
+def latency_goal(report: Dict[str, object]) -> Dict[str, Dict[str, object]]:
+    """
+    Per exported model: does it meet the "no slower per hand than the
+    rules" goal (p50 and p95)? `slowdown` is its p50 over the rules' p50.
+    """
+    rules = report["classifiers"]["rules"]["latency_us"]
+    goal = {}
+    for name, r in report["classifiers"].items():
+        if name == "rules":
+            continue
+        lat = r["latency_us"]
+        goal[name] = {
+            "meets": lat["p50_us"] <= rules["p50_us"] and lat["p95_us"] <= rules["p95_us"],
+            "slowdown": lat["p50_us"] / rules["p50_us"] if rules["p50_us"] else 0.0,
+        }
+    return goal
+
+
+def format_markdown(report: Dict[str, object]) -> str:
+    lines = [
+        f"# Gesture classifier report: {report['name']}",
+        "",
+        f"Model: {report['model']}, trained on {report['train_size']} hands, tested on {report['test_size']}.",
+        "",
+        "| classifier | accuracy | p50 µs/hand | p95 µs/hand | batch hands/s |",
+        "|---|---|---|---|---|",
+    ]
+    for name, r in report["classifiers"].items():
+        lat = r.get("latency_us", {})
+        lines.append(
+            f"| {name} | {r['accuracy'] * 100:.2f}% | {lat.get('p50_us', 0):.1f} | {lat.get('p95_us', 0):.1f} "
+            f"| {r.get('batch_hands_per_s', 0):,.0f} |"
+        )
+    failing = {name: g for name, g in report["latency_goal"].items() if not g["meets"]}
+    if failing:
+        lines += ["", "**Latency goal not met**: per hand, "
+                  + ", ".join(f"{name} is {g['slowdown']:.1f}x slower than the rules (p50)" for name, g in failing.items())
+                  + ". The goal is no slower than the rules; keep the rules on the live path or batch hands."]
+    lines += ["", "Recall per gesture:", "", "| gesture | " + " | ".join(report["classifiers"]) + " |",
+              "|---|" + "---|" * len(report["classifiers"])]
+    for key in report["classes"]:
+        cells = [f"{r['recall'].get(key, 0) * 100:.1f}%" for r in report["classifiers"].values()]
+        lines.append(f"| {key} | " + " | ".join(cells) + " |")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    name = args.name or f"gesture_{args.model}"
+
+    ds = load_training_data(args)
+    classes = [k for k in GESTURES if k in set(ds.labels.astype(str))]
+    unknown = sorted(set(ds.labels.astype(str)) - set(classes))
+    if unknown:
+        raise SystemExit(f"❌ Labels not in datasets/gestures.csv: {unknown}")
+    print(f"📦 {len(ds)} hands: {ds.counts()}")
+
+    features = hand_features_batch(ds.landmarks, ds.image_size[:, 0])
+    y = np.array([classes.index(k) for k in ds.labels.astype(str)], dtype=np.int64)
+    train_idx, test_idx = train_test_split_stratified(ds.labels, test_size=args.test_size, seed=args.seed)
+    test = LandmarkDataset(ds.landmarks[test_idx], ds.labels[test_idx], ds.image_size[test_idx])
+
+    model, clf = build_model(args)
+    t0 = time.perf_counter()
+    if args.augment > 0 and args.model == "mlp":
+        print(f"🏋️ Training {args.model} on {len(train_idx)} hands x {args.augment} augmented epochs...")
+        fit_augmented(args, model, ds, y, train_idx, features[train_idx])
+    else:
+        if args.augment > 0:
+            print("ℹ️ --augment skipped: tree ensembles cannot be trained batch by batch")
+        print(f"🏋️ Training {args.model} on {len(train_idx)} hands...")
+        model.fit(features[train_idx], y[train_idx])
+    print(f"✅ Trained in {time.perf_counter() - t0:.1f}s")
+
+    onnx_path = export_onnx(model, clf, out_dir / f"{name}.onnx")
+    models = {"onnx-fp32": onnx_path}
+    if args.quantize:
+        if args.model == "mlp":
+            models["onnx-int8"] = quantize_int8(onnx_path, out_dir / f"{name}.int8.onnx")
+        else:
+            print("ℹ️ --quantize skipped: tree ensembles have no MatMul weights to quantize")
+
+    meta = {
+        "format": METADATA_FORMAT,
+        "feature_version": FEATURE_VERSION,
+        "feature_dim": FEATURE_DIM,
+        "classes": classes,
+        "probability_output": "probabilities",
+        "model": args.model,
+        "trained_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    metadata_path(onnx_path).write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+    # ---------- evaluation ----------
+    rng = np.random.default_rng(args.seed)
+    timed = rng.choice(len(test), size=min(args.latency_hands, len(test)), replace=False)
+    timed_hands = test.landmarks[timed].tolist()
+    timed_sizes = test.image_size[timed]
+
+    report = {
+        "name": name,
+        "model": args.model,
+        "train_size": int(len(train_idx)),
+        "test_size": int(len(test)),
+        "classes": classes,
+        "classifiers": {},
+    }
+
+    rules = accuracy_report(test.labels, rules_predict(test), classes)
+    rules["latency_us"] = per_hand_latency(detect_gesture_from_landmarks, timed_hands, timed_sizes)
+    t0 = time.perf_counter()
+    rules_predict(test)
+    rules["batch_hands_per_s"] = len(test) / (time.perf_counter() - t0)
+    report["classifiers"]["rules"] = rules
+
+    for label, path in models.items():
+        onnx_clf = OnnxGestureClassifier(path)
+        t0 = time.perf_counter()
+        ids, _ = onnx_clf.predict_batch(test.landmarks, test.image_size[:, 0])
+        batch_s = time.perf_counter() - t0
+        r = accuracy_report(test.labels, ID_KEYS[ids], classes)
+        r["latency_us"] = per_hand_latency(onnx_clf, timed_hands, timed_sizes)
+        r["batch_hands_per_s"] = len(test) / batch_s
+        r["path"] = str(path)
+        r["size_bytes"] = path.stat().st_size
+        report["classifiers"][label] = r
+
+    report["latency_goal"] = latency_goal(report)
+
+    (out_dir / f"{name}.report.json").write_text(json.dumps(report, indent=2), encoding="utf-8")
+    markdown = format_markdown(report)
+    (out_dir / f"{name}.report.md").write_text(markdown, encoding="utf-8")
+
+    print(markdown)
+    for label, goal in report["latency_goal"].items():
+        if not goal["meets"]:
+            print(f"⚠️ {label}: {goal['slowdown']:.1f}x the rules' per-hand p50, fails the latency goal")
+    for label, path in models.items():
+        print(f"💾 {label}: {path} ({path.stat().st_size / 1024:.1f} KiB)")
+    print(f"💾 Metadata: {metadata_path(onnx_path)}")
+
+
+if __name__ == "__main__":
+    main()